@@ -0,0 +1,466 @@
+import argparse
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import traceback
+import tracemalloc
+from dataclasses import asdict, dataclass, fields
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List, Optional
+
+from benchmarks.synthetic_repo import RepoShape, create_synthetic_repo, openapi_spec
+from demisto_sdk.commands.common.constants import MarketplaceVersions
+from demisto_sdk.commands.common.handlers import DEFAULT_JSON_HANDLER as json
+from demisto_sdk.commands.common.logger import logger, logging_setup
+from TestSuite.repo import Repo
+from TestSuite.test_tools import ChangeCWD
+
+SDK_PATH = Path(__file__).parent.parent
+# the number of files changed by the synthetic pull request, which the git history benchmark reads at its base
+PULL_REQUEST_FILES = 500
+# the number of component schemas in the synthetic OpenAPI specification, shared by its operations
+OPENAPI_SCHEMAS = 200
+# the number of flows in the synthetic mock recording, which the timestamp replacer benchmark replays
+RECORDED_FLOWS = 2000
+# a benchmark is considered as regressed once it is slower than the baseline by more than this ratio
+DEFAULT_REGRESSION_THRESHOLD = 0.2
+
+
+@dataclass
+class Benchmark:
+    """
+    name: the name of the benchmark in the results
+    run: the timed operation, receives the synthetic repository and the output of setup,
+        may return additional measurements (e.g. memory) which are added to the results
+    setup: an untimed preparation for each round
+    """
+
+    name: str
+    run: Callable[[Repo, Any], Optional[Dict[str, Any]]]
+    setup: Optional[Callable[[Repo], Any]] = None
+
+
+def _pack_paths(repo: Repo) -> List[str]:
+    """The paths of the packs, relative to the repository (the working directory of the benchmarks)"""
+    return [str(Path(pack.path).relative_to(repo.path)) for pack in repo.packs]
+
+
+def parse_repository(repo: Repo, _) -> None:
+    from demisto_sdk.commands.content_graph.parsers.repository import (
+        RepositoryParser,
+    )
+
+    RepositoryParser(Path(repo.path)).parse()
+
+
+def collect_graph_model(repo: Repo, _) -> Dict[str, Any]:
+    """Parses the repository and collects the nodes and relationships of the content graph, measuring their memory."""
+    from demisto_sdk.commands.common.content_constant_paths import CONTENT_PATH
+    from demisto_sdk.commands.content_graph.content_graph_builder import (
+        ContentGraphBuilder,
+    )
+
+    tracemalloc.start()
+    try:
+        # only the repository path of the graph interface is used for collecting the model,
+        # which is the content path (the working directory of the benchmarks) as in the graph commands
+        builder = ContentGraphBuilder(SimpleNamespace(repo_path=CONTENT_PATH))  # type: ignore[arg-type]
+        builder._parse_and_model_content()
+        memory, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {"memory": memory, "peak_memory": peak_memory}
+
+
+def run_validations(repo: Repo, _) -> None:
+    from demisto_sdk.commands.validate.config_reader import ConfigReader
+    from demisto_sdk.commands.validate.initializer import Initializer
+    from demisto_sdk.commands.validate.validate_manager import ValidateManager
+    from demisto_sdk.commands.validate.validation_results import ResultWriter
+
+    file_path = ",".join(_pack_paths(repo))
+    ValidateManager(
+        validation_results=ResultWriter(),
+        config_reader=ConfigReader(),
+        initializer=Initializer(file_path=file_path),
+        file_path=file_path,
+    ).run_validations()
+
+
+def create_id_set(repo: Repo, _) -> None:
+    from demisto_sdk.commands.common.update_id_set import re_create_id_set
+
+    re_create_id_set(id_set_path=None, print_logs=False)
+
+
+def parse_content_dto(repo: Repo) -> Any:
+    from demisto_sdk.commands.content_graph.objects.repository import ContentDTO
+    from demisto_sdk.commands.content_graph.parsers.repository import (
+        RepositoryParser,
+    )
+
+    repository_parser = RepositoryParser(Path(repo.path))
+    repository_parser.parse()
+    return ContentDTO.from_orm(repository_parser)
+
+
+def dump_content(repo: Repo, content_dto: Any) -> None:
+    with tempfile.TemporaryDirectory() as output_dir:
+        content_dto.dump(
+            Path(output_dir) / "content_packs", MarketplaceVersions.XSOAR, zip=False
+        )
+
+
+def find_secrets(repo: Repo, _) -> None:
+    from demisto_sdk.commands.secrets.secrets import SecretsValidator
+
+    files = [
+        str(path)
+        for path in Path(repo.path, "Packs").rglob("*")
+        if path.suffix in (".py", ".yml", ".md", ".json")
+    ]
+    SecretsValidator(white_list_path=repo.secrets.path).search_potential_secrets(files)
+
+
+def create_pull_request(repo: Repo) -> List[str]:
+    """
+    Changes up to PULL_REQUEST_FILES files of the packs in a new commit, on top of a synthetic base branch.
+
+    Returns:
+        The changed files, relative to the repository.
+    """
+    from demisto_sdk.commands.common.constants import (
+        DEMISTO_GIT_PRIMARY_BRANCH,
+        DEMISTO_GIT_UPSTREAM,
+    )
+    from demisto_sdk.commands.common.tools import get_remote_file
+
+    get_remote_file.cache_clear()
+    git_util = repo.git_util
+    base_branch = f"{DEMISTO_GIT_UPSTREAM}/{DEMISTO_GIT_PRIMARY_BRANCH}"
+    if base_branch not in git_util.repo.git.branch("--remotes"):  # type: ignore[union-attr]
+        git_util.repo.git.update_ref(f"refs/remotes/{base_branch}", "HEAD")  # type: ignore[union-attr]
+        changed_files = [
+            path
+            for path in sorted(Path(repo.path, "Packs").rglob("*"))
+            # empty files are looked up remotely when they are empty at the base as well
+            if path.suffix in (".py", ".yml", ".md", ".json") and path.stat().st_size
+        ][:PULL_REQUEST_FILES]
+        for path in changed_files:
+            with path.open("a") as file:
+                file.write("\n")
+        git_util.commit_files("Synthetic pull request")  # type: ignore[union-attr]
+    return git_util.repo.git.diff("--name-only", base_branch, "HEAD").splitlines()  # type: ignore[union-attr]
+
+
+def read_pull_request_base(repo: Repo, changed_files: List[str]) -> Dict[str, Any]:
+    """Reads each one of the changed files at the base branch, as validate and update-release-notes do."""
+    from demisto_sdk.commands.common.constants import DEMISTO_GIT_PRIMARY_BRANCH
+    from demisto_sdk.commands.common.tools import get_remote_file
+
+    for path in changed_files:
+        get_remote_file(path, tag=DEMISTO_GIT_PRIMARY_BRANCH, return_content=True)
+    return {"files": len(changed_files)}
+
+
+def create_openapi_spec(repo: Repo) -> Path:
+    """Writes an OpenAPI specification with an operation per integration command of the repository."""
+    operations = sum(
+        len(integration.yml.read_dict()["script"]["commands"])
+        for pack in repo.packs
+        for integration in pack.integrations
+    )
+    spec_path = Path(repo.path, "openapi.json")
+    spec_path.write_text(json.dumps(openapi_spec(operations, OPENAPI_SCHEMAS)))
+    return spec_path
+
+
+def generate_openapi_integration(repo: Repo, spec_path: Path) -> Dict[str, Any]:
+    from demisto_sdk.commands.openapi_codegen.openapi_codegen import (
+        OpenAPIIntegration,
+    )
+
+    integration = OpenAPIIntegration(
+        str(spec_path), "Benchmark", "benchmark", "Benchmark", root_objects="data"
+    )
+    integration.load_file()
+    return {"commands": len(integration.functions)}
+
+
+def record_flows(repo: Repo) -> Path:
+    """
+    Writes a mitmproxy recording of the requests of a playbook, and its problematic keys file, as recorded by the
+    mock server. Most of the requests are POST requests with large json bodies, only some of them have timestamps.
+
+    Returns:
+        The path of the recording.
+    """
+    from mitmproxy import io
+    from mitmproxy.http import Headers
+    from mitmproxy.test import tflow, tutils
+
+    mocks_path = Path(repo.path, "Mocks")
+    mocks_path.mkdir(exist_ok=True)
+    (mocks_path / "problematic_keys.json").write_text(
+        json.dumps(
+            {
+                "keys_to_replace": "query.filter.from query.filter.to items.0.created",
+                "server_replay_ignore_params": "since",
+                "server_replay_ignore_payload_params": "",
+            }
+        )
+    )
+    flows_path = mocks_path / "playbook.mock"
+    with flows_path.open("wb") as flows_file:
+        writer = io.FlowWriter(flows_file)
+        for index in range(RECORDED_FLOWS):
+            body: Dict[str, Any] = {
+                "data": [{"id": f"data{index}.{item}"} for item in range(200)]
+            }
+            if index % 2:
+                body = {
+                    "items": [
+                        {"id": f"{index}.{item}", "created": "2023-01-01T00:00:00Z"}
+                        for item in range(100)
+                    ]
+                }
+            if index % 4 == 1:
+                body["query"] = {
+                    "filter": {"from": "2023-01-01T00:00:00Z", "to": "2023-01-02"}
+                }
+            request = tutils.treq(
+                method=b"POST",
+                path=f"/api/items?limit=50&since={index}".encode(),
+                headers=Headers(content_type="application/json"),
+                content=json.dumps(body).encode(),
+            )
+            writer.add(tflow.tflow(req=request))
+    return flows_path
+
+
+def replay_flows(repo: Repo, flows_path: Path) -> Dict[str, Any]:
+    """Cleans the problematic keys from each one of the recorded flows, as mitmdump does in playback mode."""
+    from mitmproxy import io
+    from mitmproxy.test import taddons
+
+    from demisto_sdk.commands.test_content.timestamp_replacer import (
+        TimestampReplacer,
+    )
+
+    timestamp_replacer = TimestampReplacer()
+    with taddons.context(timestamp_replacer) as context:
+        context.configure(
+            timestamp_replacer,
+            script_mode="playback",
+            keys_filepath=str(flows_path.parent / "problematic_keys.json"),
+        )
+        timestamp_replacer.running()
+        with flows_path.open("rb") as flows_file:
+            for flow in io.FlowReader(flows_file).stream():
+                timestamp_replacer.request(flow)
+    return {"flows": timestamp_replacer.count}
+
+
+def format_packs(repo: Repo, _) -> None:
+    from demisto_sdk.commands.format.format_module import format_manager
+
+    format_manager(
+        input=",".join(_pack_paths(repo)),
+        no_validate=True,
+        assume_answer=True,
+        interactive=False,
+        use_graph=False,
+    )
+
+
+BENCHMARKS = [
+    Benchmark("repository_parser", parse_repository),
+    Benchmark("graph_model", collect_graph_model),
+    Benchmark("validate", run_validations),
+    Benchmark("id_set", create_id_set),
+    Benchmark("content_dto_dump", dump_content, setup=parse_content_dto),
+    Benchmark("secrets", find_secrets),
+    Benchmark("git_history_read", read_pull_request_base, setup=create_pull_request),
+    Benchmark(
+        "openapi_codegen", generate_openapi_integration, setup=create_openapi_spec
+    ),
+    Benchmark("timestamp_replacer", replay_flows, setup=record_flows),
+    # runs last, as it changes the files of the repository
+    Benchmark("format", format_packs),
+]
+
+
+def run_benchmark(benchmark: Benchmark, repo: Repo, rounds: int) -> Dict[str, Any]:
+    times = []
+    measurements: Dict[str, Any] = {}
+    try:
+        for _ in range(rounds):
+            setup_output = benchmark.setup(repo) if benchmark.setup else None
+            start = time.perf_counter()
+            measurements = benchmark.run(repo, setup_output) or {}
+            times.append(time.perf_counter() - start)
+    except Exception as error:
+        logger.debug(traceback.format_exc())
+        logger.error(f"Benchmark {benchmark.name} failed: {error}")
+        return {"error": str(error)}
+    return {
+        "min": min(times),
+        "mean": statistics.mean(times),
+        "max": max(times),
+        "rounds": times,
+        **measurements,
+    }
+
+
+def get_sdk_commit() -> str:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "HEAD"], cwd=SDK_PATH, text=True
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def run_benchmarks(
+    shape: RepoShape, rounds: int = 1, only: Optional[List[str]] = None
+) -> Dict[str, Any]:
+    """Creates a synthetic repository of the given shape, and times each one of the benchmarks on it.
+
+    Returns:
+        The results of the run, which can be saved and compared with the results of another commit.
+    """
+    results: Dict[str, Any] = {
+        "commit": get_sdk_commit(),
+        "python": platform.python_version(),
+        "shape": asdict(shape),
+        "results": {},
+    }
+    with tempfile.TemporaryDirectory() as repo_dir:
+        logger.info(f"Creating a synthetic repository with {shape.packs} packs")
+        repo = create_synthetic_repo(Path(repo_dir), shape)
+        with ChangeCWD(repo.path):
+            for benchmark in BENCHMARKS:
+                if only and benchmark.name not in only:
+                    continue
+                logger.info(f"Running {benchmark.name}")
+                results["results"][benchmark.name] = result = run_benchmark(
+                    benchmark, repo, rounds
+                )
+                if "error" not in result:
+                    logger.info(
+                        f"{benchmark.name}: {result['min']:.2f}s"
+                        + (
+                            f", {result['memory'] / 2**20:.1f}MiB"
+                            if "memory" in result
+                            else ""
+                        )
+                    )
+    return results
+
+
+def compare_results(
+    baseline: Dict[str, Any],
+    current: Dict[str, Any],
+    threshold: float = DEFAULT_REGRESSION_THRESHOLD,
+) -> List[str]:
+    """Compares the fastest round (and the memory, when measured) of each benchmark with the baseline.
+
+    Returns:
+        The names of the benchmarks which are slower, or use more memory, than the baseline by more than the threshold.
+    """
+    if baseline.get("shape") != current.get("shape"):
+        logger.warning(
+            "The results were measured on repositories of different shapes, the comparison might not be meaningful"
+        )
+    regressions = []
+    for name, result in current["results"].items():
+        baseline_result = baseline["results"].get(name, {})
+        if "min" not in result or "min" not in baseline_result:
+            continue
+        change = result["min"] / baseline_result["min"] - 1
+        logger.info(
+            f"{name}: {baseline_result['min']:.2f}s -> {result['min']:.2f}s ({change:+.0%})"
+        )
+        if change > threshold:
+            regressions.append(name)
+        if "memory" in result and baseline_result.get("memory"):
+            memory_change = result["memory"] / baseline_result["memory"] - 1
+            logger.info(
+                f"{name} memory: {baseline_result['memory'] / 2**20:.1f}MiB -> "
+                f"{result['memory'] / 2**20:.1f}MiB ({memory_change:+.0%})"
+            )
+            if memory_change > threshold and name not in regressions:
+                regressions.append(name)
+    return regressions
+
+
+def parse_shape(packs: int, shape_overrides: List[str]) -> RepoShape:
+    shape = RepoShape(packs=packs)
+    types = {field.name: field.type for field in fields(RepoShape)}
+    for override in shape_overrides:
+        key, _, value = override.partition("=")
+        if key not in types:
+            raise ValueError(f"Unknown shape option {key}, choose from {list(types)}")
+        setattr(
+            shape,
+            key,
+            value.lower() == "true" if types[key] in (bool, "bool") else int(value),
+        )
+    return shape
+
+
+def main(args: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Times demisto-sdk commands on a synthetic content repository."
+    )
+    parser.add_argument(
+        "--packs", type=int, default=RepoShape.packs, help="Number of packs"
+    )
+    parser.add_argument(
+        "--shape",
+        action="append",
+        default=[],
+        metavar="KEY=VALUE",
+        help="Overrides the shape of the packs, e.g. --shape tasks_per_playbook=100",
+    )
+    parser.add_argument("--rounds", type=int, default=1, help="Rounds per benchmark")
+    parser.add_argument(
+        "--only",
+        help=f"Comma separated benchmarks to run, out of: {', '.join(benchmark.name for benchmark in BENCHMARKS)}",
+    )
+    parser.add_argument("--output", type=Path, help="Path to save the results JSON")
+    parser.add_argument(
+        "--compare", type=Path, help="Path to the results JSON of a previous run"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_REGRESSION_THRESHOLD,
+        help="The slowdown ratio which is considered as a regression",
+    )
+    parsed_args = parser.parse_args(args)
+
+    logging_setup(console_log_threshold="INFO")
+    results = run_benchmarks(
+        parse_shape(parsed_args.packs, parsed_args.shape),
+        rounds=parsed_args.rounds,
+        only=parsed_args.only.split(",") if parsed_args.only else None,
+    )
+    if parsed_args.output:
+        parsed_args.output.write_text(json.dumps(results, indent=4))
+        logger.info(f"Saved the results to {parsed_args.output}")
+
+    if parsed_args.compare:
+        baseline = json.loads(parsed_args.compare.read_text())
+        if regressions := compare_results(baseline, results, parsed_args.threshold):
+            logger.error(f"Regressions found in: {', '.join(regressions)}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,420 @@
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List
+
+from TestSuite.pack import Pack
+from TestSuite.repo import Repo
+
+CONTENT_REMOTE_URL = "https://github.com/demisto/content.git"
+API_MODULE_NAME = "BenchmarkApiModule"
+
+API_MODULE_CODE = """from CommonServerPython import *
+
+
+class BenchmarkClient(BaseClient):
+    def get_items(self, limit: int) -> list:
+        return self._http_request("GET", "/items", params={"limit": limit})
+"""
+
+INTEGRATION_CODE_HEADER = """import demistomock as demisto  # noqa: F401
+from CommonServerPython import *  # noqa: F401
+
+"""
+
+COMMAND_FUNCTION = '''
+
+def {function_name}(client, args: dict) -> CommandResults:
+    """Returns the {command_name} items."""
+    items = client.get_items(limit=arg_to_number(args.get("limit")) or 50)
+    return CommandResults(outputs_prefix="{context_prefix}", outputs=items)
+'''
+
+
+@dataclass
+class RepoShape:
+    """The shape of a synthetic content repository, the counts are per pack unless stated otherwise."""
+
+    packs: int = 10
+    integrations: int = 2
+    commands_per_integration: int = 10
+    scripts: int = 2
+    playbooks: int = 2
+    tasks_per_playbook: int = 30
+    incident_fields: int = 5
+    layouts: int = 1
+    release_notes: int = 3
+    # whether the integrations import an API module (from an additional ApiModules pack)
+    api_module_imports: bool = True
+
+
+def _uuid(*parts: Any) -> str:
+    """A deterministic UUID, so the generated repository is the same between runs."""
+    return str(uuid.uuid5(uuid.NAMESPACE_OID, "/".join(map(str, parts))))
+
+
+def integration_yml(name: str, commands: int) -> Dict[str, Any]:
+    return {
+        "commonfields": {"id": name, "version": -1},
+        "name": name,
+        "display": name,
+        "description": f"Collects the items of the {name} service.",
+        "category": "Utilities",
+        "fromversion": "6.10.0",
+        "configuration": [
+            {
+                "display": "Server URL",
+                "name": "url",
+                "type": 0,
+                "required": True,
+                "section": "Connect",
+            },
+            {
+                "display": "API Key",
+                "name": "credentials",
+                "type": 9,
+                "required": True,
+                "section": "Connect",
+            },
+        ],
+        "script": {
+            "type": "python",
+            "subtype": "python3",
+            "script": "",
+            "dockerimage": "demisto/python3:3.10.13.83255",
+            "commands": [
+                {
+                    "name": f"{name.lower()}-get-items-{index}",
+                    "description": f"Gets the items of type {index}.",
+                    "arguments": [
+                        {
+                            "name": "limit",
+                            "description": "The maximum number of items to return.",
+                            "defaultValue": "50",
+                        },
+                        {
+                            "name": "item_id",
+                            "description": "The ID of the item.",
+                            "isArray": True,
+                        },
+                    ],
+                    "outputs": [
+                        {
+                            "contextPath": f"{name}.Item{index}.{field}",
+                            "description": f"The {field} of the item.",
+                            "type": "String",
+                        }
+                        for field in ("ID", "Name", "Severity", "Created")
+                    ],
+                }
+                for index in range(commands)
+            ],
+        },
+    }
+
+
+def integration_code(name: str, commands: int, api_module_imports: bool) -> str:
+    code = INTEGRATION_CODE_HEADER
+    for index in range(commands):
+        code += COMMAND_FUNCTION.format(
+            function_name=f"get_items_{index}_command",
+            command_name=f"{name.lower()}-get-items-{index}",
+            context_prefix=f"{name}.Item{index}",
+        )
+    code += "\n\ndef main():\n    pass\n"
+    if api_module_imports:
+        code += f"\n\nfrom {API_MODULE_NAME} import *  # noqa: E402\n"
+    code += '\n\nif __name__ in ("__main__", "__builtin__", "builtins"):\n    main()\n'
+    return code
+
+
+def playbook_task(
+    task_id: int, playbook_name: str, script: str, next_task: bool
+) -> Dict[str, Any]:
+    task_uuid = _uuid(playbook_name, task_id)
+    return {
+        "id": str(task_id),
+        "taskid": task_uuid,
+        "type": "regular",
+        "task": {
+            "id": task_uuid,
+            "version": -1,
+            "name": f"Run {script} #{task_id}",
+            "description": f"Runs {script} on the incident.",
+            "scriptName": script,
+            "type": "regular",
+            "iscommand": False,
+            "brand": "",
+        },
+        "scriptarguments": {"value": {"simple": "${incident.id}"}},
+        "nexttasks": {"#none#": [str(task_id + 1)]} if next_task else {},
+        "separatecontext": False,
+        "view": f'{{\n  "position": {{\n    "x": 50,\n    "y": {task_id * 150}\n  }}\n}}',
+        "note": False,
+        "timertriggers": [],
+        "ignoreworker": False,
+        "skipunavailable": False,
+        "quietmode": 0,
+    }
+
+
+def playbook_yml(name: str, tasks: int, scripts: List[str]) -> Dict[str, Any]:
+    start_uuid = _uuid(name, "start")
+    playbook_tasks = {
+        "0": {
+            "id": "0",
+            "taskid": start_uuid,
+            "type": "start",
+            "task": {
+                "id": start_uuid,
+                "version": -1,
+                "name": "",
+                "iscommand": False,
+                "brand": "",
+                "description": "",
+            },
+            "nexttasks": {"#none#": ["1"]} if tasks else {},
+            "separatecontext": False,
+            "view": '{\n  "position": {\n    "x": 50,\n    "y": 0\n  }\n}',
+            "note": False,
+            "timertriggers": [],
+            "ignoreworker": False,
+            "skipunavailable": False,
+            "quietmode": 0,
+        }
+    }
+    for task_id in range(1, tasks + 1):
+        playbook_tasks[str(task_id)] = playbook_task(
+            task_id,
+            name,
+            scripts[task_id % len(scripts)] if scripts else "Print",
+            next_task=task_id < tasks,
+        )
+    return {
+        "id": name,
+        "version": -1,
+        "name": name,
+        "description": f"Investigates the incidents of {name}.",
+        "starttaskid": "0",
+        "tasks": playbook_tasks,
+        "view": '{\n  "linkLabelsPosition": {},\n  "paper": {\n    "dimensions": {\n      "height": 200,\n'
+        '      "width": 380,\n      "x": 50,\n      "y": 50\n    }\n  }\n}',
+        "inputs": [],
+        "outputs": [],
+        "fromversion": "6.10.0",
+        "tests": ["No tests"],
+    }
+
+
+def incident_field(name: str, pack_name: str) -> Dict[str, Any]:
+    cli_name = f"{pack_name}{name}".lower()
+    return {
+        "id": f"incident_{cli_name}",
+        "name": f"{pack_name} {name}",
+        "cliName": cli_name,
+        "type": "shortText",
+        "description": f"The {name} of the incident.",
+        "associatedToAll": True,
+        "version": -1,
+        "fromVersion": "6.10.0",
+        "content": True,
+        "group": 0,
+    }
+
+
+def layout(name: str, fields: List[str]) -> Dict[str, Any]:
+    return {
+        "id": name,
+        "name": name,
+        "group": "incident",
+        "version": -1,
+        "fromVersion": "6.10.0",
+        "detailsV2": {
+            "tabs": [
+                {
+                    "id": "summary",
+                    "name": "Summary",
+                    "type": "summary",
+                    "sections": [
+                        {
+                            "name": "Details",
+                            "type": "",
+                            "items": [
+                                {"fieldId": field, "id": _uuid(name, field)}
+                                for field in fields
+                            ],
+                        }
+                    ],
+                }
+            ]
+        },
+    }
+
+
+def create_api_modules_pack(repo: Repo) -> Pack:
+    pack = repo.create_pack("ApiModules")
+    pack.pack_metadata.update({"support": "xsoar", "hidden": True})
+    pack.create_script(API_MODULE_NAME, code=API_MODULE_CODE)
+    return pack
+
+
+def create_synthetic_pack(repo: Repo, pack_index: int, shape: RepoShape) -> Pack:
+    pack_name = f"BenchmarkPack{pack_index}"
+    pack = repo.create_pack(pack_name)
+    pack.pack_metadata.update(
+        {
+            "name": pack_name,
+            "description": f"Benchmark pack number {pack_index}.",
+            "support": "xsoar",
+            "currentVersion": f"1.0.{shape.release_notes}",
+            "marketplaces": ["xsoar", "marketplacev2"],
+        }
+    )
+
+    for index in range(shape.integrations):
+        name = f"{pack_name}Integration{index}"
+        pack.create_integration(
+            name,
+            code=integration_code(
+                name, shape.commands_per_integration, shape.api_module_imports
+            ),
+            yml=integration_yml(name, shape.commands_per_integration),
+            readme=f"Collects the items of the {name} service.\n",
+            description=f"## {name}\nUse an API key to connect.\n",
+        )
+
+    scripts = []
+    for index in range(shape.scripts):
+        name = f"{pack_name}Script{index}"
+        pack.create_script(name, code=f"demisto.results('{name}')\n")
+        scripts.append(name)
+
+    for index in range(shape.playbooks):
+        name = f"{pack_name} Playbook {index}"
+        pack.create_playbook(
+            name,
+            yml=playbook_yml(name, shape.tasks_per_playbook, scripts),
+            readme=f"Investigates the incidents of {name}.\n",
+        )
+
+    fields = []
+    for index in range(shape.incident_fields):
+        content = incident_field(f"Field{index}", pack_name)
+        pack.create_incident_field(f"{pack_name}Field{index}", content=content)
+        fields.append(content["id"])
+
+    for index in range(shape.layouts):
+        name = f"{pack_name} Layout {index}"
+        pack.create_layoutcontainer(name, content=layout(name, fields))
+
+    for index in range(1, shape.release_notes + 1):
+        pack.create_release_notes(
+            f"1_0_{index}",
+            content=f"\n#### Integrations\n\n##### {pack_name}Integration0\n\n"
+            f"- Updated the Docker image to: *demisto/python3:3.10.13.{index}*.\n",
+        )
+    return pack
+
+
+def create_synthetic_repo(path: Path, shape: RepoShape) -> Repo:
+    """Creates a content repository of the given shape, using the TestSuite builders.
+
+    Args:
+        path: An empty directory to create the repository in.
+        shape: The number of packs and the content of each one of them.
+
+    Returns:
+        Repo: The created repository, with all of its content committed to git.
+    """
+    repo = Repo(path)
+    if shape.api_module_imports:
+        create_api_modules_pack(repo)
+    for pack_index in range(shape.packs):
+        create_synthetic_pack(repo, pack_index, shape)
+    repo.init_git()
+    # the commands look for the content repository remote
+    repo.git_util.repo.create_remote("origin", CONTENT_REMOTE_URL)  # type: ignore[union-attr]
+    return repo
+
+
+def openapi_schema(index: int, schemas: int, depth: int) -> Dict[str, Any]:
+    """
+    A component schema with a few fields, a nested object, and references to the next schema of its group,
+    which are nested up to `depth` schemas deep. The first schema of each group references itself as its parent.
+    """
+    properties: Dict[str, Any] = {
+        "id": {"type": "string", "description": "The ID of the item."},
+        f"name{index}": {"type": "string", "description": "The name of the item."},
+        "count": {"type": "integer"},
+        "enabled": {"type": "boolean"},
+        "details": {
+            "type": "object",
+            "properties": {
+                f"created{index}": {"type": "string"},
+                "level": {"type": "integer"},
+            },
+        },
+    }
+    if index % depth == 0:
+        properties["parent"] = {
+            "type": "object",
+            "$ref": f"#/definitions/Schema{index}",
+        }
+    if index % depth != depth - 1 and index + 1 < schemas:
+        properties[f"child{index}"] = {
+            "type": "object",
+            "$ref": f"#/definitions/Schema{index + 1}",
+        }
+        properties[f"children{index}"] = {
+            "type": "array",
+            "items": {"$ref": f"#/definitions/Schema{index + 1}"},
+        }
+    return {"type": "object", "required": ["id"], "properties": properties}
+
+
+def openapi_spec(operations: int, schemas: int, depth: int = 4) -> Dict[str, Any]:
+    """A swagger 2.0 specification of a service with `operations` endpoints, which share `schemas` component schemas."""
+    paths = {}
+    for index in range(operations):
+        ref = f"#/definitions/Schema{index % schemas}"
+        paths[f"/items{index}/{{id}}"] = {
+            "get": {
+                "operationId": f"getItem{index}",
+                "summary": f"Gets the item {index}.",
+                "parameters": [
+                    {"name": "id", "in": "path", "required": True, "type": "string"},
+                    {"name": "limit", "in": "query", "type": "integer"},
+                ],
+                "responses": {"200": {"description": "OK", "schema": {"$ref": ref}}},
+            },
+            "post": {
+                "operationId": f"updateItem{index}",
+                "summary": f"Updates the item {index}.",
+                "parameters": [
+                    {"name": "id", "in": "path", "required": True, "type": "string"},
+                    {"name": "body", "in": "body", "schema": {"$ref": ref}},
+                ],
+                "responses": {
+                    "200": {
+                        "description": "OK",
+                        "schema": {
+                            "type": "object",
+                            "properties": {
+                                "data": {"type": "array", "items": {"$ref": ref}}
+                            },
+                        },
+                    }
+                },
+            },
+        }
+    return {
+        "swagger": "2.0",
+        "info": {"title": "Benchmark Service", "description": "A synthetic service."},
+        "host": "api.example.com",
+        "basePath": "/v1",
+        "paths": paths,
+        "definitions": {
+            f"Schema{index}": openapi_schema(index, schemas, depth)
+            for index in range(schemas)
+        },
+    }
@@ -0,0 +1,102 @@
+from pathlib import Path
+
+import pytest
+
+from benchmarks.benchmark import compare_results, parse_shape
+from benchmarks.synthetic_repo import RepoShape, create_synthetic_repo
+
+TINY_SHAPE = RepoShape(
+    packs=2,
+    integrations=1,
+    commands_per_integration=2,
+    scripts=1,
+    playbooks=1,
+    tasks_per_playbook=3,
+    incident_fields=2,
+    layouts=1,
+    release_notes=2,
+)
+
+
+def test_create_synthetic_repo(tmp_path):
+    """
+    Given:
+        - a tiny repository shape
+
+    When:
+        - creating a synthetic repository
+
+    Then:
+        - make sure it has the benchmark packs and the API modules pack, with the content of the shape
+        - make sure everything is committed to git
+    """
+    repo = create_synthetic_repo(tmp_path, TINY_SHAPE)
+
+    assert sorted(Path(pack.path).name for pack in repo.packs) == [
+        "ApiModules",
+        "BenchmarkPack0",
+        "BenchmarkPack1",
+    ]
+    pack_path = Path(repo.path, "Packs", "BenchmarkPack0")
+    assert len(list((pack_path / "Integrations").iterdir())) == 1
+    assert len(list((pack_path / "Playbooks").glob("*.yml"))) == 1
+    assert len(list((pack_path / "ReleaseNotes").iterdir())) == 2
+    assert (
+        "from BenchmarkApiModule import *"
+        in (
+            pack_path
+            / "Integrations"
+            / "BenchmarkPack0Integration0"
+            / "BenchmarkPack0Integration0.py"
+        ).read_text()
+    )
+    assert not repo.git_util.repo.is_dirty(untracked_files=True)
+
+
+def test_compare_results():
+    """
+    Given:
+        - the results of a baseline run and a current run, one benchmark failed in the current run
+
+    When:
+        - comparing them with a threshold of 20%
+
+    Then:
+        - make sure only the benchmark which is slower by more than the threshold is reported
+    """
+    baseline = {
+        "shape": {},
+        "results": {"fast": {"min": 1.0}, "slow": {"min": 1.0}, "failed": {"min": 1.0}},
+    }
+    current = {
+        "shape": {},
+        "results": {
+            "fast": {"min": 1.1},
+            "slow": {"min": 1.5},
+            "failed": {"error": "e"},
+        },
+    }
+
+    assert compare_results(baseline, current, threshold=0.2) == ["slow"]
+
+
+def test_parse_shape():
+    """
+    Given:
+        - overrides of the repository shape
+
+    When:
+        - parsing them
+
+    Then:
+        - make sure the values are converted to the types of the shape, and unknown keys are rejected
+    """
+    shape = parse_shape(3, ["tasks_per_playbook=100", "api_module_imports=false"])
+
+    assert (shape.packs, shape.tasks_per_playbook, shape.api_module_imports) == (
+        3,
+        100,
+        False,
+    )
+    with pytest.raises(ValueError):
+        parse_shape(3, ["unknown=1"])
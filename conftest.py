@@ -168,3 +168,19 @@ def mock_update_id_set_cpu_count() -> Generator:
 @pytest.fixture(autouse=True)
 def clear_cache():
     tools.get_file.cache_clear()
+
+
+@pytest.fixture(autouse=True)
+def disable_dockerhub_cache(monkeypatch):
+    """
+    Responses of dockerhub are cached on disk between runs, tests should never be affected by each other's responses.
+    """
+    monkeypatch.setenv("DEMISTO_SDK_DISABLE_DOCKERHUB_CACHE", "true")
+
+
+@pytest.fixture(autouse=True)
+def disable_unified_output_cache(monkeypatch):
+    """
+    Unified outputs are cached on disk between runs, tests should always unify the items they prepare.
+    """
+    monkeypatch.setenv("DEMISTO_SDK_DISABLE_UNIFIED_OUTPUT_CACHE", "true")
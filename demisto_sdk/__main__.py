@@ -51,6 +51,7 @@ from demisto_sdk.commands.common.tools import (
     is_sdk_defined_working_offline,
     parse_marketplace_kwargs,
 )
+from demisto_sdk.commands.common.tracing import TRACE_FILE_ENV_VAR, tracing
 from demisto_sdk.commands.content_graph.commands.create import create
 from demisto_sdk.commands.content_graph.commands.get_dependencies import (
     get_dependencies,
@@ -64,6 +65,9 @@ from demisto_sdk.commands.generate_modeling_rules import generate_modeling_rules
 from demisto_sdk.commands.prepare_content.prepare_upload_manager import (
     PrepareUploadManager,
 )
+from demisto_sdk.commands.prepare_content.unified_output_cache import (
+    UNIFIED_OUTPUT_CACHE,
+)
 from demisto_sdk.commands.setup_env.setup_environment import IDEType
 from demisto_sdk.commands.split.ymlsplitter import YmlSplitter
 from demisto_sdk.commands.test_content.test_modeling_rule import (
@@ -165,6 +169,11 @@ def logging_setup_decorator(func, *args, **kwargs):
         " Possible values: DEBUG, INFO, WARNING, ERROR.",
     )
     @click.option("--log-file-path", help="Path to save log files onto.")
+    @click.option(
+        "--trace-file",
+        help="Path to save a trace of the command onto, in the Chrome trace event format (can be viewed with "
+        f"https://ui.perfetto.dev). Can also be set by the {TRACE_FILE_ENV_VAR} environment variable.",
+    )
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
         logging_setup(
@@ -174,7 +183,9 @@ def logging_setup_decorator(func, *args, **kwargs):
         )
 
         handle_deprecated_args(get_context_arg(args).args)
-        return func(*args, **kwargs)
+        trace_file = kwargs.pop("trace_file", None)
+        with tracing(trace_file, name=get_context_arg(args).command_path):
+            return func(*args, **kwargs)
 
     return wrapper
 
@@ -503,6 +514,7 @@ def prepare_content(ctx, **kwargs):
             generic_module_unifier.merge_generic_module_with_its_dashboards()
         else:
             PrepareUploadManager.prepare_for_upload(**kwargs)
+    UNIFIED_OUTPUT_CACHE.log_stats()
     return 0
 
 
@@ -1393,6 +1405,13 @@ def coverage_analyze(ctx, **kwargs):
     is_flag=True,
     default=True,
 )
+@click.option(
+    "-mp",
+    "--multiprocessing",
+    help="Format the files of different packs in parallel processes, requires -y or -n.",
+    is_flag=True,
+    default=False,
+)
 @click.argument("file_paths", nargs=-1, type=click.Path(exists=True, resolve_path=True))
 @click.pass_context
 @logging_setup_decorator
@@ -1441,6 +1460,7 @@ def format(
             add_tests=add_tests,
             id_set_path=id_set_path,
             use_graph=kwargs.get("graph", True),
+            multiprocessing=kwargs.get("multiprocessing", False),
         )
 
 
@@ -2490,6 +2510,13 @@ def merge_id_sets(ctx, **kwargs):
     help="If new version contains breaking changes.",
     is_flag=True,
 )
+@click.option(
+    "--batch",
+    help="Read the git data of all of the changed packs at once and update their release notes in parallel. "
+    "Useful when many packs are changed, e.g. by a change of an API module.",
+    is_flag=True,
+    default=False,
+)
 @click.pass_context
 @logging_setup_decorator
 def update_release_notes(ctx, **kwargs):
@@ -2527,6 +2554,7 @@ def update_release_notes(ctx, **kwargs):
             prev_ver=kwargs.get("prev_ver"),
             is_force=kwargs.get("force", False),
             is_bc=kwargs.get("breaking_changes", False),
+            batch=kwargs.get("batch", False),
         )
         rn_mng.manage_rn_update()
         sys.exit(0)
@@ -3087,6 +3115,13 @@ def test_content(ctx, **kwargs):
     "content directory.",
     default=True,
 )
+@click.option(
+    "-mp",
+    "--multiprocessing",
+    is_flag=True,
+    help="Review the files in parallel processes.",
+    default=False,
+)
 @click.pass_context
 @logging_setup_decorator
 def doc_review(ctx, **kwargs):
@@ -3105,6 +3140,7 @@ def doc_review(ctx, **kwargs):
         release_notes_only=kwargs.get("release_notes"),
         xsoar_only=kwargs.get("xsoar_only"),
         load_known_words_from_pack=kwargs.get("use_packs_known_words"),
+        multiprocessing=kwargs.get("multiprocessing"),
     )
     result = doc_reviewer.run_doc_review()
     if result:
@@ -3125,20 +3161,34 @@ def doc_review(ctx, **kwargs):
     "--new",
     type=str,
     help="The path to the new version of the integration",
-    required=True,
 )
 @click.option(
     "-o",
     "--old",
     type=str,
     help="The path to the old version of the integration",
-    required=True,
 )
 @click.option(
     "--docs-format",
     is_flag=True,
     help="Whether output should be in the format for the version differences section in README.",
 )
+@click.option(
+    "--old-ref",
+    type=str,
+    help="A git ref of the old versions of the integrations. Checks all of the integrations which were changed "
+    "between --old-ref and --new-ref, instead of --old and --new.",
+)
+@click.option(
+    "--new-ref",
+    type=str,
+    help="A git ref of the new versions of the integrations, the current commit by default.",
+)
+@click.option(
+    "--output",
+    type=click.Path(dir_okay=False),
+    help="The path to write the report of all of the changed integrations to, when using --old-ref.",
+)
 @click.pass_context
 @logging_setup_decorator
 def integration_diff(ctx, **kwargs):
@@ -3147,14 +3197,28 @@ def integration_diff(ctx, **kwargs):
     """
     from demisto_sdk.commands.integration_diff.integration_diff_detector import (
         IntegrationDiffDetector,
+        check_changed_integrations,
     )
 
-    integration_diff_detector = IntegrationDiffDetector(
-        new=kwargs.get("new", ""),
-        old=kwargs.get("old", ""),
-        docs_format=kwargs.get("docs_format", False),
-    )
-    result = integration_diff_detector.check_different()
+    if kwargs.get("old_ref"):
+        result = check_changed_integrations(
+            old_ref=kwargs["old_ref"],
+            new_ref=kwargs.get("new_ref") or "HEAD",
+            docs_format=kwargs.get("docs_format", False),
+            output=kwargs.get("output"),
+        )
+
+    elif not kwargs.get("new") or not kwargs.get("old"):
+        logger.info("[red]Either --new and --old, or --old-ref are required.[/red]")
+        sys.exit(1)
+
+    else:
+        integration_diff_detector = IntegrationDiffDetector(
+            new=kwargs.get("new", ""),
+            old=kwargs.get("old", ""),
+            docs_format=kwargs.get("docs_format", False),
+        )
+        result = integration_diff_detector.check_different()
 
     if result:
         sys.exit(0)
@@ -3377,6 +3441,7 @@ def create_content_graph(
         marketplace=marketplace,
         no_dependencies=no_dependencies,
         output_path=output_path,
+        trace_file=None,  # traced by the deprecated command itself
         **kwargs,
     )
 
@@ -3459,6 +3524,7 @@ def update_content_graph(
         packs_to_update=packs,
         no_dependencies=no_dependencies,
         output_path=output_path,
+        trace_file=None,  # traced by the deprecated command itself
         **kwargs,
     )
 
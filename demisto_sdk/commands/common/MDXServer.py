@@ -1,13 +1,20 @@
+import os
+import signal
 import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Callable, Optional
+from typing import Callable, Dict, List, Optional
 
 import docker
 import docker.errors
 import docker.models.containers
+import requests
+from more_itertools import chunked
+from requests.adapters import HTTPAdapter
 
-from demisto_sdk.commands.common.constants import MDX_SERVER_DOCKER_IMAGE
+from demisto_sdk.commands.common.constants import CACHE_DIR, MDX_SERVER_DOCKER_IMAGE
 from demisto_sdk.commands.common.docker_helper import (
     get_docker,
     init_global_docker_client,
@@ -22,6 +29,18 @@ _SERVER_SCRIPT_NAME = "mdx-parse-server.js"
 _MDX_SERVER_PROCESS: Optional[subprocess.Popen] = None
 _RUNNING_CONTAINER_IMAGE: Optional[docker.models.containers.Container] = None
 
+MDX_SERVER_URL = "http://localhost:6161"
+MDX_BATCH_SIZE = 50
+MDX_BATCH_WORKERS = 4
+
+# when set, the local server is kept alive between runs and reused by the following ones
+PERSISTENT_MDX_SERVER = "DEMISTO_SDK_PERSISTENT_MDX_SERVER"
+MDX_SERVER_PID_FILE = CACHE_DIR / "mdx_server.pid"
+MDX_SERVER_LOG_FILE = CACHE_DIR / "mdx_server.log"
+# seconds after which an idle persistent server exits
+PERSISTENT_MDX_SERVER_IDLE_TIMEOUT = 3600
+PERSISTENT_MDX_SERVER_STARTUP_TIMEOUT = 30
+
 
 def server_script_path():
     """The path to the script that runs the mdxserver
@@ -162,3 +181,135 @@ def terminate_process(process):
     if process:
         logger.debug("Stopping local mdx server")
         process.terminate()
+
+
+def mdx_server_health() -> Optional[dict]:
+    """
+    Returns the health response of the server, None if it is not up or does not support health checks.
+    """
+    try:
+        response = requests.get(f"{MDX_SERVER_URL}/health", timeout=5)
+        if response.status_code == 200:
+            health = response.json()
+            if isinstance(health, dict) and health.get("status") == "ok":
+                return health
+    except Exception as error:
+        logger.debug(f"MDX server health check failed: {error}")
+    return None
+
+
+def _read_persistent_server_pid() -> Optional[int]:
+    try:
+        pid = int(MDX_SERVER_PID_FILE.read_text().strip())
+        os.kill(pid, 0)
+        return pid
+    except (OSError, ValueError):
+        return None
+
+
+def start_persistent_local_MDX_server() -> bool:
+    """
+    Starts a local node server which is kept alive after the run and is reused by the following runs.
+    The server is detached from the current process, its pid is kept in MDX_SERVER_PID_FILE and it exits by itself
+    once it is idle for PERSISTENT_MDX_SERVER_IDLE_TIMEOUT seconds.
+
+    Returns:
+        bool: whether the server is up.
+    """
+    health = mdx_server_health()
+    if health and health.get("pid") == _read_persistent_server_pid():
+        logger.debug(f"Reusing the persistent mdx server (pid {health['pid']})")
+        return True
+
+    logger.debug("Starting a persistent local mdx server")
+    MDX_SERVER_PID_FILE.parent.mkdir(parents=True, exist_ok=True)
+    with open(MDX_SERVER_LOG_FILE, "w") as log_file:
+        process = subprocess.Popen(
+            ["node", str(server_script_path())],
+            stdout=log_file,
+            stderr=subprocess.STDOUT,
+            env={
+                **os.environ,
+                "MDX_SERVER_IDLE_TIMEOUT": str(PERSISTENT_MDX_SERVER_IDLE_TIMEOUT),
+            },
+            start_new_session=True,
+        )
+    MDX_SERVER_PID_FILE.write_text(str(process.pid))
+
+    deadline = time.monotonic() + PERSISTENT_MDX_SERVER_STARTUP_TIMEOUT
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            break
+        if mdx_server_health():
+            logger.debug(f"Started a persistent mdx server (pid {process.pid})")
+            return True
+        time.sleep(0.2)
+
+    logger.debug(
+        f"The persistent mdx server could not be started, see {MDX_SERVER_LOG_FILE}"
+    )
+    stop_persistent_MDX_server()
+    return False
+
+
+def stop_persistent_MDX_server() -> None:
+    if pid := _read_persistent_server_pid():
+        logger.debug(f"Stopping the persistent mdx server (pid {pid})")
+        try:
+            os.kill(pid, signal.SIGTERM)
+        except OSError:
+            pass
+    MDX_SERVER_PID_FILE.unlink(missing_ok=True)
+
+
+def _validate_mdx_batch(
+    session: requests.Session, documents: List[Dict[str, str]]
+) -> Optional[Dict[str, Optional[str]]]:
+    response = session.post(
+        f"{MDX_SERVER_URL}/batch", json={"documents": documents}, timeout=120
+    )
+    try:
+        results = response.json()["results"]
+    except (ValueError, KeyError, TypeError):
+        # an older server, which parses the whole body as a single document
+        return None
+    return {result["id"]: result["error"] for result in results}
+
+
+def validate_mdx_batch(
+    documents: Dict[str, str],
+    batch_size: int = MDX_BATCH_SIZE,
+    max_workers: int = MDX_BATCH_WORKERS,
+) -> Optional[Dict[str, Optional[str]]]:
+    """
+    Parses many documents using the batch endpoint of the server, the batches are sent concurrently.
+
+    Args:
+        documents: the content of each document, by its ID
+        batch_size: the number of documents per request
+        max_workers: the number of requests which are sent concurrently
+
+    Returns:
+        The parse failure of each document by its ID (None for valid documents),
+        None if the server does not support batches, and the documents should be parsed one by one.
+    """
+    if not documents:
+        return {}
+    batches = [
+        [{"id": id_, "content": documents[id_]} for id_ in batch]
+        for batch in chunked(documents, batch_size)
+    ]
+    with requests.Session() as session:
+        # the session is shared between the threads, so the connections are kept alive between batches
+        session.mount("http://", HTTPAdapter(pool_maxsize=max_workers))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            batch_results = list(
+                executor.map(lambda batch: _validate_mdx_batch(session, batch), batches)
+            )
+
+    results: Dict[str, Optional[str]] = {}
+    for batch_result in batch_results:
+        if batch_result is None:
+            return None
+        results.update(batch_result)
+    return results
@@ -1,3 +1,5 @@
+from typing import Any
+
 import requests
 
 
@@ -14,3 +16,21 @@ class UnHealthyServer(RuntimeError):
 class InvalidServerType(ValueError):
     def __init__(self, server: str, server_type: str):
         super().__init__(f"The server {server} is not {server_type} server")
+
+
+class PollingTimeout(TimeoutError):
+    def __init__(self, incident_id: str, last_state: Any, timeout: float):
+        self.incident_id = incident_id
+        self.last_state = last_state
+        super().__init__(
+            f"Incident {incident_id} did not reach the expected state within {timeout} seconds, last state is {last_state}"
+        )
+
+
+class PollingFetchError(RuntimeError):
+    def __init__(self, incident_id: str, error: BaseException, failures: int):
+        self.incident_id = incident_id
+        self.error = error
+        super().__init__(
+            f"Could not fetch the state of incident {incident_id} {failures} consecutive times, last error: {error}"
+        )
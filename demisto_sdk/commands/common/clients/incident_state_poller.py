@@ -0,0 +1,277 @@
+import asyncio
+import concurrent.futures
+import threading
+import time
+from collections import defaultdict
+from typing import Any, Callable, Dict, List, Optional
+
+from more_itertools import chunked
+
+from demisto_sdk.commands.common.clients.errors import PollingFetchError, PollingTimeout
+from demisto_sdk.commands.common.logger import logger
+
+# receives a batch of incident IDs and returns the current state of each one of them,
+# incidents which are missing from the returned mapping keep their previous state,
+# and incidents which are mapped to an exception are considered as incidents that could not be fetched.
+StateFetcher = Callable[[List[str]], Dict[str, Any]]
+
+
+class _Waiter:
+    def __init__(
+        self,
+        incident_id: str,
+        fetcher: StateFetcher,
+        is_final: Callable[[Any], bool],
+        deadline: float,
+        timeout: float,
+        future: "asyncio.Future[Any]",
+    ):
+        self.incident_id = incident_id
+        self.fetcher = fetcher
+        self.is_final = is_final
+        self.deadline = deadline
+        self.timeout = timeout
+        self.future = future
+        self.last_state: Any = None
+        self.fetch_failures = 0
+
+
+class IncidentStatePoller:
+    """
+    Polls the states of many in-flight incidents from a single asyncio event-loop.
+
+    Every tracked incident is registered together with a fetcher, all the incidents that share the same fetcher
+    are queried together (in batches of `batch_size`) on each polling round instead of each caller sleeping
+    and querying on its own. The interval between rounds starts at `min_interval` and grows by `backoff_factor`
+    (up to `max_interval`) as long as none of the tracked incidents changed its state, and is reset once a state
+    changes or a new incident is tracked.
+    Incidents which could not be fetched on `max_fetch_failures` consecutive rounds (either the fetcher raised
+    or mapped them to an exception) are failed with PollingFetchError, rather than waiting until their timeout.
+
+    The event-loop runs in a daemon thread which is started on demand, so the poller can be shared
+    between threads using `track`, or awaited directly from coroutines of a single event-loop using `wait_for`.
+    """
+
+    def __init__(
+        self,
+        min_interval: float = 1,
+        max_interval: float = 30,
+        backoff_factor: float = 2,
+        batch_size: int = 100,
+        max_fetch_failures: int = 3,
+    ):
+        if min_interval <= 0 or max_interval < min_interval:
+            raise ValueError(
+                "min_interval must be larger than 0 and smaller or equal to max_interval"
+            )
+        if backoff_factor < 1:
+            raise ValueError("backoff_factor must be larger or equal to 1")
+        if max_fetch_failures < 1:
+            raise ValueError("max_fetch_failures must be larger or equal to 1")
+
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff_factor = backoff_factor
+        self.batch_size = batch_size
+        self.max_fetch_failures = max_fetch_failures
+        self.requests_count = 0
+
+        self._waiters: List[_Waiter] = []
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._thread_lock = threading.Lock()
+        self._wakeup: Optional[asyncio.Event] = None
+        self._polling_task: Optional["asyncio.Task[None]"] = None
+
+    def __enter__(self) -> "IncidentStatePoller":
+        return self
+
+    def __exit__(self, *args):
+        self.stop()
+
+    def _ensure_started(self) -> asyncio.AbstractEventLoop:
+        with self._thread_lock:
+            if not self._loop or not self._thread or not self._thread.is_alive():
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(
+                    target=self._loop.run_forever,
+                    name="incident-state-poller",
+                    daemon=True,
+                )
+                self._thread.start()
+            return self._loop
+
+    def stop(self):
+        """
+        Stops the poller event-loop, incidents which are still tracked are cancelled.
+        """
+        with self._thread_lock:
+            if not self._loop or not self._thread:
+                return
+
+            async def _cancel_waiters():
+                for waiter in self._waiters:
+                    waiter.future.cancel()
+                self._waiters.clear()
+                if self._polling_task:
+                    self._polling_task.cancel()
+
+            asyncio.run_coroutine_threadsafe(_cancel_waiters(), self._loop).result()
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            self._loop.close()
+            self._loop = self._thread = self._polling_task = self._wakeup = None
+
+    def track(
+        self,
+        incident_id: str,
+        fetcher: StateFetcher,
+        is_final: Callable[[Any], bool],
+        timeout: float,
+    ) -> "concurrent.futures.Future[Any]":
+        """
+        Starts tracking an incident, can be called from any thread.
+
+        Args:
+            incident_id: the incident ID to poll its state
+            fetcher: function which retrieves the states of a batch of incidents
+            is_final: whether a state is considered to be the final state of the incident
+            timeout: how long (in seconds) to poll until the incident reaches a final state
+
+        Returns:
+            future which is resolved with the final state of the incident,
+            raises PollingTimeout in case the incident did not reach a final state on time,
+            or PollingFetchError in case its state could not be fetched on too many consecutive rounds.
+        """
+        return asyncio.run_coroutine_threadsafe(
+            self.wait_for(incident_id, fetcher, is_final=is_final, timeout=timeout),
+            self._ensure_started(),
+        )
+
+    async def wait_for(
+        self,
+        incident_id: str,
+        fetcher: StateFetcher,
+        is_final: Callable[[Any], bool],
+        timeout: float,
+    ) -> Any:
+        """
+        Waits until an incident reaches a final state, all the waits of the poller must run in the same event-loop.
+        """
+        if timeout <= 0:
+            raise ValueError("timeout argument must be larger than 0")
+
+        waiter = _Waiter(
+            incident_id,
+            fetcher=fetcher,
+            is_final=is_final,
+            deadline=time.monotonic() + timeout,
+            timeout=timeout,
+            future=asyncio.get_running_loop().create_future(),
+        )
+        self._waiters.append(waiter)
+
+        if not self._polling_task or self._polling_task.done():
+            self._wakeup = asyncio.Event()
+            self._polling_task = asyncio.create_task(self._poll())
+        else:
+            # a new incident resets the back-off so its first state is fetched as soon as possible
+            self._wakeup.set()  # type: ignore[union-attr]
+
+        return await waiter.future
+
+    async def _poll(self):
+        interval = self.min_interval
+        while self._waiters:
+            # never sleep past the closest deadline, so timed-out incidents are reported on time
+            closest_deadline = min(waiter.deadline for waiter in self._waiters)
+            sleep_time = max(min(interval, closest_deadline - time.monotonic()), 0)
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=sleep_time)  # type: ignore[union-attr]
+                interval = self.min_interval
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()  # type: ignore[union-attr]
+
+            if await self._poll_round():
+                interval = self.min_interval
+            else:
+                interval = min(interval * self.backoff_factor, self.max_interval)
+
+    async def _poll_round(self) -> bool:
+        """
+        Queries the states of all the tracked incidents and resolves the ones that reached a final state.
+
+        Returns:
+            bool: whether any of the tracked incidents changed its state.
+        """
+        incidents_by_fetcher: Dict[StateFetcher, List[str]] = defaultdict(list)
+        for waiter in self._waiters:
+            if waiter.incident_id not in incidents_by_fetcher[waiter.fetcher]:
+                incidents_by_fetcher[waiter.fetcher].append(waiter.incident_id)
+
+        loop = asyncio.get_running_loop()
+        batches = [
+            (fetcher, batch)
+            for fetcher, incident_ids in incidents_by_fetcher.items()
+            for batch in chunked(incident_ids, self.batch_size)
+        ]
+        self.requests_count += len(batches)
+        results = await asyncio.gather(
+            *(loop.run_in_executor(None, fetcher, batch) for fetcher, batch in batches),
+            return_exceptions=True,
+        )
+
+        states: Dict[StateFetcher, Dict[str, Any]] = defaultdict(dict)
+        for (fetcher, batch), result in zip(batches, results):
+            if isinstance(result, BaseException):
+                logger.debug(
+                    f"Could not fetch the states of incidents {batch}: {result}"
+                )
+                result = dict.fromkeys(batch, result)
+            states[fetcher].update(result)
+
+        changed = False
+        now = time.monotonic()
+        for waiter in list(self._waiters):
+            if waiter.future.done():
+                # the caller cancelled the waiting
+                self._waiters.remove(waiter)
+                continue
+            fetched_states = states[waiter.fetcher]
+            if isinstance(
+                error := fetched_states.get(waiter.incident_id), BaseException
+            ):
+                waiter.fetch_failures += 1
+                if waiter.fetch_failures >= self.max_fetch_failures:
+                    fetch_error = PollingFetchError(
+                        waiter.incident_id,
+                        error=error,
+                        failures=waiter.fetch_failures,
+                    )
+                    fetch_error.__cause__ = error
+                    waiter.future.set_exception(fetch_error)
+                    self._waiters.remove(waiter)
+                    continue
+            elif waiter.incident_id in fetched_states:
+                waiter.fetch_failures = 0
+                state = fetched_states[waiter.incident_id]
+                if state != waiter.last_state:
+                    logger.debug(f"state of incident {waiter.incident_id} is {state}")
+                    changed = True
+                    waiter.last_state = state
+                if waiter.is_final(state):
+                    waiter.future.set_result(state)
+                    self._waiters.remove(waiter)
+                    continue
+            if now >= waiter.deadline:
+                waiter.future.set_exception(
+                    PollingTimeout(
+                        waiter.incident_id,
+                        last_state=waiter.last_state,
+                        timeout=waiter.timeout,
+                    )
+                )
+                self._waiters.remove(waiter)
+
+        return changed
@@ -0,0 +1,288 @@
+import asyncio
+from typing import Dict, List
+
+import pytest
+
+from demisto_sdk.commands.common.clients import XsoarClient, XsoarClientConfig
+from demisto_sdk.commands.common.clients.errors import (
+    PollingFetchError,
+    PollingTimeout,
+)
+from demisto_sdk.commands.common.clients.incident_state_poller import (
+    IncidentStatePoller,
+)
+from demisto_sdk.commands.common.constants import IncidentState
+
+
+class FakeIncidentsServer:
+    """
+    Fake server in which each incident advances one state on every search request that asks about it.
+    """
+
+    def __init__(self, incidents_states: Dict[str, List[str]]):
+        self.incidents_states = incidents_states
+        self.requests: List[List[str]] = []
+
+    def search(self, incident_ids: List[str]) -> Dict[str, str]:
+        self.requests.append(list(incident_ids))
+        states = {}
+        for incident_id in incident_ids:
+            if incident_id not in self.incidents_states:
+                continue
+            incident_states = self.incidents_states[incident_id]
+            states[incident_id] = (
+                incident_states.pop(0)
+                if len(incident_states) > 1
+                else incident_states[0]
+            )
+        return states
+
+
+def is_completed(state: str) -> bool:
+    return state == "completed"
+
+
+def test_track_many_incidents_in_batched_requests():
+    """
+    Given:
+        - 10 incidents that reach a final state after a different amount of polling rounds
+
+    When:
+        - tracking all of them with the same fetcher and a batch size of 4
+
+    Then:
+        - make sure all the futures are resolved with the final state
+        - make sure the incidents were queried in batches rather than in a request per incident
+    """
+    server = FakeIncidentsServer(
+        {str(i): ["inprogress"] * (i % 3) + ["completed"] for i in range(10)}
+    )
+    with IncidentStatePoller(
+        min_interval=0.01, max_interval=0.05, batch_size=4
+    ) as poller:
+        futures = [
+            poller.track(str(i), server.search, is_final=is_completed, timeout=5)
+            for i in range(10)
+        ]
+        assert [future.result(timeout=10) for future in futures] == ["completed"] * 10
+
+    assert all(len(request) <= 4 for request in server.requests)
+    # 3 rounds at most, each one of them is split into up to 3 batches
+    assert len(server.requests) < 10 * 3
+
+
+def test_track_timeout():
+    """
+    Given:
+        - an incident that never reaches a final state
+
+    When:
+        - tracking it with a short timeout
+
+    Then:
+        - make sure PollingTimeout is raised with the last state of the incident
+    """
+    server = FakeIncidentsServer({"1": ["inprogress"]})
+    with IncidentStatePoller(min_interval=0.01, max_interval=0.02) as poller:
+        future = poller.track("1", server.search, is_final=is_completed, timeout=0.1)
+        with pytest.raises(PollingTimeout) as error:
+            future.result(timeout=5)
+
+    assert error.value.incident_id == "1"
+    assert error.value.last_state == "inprogress"
+
+
+def test_adaptive_backoff():
+    """
+    Given:
+        - an incident which its state does not change for a while
+
+    When:
+        - polling it with a backoff factor of 2
+
+    Then:
+        - make sure the amount of requests is smaller than with a fixed interval
+    """
+    server = FakeIncidentsServer({"1": ["inprogress"] * 100 + ["completed"]})
+    with IncidentStatePoller(
+        min_interval=0.01, max_interval=0.08, backoff_factor=2
+    ) as poller:
+        future = poller.track("1", server.search, is_final=is_completed, timeout=0.5)
+        with pytest.raises(PollingTimeout):
+            future.result(timeout=5)
+
+    # with a fixed interval of 0.01 seconds there would have been ~50 requests
+    assert len(server.requests) < 15
+
+
+def test_fetcher_errors_do_not_fail_the_polling():
+    """
+    Given:
+        - a fetcher which fails on the first request
+
+    When:
+        - tracking an incident
+
+    Then:
+        - make sure the polling continues and the incident is resolved
+    """
+    server = FakeIncidentsServer({"1": ["completed"]})
+    calls = []
+
+    def flaky_search(incident_ids: List[str]) -> Dict[str, str]:
+        calls.append(incident_ids)
+        if len(calls) == 1:
+            raise ConnectionError("server is unavailable")
+        return server.search(incident_ids)
+
+    with IncidentStatePoller(min_interval=0.01, max_interval=0.02) as poller:
+        future = poller.track("1", flaky_search, is_final=is_completed, timeout=5)
+        assert future.result(timeout=10) == "completed"
+
+    assert len(calls) == 2
+
+
+def test_fetcher_errors_fail_the_polling_after_max_failures():
+    """
+    Given:
+        - a fetcher which always fails, and an incident which is mapped to an error by its fetcher
+
+    When:
+        - tracking both incidents with a long timeout
+
+    Then:
+        - make sure PollingFetchError is raised with the original error once the fetch failed 3 consecutive times
+    """
+    calls = []
+
+    def failing_search(incident_ids: List[str]) -> Dict[str, str]:
+        calls.append(incident_ids)
+        raise ConnectionError("server is unavailable")
+
+    def not_found_search(incident_ids: List[str]) -> Dict[str, Exception]:
+        return {incident_id: LookupError("not found") for incident_id in incident_ids}
+
+    with IncidentStatePoller(
+        min_interval=0.01, max_interval=0.02, max_fetch_failures=3
+    ) as poller:
+        failing = poller.track("1", failing_search, is_final=is_completed, timeout=60)
+        not_found = poller.track(
+            "2", not_found_search, is_final=is_completed, timeout=60
+        )
+        with pytest.raises(PollingFetchError, match="server is unavailable") as error:
+            failing.result(timeout=10)
+        with pytest.raises(PollingFetchError, match="not found"):
+            not_found.result(timeout=10)
+
+    assert isinstance(error.value.error, ConnectionError)
+    assert error.value.__cause__ is error.value.error
+    assert len(calls) == 3
+
+
+def test_wait_for_within_the_poller_loop():
+    """
+    Given:
+        - coroutines which run in the event-loop of the poller
+
+    When:
+        - awaiting several incidents concurrently using wait_for
+
+    Then:
+        - make sure all of them are resolved
+    """
+    server = FakeIncidentsServer({"1": ["new", "completed"], "2": ["completed"]})
+    poller = IncidentStatePoller(min_interval=0.01, max_interval=0.02)
+
+    async def wait_for_all():
+        return await asyncio.gather(
+            poller.wait_for("1", server.search, is_final=is_completed, timeout=5),
+            poller.wait_for("2", server.search, is_final=is_completed, timeout=5),
+        )
+
+    assert asyncio.run(wait_for_all()) == ["completed", "completed"]
+
+
+def test_xsoar_client_poll_incidents_states(mocker):
+    """
+    Given:
+        - xsoar client and 3 incidents which are closed after a few rounds
+
+    When:
+        - running poll_incidents_states
+
+    Then:
+        - make sure the raw incidents are returned in the requested order
+        - make sure all the incidents are searched together
+    """
+    mocker.patch.object(XsoarClient, "is_healthy", return_value=True)
+    client = XsoarClient(
+        config=XsoarClientConfig(base_api_url="https://test.com", api_key="test"),
+        client=mocker.MagicMock(),
+    )
+    client.incident_state_poller.min_interval = 0.01
+    client.incident_state_poller.max_interval = 0.02
+
+    server = FakeIncidentsServer(
+        {
+            "1": [IncidentState.IN_PROGRESS.value, IncidentState.CLOSED.value],
+            "2": [IncidentState.CLOSED.value],
+            "3": [IncidentState.NEW.value] * 2 + [IncidentState.CLOSED.value],
+        }
+    )
+
+    def search_incidents(incident_ids, size):
+        return {
+            "data": [
+                {"id": incident_id, "name": f"incident-{incident_id}", "status": state}
+                for incident_id, state in server.search(incident_ids).items()
+            ]
+        }
+
+    mocker.patch.object(client, "search_incidents", side_effect=search_incidents)
+
+    incidents = client.poll_incidents_states(["3", "1", "2"], timeout=5)
+
+    assert [incident["id"] for incident in incidents] == ["3", "1", "2"]
+    assert server.requests[0] == ["3", "1", "2"]
+    assert len(server.requests) <= 3
+    client.incident_state_poller.stop()
+
+
+@pytest.mark.parametrize(
+    "search_result, expected_error",
+    [
+        ({"return_value": {"data": []}}, "incident 1 was not found"),
+        (
+            {"side_effect": ConnectionError("server is unavailable")},
+            "server is unavailable",
+        ),
+    ],
+)
+def test_xsoar_client_poll_incident_state_not_found(
+    mocker, search_result, expected_error
+):
+    """
+    Given:
+        - xsoar client and
+            - case 1: incident which does not exist
+            - case 2: search requests which fail
+
+    When:
+        - running poll_incident_state with a long timeout
+
+    Then:
+        - make sure ValueError is raised with the search error, without waiting until the timeout
+    """
+    mocker.patch.object(XsoarClient, "is_healthy", return_value=True)
+    client = XsoarClient(
+        config=XsoarClientConfig(base_api_url="https://test.com", api_key="test"),
+        client=mocker.MagicMock(),
+    )
+    client.incident_state_poller.min_interval = 0.01
+    client.incident_state_poller.max_interval = 0.02
+    mocker.patch.object(client, "search_incidents", **search_result)
+
+    with pytest.raises(ValueError, match="Could not find incident ID 1") as error:
+        client.poll_incident_state("1", timeout=60)
+    assert expected_error in str(error.value)
+    client.incident_state_poller.stop()
@@ -24,9 +24,14 @@ from urllib3 import HTTPResponse
 from demisto_sdk.commands.common.clients.configs import XsoarClientConfig
 from demisto_sdk.commands.common.clients.errors import (
     InvalidServerType,
+    PollingFetchError,
+    PollingTimeout,
     UnAuthorized,
     UnHealthyServer,
 )
+from demisto_sdk.commands.common.clients.incident_state_poller import (
+    IncidentStatePoller,
+)
 from demisto_sdk.commands.common.constants import (
     MINIMUM_XSOAR_SAAS_VERSION,
     IncidentState,
@@ -691,6 +696,104 @@ class XsoarClient:
         )
         return raw_response
 
+    @cached_property
+    def incident_state_poller(self) -> IncidentStatePoller:
+        """
+        Poller which is shared between all the incidents polled by this client,
+        so the states of incidents polled concurrently are retrieved in batched search requests.
+        """
+        return IncidentStatePoller(min_interval=1, max_interval=15)
+
+    def get_incidents_by_ids(self, incident_ids: List[str]) -> Dict[str, Dict]:
+        """
+        Retrieves a batch of incidents in a single search request.
+
+        Args:
+            incident_ids: the incident IDs to retrieve
+
+        Returns:
+            mapping between the incident ID to its raw response, incidents which were not found are omitted.
+        """
+        raw_response = self.search_incidents(incident_ids, size=len(incident_ids))
+        return {
+            str(incident.get("id")): incident
+            for incident in (raw_response or {}).get("data") or []
+        }
+
+    def _get_polled_incidents(self, incident_ids: List[str]) -> Dict[str, Any]:
+        """
+        The fetcher of the incident state poller, incidents which were not found are mapped to an error,
+        so the polling of incidents which do not exist fails rather than waiting until the timeout.
+        """
+        incidents = self.get_incidents_by_ids(incident_ids)
+        return {
+            incident_id: incidents.get(incident_id)
+            or LookupError(f"incident {incident_id} was not found")
+            for incident_id in incident_ids
+        }
+
+    def poll_incidents_states(
+        self,
+        incident_ids: List[str],
+        expected_states: Tuple[IncidentState, ...] = (IncidentState.CLOSED,),
+        timeout: int = 120,
+    ) -> List[Dict]:
+        """
+        Polls for the states of several incidents concurrently
+
+        Args:
+            incident_ids: the incident IDs to poll their states
+            expected_states: which states are considered to be valid for the incidents to reach
+            timeout: how long to query until all the incidents reach the expected state
+
+        Returns:
+            raw responses of the incidents that reached into the relevant state, in the order of incident_ids.
+        """
+        if timeout <= 0:
+            raise ValueError("timeout argument must be larger than 0")
+
+        expected_state_names = {state.name for state in expected_states}
+
+        def reached_expected_state(incident: Dict) -> bool:
+            incident_status = IncidentState(str(incident.get("status"))).name
+            logger.debug(
+                f"status of the incident {incident.get('name')} is {incident_status}"
+            )
+            return incident_status in expected_state_names
+
+        futures = [
+            self.incident_state_poller.track(
+                incident_id,
+                fetcher=self._get_polled_incidents,
+                is_final=reached_expected_state,
+                timeout=timeout,
+            )
+            for incident_id in incident_ids
+        ]
+
+        incidents = []
+        try:
+            for incident_id, future in zip(incident_ids, futures):
+                try:
+                    incidents.append(future.result())
+                except PollingFetchError as error:
+                    raise ValueError(
+                        f"Could not find incident ID {incident_id}, error:\n{error.error}"
+                    ) from error
+                except PollingTimeout as error:
+                    if not error.last_state:
+                        raise ValueError(f"Could not find incident ID {incident_id}")
+                    raise RuntimeError(
+                        f"status of incident {error.last_state.get('name')} is "
+                        f"{IncidentState(str(error.last_state.get('status'))).name}"
+                    )
+        except Exception:
+            # stop polling the rest of the incidents once one of them failed
+            for future in futures:
+                future.cancel()
+            raise
+        return incidents
+
     def poll_incident_state(
         self,
         incident_id: str,
@@ -708,34 +811,9 @@ class XsoarClient:
         Returns:
             raw response of the incident that reached into the relevant state.
         """
-        if timeout <= 0:
-            raise ValueError("timeout argument must be larger than 0")
-
-        elapsed_time = 0
-        start_time = time.time()
-        interval = timeout / 10
-        incident_name = None
-        incident_status = None
-
-        expected_state_names = {state.name for state in expected_states}
-
-        while elapsed_time < timeout:
-            try:
-                incident = self.search_incidents(incident_id).get("data", [])[0]
-            except Exception as e:
-                raise ValueError(
-                    f"Could not find incident ID {incident_id}, error:\n{e}"
-                )
-            incident_status = IncidentState(str(incident.get("status"))).name
-            incident_name = incident.get("name")
-            logger.debug(f"status of the incident {incident_name} is {incident_status}")
-            if incident_status in expected_state_names:
-                return incident
-            else:
-                time.sleep(interval)
-                elapsed_time = int(time.time() - start_time)
-
-        raise RuntimeError(f"status of incident {incident_name} is {incident_status}")
+        return self.poll_incidents_states(
+            [incident_id], expected_states=expected_states, timeout=timeout
+        )[0]
 
     @retry(exceptions=ApiException)
     def delete_incidents(
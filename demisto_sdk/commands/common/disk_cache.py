@@ -0,0 +1,154 @@
+import contextlib
+import hashlib
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Iterator, Optional, Tuple, Type, Union
+
+from demisto_sdk.commands.common.handlers import DEFAULT_JSON_HANDLER as json
+from demisto_sdk.commands.common.logger import logger
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    # not available on windows, locks are skipped and concurrent writers may do the same work twice
+    fcntl = None  # type: ignore[assignment]
+
+
+class DiskCache:
+    """
+    A JSON based on-disk cache which can be shared between processes.
+
+    Every entry is saved in its own file, named by the hash of its key, and written atomically, so readers never see
+    partial entries. Entries expire after `ttl` seconds unless they are saved as immutable, and expired entries are
+    still returned by `get(..., allow_expired=True)` for callers that prefer a stale value over a failure
+    (e.g. when there is no network).
+    `get_or_set` takes a per-key file lock, so when several processes miss the same key only one of them computes it.
+    """
+
+    def __init__(self, cache_dir: Union[Path, str], ttl: float = 3600):
+        self.cache_dir = Path(cache_dir)
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / f"{hashlib.sha256(key.encode()).hexdigest()}.json"
+
+    def get(self, key: str, allow_expired: bool = False) -> Optional[Any]:
+        """
+        Returns the value of a key, None if the key does not exist or expired.
+        """
+        try:
+            entry = json.loads(self._entry_path(key).read_text())
+        except FileNotFoundError:
+            return None
+        except Exception as error:
+            logger.debug(
+                f"Could not read cache entry of {key=} from {self.cache_dir}: {error}"
+            )
+            return None
+
+        if entry.get("key") != key:
+            return None
+        if (
+            not allow_expired
+            and not entry.get("immutable")
+            and time.time() - entry.get("stored_at", 0) > entry.get("ttl", self.ttl)
+        ):
+            return None
+        return entry.get("value")
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        immutable: bool = False,
+        ttl: Optional[float] = None,
+    ) -> None:
+        """
+        Saves a value of a key, immutable values never expire.
+        """
+        entry = {
+            "key": key,
+            "value": value,
+            "stored_at": time.time(),
+            "ttl": self.ttl if ttl is None else ttl,
+            "immutable": immutable,
+        }
+        temp_path = None
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                "w", dir=self.cache_dir, suffix=".tmp", delete=False
+            ) as temp_file:
+                temp_path = temp_file.name
+                temp_file.write(json.dumps(entry))
+            os.replace(temp_path, self._entry_path(key))
+        except Exception as error:
+            logger.debug(
+                f"Could not write cache entry of {key=} to {self.cache_dir}: {error}"
+            )
+            if temp_path:
+                with contextlib.suppress(FileNotFoundError):
+                    Path(temp_path).unlink()
+
+    @contextlib.contextmanager
+    def lock(self, key: str) -> Iterator[None]:
+        """
+        Inter-process lock of a single key.
+        """
+        if not fcntl:
+            yield
+            return
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        with open(self._entry_path(key).with_suffix(".lock"), "w") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def get_or_set(
+        self,
+        key: str,
+        compute: Callable[[], Any],
+        immutable: bool = False,
+        ttl: Optional[float] = None,
+        fallback_to_expired_on: Tuple[Type[Exception], ...] = (),
+    ) -> Any:
+        """
+        Returns the cached value of the key, or computes and caches it.
+
+        Args:
+            key: the cache key
+            compute: computes the value on a cache miss
+            immutable: whether the computed value never expires
+            ttl: custom time-to-live of the computed value
+            fallback_to_expired_on: exceptions of the computation on which an expired value is returned instead
+        """
+        if (value := self.get(key)) is not None:
+            self.hits += 1
+            return value
+
+        with self.lock(key):
+            # another process might have computed the value while waiting for the lock
+            if (value := self.get(key)) is not None:
+                self.hits += 1
+                return value
+            self.misses += 1
+            try:
+                value = compute()
+            except fallback_to_expired_on:
+                if (expired_value := self.get(key, allow_expired=True)) is not None:
+                    logger.debug(f"Using an expired cache entry of {key=}")
+                    return expired_value
+                raise
+            self.set(key, value, immutable=immutable, ttl=ttl)
+            return value
+
+    def clear(self) -> None:
+        for path in self.cache_dir.glob("*.json"):
+            with contextlib.suppress(FileNotFoundError):
+                path.unlink()
@@ -2,21 +2,30 @@ import os
 from datetime import datetime, timedelta
 from enum import Enum
 from functools import lru_cache
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 import dateparser
 import requests
 from packaging.version import InvalidVersion, Version
 from requests.exceptions import ConnectionError, RequestException, Timeout
 
+from demisto_sdk.commands.common.constants import CACHE_DIR
+from demisto_sdk.commands.common.disk_cache import DiskCache
 from demisto_sdk.commands.common.handlers.xsoar_handler import JSONDecodeError
 from demisto_sdk.commands.common.logger import logger
-from demisto_sdk.commands.common.tools import retry
+from demisto_sdk.commands.common.tools import retry, string_to_bool
 
 DOCKERHUB_USER = "DOCKERHUB_USER"
 DOCKERHUB_PASSWORD = "DOCKERHUB_PASSWORD"
 DEFAULT_REPOSITORY = "demisto"
 
+DOCKERHUB_CACHE_DIR = CACHE_DIR / "dockerhub"
+DISABLE_DOCKERHUB_CACHE = "DEMISTO_SDK_DISABLE_DOCKERHUB_CACHE"
+DOCKERHUB_CACHE_TTL = "DEMISTO_SDK_DOCKERHUB_CACHE_TTL"
+DEFAULT_DOCKERHUB_CACHE_TTL = 24 * 60 * 60
+# tags are added all the time, so the list of tags is refreshed more often than the metadata of a specific tag
+DOCKERHUB_TAGS_LIST_CACHE_TTL = 60 * 60
+
 
 class DockerHubAuthScope(str, Enum):
     PULL = "pull"  # Grants read-only access to the repository, allowing you to pull images.
@@ -35,6 +44,48 @@ class DockerHubRequestException(Exception):
         return f"Error - {self.message} - Exception - {self.exception}"
 
 
+def get_dockerhub_cache() -> Optional[DiskCache]:
+    """
+    Returns the on-disk cache of dockerhub responses which is shared between all the demisto-sdk processes,
+    or None if the cache is disabled by the DEMISTO_SDK_DISABLE_DOCKERHUB_CACHE environment variable.
+    """
+    if string_to_bool(os.getenv(DISABLE_DOCKERHUB_CACHE), default_when_empty=False):
+        return None
+    return DiskCache(
+        DOCKERHUB_CACHE_DIR,
+        ttl=int(os.getenv(DOCKERHUB_CACHE_TTL) or DEFAULT_DOCKERHUB_CACHE_TTL),
+    )
+
+
+def cached_dockerhub_response(
+    key: str,
+    get_response: Callable[[], Any],
+    immutable: bool = False,
+    ttl: Optional[float] = None,
+    cache: Optional[DiskCache] = None,
+) -> Any:
+    """
+    Returns a dockerhub response from the on-disk cache, or retrieves and caches it.
+    When dockerhub is not reachable, an expired response is returned if there is one.
+
+    Args:
+        key: the cache key, should identify the repository and the tag/digest of the response
+        get_response: retrieves the response from dockerhub
+        immutable: whether the response never changes, e.g. responses of content addressable (digest) endpoints
+        ttl: custom time-to-live of the response
+        cache: the cache to use, the default dockerhub cache if not provided
+    """
+    if not (cache := cache or get_dockerhub_cache()):
+        return get_response()
+    return cache.get_or_set(
+        key,
+        get_response,
+        immutable=immutable,
+        ttl=ttl,
+        fallback_to_expired_on=(ConnectionError, Timeout),
+    )
+
+
 @lru_cache
 class DockerHubClient:
 
@@ -49,6 +100,7 @@ class DockerHubClient:
         username: str = "",
         password: str = "",
         verify_ssl: bool = False,
+        cache: Optional[DiskCache] = None,
     ):
 
         self.registry_api_url = registry or self.DEFAULT_REGISTRY
@@ -61,6 +113,11 @@ class DockerHubClient:
         self._session = requests.Session()
         self._docker_hub_auth_tokens: Dict[str, Any] = {}
         self.verify_ssl = verify_ssl
+        self._cache = cache
+
+    @property
+    def cache(self) -> Optional[DiskCache]:
+        return self._cache or get_dockerhub_cache()
 
     def __enter__(self):
         return self
@@ -201,12 +258,38 @@ class DockerHubClient:
 
         _params = params or {"page_size": 1000} if not next_page_url else params
 
+        def get_response():
+            return self._do_docker_hub_get_request(
+                url,
+                headers=headers,
+                params=params,
+                request_params=_params,
+                results_key=results_key,
+            )
+
+        if url_suffix and (cache := self.cache):
+            # cache the whole (paginated) response, the pages themselves are not cached
+            return cached_dockerhub_response(
+                f"hub:{url}:{sorted(headers or ())}:{sorted(params or ())}",
+                get_response,
+                cache=cache,
+            )
+        return get_response()
+
+    def _do_docker_hub_get_request(
+        self,
+        url: str,
+        headers: Optional[frozenset],
+        params: Optional[frozenset],
+        request_params: Any,
+        results_key: str,
+    ):
         raw_json_response = self.get_request(
             url,
             headers={key: value for key, value in headers}
             if headers
             else {"Accept": "application/json"},
-            params=_params,
+            params=request_params,
         )
 
         amount_of_objects = raw_json_response.get("count")
@@ -251,17 +334,32 @@ class DockerHubClient:
         if not url_suffix.startswith("/"):
             url_suffix = f"/{url_suffix}"
 
-        return self.get_request(
-            f"{self.registry_api_url}/{docker_image}{url_suffix}",
-            headers={key: value for key, value in headers}
-            if headers
-            else None
-            or {
-                "Accept": "application/vnd.docker.distribution.manifest.v2+json,"
-                "application/vnd.docker.distribution.manifest.list.v2+json",
-                "Authorization": f"Bearer {self.get_token(docker_image, scope=scope)}",
-            },
-            params={key: value for key, value in params} if params else None,
+        url = f"{self.registry_api_url}/{docker_image}{url_suffix}"
+
+        def get_response() -> Dict[str, Any]:
+            # the token is retrieved only when the response is not cached
+            return self.get_request(
+                url,
+                headers={key: value for key, value in headers}
+                if headers
+                else None
+                or {
+                    "Accept": "application/vnd.docker.distribution.manifest.v2+json,"
+                    "application/vnd.docker.distribution.manifest.list.v2+json",
+                    "Authorization": f"Bearer {self.get_token(docker_image, scope=scope)}",
+                },
+                params={key: value for key, value in params} if params else None,
+            )
+
+        if not (cache := self.cache):
+            return get_response()
+        return cached_dockerhub_response(
+            f"registry:{url}:{scope}:{sorted(headers or ())}:{sorted(params or ())}",
+            get_response,
+            # content addressable endpoints (by digest) can never change
+            immutable="sha256:" in url_suffix,
+            ttl=DOCKERHUB_TAGS_LIST_CACHE_TTL if url_suffix == "/tags/list" else None,
+            cache=cache,
         )
 
     def get_image_manifests(self, docker_image: str, tag: str) -> Dict[str, Any]:
@@ -5,8 +5,14 @@ import pytest
 from freezegun import freeze_time
 from packaging.version import Version
 from requests import Response, Session
+from requests.exceptions import ConnectionError
 
-from demisto_sdk.commands.common.docker.dockerhub_client import DockerHubClient
+from demisto_sdk.commands.common.disk_cache import DiskCache
+from demisto_sdk.commands.common.docker.dockerhub_client import (
+    DISABLE_DOCKERHUB_CACHE,
+    DockerHubClient,
+    get_dockerhub_cache,
+)
 from demisto_sdk.commands.common.handlers import DEFAULT_JSON_HANDLER as json
 
 
@@ -248,3 +254,132 @@ def test_do_docker_hub_get_request_single_object(
     )
 
     assert dockerhub_client.do_docker_hub_get_request("/test") == {"test": "test"}
+
+
+@pytest.fixture()
+def cached_dockerhub_client(tmp_path) -> DockerHubClient:
+    return DockerHubClient(
+        username="test", password="test", cache=DiskCache(tmp_path, ttl=60)
+    )
+
+
+def mock_registry(requests_mock, digest: str = "sha256:1234"):
+    requests_mock.get(
+        "https://auth.docker.io/token",
+        json={"token": "1234", "issued_at": "1234", "expires_in": 300},
+    )
+    requests_mock.get(
+        "https://registry-1.docker.io/v2/demisto/pan-os-python/manifests/1.0.0.1",
+        json={"config": {"digest": digest}},
+    )
+    requests_mock.get(
+        f"https://registry-1.docker.io/v2/demisto/pan-os-python/blobs/{digest}",
+        json={"config": {"Env": ["PYTHON_VERSION=3.10.11"]}},
+    )
+
+
+def test_get_image_env_from_warm_cache(
+    requests_mock, tmp_path, cached_dockerhub_client: DockerHubClient
+):
+    """
+    Given:
+        - a dockerhub cache which was filled by another process (client)
+
+    When:
+        - running get_image_env
+
+    Then:
+        - ensure that the env is returned without sending any request to dockerhub
+    """
+    mock_registry(requests_mock)
+    expected_env = ["PYTHON_VERSION=3.10.11"]
+    assert (
+        cached_dockerhub_client.get_image_env("demisto/pan-os-python", tag="1.0.0.1")
+        == expected_env
+    )
+    requests_count = requests_mock.call_count
+
+    other_client = DockerHubClient(
+        username="test2", password="test2", cache=DiskCache(tmp_path, ttl=60)
+    )
+    assert (
+        other_client.get_image_env("demisto/pan-os-python", tag="1.0.0.1")
+        == expected_env
+    )
+    assert requests_mock.call_count == requests_count
+
+
+def test_digest_entries_never_expire(
+    requests_mock, cached_dockerhub_client: DockerHubClient
+):
+    """
+    Given:
+        - cached manifests and blobs responses of a docker image
+
+    When:
+        - running get_image_env after the ttl of the cache has passed
+
+    Then:
+        - ensure that only the manifests (tag) are retrieved again, and the blobs (digest) are taken from the cache
+    """
+    mock_registry(requests_mock)
+    with freeze_time("2024-01-01 00:00:00"):
+        cached_dockerhub_client.get_image_env("demisto/pan-os-python", tag="1.0.0.1")
+
+    cached_dockerhub_client.do_registry_get_request.cache_clear()
+    requests_mock.reset_mock()
+    with freeze_time("2024-01-01 01:00:00"):
+        cached_dockerhub_client.get_image_env("demisto/pan-os-python", tag="1.0.0.1")
+
+    requested_urls = [request.path for request in requests_mock.request_history]
+    assert "/v2/demisto/pan-os-python/manifests/1.0.0.1" in requested_urls
+    assert not any("/blobs/" in url for url in requested_urls)
+
+
+def test_expired_entries_are_used_on_connection_error(
+    mocker, requests_mock, cached_dockerhub_client: DockerHubClient
+):
+    """
+    Given:
+        - an expired cached response of docker image manifests
+
+    When:
+        - dockerhub is not reachable
+
+    Then:
+        - ensure that the expired response is returned
+    """
+    mocker.patch("time.sleep")
+    mock_registry(requests_mock)
+    with freeze_time("2024-01-01 00:00:00"):
+        cached_dockerhub_client.get_image_digest("demisto/pan-os-python", tag="1.0.0.1")
+
+    cached_dockerhub_client.do_registry_get_request.cache_clear()
+    requests_mock.get(
+        "https://registry-1.docker.io/v2/demisto/pan-os-python/manifests/1.0.0.1",
+        exc=ConnectionError,
+    )
+    with freeze_time("2024-01-01 01:00:00"):
+        assert (
+            cached_dockerhub_client.get_image_digest(
+                "demisto/pan-os-python", tag="1.0.0.1"
+            )
+            == "sha256:1234"
+        )
+
+
+def test_cache_is_disabled_by_env_var(monkeypatch):
+    """
+    Given:
+        - the DEMISTO_SDK_DISABLE_DOCKERHUB_CACHE environment variable
+
+    When:
+        - getting the dockerhub cache
+
+    Then:
+        - ensure that the cache is disabled only when the environment variable is set to true
+    """
+    monkeypatch.setenv(DISABLE_DOCKERHUB_CACHE, "true")
+    assert get_dockerhub_cache() is None
+    monkeypatch.setenv(DISABLE_DOCKERHUB_CACHE, "false")
+    assert isinstance(get_dockerhub_cache(), DiskCache)
@@ -26,6 +26,9 @@ from demisto_sdk.commands.common.constants import (
     TYPE_PYTHON2,
     TYPE_PYTHON3,
 )
+from demisto_sdk.commands.common.docker.dockerhub_client import (
+    cached_dockerhub_response,
+)
 from demisto_sdk.commands.common.docker_images_metadata import DockerImagesMetadata
 from demisto_sdk.commands.common.logger import logger
 from demisto_sdk.commands.common.tools import retry
@@ -659,9 +662,17 @@ def _get_python_version_from_dockerhub_api(image: str) -> Version:
         # we need to remove the gitlab prefix, as we query the API
         repo = repo.replace(f"{DOCKER_REGISTRY_URL}/", "")
     try:
-        token = _get_docker_hub_token(repo)
-        digest = _get_image_digest(repo, tag, token)
-        env = _get_image_env(repo, digest, token)
+        # the token is retrieved only if one of the responses is not cached already
+        get_token = functools.lru_cache(lambda: _get_docker_hub_token(repo))
+        digest = cached_dockerhub_response(
+            f"image-digest:{repo}:{tag}",
+            lambda: _get_image_digest(repo, tag, get_token()),
+        )
+        env = cached_dockerhub_response(
+            f"image-env:{repo}:{digest}",
+            lambda: _get_image_env(repo, digest, get_token()),
+            immutable=True,
+        )
         return _get_python_version_from_env(env)
     except Exception as e:
         logger.error(
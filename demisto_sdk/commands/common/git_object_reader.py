@@ -0,0 +1,226 @@
+import atexit
+import os
+import re
+import subprocess
+import threading
+from pathlib import Path
+from typing import IO, Dict, List, Optional, Tuple, Union
+
+from git import InvalidGitRepositoryError
+
+from demisto_sdk.commands.common.logger import logger
+
+# the arguments of the long-lived git processes, --batch returns the objects and --batch-check only their headers
+BATCH = "--batch"
+BATCH_CHECK = "--batch-check"
+COMMIT_ID_PATTERN = re.compile(r"[0-9a-f]{40}")
+
+
+def _git_dir_id(repo_path: Path) -> Tuple[int, int]:
+    try:
+        stat = (repo_path / ".git").stat()
+    except OSError:
+        return 0, 0
+    return stat.st_ino, stat.st_ctime_ns
+
+
+class GitObjectReader:
+    """
+    Reads files of any revision of a git repository through long-lived `git cat-file --batch` processes,
+    instead of running git (or walking the trees by GitPython) for each file.
+
+    The tree of each commit is resolved once (branches are resolved on each request, as they might move), and the
+    files are then requested by their tree. Many files can be requested at once, in which case all of the requests
+    are written to git before their objects are read back (pipelined).
+    There is a single reader per repository (and per process, as the pipes can not be shared with forked processes),
+    which is replaced once the git directory of the repository changes (e.g. the repository was created again).
+
+    Example:
+        reader = GitObjectReader.for_repo()
+        old_yml = reader.read("origin/master", "Packs/HelloWorld/Integrations/HelloWorld/HelloWorld.yml")
+    """
+
+    _readers: Dict[Tuple[int, Path], "GitObjectReader"] = {}
+    _roots: Dict[Path, Path] = {}
+
+    def __init__(self, repo_path: Path):
+        """
+        Args:
+            repo_path: the root of the repository.
+        """
+        self.repo_path = repo_path
+        self.git_dir_id = _git_dir_id(repo_path)
+        self._processes: Dict[str, subprocess.Popen] = {}
+        self._trees: Dict[str, str] = {}
+        self._lock = threading.RLock()
+
+    @classmethod
+    def for_repo(cls, path: Union[str, Path, None] = None) -> "GitObjectReader":
+        """Returns the shared reader of the repository of the given path, the current directory by default."""
+        path = Path(path or Path.cwd()).resolve()
+        if path not in cls._roots:
+            try:
+                cls._roots[path] = Path(
+                    subprocess.check_output(
+                        ["git", "rev-parse", "--show-toplevel"],
+                        cwd=path if path.is_dir() else path.parent,
+                        stderr=subprocess.DEVNULL,
+                        text=True,
+                    ).strip()
+                ).resolve()
+            except (OSError, subprocess.CalledProcessError) as error:
+                raise InvalidGitRepositoryError(
+                    f"Unable to find Repository from {path} - aborting"
+                ) from error
+        key = (os.getpid(), cls._roots[path])
+        reader = cls._readers.get(key)
+        if reader is None or reader.git_dir_id != _git_dir_id(cls._roots[path]):
+            if reader:
+                reader.close()
+            reader = cls._readers[key] = cls(cls._roots[path])
+        return reader
+
+    @classmethod
+    def close_all(cls) -> None:
+        for (pid, _), reader in list(cls._readers.items()):
+            if pid == os.getpid():
+                reader.close()
+
+    def close(self) -> None:
+        with self._lock:
+            for process in self._processes.values():
+                if process.stdin:
+                    process.stdin.close()
+                process.wait()
+            self._processes = {}
+
+    def _process(self, mode: str) -> subprocess.Popen:
+        process = self._processes.get(mode)
+        if process is None or process.poll() is not None:
+            logger.debug(f"Starting git cat-file {mode} in {self.repo_path}")
+            process = self._processes[mode] = subprocess.Popen(
+                ["git", "cat-file", mode],
+                cwd=self.repo_path,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+            )
+        return process
+
+    def _request(
+        self, object_names: List[str], mode: str = BATCH
+    ) -> List[Optional[Tuple[str, bytes]]]:
+        """
+        Requests the given objects from git.
+
+        Returns:
+            The id and the content (empty in batch check mode) of each one of the objects, None for missing objects.
+        """
+        if not object_names:
+            return []
+        with self._lock:
+            process = self._process(mode)
+            stdin: IO[bytes] = process.stdin  # type: ignore[assignment]
+            stdout: IO[bytes] = process.stdout  # type: ignore[assignment]
+            requests = "".join(f"{name}\n" for name in object_names).encode()
+
+            def write_requests():
+                stdin.write(requests)
+                stdin.flush()
+
+            writer = None
+            if len(object_names) == 1:
+                write_requests()
+            else:
+                # writing in a thread, so git is never blocked on writing objects which are not read yet
+                writer = threading.Thread(target=write_requests, daemon=True)
+                writer.start()
+            objects: List[Optional[Tuple[str, bytes]]] = []
+            try:
+                for _ in object_names:
+                    header = stdout.readline()
+                    if not header:
+                        raise OSError(f"git cat-file {mode} exited unexpectedly")
+                    parts = header.split()
+                    if header.endswith((b" missing\n", b" ambiguous\n")):
+                        objects.append(None)
+                    elif mode == BATCH_CHECK:
+                        objects.append((parts[0].decode(), b""))
+                    else:
+                        content = stdout.read(int(parts[2]))
+                        stdout.read(1)  # the newline after the content
+                        objects.append((parts[0].decode(), content))
+            except Exception:
+                # the responses are out of sync with the requests, the process is restarted by the next request
+                process.kill()
+                raise
+            finally:
+                if writer:
+                    writer.join()
+            return objects
+
+    def resolve_tree(self, revision: str) -> Optional[str]:
+        """The id of the tree of the given revision, None if there is no such revision."""
+        if revision in self._trees:
+            return self._trees[revision]
+        git_object = self._request([f"{revision}^{{tree}}"], mode=BATCH_CHECK)[0]
+        tree = git_object[0] if git_object else None
+        if tree and COMMIT_ID_PATTERN.fullmatch(revision):
+            self._trees[revision] = tree
+        return tree
+
+    def relative_path(self, path: Union[str, Path]) -> Optional[str]:
+        """The path relative to the root of the repository, None when it is outside of the repository."""
+        relative_path = Path(
+            os.path.relpath(Path(path).absolute().resolve(), self.repo_path)
+        )
+        if relative_path.parts and relative_path.parts[0] == "..":
+            return None
+        return relative_path.as_posix()
+
+    def _object_names(
+        self, revision: str, paths: List[Union[str, Path]]
+    ) -> List[Optional[str]]:
+        tree = self.resolve_tree(revision)
+        object_names: List[Optional[str]] = []
+        for path in paths:
+            relative_path = self.relative_path(path)
+            object_names.append(
+                f"{tree}:{relative_path}" if tree and relative_path else None
+            )
+        return object_names
+
+    def read_many(
+        self, revision: str, paths: List[Union[str, Path]]
+    ) -> List[Optional[bytes]]:
+        """
+        Reads the files of the given revision, in a single pipelined request.
+
+        Args:
+            revision: a commit, branch or tag, e.g. `origin/master`.
+            paths: the paths of the files, absolute or relative to the current directory.
+
+        Returns:
+            The content of each one of the files, None for files which do not exist in the revision.
+        """
+        object_names = self._object_names(revision, paths)
+        objects = iter(self._request([name for name in object_names if name]))
+        results: List[Optional[bytes]] = []
+        for name in object_names:
+            git_object = next(objects) if name else None
+            results.append(git_object[1] if git_object else None)
+        return results
+
+    def read(self, revision: str, path: Union[str, Path]) -> Optional[bytes]:
+        """Reads a file of the given revision, None if it does not exist in the revision."""
+        return self.read_many(revision, [path])[0]
+
+    def exists(self, revision: str, path: Union[str, Path]) -> bool:
+        """Whether the file exists in the given revision, without reading it."""
+        (object_name,) = self._object_names(revision, [path])
+        return bool(object_name) and bool(
+            self._request([object_name], mode=BATCH_CHECK)[0]  # type: ignore[list-item]
+        )
+
+
+atexit.register(GitObjectReader.close_all)
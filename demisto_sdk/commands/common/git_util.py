@@ -2,7 +2,7 @@ import os
 import re
 from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional, Set, Tuple, Union
+from typing import Dict, List, Optional, Set, Tuple, Union
 
 import click
 import gitdb
@@ -12,7 +12,7 @@ from git import (
 )
 from git.diff import Lit_change_type
 from git.exc import GitError, NoSuchPathError
-from git.objects import Blob, Commit
+from git.objects import Commit
 from git.remote import Remote
 
 from demisto_sdk.commands.common.constants import (
@@ -20,6 +20,7 @@ from demisto_sdk.commands.common.constants import (
     DEMISTO_GIT_UPSTREAM,
     PACKS_FOLDER,
 )
+from demisto_sdk.commands.common.git_object_reader import GitObjectReader
 from demisto_sdk.commands.common.logger import logger
 
 
@@ -46,6 +47,7 @@ class GitFileNotFoundError(NoSuchPathError):
 class GitUtil:
     # in order to use Repo class/static methods
     REPO_CLS = Repo
+    _shared: Dict[Path, "GitUtil"] = {}
 
     def __init__(
         self,
@@ -67,6 +69,19 @@ class GitUtil:
                 f"Unable to find Repository from current {repo_path.absolute()} - aborting"
             )
 
+    @classmethod
+    def shared(cls) -> "GitUtil":
+        """The GitUtil of the current directory, loaded once instead of on each use."""
+        current_path = Path.cwd()
+        if current_path not in cls._shared:
+            cls._shared[current_path] = cls(current_path)
+        return cls._shared[current_path]
+
+    @property
+    def object_reader(self) -> GitObjectReader:
+        """The shared reader of the files of any revision of the repository."""
+        return GitObjectReader.for_repo(self.repo.working_dir)
+
     @classmethod
     def from_content_path(cls, path: Optional[Path] = None) -> "GitUtil":
         if content_path := os.getenv("DEMISTO_SDK_CONTENT_PATH"):
@@ -158,13 +173,14 @@ class GitUtil:
         commit = self.get_commit(commit_or_branch, from_remote=from_remote)
         path = str(self.path_from_git_root(path))
 
-        try:
-            blob: Blob = commit.tree / path
-        except KeyError:
+        content = self.object_reader.read(
+            commit.hexsha, Path(self.repo.working_dir, path)
+        )
+        if content is None:
             raise GitFileNotFoundError(
                 commit_or_branch, path=path, from_remote=from_remote
             )
-        return blob.data_stream.read()
+        return content
 
     def is_file_exist_in_commit_or_branch(
         self, path: Union[Path, str], commit_or_branch: str, from_remote: bool = True
@@ -177,10 +193,9 @@ class GitUtil:
 
         path = str(self.path_from_git_root(path))
 
-        try:
-            return commit.tree[path].path == path
-        except KeyError:
-            return False
+        return self.object_reader.exists(
+            commit.hexsha, Path(self.repo.working_dir, path)
+        )
 
     @lru_cache
     def get_all_files(self) -> Set[Path]:
@@ -817,6 +832,7 @@ class GitUtil:
     def get_current_commit_hash(self) -> str:
         return str(self.repo.head.object.hexsha)
 
+    @lru_cache
     def git_path(self) -> str:
         git_path = self.repo.git.rev_parse("--show-toplevel")
         return git_path.replace("\n", "")
@@ -921,10 +937,15 @@ class GitUtil:
             git_file_path: The git file path. For example get origin/master:README.md
 
         Returns:
-            The fetched file content.
+            The fetched file content, empty if the file does not exist in that branch.
         """
-        file_content = self.repo.git.show(git_file_path)
-        return file_content
+        revision, _, path = git_file_path.partition(":")
+        content = self.object_reader.read(revision, Path(self.repo.working_dir, path))
+        if not content:
+            return ""
+        text = content.decode()
+        # as returned by git show
+        return text[:-1] if text.endswith("\n") else text
 
     def get_local_remote_file_path(
         self, full_file_path: str, tag: str, from_remote: bool = True
@@ -1,13 +1,18 @@
 import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from functools import lru_cache
-from typing import Optional, Tuple, Union
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Union
 
 import requests
 from dateparser import parse
 from pkg_resources import parse_version
+from requests.adapters import HTTPAdapter
 
 from demisto_sdk.commands.common.constants import (
+    API_MODULES_PACK,
     NATIVE_IMAGE_DOCKER_NAME,
     IronBankDockers,
 )
@@ -16,7 +21,12 @@ from demisto_sdk.commands.common.hook_validations.base_validator import (
     BaseValidator,
     error_codes,
 )
-from demisto_sdk.commands.common.tools import get_pack_metadata, get_yaml
+from demisto_sdk.commands.common.logger import logger
+from demisto_sdk.commands.common.tools import (
+    get_pack_metadata,
+    get_yaml,
+    is_iron_bank_pack,
+)
 
 # disable insecure warnings
 requests.packages.urllib3.disable_warnings()  # type: ignore
@@ -31,9 +41,29 @@ ACCEPT_HEADER = {
 TIMEOUT = 60
 DEFAULT_REGISTRY = "registry-1.docker.io"
 DEPRECATED_DOCKER_IMAGE_LIST_URL = "https://raw.githubusercontent.com/demisto/dockerfiles/master/docker/deprecated_images.json"
+# the number of docker images which are resolved concurrently by the prefetch
+DOCKER_PREFETCH_WORKERS = 8
+# registry tokens are valid for 5 minutes, they are reused for a bit less than that
+AUTH_TOKEN_TTL = 4 * 60
+
+
+@lru_cache
+def get_registry_session() -> requests.Session:
+    """The session of the docker hub requests, shared between the threads so the connections are kept alive."""
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_maxsize=DOCKER_PREFETCH_WORKERS))
+    return session
 
 
 class DockerImageValidator(BaseValidator):
+    # the docker hub data of the images which were resolved in advance, see prefetch_docker_images
+    _PREFETCHED_LATEST_TAGS: Dict[str, str] = {}
+    _PREFETCHED_CREATION_DATES: Dict[Tuple[str, str], datetime] = {}
+    _PREFETCHED_DEPRECATED_IMAGES: Optional[List[dict]] = None
+    # the registry tokens by the registry and the image, with the time they were received
+    _AUTH_TOKENS: Dict[Tuple[str, str], Tuple[Optional[str], float]] = {}
+    _AUTH_TOKENS_LOCK = threading.Lock()
+
     def __init__(
         self,
         yml_file_path,
@@ -190,9 +220,11 @@ class DockerImageValidator(BaseValidator):
             bool: True if the docker is more than 3 days old.
         """
         three_days_ago: Optional[datetime] = parse("3 days ago")
-        last_updated = self.get_docker_image_creation_date(
-            self.docker_image_name, self.docker_image_tag
-        )
+        image = (self.docker_image_name, self.docker_image_tag)
+        if image in self._PREFETCHED_CREATION_DATES:
+            last_updated = self._PREFETCHED_CREATION_DATES[image]
+        else:
+            last_updated = self.get_docker_image_creation_date(*image)
         return not last_updated or three_days_ago > last_updated
 
     def get_code_type(self):
@@ -233,8 +265,28 @@ class DockerImageValidator(BaseValidator):
     def docker_auth(image_name, verify_ssl=True, registry=DEFAULT_REGISTRY):
         """
         Authenticate to the docker service. Return an authentication token if authentication is required.
+        The token of each image is reused by the following requests of the image, until it is about to expire.
         """
-        res = requests.get(
+        with DockerImageValidator._AUTH_TOKENS_LOCK:
+            token, received_at = DockerImageValidator._AUTH_TOKENS.get(
+                (registry, image_name), (None, 0)
+            )
+        if time.time() - received_at < AUTH_TOKEN_TTL:
+            return token
+        token = DockerImageValidator._request_auth_token(
+            image_name, verify_ssl, registry
+        )
+        with DockerImageValidator._AUTH_TOKENS_LOCK:
+            DockerImageValidator._AUTH_TOKENS[(registry, image_name)] = (
+                token,
+                time.time(),
+            )
+        return token
+
+    @staticmethod
+    def _request_auth_token(image_name, verify_ssl, registry):
+        session = get_registry_session()
+        res = session.get(
             f"https://{registry}/v2/",
             headers=ACCEPT_HEADER,
             timeout=TIMEOUT,
@@ -251,7 +303,7 @@ class DockerImageValidator(BaseValidator):
                 if parse_auth:
                     realm, service = parse_auth
             params = {"scope": f"repository:{image_name}:pull", "service": service}
-            res = requests.get(
+            res = session.get(
                 url=realm,
                 params=params,
                 headers=ACCEPT_HEADER,
@@ -333,14 +385,7 @@ class DockerImageValidator(BaseValidator):
             The last_updated value of the docker
         """
         last_updated = None
-        auth_token = DockerImageValidator.docker_auth(
-            docker_image_name, False, DEFAULT_REGISTRY
-        )
-        headers = ACCEPT_HEADER.copy()
-        if auth_token:
-            headers["Authorization"] = f"Bearer {auth_token}"
-        # first try to get the docker image tags using normal http request
-        res = requests.get(
+        res = get_registry_session().get(
             url=f"https://hub.docker.com/v2/repositories/{docker_image_name}/tags/{docker_image_tag}",
             verify=False,
             timeout=TIMEOUT,
@@ -362,14 +407,9 @@ class DockerImageValidator(BaseValidator):
             The latest tag for the docker image.
         """
         tag = ""
-        auth_token = DockerImageValidator.docker_auth(
-            docker_image_name, False, DEFAULT_REGISTRY
-        )
-        headers = ACCEPT_HEADER.copy()
-        if auth_token:
-            headers["Authorization"] = f"Bearer {auth_token}"
+        session = get_registry_session()
         # first try to get the docker image tags using normal http request
-        res = requests.get(
+        res = session.get(
             url=f"https://hub.docker.com/v2/repositories/{docker_image_name}/tags",
             verify=False,
             timeout=TIMEOUT,
@@ -383,7 +423,13 @@ class DockerImageValidator(BaseValidator):
         else:
             # if http request did not succeed than get tags using the API.
             # See: https://docs.docker.com/registry/spec/api/#listing-image-tags
-            res = requests.get(
+            auth_token = DockerImageValidator.docker_auth(
+                docker_image_name, False, DEFAULT_REGISTRY
+            )
+            headers = ACCEPT_HEADER.copy()
+            if auth_token:
+                headers["Authorization"] = f"Bearer {auth_token}"
+            res = session.get(
                 f"https://{DEFAULT_REGISTRY}/v2/{docker_image_name}/tags/list",
                 headers=headers,
                 timeout=TIMEOUT,
@@ -424,6 +470,8 @@ class DockerImageValidator(BaseValidator):
                 return self.get_docker_image_latest_tag_from_iron_bank_request(
                     docker_image_name
                 )
+            if docker_image_name in self._PREFETCHED_LATEST_TAGS:
+                return self._PREFETCHED_LATEST_TAGS[docker_image_name]
             return self.get_docker_image_latest_tag_request(docker_image_name)
         except (requests.exceptions.RequestException, Exception) as e:
             if not docker_image_name:
@@ -601,7 +649,11 @@ class DockerImageValidator(BaseValidator):
             docker_image_name (str): The name of the docker image for example: demisto/python
         Returns: Tuple with the docker image name and reason if it's deprecated.
         """
-        docker_image_deprecated_list = self.get_deprecated_dockers_list()
+        docker_image_deprecated_list = (
+            self._PREFETCHED_DEPRECATED_IMAGES
+            if self._PREFETCHED_DEPRECATED_IMAGES is not None
+            else self.get_deprecated_dockers_list()
+        )
         for docker_image in docker_image_deprecated_list:
             if docker_image_name == docker_image.get("image_name"):
                 deprecated_reason = docker_image.get("reason")
@@ -620,3 +672,134 @@ class DockerImageValidator(BaseValidator):
             return NATIVE_IMAGE_DOCKER_NAME in self.yml_docker_image
 
         return False
+
+    @staticmethod
+    def get_docker_images_of_files(file_paths: Iterable[str]) -> Dict[str, Set[str]]:
+        """
+        Returns the tags of the docker images of the given integrations and scripts by their image names,
+        the default image of the python version is given (without a tag) for files which have no docker image.
+        Files of other content types, javascript files and Iron Bank files are skipped.
+        """
+        images: Dict[str, Set[str]] = {}
+        for file_path in file_paths:
+            if API_MODULES_PACK in str(file_path):
+                continue
+            try:
+                yml_file = get_yaml(file_path)
+                if (
+                    not isinstance(yml_file, dict)
+                    or "script" not in yml_file
+                    or is_iron_bank_pack(file_path)
+                ):
+                    continue
+            except Exception as error:
+                logger.debug(
+                    f"Could not read {file_path} for its docker image: {error}"
+                )
+                continue
+            # integrations keep the docker image under the script section, scripts at the top level
+            script = (
+                yml_file["script"] if isinstance(yml_file["script"], dict) else yml_file
+            )
+            if script.get("type", "python") == "javascript":
+                continue
+            if docker_image := script.get("dockerimage"):
+                image_name, _, tag = docker_image.partition(":")
+                if image_name.startswith("demisto/"):
+                    images.setdefault(image_name, set()).add(tag)
+            elif script.get("subtype", "python2") == "python2":
+                images.setdefault("demisto/python", set())
+            else:
+                images.setdefault("demisto/python3", set())
+        return images
+
+    @staticmethod
+    def _prefetch(description: str, function, *args):
+        try:
+            return function(*args)
+        except Exception as error:
+            # the validator requests it again, and reports the error if it happens again
+            logger.debug(f"Could not prefetch the {description} of {args}: {error}")
+            return None
+
+    @staticmethod
+    def prefetch_docker_images(
+        file_paths: Iterable[str], max_workers: int = DOCKER_PREFETCH_WORKERS
+    ) -> None:
+        """
+        Resolves the docker hub data of the docker images of the integrations and scripts concurrently, once per
+        image, the results are used by the following validations of these files instead of requests per file.
+        The latest tag of every image, the deprecated images, and the creation date of every image tag which is
+        not the latest one are resolved.
+
+        Args:
+            file_paths: the paths of the files which are about to be validated
+            max_workers: the number of requests which are sent concurrently
+        """
+        images = DockerImageValidator.get_docker_images_of_files(file_paths)
+        image_names = [
+            image_name
+            for image_name in images
+            if image_name not in DockerImageValidator._PREFETCHED_LATEST_TAGS
+        ]
+        if not image_names:
+            return
+        logger.debug(f"Prefetching {len(image_names)} docker images")
+        prefetch = DockerImageValidator._prefetch
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            deprecated_images = None
+            if DockerImageValidator._PREFETCHED_DEPRECATED_IMAGES is None:
+                deprecated_images = executor.submit(
+                    prefetch,
+                    "deprecated images",
+                    DockerImageValidator.get_deprecated_dockers_list,
+                )
+            latest_tags = executor.map(
+                lambda image_name: prefetch(
+                    "latest tag",
+                    DockerImageValidator.get_docker_image_latest_tag_request,
+                    image_name,
+                ),
+                image_names,
+            )
+            for image_name, latest_tag in zip(image_names, latest_tags):
+                if latest_tag is not None:
+                    DockerImageValidator._PREFETCHED_LATEST_TAGS[
+                        image_name
+                    ] = latest_tag
+
+            # the creation date is needed only by images which are not on the latest tag
+            outdated_images = [
+                (image_name, tag)
+                for image_name in image_names
+                for tag in images[image_name]
+                if tag
+                and DockerImageValidator._PREFETCHED_LATEST_TAGS.get(image_name)
+                not in (None, tag)
+            ]
+            creation_dates = executor.map(
+                lambda image: prefetch(
+                    "creation date",
+                    DockerImageValidator.get_docker_image_creation_date,
+                    *image,
+                ),
+                outdated_images,
+            )
+            for image, creation_date in zip(outdated_images, creation_dates):
+                if creation_date is not None:
+                    DockerImageValidator._PREFETCHED_CREATION_DATES[
+                        image
+                    ] = creation_date
+            if (
+                deprecated_images
+                and (deprecated_images_list := deprecated_images.result()) is not None
+            ):
+                DockerImageValidator._PREFETCHED_DEPRECATED_IMAGES = (
+                    deprecated_images_list
+                )
+
+    @staticmethod
+    def clear_prefetched_docker_images() -> None:
+        DockerImageValidator._PREFETCHED_LATEST_TAGS = {}
+        DockerImageValidator._PREFETCHED_CREATION_DATES = {}
+        DockerImageValidator._PREFETCHED_DEPRECATED_IMAGES = None
@@ -1,3 +1,4 @@
+import hashlib
 import os
 import re
 import socket
@@ -6,14 +7,13 @@ from dataclasses import dataclass
 from functools import lru_cache
 from pathlib import Path
 from threading import Lock
-from typing import Callable, List, Optional, Set
+from typing import Callable, Dict, Iterable, List, Optional, Set
 from urllib.parse import urlparse
 
 import docker
 import requests
 from git import InvalidGitRepositoryError
 from requests.adapters import HTTPAdapter
-from requests.exceptions import HTTPError
 from urllib3.util import Retry
 
 from demisto_sdk.commands.common.constants import (
@@ -40,17 +40,21 @@ from demisto_sdk.commands.common.hook_validations.base_validator import (
 from demisto_sdk.commands.common.logger import logger
 from demisto_sdk.commands.common.markdown_lint import run_markdownlint
 from demisto_sdk.commands.common.MDXServer import (
+    PERSISTENT_MDX_SERVER,
     start_docker_MDX_server,
     start_local_MDX_server,
+    start_persistent_local_MDX_server,
+    validate_mdx_batch,
 )
 from demisto_sdk.commands.common.tools import (
     compare_context_path_in_yml_and_readme,
     get_pack_name,
-    get_url_with_retries,
     get_yaml,
     get_yml_paths_in_dir,
     run_command_os,
+    string_to_bool,
 )
+from demisto_sdk.commands.common.url_checker import UrlChecker, get_url_check_cache
 
 NO_HTML = "<!-- NOT_HTML_DOC -->"
 YES_HTML = "<!-- HTML_DOC -->"
@@ -138,6 +142,39 @@ def get_relative_urls(content: str) -> Set[ReadmeUrl]:
     )
 
 
+def get_absolute_image_urls(content: str) -> List[str]:
+    """
+    Find all absolute image urls (md images and html img tags) in README.
+    Returns: the urls, in the order of their links.
+    """
+    absolute_links = re.findall(
+        URL_IMAGE_LINK_REGEX,
+        content,
+        re.IGNORECASE | re.MULTILINE,
+    )
+    absolute_links += re.findall(
+        HTML_IMAGE_LINK_REGEX,
+        content,
+        re.IGNORECASE | re.MULTILINE,
+    )
+    # striping in case there are whitespaces at the beginning/ending of url.
+    return [link[1].strip() for link in absolute_links]
+
+
+def is_branch_image_url(image_url: str, working_branch_name: str) -> bool:
+    """
+    Whether the image url contains the working branch name (other than master), such links are invalid since the
+    branch will be deleted after merge to master. in the url path (after '.com'), the third element should be the
+    branch name, e.g. 'https://raw.githubusercontent.com/demisto/content/<branch-name>/Packs/.../image.png'
+    """
+    url_path_elem_list = urlparse(image_url).path.split("/")[1:]
+    return (
+        len(url_path_elem_list) >= 3
+        and url_path_elem_list[2] == working_branch_name
+        and working_branch_name != DEMISTO_GIT_PRIMARY_BRANCH
+    )
+
+
 def mdx_server_is_up() -> bool:
     """
     Will ping the node server to check if it is already up
@@ -167,6 +204,11 @@ class ReadMeValidator(BaseValidator):
 
     # Static var to hold the mdx server process
     _MDX_SERVER_LOCK = Lock()
+    # the mdx parse results of the READMEs which were validated in batches, by the digest of their (fixed) content
+    _PREFETCHED_MDX_RESULTS: Dict[str, Optional[str]] = {}
+    # the current branch and the checker of the absolute image links, which are shared by the READMEs of the run
+    _WORKING_BRANCH_NAME: Optional[str] = None
+    _URL_CHECKER: Optional[UrlChecker] = None
     MINIMUM_README_LENGTH = 30
 
     def __init__(
@@ -220,9 +262,19 @@ class ReadMeValidator(BaseValidator):
         server_started = mdx_server_is_up()
         if not server_started:
             return False
+        readme_content = self.fix_mdx()
+        content_digest = ReadMeValidator._mdx_content_digest(readme_content)
+        if content_digest in ReadMeValidator._PREFETCHED_MDX_RESULTS:
+            parse_error = ReadMeValidator._PREFETCHED_MDX_RESULTS[content_digest]
+            if parse_error:
+                error_message, error_code = Errors.readme_error(parse_error)
+                if self.handle_error(
+                    error_message, error_code, file_path=self.file_path
+                ):
+                    return False
+            return True
         for _ in range(RETRIES_VERIFY_MDX):
             try:
-                readme_content = self.fix_mdx()
                 retry = Retry(total=2)
                 adapter = HTTPAdapter(max_retries=retry)
                 session = requests.Session()
@@ -269,7 +321,10 @@ class ReadMeValidator(BaseValidator):
         )
 
     def fix_mdx(self) -> str:
-        txt = self.readme_content
+        return ReadMeValidator.fix_mdx_content(self.readme_content)
+
+    @staticmethod
+    def fix_mdx_content(txt: str) -> str:
         # copied from: https://github.com/demisto/content-docs/blob/2402bd1ab1a71f5bf1a23e1028df6ce3b2729cbb/content-repo/mdx_utils.py#L11
         # to use the same logic as we have in the content-docs build
         replace_tuples = [
@@ -285,17 +340,66 @@ class ReadMeValidator(BaseValidator):
         return txt
 
     def is_html_doc(self) -> bool:
-        if self.readme_content.startswith(NO_HTML):
+        return ReadMeValidator.is_html_content(self.readme_content)
+
+    @staticmethod
+    def is_html_content(readme_content: str) -> bool:
+        if readme_content.startswith(NO_HTML):
             return False
-        if self.readme_content.startswith(YES_HTML):
+        if readme_content.startswith(YES_HTML):
             return True
         # use some heuristics to try to figure out if this is html
         return (
-            self.readme_content.startswith("<p>")
-            or self.readme_content.startswith("<!DOCTYPE html>")
-            or ("<thead>" in self.readme_content and "<tbody>" in self.readme_content)
+            readme_content.startswith("<p>")
+            or readme_content.startswith("<!DOCTYPE html>")
+            or ("<thead>" in readme_content and "<tbody>" in readme_content)
         )
 
+    @staticmethod
+    def _mdx_content_digest(readme_content: str) -> str:
+        return hashlib.sha256(readme_content.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def prefetch_mdx_validations(file_paths: Iterable[str]) -> None:
+        """
+        Parses the READMEs using the batch endpoint of the mdx server, instead of a request per README,
+        the results are used by the following mdx validations of these READMEs.
+        Should be called while the server is up, READMEs which are not prefetched are parsed one by one as usual.
+
+        Args:
+            file_paths: the paths of the READMEs which are about to be validated
+        """
+        if not mdx_server_is_up():
+            return
+        documents = {}
+        for file_path in file_paths:
+            try:
+                readme_content = Path(file_path).read_text()
+            except Exception as error:
+                logger.debug(f"Could not read {file_path} for mdx validation: {error}")
+                continue
+            if ReadMeValidator.is_html_content(readme_content):
+                continue
+            readme_content = ReadMeValidator.fix_mdx_content(readme_content)
+            content_digest = ReadMeValidator._mdx_content_digest(readme_content)
+            if content_digest not in ReadMeValidator._PREFETCHED_MDX_RESULTS:
+                documents[content_digest] = readme_content
+        if not documents:
+            return
+
+        try:
+            results = validate_mdx_batch(documents)
+        except Exception as error:
+            logger.debug(f"Could not validate the READMEs in batches: {error}")
+            return
+        if results is None:
+            logger.debug(
+                "The mdx server does not support batches, validating the READMEs one by one"
+            )
+            return
+        logger.debug(f"Validated {len(results)} READMEs in batches")
+        ReadMeValidator._PREFETCHED_MDX_RESULTS.update(results)
+
     @error_codes("RM101")
     def is_image_path_valid(self) -> bool:
         """Validate images absolute paths, and prints the suggested path if its not valid.
@@ -510,6 +614,49 @@ class ReadMeValidator(BaseValidator):
 
         return error_list
 
+    @staticmethod
+    def get_working_branch_name() -> str:
+        """The current branch (or commit hash), which should not be linked by the absolute image links."""
+        if ReadMeValidator._WORKING_BRANCH_NAME is not None:
+            return ReadMeValidator._WORKING_BRANCH_NAME
+        try:
+            return GitUtil().get_current_git_branch_or_hash()
+        except InvalidGitRepositoryError:
+            return ""
+
+    @staticmethod
+    def get_url_checker() -> UrlChecker:
+        """The checker of the absolute image links, shared by all the READMEs of the run."""
+        if ReadMeValidator._URL_CHECKER is None:
+            ReadMeValidator._URL_CHECKER = UrlChecker(cache=get_url_check_cache())
+        return ReadMeValidator._URL_CHECKER
+
+    @staticmethod
+    def prefetch_absolute_image_links(file_paths: Iterable[str]) -> None:
+        """
+        Checks the absolute image links of the READMEs all at once, concurrently and once per link,
+        the results are used by the following absolute image path validations of these READMEs.
+
+        Args:
+            file_paths: the paths of the READMEs which are about to be validated
+        """
+        working_branch_name = ReadMeValidator.get_working_branch_name()
+        ReadMeValidator._WORKING_BRANCH_NAME = working_branch_name
+        image_urls = []
+        for file_path in file_paths:
+            try:
+                readme_content = Path(file_path).read_text()
+            except Exception as error:
+                logger.debug(f"Could not read {file_path} for image links: {error}")
+                continue
+            image_urls.extend(
+                image_url
+                for image_url in get_absolute_image_urls(readme_content)
+                if not is_branch_image_url(image_url, working_branch_name)
+            )
+        if image_urls:
+            ReadMeValidator.get_url_checker().check_many(image_urls)
+
     def check_readme_absolute_image_paths(self, is_pack_readme: bool = False) -> list:
         """Validate readme images absolute paths - Check if absolute paths are not broken.
 
@@ -520,50 +667,28 @@ class ReadMeValidator(BaseValidator):
             list: List of the errors found
         """
         error_list = []
-        working_branch_name: str = ""
-        try:
-            working_branch_name = GitUtil().get_current_git_branch_or_hash()
-        except InvalidGitRepositoryError:
-            pass
-        absolute_links = re.findall(
-            URL_IMAGE_LINK_REGEX,
-            self.readme_content,
-            re.IGNORECASE | re.MULTILINE,
-        )
-        absolute_links += re.findall(
-            HTML_IMAGE_LINK_REGEX,
-            self.readme_content,
-            re.IGNORECASE | re.MULTILINE,
-        )
-        for link in absolute_links:
+        working_branch_name = self.get_working_branch_name()
+        for img_url in get_absolute_image_urls(self.readme_content):
             error_message: str = ""
             error_code: str = ""
-            img_url = link[
-                1
-            ].strip()  # striping in case there are whitespaces at the beginning/ending of url.
             try:
-                # a link that contains a branch name (other than master) is invalid since the branch will be deleted
-                # after merge to master. in the url path (after '.com'), the third element should be the branch name.
-                # example 'https://raw.githubusercontent.com/demisto/content/<branch-name>/Packs/.../image.png'
-                url_path_elem_list = urlparse(img_url).path.split("/")[1:]
-                if len(url_path_elem_list) >= 3 and (
-                    url_path_elem_list[2] == working_branch_name
-                    and working_branch_name != DEMISTO_GIT_PRIMARY_BRANCH
-                ):
+                if is_branch_image_url(img_url, working_branch_name):
                     error_message, error_code = Errors.invalid_readme_image_error(
                         img_url,
                         error_type="branch_name_readme_absolute_error",
                     )
                 else:
-                    try:
-                        get_url_with_retries(
-                            img_url, retries=5, backoff_factor=1, timeout=10
+                    result = self.get_url_checker().check(img_url)
+                    if result.error:
+                        logger.warning(
+                            f"[yellow]Could not validate the image link: {img_url}\n {result.error}[/yellow]"
                         )
-                    except HTTPError as error:
+                        continue
+                    if result.is_broken:
                         error_message, error_code = Errors.invalid_readme_image_error(
                             img_url,
                             error_type="general_readme_absolute_error",
-                            response=error.response,
+                            response=result.to_response(),
                         )
             except Exception as ex:
                 logger.exception(
@@ -903,6 +1028,14 @@ class ReadMeValidator(BaseValidator):
                 return empty_context_mgr(True)
             if ReadMeValidator.are_modules_installed_for_verify(CONTENT_PATH):  # type: ignore
                 ReadMeValidator.add_node_env_vars()
+                if (
+                    string_to_bool(
+                        os.getenv(PERSISTENT_MDX_SERVER), default_when_empty=False
+                    )
+                    and start_persistent_local_MDX_server()
+                ):
+                    # the server is kept alive for the following runs
+                    return empty_context_mgr(True)
                 return start_local_MDX_server(handle_error, file_path)
             elif ReadMeValidator.is_docker_available():
                 return start_docker_MDX_server(handle_error, file_path)
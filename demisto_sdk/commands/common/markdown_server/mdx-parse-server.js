@@ -47,11 +47,62 @@ function markdownLint(req, res, body, query) {
         fixedText : fixedText, errorNum : validationResults[fileName].length}))
 
 }
+async function parseMdx(content) {
+    try {
+        await mdx(content)
+        return null
+    } catch (error) {
+        return "MDX parse failure: " + error
+    }
+}
+
+// parses many documents in a single request, the body is {"documents": [{"id": ..., "content": ...}]}
+// and the response is {"results": [{"id": ..., "error": null or the parse failure}]}, in the same order.
+async function batchParse(req, res, body) {
+    let documents
+    try {
+        documents = JSON.parse(body).documents
+        if (!Array.isArray(documents)) {
+            throw new Error('documents should be a list')
+        }
+    } catch (error) {
+        res.statusCode = 400
+        res.end('Invalid batch request: ' + error)
+        return
+    }
+    const results = await Promise.all(documents.map(async (document) => ({
+        id: document.id,
+        error: await parseMdx(document.content)
+    })))
+    res.setHeader('Content-Type', 'application/json');
+    res.statusCode = 200
+    res.end(JSON.stringify({ results: results }))
+}
+
+// a server which is kept alive between runs (MDX_SERVER_IDLE_TIMEOUT is set, in seconds) exits once it is idle
+const idleTimeout = parseInt(process.env.MDX_SERVER_IDLE_TIMEOUT || '0') * 1000
+let idleTimer = null
+
+function resetIdleTimer() {
+    if (idleTimeout > 0) {
+        clearTimeout(idleTimer)
+        idleTimer = setTimeout(() => process.exit(0), idleTimeout)
+    }
+}
+
 function requestHandler(req, res) {
     // console.log(req)
+    resetIdleTimer()
+    let urlObj = url.parse(req.url, true)
+    if (req.method == 'GET' && urlObj.pathname == '/health') {
+        res.setHeader('Content-Type', 'application/json');
+        res.end(JSON.stringify({ status: 'ok', batch: true, pid: process.pid }))
+        return
+    }
     if (req.method != 'POST') {
         res.statusCode = 405
         res.end('Only POST is supported')
+        return
     }
     let body = ''
     req.setEncoding('utf8');
@@ -61,18 +112,21 @@ function requestHandler(req, res) {
     req.on('end', async function () {
         //   console.log('Body length: ' + body.length)
 
-        let urlObj = url.parse(req.url, true)
         if(urlObj.pathname == '/markdownlint')
         {
             markdownLint(req, res, body, urlObj.query)
         }
+        else if(urlObj.pathname == '/batch')
+        {
+            await batchParse(req, res, body)
+        }
         else {
-            try {
-                let parsed = await mdx(body)
-                res.end('Successfully parsed mdx')
-            } catch (error) {
+            let error = await parseMdx(body)
+            if (error) {
                 res.statusCode = 500
-                res.end("MDX parse failure: " + error)
+                res.end(error)
+            } else {
+                res.end('Successfully parsed mdx')
             }
         }
 
@@ -86,4 +140,5 @@ server.listen(6161, (err) => {
         return console.log('MDX server failed starting.', err)
     }
     console.log(`MDX server is listening on port: 6161`)
+    resetIdleTimer()
 });
@@ -0,0 +1,135 @@
+from multiprocessing import Pool
+from pathlib import Path
+
+import pytest
+from freezegun import freeze_time
+
+from demisto_sdk.commands.common.disk_cache import DiskCache
+
+
+def test_get_or_set_computes_only_on_miss(tmp_path: Path):
+    """
+    Given:
+        - an empty disk cache
+
+    When:
+        - running get_or_set twice with the same key, and once from a new cache instance on the same directory
+
+    Then:
+        - make sure the value is computed only once and shared between the instances
+    """
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return {"value": [1, 2]}
+
+    cache = DiskCache(tmp_path)
+    assert cache.get_or_set("key", compute) == {"value": [1, 2]}
+    assert cache.get_or_set("key", compute) == {"value": [1, 2]}
+    assert DiskCache(tmp_path).get_or_set("key", compute) == {"value": [1, 2]}
+    assert len(calls) == 1
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_expiration(tmp_path: Path):
+    """
+    Given:
+        - a mutable and an immutable entry
+
+    When:
+        - getting them after the ttl has passed
+
+    Then:
+        - make sure only the mutable entry expired
+        - make sure the expired entry is still returned when allowing expired entries
+    """
+    cache = DiskCache(tmp_path, ttl=60)
+    with freeze_time("2024-01-01 00:00:00"):
+        cache.set("mutable", 1)
+        cache.set("immutable", 2, immutable=True)
+
+    with freeze_time("2024-01-01 00:02:00"):
+        assert cache.get("mutable") is None
+        assert cache.get("mutable", allow_expired=True) == 1
+        assert cache.get("immutable") == 2
+
+
+def test_fallback_to_expired_entry(tmp_path: Path):
+    """
+    Given:
+        - an expired entry
+
+    When:
+        - the computation of the entry fails with a connection error
+
+    Then:
+        - make sure the expired entry is returned
+        - make sure other errors, or errors without an expired entry, are raised
+    """
+    cache = DiskCache(tmp_path, ttl=60)
+
+    def fail():
+        raise ConnectionError("no network")
+
+    with freeze_time("2024-01-01 00:00:00"):
+        cache.set("key", "old")
+
+    with freeze_time("2024-01-01 00:02:00"):
+        assert (
+            cache.get_or_set("key", fail, fallback_to_expired_on=(ConnectionError,))
+            == "old"
+        )
+        with pytest.raises(ConnectionError):
+            cache.get_or_set("key", fail)
+        with pytest.raises(ConnectionError):
+            cache.get_or_set(
+                "missing-key", fail, fallback_to_expired_on=(ConnectionError,)
+            )
+
+
+def _compute_in_process(cache_dir: str) -> str:
+    def compute():
+        with open(Path(cache_dir) / "computations.txt", "a") as computations:
+            computations.write("1\n")
+        return "value"
+
+    return DiskCache(cache_dir).get_or_set("shared-key", compute)
+
+
+def test_get_or_set_between_processes(tmp_path: Path):
+    """
+    Given:
+        - several processes which share the same cache directory
+
+    When:
+        - all of them running get_or_set with the same key at the same time
+
+    Then:
+        - make sure the value is computed only once
+    """
+    with Pool(4) as pool:
+        results = pool.map(_compute_in_process, [str(tmp_path)] * 8)
+
+    assert results == ["value"] * 8
+    assert (tmp_path / "computations.txt").read_text().count("1") == 1
+
+
+def test_corrupted_entry(tmp_path: Path):
+    """
+    Given:
+        - a cache entry which its file is corrupted
+
+    When:
+        - running get_or_set
+
+    Then:
+        - make sure the entry is treated as a miss and is rewritten
+    """
+    cache = DiskCache(tmp_path)
+    cache.set("key", "value")
+    cache._entry_path("key").write_text("{not json")
+
+    assert cache.get("key") is None
+    assert cache.get_or_set("key", lambda: "new value") == "new value"
+    assert cache.get("key") == "new value"
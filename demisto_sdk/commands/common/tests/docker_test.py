@@ -806,3 +806,70 @@ class TestDockerImage:
                 "demisto/aiohttp",
                 "Use the demisto/py3-tools docker image instead.",
             ) == docker_image_validator.is_docker_image_deprecated("demisto/aiohttp")
+
+
+def test_prefetch_docker_images(pack, requests_mock):
+    """
+    Given:
+        - two integrations and a script, two of them use the latest tag of one image, and one uses an outdated tag of
+          another image
+
+    When:
+        - prefetching their docker images, and then validating each one of them
+
+    Then:
+        - make sure the latest tag of each image, the deprecated images and the creation date of the outdated tag
+          are requested once
+        - make sure the validations use the prefetched data, without additional requests
+    """
+    DockerImageValidator.get_docker_image_latest_tag_request.cache_clear()
+    DockerImageValidator.get_docker_image_creation_date.cache_clear()
+    DockerImageValidator.clear_prefetched_docker_images()
+    requests_mock.get(DEPRECATED_IMAGES_URL, json=[])
+    requests_mock.get(
+        "https://hub.docker.com/v2/repositories/demisto/prefetched/tags",
+        json={"results": MOCK_TAG_LIST},
+    )
+    requests_mock.get(
+        "https://hub.docker.com/v2/repositories/demisto/outdated/tags",
+        json={"results": MOCK_TAG_LIST},
+    )
+    requests_mock.get(
+        "https://hub.docker.com/v2/repositories/demisto/outdated/tags/1.0.0.2689",
+        json=MOCK_TAG_LIST[1],
+    )
+    yml_paths = [
+        pack.create_integration(
+            "First", docker_image="demisto/prefetched:1.0.0.2876"
+        ).yml.path,
+        pack.create_integration(
+            "Second", docker_image="demisto/outdated:1.0.0.2689"
+        ).yml.path,
+        pack.create_script(
+            "Script", docker_image="demisto/prefetched:1.0.0.2876"
+        ).yml.path,
+    ]
+
+    try:
+        DockerImageValidator.prefetch_docker_images(yml_paths)
+        assert sorted(request.path for request in requests_mock.request_history) == [
+            "/demisto/dockerfiles/master/docker/deprecated_images.json",
+            "/v2/repositories/demisto/outdated/tags",
+            "/v2/repositories/demisto/outdated/tags/1.0.0.2689",
+            "/v2/repositories/demisto/prefetched/tags",
+        ]
+        requests_count = requests_mock.call_count
+
+        validators = [
+            DockerImageValidator(yml_path, True, "Integrations" in yml_path)
+            for yml_path in yml_paths
+        ]
+        assert [validator.docker_image_latest_tag for validator in validators] == [
+            "1.0.0.2876"
+        ] * 3
+        assert validators[0].is_docker_image_valid()
+        assert not validators[1].is_docker_image_valid()
+        assert validators[2].is_docker_image_valid()
+        assert requests_mock.call_count == requests_count
+    finally:
+        DockerImageValidator.clear_prefetched_docker_images()
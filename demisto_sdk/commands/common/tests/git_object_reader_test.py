@@ -0,0 +1,89 @@
+import pytest
+
+from demisto_sdk.commands.common.git_object_reader import GitObjectReader
+from demisto_sdk.commands.common.git_util import GitUtil
+
+
+@pytest.fixture
+def git_repo(tmp_path):
+    """A repository with two commits, the second one modifies the README and adds a new file."""
+    repo_path = tmp_path / "content"
+    repo = GitUtil.REPO_CLS.init(repo_path)
+    with repo.config_writer() as config:
+        config.set_value("user", "name", "test")
+        config.set_value("user", "email", "test@test.com")
+    (repo_path / "Packs" / "Test").mkdir(parents=True)
+    (repo_path / "Packs" / "Test" / "README.md").write_text("old readme\n")
+    repo.index.add(["Packs/Test/README.md"])
+    first_commit = repo.index.commit("first").hexsha
+    (repo_path / "Packs" / "Test" / "README.md").write_text("new readme\n")
+    (repo_path / "Packs" / "Test" / "pack_metadata.json").write_text("{}")
+    repo.index.add(["Packs/Test/README.md", "Packs/Test/pack_metadata.json"])
+    repo.index.commit("second")
+    yield repo_path, first_commit
+    GitObjectReader.close_all()
+
+
+def test_read_files_of_revisions(git_repo):
+    """
+    Given:
+        - a repository with a file which was modified, and a file which was added, in the last commit
+
+    When:
+        - reading the files of the first commit and of the branch
+
+    Then:
+        - make sure the content of each revision is returned
+        - make sure files which do not exist in the revision, or are outside of the repository, are None
+    """
+    repo_path, first_commit = git_repo
+    reader = GitObjectReader.for_repo(repo_path)
+    readme = repo_path / "Packs" / "Test" / "README.md"
+    metadata = repo_path / "Packs" / "Test" / "pack_metadata.json"
+
+    assert reader.read(first_commit, readme) == b"old readme\n"
+    assert reader.read_many(
+        "HEAD", [readme, metadata, repo_path.parent / "outside.md"]
+    ) == [b"new readme\n", b"{}", None]
+    assert reader.read_many(first_commit, [metadata, readme]) == [
+        None,
+        b"old readme\n",
+    ]
+    assert reader.read("no-such-branch", readme) is None
+
+
+def test_file_exists_in_revision(git_repo):
+    """
+    Given:
+        - a repository with a file which was added in the last commit
+
+    When:
+        - checking whether it exists in the first and in the last commits
+
+    Then:
+        - make sure it exists only in the last one
+    """
+    repo_path, first_commit = git_repo
+    reader = GitObjectReader.for_repo(repo_path)
+    metadata = repo_path / "Packs" / "Test" / "pack_metadata.json"
+
+    assert reader.exists("HEAD", metadata)
+    assert not reader.exists(first_commit, metadata)
+
+
+def test_reader_per_repository(git_repo):
+    """
+    Given:
+        - a repository
+
+    When:
+        - getting its reader from the root and from a sub directory
+
+    Then:
+        - make sure the same reader is returned, rooted at the repository
+    """
+    repo_path, _ = git_repo
+    reader = GitObjectReader.for_repo(repo_path)
+
+    assert GitObjectReader.for_repo(repo_path / "Packs" / "Test") is reader
+    assert reader.repo_path == repo_path.resolve()
@@ -10,6 +10,7 @@ import demisto_sdk
 from demisto_sdk.commands.common.git_util import GitUtil
 from demisto_sdk.commands.common.hook_validations.readme import ReadMeValidator
 from demisto_sdk.commands.common.legacy_git_tools import git_path
+from demisto_sdk.commands.common.MDXServer import validate_mdx_batch
 from TestSuite.test_tools import ChangeCWD, str_in_call_args_list
 
 VALID_MD = f"{git_path()}/demisto_sdk/tests/test_files/README-valid.md"
@@ -801,3 +802,168 @@ def test_verify_image_exist(mocker, current, answer):
     mocker.patch.object(Path, "is_file", return_value=answer)
 
     assert ReadMeValidator(current).verify_image_exist() == answer
+
+
+def _mock_mdx_batch_endpoint(request, context):
+    return {
+        "results": [
+            {
+                "id": document["id"],
+                "error": "MDX parse failure: Unexpected character"
+                if "<invalid" in document["content"]
+                else None,
+            }
+            for document in request.json()["documents"]
+        ]
+    }
+
+
+def test_prefetch_mdx_validations(mocker, monkeypatch, tmp_path):
+    """
+    Given:
+        - a valid README, an invalid README and an HTML README, and an mdx server which supports batches
+
+    When:
+        - prefetching the mdx validations of the READMEs, and then validating each one of them
+
+    Then:
+        - make sure all the READMEs are parsed in a single batch request, without the HTML README
+        - make sure the validations use the prefetched results, without additional requests
+    """
+    monkeypatch.setattr(ReadMeValidator, "_PREFETCHED_MDX_RESULTS", {})
+    mocker.patch(
+        "demisto_sdk.commands.common.hook_validations.readme.mdx_server_is_up",
+        return_value=True,
+    )
+    valid_readme = tmp_path / "README.md"
+    valid_readme.write_text("## Valid README\nThis is a valid README")
+    invalid_readme = tmp_path / "playbook-Test_README.md"
+    invalid_readme.write_text("## Invalid README\n<invalid")
+    html_readme = tmp_path / "Other_README.md"
+    html_readme.write_text("<p>This is an HTML README</p>")
+
+    with requests_mock.Mocker() as m:
+        m.post("http://localhost:6161/batch", json=_mock_mdx_batch_endpoint)
+        ReadMeValidator.prefetch_mdx_validations(
+            [str(valid_readme), str(invalid_readme), str(html_readme)]
+        )
+        assert len(m.request_history) == 1
+        assert len(m.request_history[0].json()["documents"]) == 2
+
+        assert ReadMeValidator(str(valid_readme)).mdx_verify_server()
+        assert not ReadMeValidator(str(invalid_readme)).mdx_verify_server()
+        assert len(m.request_history) == 1
+
+
+def test_prefetch_mdx_validations_unsupported_server(mocker, monkeypatch, tmp_path):
+    """
+    Given:
+        - an mdx server which does not support batches (parses the whole body as a single document)
+
+    When:
+        - prefetching the mdx validations of a README, and then validating it
+
+    Then:
+        - make sure nothing is prefetched, and the README is parsed by its own request
+    """
+    monkeypatch.setattr(ReadMeValidator, "_PREFETCHED_MDX_RESULTS", {})
+    mocker.patch(
+        "demisto_sdk.commands.common.hook_validations.readme.mdx_server_is_up",
+        return_value=True,
+    )
+    readme = tmp_path / "README.md"
+    readme.write_text("## Valid README\nThis is a valid README")
+
+    with requests_mock.Mocker() as m:
+        m.post("http://localhost:6161/batch", text="Successfully parsed mdx")
+        m.post("http://localhost:6161", text="Successfully parsed mdx")
+        ReadMeValidator.prefetch_mdx_validations([str(readme)])
+        assert not ReadMeValidator._PREFETCHED_MDX_RESULTS
+
+        assert ReadMeValidator(str(readme)).mdx_verify_server()
+        assert m.request_history[-1].path == "/"
+
+
+def test_validate_mdx_batch_concurrent_batches():
+    """
+    Given:
+        - several documents and a batch size smaller than their number
+
+    When:
+        - validating them in batches
+
+    Then:
+        - make sure the documents are split between several requests, and the results of all of them are returned
+    """
+    documents = {str(i): f"## Document {i}" for i in range(5)}
+    documents["invalid"] = "<invalid"
+
+    with requests_mock.Mocker() as m:
+        m.post("http://localhost:6161/batch", json=_mock_mdx_batch_endpoint)
+        results = validate_mdx_batch(documents, batch_size=2, max_workers=2)
+
+    assert len(m.request_history) == 3
+    assert results == {
+        **{str(i): None for i in range(5)},
+        "invalid": "MDX parse failure: Unexpected character",
+    }
+
+
+def test_prefetch_absolute_image_links(mocker, monkeypatch, tmp_path):
+    """
+    Given:
+        - two READMEs which link the same image, one of them also links a broken image and an image of the branch
+
+    When:
+        - prefetching their absolute image links, and then validating the absolute image paths of each one of them
+
+    Then:
+        - make sure each image is requested once, and the image of the branch is not requested at all
+        - make sure only the README with the broken image and the image of the branch is invalid
+    """
+    monkeypatch.setattr(ReadMeValidator, "_WORKING_BRANCH_NAME", None)
+    monkeypatch.setattr(ReadMeValidator, "_URL_CHECKER", None)
+    mocker.patch.object(
+        ReadMeValidator, "get_working_branch_name", return_value="my-branch"
+    )
+    mocker.patch("demisto_sdk.commands.common.tools.sleep")
+    shared_image = "https://github.com/demisto/content/raw/master/shared.png"
+    broken_image = "https://github.com/demisto/content/raw/master/broken.png"
+    branch_image = (
+        "https://raw.githubusercontent.com/demisto/content/my-branch/image.png"
+    )
+    valid_readme = tmp_path / "README.md"
+    valid_readme.write_text(f"## Valid README\n![shared]({shared_image})")
+    invalid_readme = tmp_path / "playbook-Test_README.md"
+    invalid_readme.write_text(
+        f'## Invalid README\n![shared]({shared_image})\n<img src="{broken_image}"/>\n'
+        f"![branch]({branch_image})"
+    )
+
+    with requests_mock.Mocker() as m:
+        m.head(shared_image, status_code=200)
+        m.head(broken_image, status_code=404)
+        m.get(broken_image, status_code=404, reason="Not Found")
+        ReadMeValidator.prefetch_absolute_image_links(
+            [str(valid_readme), str(invalid_readme)]
+        )
+        assert sorted(
+            (request.method, request.url) for request in m.request_history
+        ) == [
+            *([("GET", broken_image)] * 5),
+            ("HEAD", broken_image),
+            ("HEAD", shared_image),
+        ]
+        requests_count = len(m.request_history)
+
+        assert not ReadMeValidator(
+            str(valid_readme)
+        ).check_readme_absolute_image_paths()
+        errors = ReadMeValidator(
+            str(invalid_readme)
+        ).check_readme_absolute_image_paths()
+        assert len(m.request_history) == requests_count
+
+    assert len(errors) == 2
+    assert "Branch name was found in the URL" in errors[0]
+    assert "got HTTP response code 404, reason = Not Found" in errors[1]
@@ -0,0 +1,126 @@
+import multiprocessing
+import os
+
+from demisto_sdk.commands.common import tracing
+from demisto_sdk.commands.common.handlers import DEFAULT_JSON_HANDLER as json
+from demisto_sdk.commands.common.tracing import (
+    TRACE_FILE_ENV_VAR,
+    TRACE_PARTS_DIR_ENV_VAR,
+    span,
+    traced,
+)
+
+
+@traced()
+def traced_function(number: int) -> int:
+    return number * 2
+
+
+def traced_in_worker(number: int) -> int:
+    with span("worker span", number=number):
+        return traced_function(number)
+
+
+def load_spans(trace_file) -> list:
+    return [
+        event
+        for event in json.loads(trace_file.read_text())["traceEvents"]
+        if event["ph"] == "X"
+    ]
+
+
+def test_spans_are_written_to_trace_file(tmp_path):
+    """
+    Given:
+        - a traced command which runs a span and a traced function
+
+    When:
+        - the command ends
+
+    Then:
+        - make sure the trace file has a complete event for each one of them, nested within the command span
+        - make sure the arguments of the span are kept
+    """
+    trace_file = tmp_path / "trace.json"
+    with tracing.tracing(trace_file, name="test-command"):
+        with span("outer", pack="TestPack"):
+            assert traced_function(2) == 4
+
+    spans = {event["name"]: event for event in load_spans(trace_file)}
+    assert set(spans) == {"test-command", "outer", "traced_function"}
+    assert spans["outer"]["args"] == {"pack": "TestPack"}
+    assert spans["outer"]["pid"] == os.getpid()
+    command_span = spans["test-command"]
+    assert (
+        command_span["ts"]
+        <= spans["traced_function"]["ts"]
+        <= command_span["ts"] + command_span["dur"]
+    )
+    assert not tracing.tracing_enabled()
+    assert TRACE_PARTS_DIR_ENV_VAR not in os.environ
+
+
+def test_spans_of_worker_processes(tmp_path):
+    """
+    Given:
+        - a traced command which runs spans in the workers of a multiprocessing pool
+
+    When:
+        - the command ends
+
+    Then:
+        - make sure the spans of the workers are in the trace file, under the pids of the workers
+    """
+    trace_file = tmp_path / "trace.json"
+    with tracing.tracing(trace_file):
+        with multiprocessing.Pool(processes=2) as pool:
+            assert pool.map(traced_in_worker, range(4)) == [0, 2, 4, 6]
+
+    worker_spans = [
+        event for event in load_spans(trace_file) if event["name"] == "worker span"
+    ]
+    assert sorted(event["args"]["number"] for event in worker_spans) == [0, 1, 2, 3]
+    assert all(event["pid"] != os.getpid() for event in worker_spans)
+
+
+def test_tracing_from_environment_variable(tmp_path, monkeypatch):
+    """
+    Given:
+        - the trace file environment variable is set
+
+    When:
+        - running a command without a trace file argument
+
+    Then:
+        - make sure the trace is written to the file of the environment variable
+    """
+    trace_file = tmp_path / "trace.json"
+    monkeypatch.setenv(TRACE_FILE_ENV_VAR, str(trace_file))
+
+    with tracing.tracing(name="test-command"):
+        traced_function(1)
+
+    assert {event["name"] for event in load_spans(trace_file)} == {
+        "test-command",
+        "traced_function",
+    }
+
+
+def test_tracing_disabled(tmp_path, monkeypatch):
+    """
+    Given:
+        - no trace file
+
+    When:
+        - running spans and traced functions
+
+    Then:
+        - make sure nothing is traced
+    """
+    monkeypatch.delenv(TRACE_FILE_ENV_VAR, raising=False)
+    with tracing.tracing(name="test-command"):
+        with span("outer"):
+            assert traced_function(3) == 6
+        assert not tracing.tracing_enabled()
+
+    assert not list(tmp_path.iterdir())
@@ -0,0 +1,158 @@
+import threading
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from demisto_sdk.commands.common.disk_cache import DiskCache
+from demisto_sdk.commands.common.url_checker import (
+    URL_CHECK_CACHE_TTL,
+    UrlChecker,
+    UrlCheckResult,
+    get_url_check_cache,
+)
+
+
+class ImagesHandler(BaseHTTPRequestHandler):
+    """
+    /image.png supports HEAD requests, /no-head.png supports only GET requests, anything else does not exist.
+    """
+
+    requests: Counter = Counter()
+
+    def _respond(self, method: str):
+        ImagesHandler.requests[(method, self.path)] += 1
+        if self.path == "/image.png" or (
+            self.path == "/no-head.png" and method == "GET"
+        ):
+            status_code = 200
+        elif self.path == "/no-head.png":
+            status_code = 405
+        else:
+            status_code = 404
+        self.send_response(status_code)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def do_HEAD(self):
+        self._respond("HEAD")
+
+    def do_GET(self):
+        self._respond("GET")
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def images_server():
+    ImagesHandler.requests = Counter()
+    server = ThreadingHTTPServer(("localhost", 0), ImagesHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://localhost:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_check_many_urls(mocker, images_server):
+    """
+    Given:
+        - a reachable url which is given several times, a url which does not support HEAD requests and a broken url
+
+    When:
+        - checking them
+
+    Then:
+        - make sure each url is requested once, by HEAD and only when that fails by GET
+        - make sure only the broken url is broken
+    """
+    mocker.patch("demisto_sdk.commands.common.tools.sleep")
+    image, no_head, missing = (
+        f"{images_server}/image.png",
+        f"{images_server}/no-head.png",
+        f"{images_server}/missing.png",
+    )
+    checker = UrlChecker(max_workers=3, retries=2)
+
+    results = checker.check_many([image, no_head, image, missing, image])
+
+    assert list(results) == [image, no_head, missing]
+    assert not results[image].is_broken
+    assert not results[no_head].is_broken
+    assert results[missing] == UrlCheckResult(404, "Not Found")
+    assert ImagesHandler.requests == {
+        ("HEAD", "/image.png"): 1,
+        ("HEAD", "/no-head.png"): 1,
+        ("GET", "/no-head.png"): 1,
+        ("HEAD", "/missing.png"): 1,
+        ("GET", "/missing.png"): 2,
+    }
+
+    assert checker.check(image) == results[image]
+    assert ImagesHandler.requests[("HEAD", "/image.png")] == 1
+
+
+def test_check_url_without_response():
+    """
+    Given:
+        - a url of a server which is not reachable
+
+    When:
+        - checking it
+
+    Then:
+        - make sure the error is returned, and the url is not considered as broken
+    """
+    result = UrlChecker(retries=1, timeout=1).check("http://localhost:1/image.png")
+
+    assert result.error
+    assert result.status_code is None
+    assert not result.is_broken
+
+
+def test_check_urls_with_disk_cache(mocker, tmp_path, images_server):
+    """
+    Given:
+        - an on-disk cache which is shared between checkers
+
+    When:
+        - checking a reachable url and a broken url by two checkers
+
+    Then:
+        - make sure the reachable url is requested only by the first checker, while the broken url is checked again
+    """
+    mocker.patch("demisto_sdk.commands.common.tools.sleep")
+    urls = [f"{images_server}/image.png", f"{images_server}/missing.png"]
+    cache = DiskCache(tmp_path / "url_checks", ttl=60)
+
+    first_results = UrlChecker(retries=1, cache=cache).check_many(urls)
+    second_results = UrlChecker(retries=1, cache=cache).check_many(urls)
+
+    assert first_results == second_results
+    assert ImagesHandler.requests[("HEAD", "/image.png")] == 1
+    assert ImagesHandler.requests[("HEAD", "/missing.png")] == 2
+
+
+@pytest.mark.parametrize(
+    "ttl, expected_ttl", [(None, None), ("0", None), ("60", 60), ("1h", None)]
+)
+def test_get_url_check_cache(monkeypatch, ttl, expected_ttl):
+    """
+    Given:
+        - the DEMISTO_SDK_URL_CHECK_CACHE_TTL environment variable is not set, zero, a number or not a number
+
+    When:
+        - getting the on-disk url check cache
+
+    Then:
+        - make sure the cache is used only with a positive number of seconds, and an invalid value does not fail
+    """
+    if ttl is None:
+        monkeypatch.delenv(URL_CHECK_CACHE_TTL, raising=False)
+    else:
+        monkeypatch.setenv(URL_CHECK_CACHE_TTL, ttl)
+
+    cache = get_url_check_cache()
+
+    assert (cache.ttl if cache else None) == expected_ttl
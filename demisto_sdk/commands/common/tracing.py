@@ -0,0 +1,224 @@
+import multiprocessing
+import os
+import shutil
+import tempfile
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from functools import wraps
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, TextIO, Union
+
+from demisto_sdk.commands.common.handlers import DEFAULT_JSON_HANDLER as json
+from demisto_sdk.commands.common.logger import logger
+
+TRACE_FILE_ENV_VAR = "DEMISTO_SDK_TRACE_FILE"
+# set by the traced command, so its worker and child processes (e.g. the hooks of pre-commit) add their spans too
+TRACE_PARTS_DIR_ENV_VAR = "DEMISTO_SDK_TRACE_PARTS_DIR"
+SPAN_CATEGORY = "demisto-sdk"
+
+# the directory each traced process writes its spans to (a file per process), None when tracing is disabled
+_parts_dir: Optional[Path] = (
+    Path(os.environ[TRACE_PARTS_DIR_ENV_VAR])
+    if os.getenv(TRACE_PARTS_DIR_ENV_VAR)
+    else None
+)
+_part_file: Optional[TextIO] = None
+_part_file_pid: Optional[int] = None
+_traced_thread_ids: set = set()
+_lock = threading.Lock()
+
+_DISABLED_SPAN = nullcontext()
+
+
+def tracing_enabled() -> bool:
+    return _parts_dir is not None
+
+
+def _span_args(args: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        key: value if isinstance(value, (str, int, float, bool)) else str(value)
+        for key, value in args.items()
+    }
+
+
+def _write_event(event: Dict[str, Any]) -> None:
+    """
+    Appends a trace event to the part file of the current process.
+    The events are flushed right away, as pool workers might be terminated without any cleanup.
+    """
+    global _part_file, _part_file_pid, _lock
+    if _parts_dir is None:
+        return
+    pid = os.getpid()
+    if _part_file_pid != pid:
+        # the first event of this process, forked processes inherit the state of their parent
+        _lock = threading.Lock()
+        _traced_thread_ids.clear()
+        _part_file = open(_parts_dir / f"{pid}.jsonl", "a", buffering=1)
+        _part_file_pid = pid
+        _part_file.write(
+            json.dumps(
+                {
+                    "name": "process_name",
+                    "ph": "M",
+                    "pid": pid,
+                    "tid": 0,
+                    "args": {"name": multiprocessing.current_process().name},
+                }
+            )
+            + "\n"
+        )
+    event["pid"] = pid
+    with _lock:
+        if event["tid"] not in _traced_thread_ids:
+            _traced_thread_ids.add(event["tid"])
+            _part_file.write(  # type: ignore[union-attr]
+                json.dumps(
+                    {
+                        "name": "thread_name",
+                        "ph": "M",
+                        "pid": pid,
+                        "tid": event["tid"],
+                        "args": {"name": threading.current_thread().name},
+                    }
+                )
+                + "\n"
+            )
+        _part_file.write(json.dumps(event) + "\n")  # type: ignore[union-attr]
+
+
+class _Span:
+    __slots__ = ("name", "args", "start_time", "start_counter")
+
+    def __init__(self, name: str, args: Dict[str, Any]):
+        self.name = name
+        self.args = args
+
+    def __enter__(self) -> "_Span":
+        self.start_time = time.time_ns()
+        self.start_counter = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        duration = time.perf_counter_ns() - self.start_counter
+        if exc_type:
+            self.args["error"] = exc_type.__name__
+        try:
+            _write_event(
+                {
+                    "name": self.name,
+                    "cat": SPAN_CATEGORY,
+                    "ph": "X",
+                    "ts": self.start_time / 1000,
+                    "dur": duration / 1000,
+                    "tid": threading.get_native_id(),
+                    "args": _span_args(self.args),
+                }
+            )
+        except Exception as error:
+            # tracing should never fail the command
+            logger.debug(f"Could not trace the span {self.name}: {error}")
+
+
+def span(name: str, **args):
+    """
+    Measures the block within it as a span of the trace, does nothing when tracing is disabled.
+
+    Args:
+        name: the name of the span
+        args: additional information shown with the span (e.g. the pack name)
+
+    Example:
+        with span("parse pack", pack=pack_name):
+            ...
+    """
+    if _parts_dir is None:
+        return _DISABLED_SPAN
+    return _Span(name, args)
+
+
+def traced(name: Optional[str] = None) -> Callable:
+    """
+    Decorate the functions using this decorator to measure each one of their calls as a span of the trace.
+
+    Args:
+        name: the name of the spans, the qualified name of the function by default
+    """
+
+    def decorator(func: Callable) -> Callable:
+        span_name = name or func.__qualname__
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if _parts_dir is None:
+                return func(*args, **kwargs)
+            with _Span(span_name, {}):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def start_tracing() -> None:
+    global _parts_dir
+    _parts_dir = Path(tempfile.mkdtemp(prefix="demisto-sdk-trace-"))
+    os.environ[TRACE_PARTS_DIR_ENV_VAR] = str(_parts_dir)
+
+
+def stop_tracing(trace_file: Union[str, Path]) -> None:
+    """
+    Stops tracing, and writes the spans of all the traced processes to the trace file,
+    in the Chrome trace event format (can be viewed with https://ui.perfetto.dev or chrome://tracing).
+    """
+    global _parts_dir, _part_file, _part_file_pid
+    if _parts_dir is None:
+        return
+    parts_dir = _parts_dir
+    _parts_dir = None
+    os.environ.pop(TRACE_PARTS_DIR_ENV_VAR, None)
+    if _part_file:
+        _part_file.close()
+    _part_file = _part_file_pid = None
+
+    events: List[Dict[str, Any]] = []
+    for part in sorted(parts_dir.glob("*.jsonl")):
+        for line in part.read_text().splitlines():
+            # the last line might be partial, if the process was killed while writing it
+            try:
+                events.append(json.loads(line))
+            except Exception:
+                logger.debug(f"Skipping an invalid trace event in {part.name}: {line}")
+    shutil.rmtree(parts_dir, ignore_errors=True)
+
+    Path(trace_file).write_text(
+        json.dumps({"traceEvents": events, "displayTimeUnit": "ms"})
+    )
+    logger.info(
+        f"Saved the trace to {trace_file}, it can be viewed with https://ui.perfetto.dev"
+    )
+
+
+@contextmanager
+def tracing(
+    trace_file: Union[str, Path, None] = None, name: str = "demisto-sdk"
+) -> Iterator[None]:
+    """
+    Traces a command to the given trace file (or the one of the DEMISTO_SDK_TRACE_FILE environment variable),
+    the whole command is measured as a span named after it.
+    When the command runs within an already traced process (e.g. a hook of pre-commit), its spans are added
+    to the trace of that process instead.
+    """
+    trace_file = trace_file or os.getenv(TRACE_FILE_ENV_VAR)
+    if _parts_dir is not None or not trace_file:
+        with span(name):
+            yield
+        return
+
+    start_tracing()
+    try:
+        with span(name):
+            yield
+    finally:
+        stop_tracing(trace_file)
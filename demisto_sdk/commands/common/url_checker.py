@@ -0,0 +1,153 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, Iterable, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.exceptions import HTTPError
+
+from demisto_sdk.commands.common.constants import CACHE_DIR
+from demisto_sdk.commands.common.disk_cache import DiskCache
+from demisto_sdk.commands.common.logger import logger
+from demisto_sdk.commands.common.tools import get_url_with_retries
+
+URL_CHECK_WORKERS = 10
+URL_CHECK_CACHE_DIR = CACHE_DIR / "url_checks"
+# when set, reachable urls are kept on disk for this number of seconds, and are not checked again by the following runs
+URL_CHECK_CACHE_TTL = "DEMISTO_SDK_URL_CHECK_CACHE_TTL"
+
+
+@dataclass(frozen=True)
+class UrlCheckResult:
+    """
+    The result of checking a url.
+
+    status_code: the HTTP status code of the response, None if there was no response.
+    reason: the reason of the response.
+    error: the error which prevented the check, e.g. a connection error.
+    """
+
+    status_code: Optional[int] = None
+    reason: str = ""
+    error: str = ""
+
+    @property
+    def is_broken(self) -> bool:
+        return self.status_code is not None and self.status_code >= 400
+
+    def to_response(self) -> requests.Response:
+        """A response with the status of the check, for the error messages which are built from responses."""
+        response = requests.Response()
+        response.status_code = self.status_code  # type: ignore[assignment]
+        response.reason = self.reason
+        return response
+
+
+def get_url_check_cache() -> Optional[DiskCache]:
+    """
+    Returns the on-disk cache of reachable urls,
+    or None unless the DEMISTO_SDK_URL_CHECK_CACHE_TTL environment variable is set.
+    """
+    if not (ttl_value := os.getenv(URL_CHECK_CACHE_TTL)):
+        return None
+    try:
+        ttl = int(ttl_value)
+    except ValueError:
+        logger.warning(
+            f"{URL_CHECK_CACHE_TTL} must be a number of seconds, got {ttl_value!r}. "
+            "Checking the urls without the on-disk cache."
+        )
+        return None
+    if ttl <= 0:
+        return None
+    return DiskCache(URL_CHECK_CACHE_DIR, ttl=ttl)
+
+
+class UrlChecker:
+    """
+    Checks whether urls are reachable, concurrently and at most once per url.
+
+    Each url is requested by HEAD first, and only when that fails by GET (with retries), as some servers do not
+    support HEAD requests. The results are kept for the lifetime of the checker, and reachable urls are also kept in
+    the on-disk cache, if there is one.
+
+    Example:
+        checker = UrlChecker()
+        results = checker.check_many(["https://github.com/demisto/content/raw/master/image.png", ...])
+    """
+
+    def __init__(
+        self,
+        max_workers: int = URL_CHECK_WORKERS,
+        retries: int = 5,
+        timeout: float = 10,
+        cache: Optional[DiskCache] = None,
+    ):
+        self.max_workers = max_workers
+        self.retries = retries
+        self.timeout = timeout
+        self.cache = cache
+        self._results: Dict[str, UrlCheckResult] = {}
+        self._lock = threading.Lock()
+        self._session = requests.Session()
+        # the session is shared between the threads, so the connections are kept alive between requests
+        self._session.mount("https://", HTTPAdapter(pool_maxsize=max_workers))
+        self._session.mount("http://", HTTPAdapter(pool_maxsize=max_workers))
+
+    def _request(self, url: str) -> UrlCheckResult:
+        try:
+            response = self._session.head(
+                url, timeout=self.timeout, allow_redirects=True
+            )
+            if response.ok:
+                return UrlCheckResult(response.status_code, response.reason)
+        except Exception as error:
+            logger.debug(f"Could not check {url} by a HEAD request: {error}")
+
+        try:
+            response = get_url_with_retries(
+                url, retries=self.retries, timeout=self.timeout
+            )
+            response.close()
+            return UrlCheckResult(response.status_code, response.reason)
+        except HTTPError as error:
+            return UrlCheckResult(error.response.status_code, error.response.reason)
+        except Exception as error:
+            return UrlCheckResult(error=str(error))
+
+    def _check(self, url: str) -> UrlCheckResult:
+        if self.cache and (cached := self.cache.get(url)):
+            return UrlCheckResult(**cached)
+        result = self._request(url)
+        if self.cache and result.status_code and not result.is_broken:
+            # only reachable urls are kept, broken urls are checked again once they are fixed
+            self.cache.set(
+                url, {"status_code": result.status_code, "reason": result.reason}
+            )
+        return result
+
+    def check_many(self, urls: Iterable[str]) -> Dict[str, UrlCheckResult]:
+        """
+        Checks the given urls, each url is requested once, even if it is given several times or was already checked.
+
+        Returns:
+            The result of each one of the urls.
+        """
+        urls = list(dict.fromkeys(urls))
+        with self._lock:
+            unchecked = [url for url in urls if url not in self._results]
+        if unchecked:
+            logger.debug(f"Checking {len(unchecked)} urls")
+            if len(unchecked) == 1:
+                results = [self._check(unchecked[0])]
+            else:
+                with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                    results = list(executor.map(self._check, unchecked))
+            with self._lock:
+                self._results.update(zip(unchecked, results))
+        return {url: self._results[url] for url in urls}
+
+    def check(self, url: str) -> UrlCheckResult:
+        return self.check_many([url])[url]
@@ -0,0 +1,349 @@
+"""
+A compact export format of the content graph, an alternative to the GraphML export of APOC.
+
+Each exported graph is a directory named `<repo name>.bulk`, which holds a gzip compressed JSON lines file per set of
+node labels and per relationship type, and a manifest which lists the files, their labels/type and their counts:
+
+    content.bulk/
+        manifest.json
+        nodes/BaseNode-BaseContent-ContentItem-Integration.jsonl.gz  # {"id": 0, "properties": {...}}
+        relationships/USES.jsonl.gz  # {"source": 0, "target": 12, "properties": {...}}
+
+The node ids are local to the exported graph, so graphs of different repositories can be imported together
+without rewriting them (unlike the GraphML files).
+The files can be imported to neo4j in batches, or loaded to memory by `InMemoryGraph` without neo4j at all.
+"""
+import gzip
+import os
+from collections import defaultdict
+from enum import Enum
+from pathlib import Path, PurePosixPath
+from typing import (
+    IO,
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
+from zipfile import ZipFile
+
+from demisto_sdk.commands.common.handlers import DEFAULT_JSON_HANDLER as json
+from demisto_sdk.commands.common.logger import logger
+
+BULK_GRAPH_SUFFIX = ".bulk"
+BULK_GRAPH_FORMAT_VERSION = 1
+MANIFEST_FILE_NAME = "manifest.json"
+NODES_DIR_NAME = "nodes"
+RELATIONSHIPS_DIR_NAME = "relationships"
+BULK_FILE_SUFFIX = ".jsonl.gz"
+GRAPH_EXPORT_FORMAT_ENV_VAR = "DEMISTO_SDK_GRAPH_EXPORT_FORMAT"
+
+
+class GraphExportFormat(str, Enum):
+    GRAPHML = "graphml"
+    BULK = "bulk"
+    ALL = "all"  # both of the formats, for consumers which did not move to the bulk format yet
+
+    @property
+    def graphml(self) -> bool:
+        return self in (GraphExportFormat.GRAPHML, GraphExportFormat.ALL)
+
+    @property
+    def bulk(self) -> bool:
+        return self in (GraphExportFormat.BULK, GraphExportFormat.ALL)
+
+
+def get_graph_export_format() -> GraphExportFormat:
+    """The format of the exported graph, set by the DEMISTO_SDK_GRAPH_EXPORT_FORMAT environment variable."""
+    export_format = os.getenv(GRAPH_EXPORT_FORMAT_ENV_VAR) or GraphExportFormat.GRAPHML
+    try:
+        return GraphExportFormat(str(export_format).lower())
+    except ValueError:
+        logger.warning(
+            f"Unknown graph export format {export_format}, "
+            f"choose from {[export_format.value for export_format in GraphExportFormat]}. Using GraphML."
+        )
+        return GraphExportFormat.GRAPHML
+
+
+class BulkNode(NamedTuple):
+    id: str
+    labels: Tuple[str, ...]
+    properties: Dict[str, Any]
+
+
+class BulkRelationship(NamedTuple):
+    relationship_type: str
+    source: str
+    target: str
+    properties: Dict[str, Any]
+
+
+class BulkGraphWriter:
+    """
+    Writes a graph in the bulk format, the nodes must be added before the relationships between them.
+
+    Example:
+        with BulkGraphWriter(import_path / f"{repo_name}{BULK_GRAPH_SUFFIX}") as writer:
+            writer.add_nodes(nodes)
+            writer.add_relationships(relationships)
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        (path / NODES_DIR_NAME).mkdir(parents=True, exist_ok=True)
+        (path / RELATIONSHIPS_DIR_NAME).mkdir(parents=True, exist_ok=True)
+        # maps the ids of the exported nodes (e.g. the element ids of neo4j) to compact integers
+        self._node_ids: Dict[Any, int] = {}
+        self._files: Dict[str, IO[str]] = {}
+        self._manifest: Dict[str, Any] = {
+            "format_version": BULK_GRAPH_FORMAT_VERSION,
+            "nodes": {},
+            "relationships": {},
+        }
+
+    def _write(self, section: str, file_name: str, line: Dict[str, Any]) -> None:
+        relative_path = f"{section}/{file_name}{BULK_FILE_SUFFIX}"
+        if relative_path not in self._files:
+            self._files[relative_path] = gzip.open(
+                self.path / relative_path, "wt", encoding="utf-8"
+            )
+        self._files[relative_path].write(json.dumps(line) + "\n")
+        self._manifest[section][relative_path]["count"] += 1
+
+    def add_nodes(self, nodes: Iterable[Dict[str, Any]]) -> None:
+        """
+        Args:
+            nodes: dictionaries with the id, labels and properties of each node.
+        """
+        for node in nodes:
+            labels = sorted(node["labels"])
+            file_name = "-".join(labels)
+            self._manifest[NODES_DIR_NAME].setdefault(
+                f"{NODES_DIR_NAME}/{file_name}{BULK_FILE_SUFFIX}",
+                {"labels": labels, "count": 0},
+            )
+            node_id = self._node_ids.setdefault(node["id"], len(self._node_ids))
+            self._write(
+                NODES_DIR_NAME,
+                file_name,
+                {"id": node_id, "properties": node["properties"]},
+            )
+
+    def add_relationships(self, relationships: Iterable[Dict[str, Any]]) -> None:
+        """
+        Args:
+            relationships: dictionaries with the type, source id, target id and properties of each relationship.
+        """
+        for relationship in relationships:
+            relationship_type = relationship["type"]
+            self._manifest[RELATIONSHIPS_DIR_NAME].setdefault(
+                f"{RELATIONSHIPS_DIR_NAME}/{relationship_type}{BULK_FILE_SUFFIX}",
+                {"type": relationship_type, "count": 0},
+            )
+            self._write(
+                RELATIONSHIPS_DIR_NAME,
+                relationship_type,
+                {
+                    "source": self._node_ids[relationship["source"]],
+                    "target": self._node_ids[relationship["target"]],
+                    "properties": relationship["properties"],
+                },
+            )
+
+    def close(self) -> None:
+        for file in self._files.values():
+            file.close()
+        self._files = {}
+        (self.path / MANIFEST_FILE_NAME).write_text(
+            json.dumps(self._manifest, indent=4)
+        )
+
+    def __enter__(self) -> "BulkGraphWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+
+class BulkGraphReader:
+    """Reads a graph in the bulk format, from a directory or from a directory within a zip file."""
+
+    def __init__(
+        self, path: Union[Path, PurePosixPath], zip_file: Optional[ZipFile] = None
+    ):
+        """
+        Args:
+            path: the path of the bulk graph directory (within the zip file, if given).
+            zip_file: the zip file which holds the directory.
+        """
+        self.path = path
+        self.zip_file = zip_file
+        with self._open(MANIFEST_FILE_NAME) as manifest_file:
+            self.manifest: Dict[str, Any] = json.loads(manifest_file.read())
+        if self.manifest.get("format_version") != BULK_GRAPH_FORMAT_VERSION:
+            raise ValueError(
+                f"Unsupported bulk graph format version {self.manifest.get('format_version')} in {path}"
+            )
+
+    @property
+    def name(self) -> str:
+        """The name of the exported repository."""
+        return self.path.name[: -len(BULK_GRAPH_SUFFIX)]
+
+    def _open(self, relative_path: str) -> IO[bytes]:
+        if self.zip_file:
+            return self.zip_file.open(
+                str(PurePosixPath(self.path.as_posix(), relative_path))
+            )
+        return open(self.path / relative_path, "rb")
+
+    def _iter_lines(
+        self, relative_path: str, batch_size: int
+    ) -> Iterator[List[Dict[str, Any]]]:
+        batch: List[Dict[str, Any]] = []
+        with self._open(relative_path) as compressed, gzip.open(
+            compressed, "rt", encoding="utf-8"
+        ) as file:
+            for line in file:
+                batch.append(json.loads(line))
+                if len(batch) >= batch_size:
+                    yield batch
+                    batch = []
+        if batch:
+            yield batch
+
+    def iter_nodes(
+        self, batch_size: int = 10_000
+    ) -> Iterator[Tuple[List[str], List[Dict[str, Any]]]]:
+        """Yields the labels of each node file with batches of its nodes (id and properties)."""
+        for relative_path, node_file in self.manifest[NODES_DIR_NAME].items():
+            for batch in self._iter_lines(relative_path, batch_size):
+                yield node_file["labels"], batch
+
+    def iter_relationships(
+        self, batch_size: int = 10_000
+    ) -> Iterator[Tuple[str, List[Dict[str, Any]]]]:
+        """Yields the type of each relationship file with batches of its relationships (source, target and properties)."""
+        for relationship_path, relationship_file in self.manifest[
+            RELATIONSHIPS_DIR_NAME
+        ].items():
+            for batch in self._iter_lines(relationship_path, batch_size):
+                yield relationship_file["type"], batch
+
+
+def is_bulk_graph(path: Path) -> bool:
+    return path.suffix == BULK_GRAPH_SUFFIX and (path / MANIFEST_FILE_NAME).is_file()
+
+
+def get_bulk_graph_readers(path: Path) -> List[BulkGraphReader]:
+    """
+    Returns the readers of the bulk graphs of the given path, which is either a bulk graph directory,
+    a directory which holds bulk graph directories (e.g. the import directory), or a zip file of such a directory.
+    """
+    if path.is_file():
+        zip_file = ZipFile(path)
+        return [
+            BulkGraphReader(PurePosixPath(name).parent, zip_file)
+            for name in sorted(zip_file.namelist())
+            if PurePosixPath(name).name == MANIFEST_FILE_NAME
+            and PurePosixPath(name).parent.suffix == BULK_GRAPH_SUFFIX
+        ]
+    if is_bulk_graph(path):
+        return [BulkGraphReader(path)]
+    return [
+        BulkGraphReader(bulk_path)
+        for bulk_path in sorted(path.iterdir())
+        if is_bulk_graph(bulk_path)
+    ]
+
+
+class InMemoryGraph:
+    """
+    The content graph loaded from the bulk format files, for consumers which only read the graph
+    and do not need neo4j (or the GraphML files).
+    When loading several graphs (e.g. of the content and of a private repository), their node ids are prefixed
+    by their index, and their nodes are kept as is (the duplicated nodes are not merged as in the neo4j import).
+    """
+
+    def __init__(self) -> None:
+        self.nodes: Dict[str, BulkNode] = {}
+        self._outgoing: Dict[str, List[BulkRelationship]] = defaultdict(list)
+        self._incoming: Dict[str, List[BulkRelationship]] = defaultdict(list)
+
+    @classmethod
+    def load(cls, path: Path) -> "InMemoryGraph":
+        """
+        Args:
+            path: a bulk graph directory, a directory of bulk graphs or a zip file of them (e.g. an exported graph zip).
+        """
+        graph = cls()
+        readers = get_bulk_graph_readers(path)
+        if not readers:
+            raise FileNotFoundError(f"No bulk graph was found in {path}")
+        for index, reader in enumerate(readers):
+            graph.add(reader, prefix=f"{index}:" if len(readers) > 1 else "")
+        if readers[0].zip_file:
+            readers[0].zip_file.close()
+        return graph
+
+    def add(self, reader: BulkGraphReader, prefix: str = "") -> None:
+        for labels, batch in reader.iter_nodes():
+            node_labels = tuple(labels)
+            for node in batch:
+                node_id = f"{prefix}{node['id']}"
+                self.nodes[node_id] = BulkNode(node_id, node_labels, node["properties"])
+        for relationship_type, batch in reader.iter_relationships():
+            for relationship in batch:
+                bulk_relationship = BulkRelationship(
+                    relationship_type,
+                    f"{prefix}{relationship['source']}",
+                    f"{prefix}{relationship['target']}",
+                    relationship["properties"],
+                )
+                self._outgoing[bulk_relationship.source].append(bulk_relationship)
+                self._incoming[bulk_relationship.target].append(bulk_relationship)
+
+    def search(self, label: str = None, **properties) -> List[BulkNode]:
+        """
+        Args:
+            label: the label of the nodes (e.g. a content type), all of the nodes by default.
+            **properties: a key, value filter for the search. For example: `search(object_id="QRadar")`.
+        """
+        return [
+            node
+            for node in self.nodes.values()
+            if (label is None or label in node.labels)
+            and all(
+                node.properties.get(key) == value for key, value in properties.items()
+            )
+        ]
+
+    def get_relationships(
+        self,
+        node_id: str,
+        relationship_type: str = None,
+        outgoing: bool = True,
+    ) -> List[Tuple[BulkRelationship, BulkNode]]:
+        """Returns the relationships of a node, together with the node on their other side."""
+        relationships = (self._outgoing if outgoing else self._incoming).get(
+            node_id, []
+        )
+        return [
+            (
+                relationship,
+                self.nodes[relationship.target if outgoing else relationship.source],
+            )
+            for relationship in relationships
+            if relationship_type is None
+            or relationship.relationship_type == relationship_type
+        ]
+
+    @property
+    def relationships_count(self) -> int:
+        return sum(len(relationships) for relationships in self._outgoing.values())
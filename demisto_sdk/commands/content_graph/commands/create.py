@@ -11,6 +11,7 @@ from demisto_sdk.commands.common.logger import (
     logger,
     logging_setup,
 )
+from demisto_sdk.commands.common.tracing import traced, tracing
 from demisto_sdk.commands.content_graph.commands.common import recover_if_fails
 from demisto_sdk.commands.content_graph.common import (
     NEO4J_DATABASE_HTTP,
@@ -25,6 +26,7 @@ from demisto_sdk.commands.content_graph.interface import ContentGraphInterface
 app = typer.Typer()
 
 
+@traced()
 @recover_if_fails
 def create_content_graph(
     content_graph_interface: ContentGraphInterface,
@@ -100,6 +102,11 @@ def create(
         "--log-file-path",
         help="Path to save log files onto.",
     ),
+    trace_file: Optional[str] = typer.Option(
+        None,
+        "--trace-file",
+        help="Path to save a trace of the command onto, in the Chrome trace event format.",
+    ),
 ) -> None:
     """
     Parses all content packs under the repository, including their
@@ -111,7 +118,9 @@ def create(
         file_log_threshold=file_log_threshold,
         log_file_path=log_file_path,
     )
-    with ContentGraphInterface() as content_graph_interface:
+    with tracing(
+        trace_file, name=f"graph {ctx.info_name}"
+    ), ContentGraphInterface() as content_graph_interface:
         create_content_graph(
             content_graph_interface=content_graph_interface,
             marketplace=marketplace,
@@ -14,6 +14,7 @@ from demisto_sdk.commands.common.tools import (
     get_all_repo_pack_ids,
     is_external_repository,
 )
+from demisto_sdk.commands.common.tracing import traced, tracing
 from demisto_sdk.commands.content_graph.commands.common import recover_if_fails
 from demisto_sdk.commands.content_graph.commands.create import create_content_graph
 from demisto_sdk.commands.content_graph.common import (
@@ -52,6 +53,7 @@ def should_update_graph(
     )
 
 
+@traced()
 @recover_if_fails
 def update_content_graph(
     content_graph_interface: ContentGraphInterface,
@@ -215,6 +217,11 @@ def update(
         "--log-file-path",
         help="Path to save log files onto.",
     ),
+    trace_file: Optional[str] = typer.Option(
+        None,
+        "--trace-file",
+        help="Path to save a trace of the command onto, in the Chrome trace event format.",
+    ),
 ) -> None:
     """
     Downloads the official content graph, imports it locally,
@@ -226,7 +233,9 @@ def update(
         file_log_threshold=file_log_threshold,
         log_file_path=log_file_path,
     )
-    with ContentGraphInterface() as content_graph_interface:
+    with tracing(
+        trace_file, name=f"graph {ctx.info_name}"
+    ), ContentGraphInterface() as content_graph_interface:
         update_content_graph(
             content_graph_interface,
             marketplace=marketplace,
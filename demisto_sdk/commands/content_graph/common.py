@@ -1,8 +1,22 @@
 import enum
 import os
 import re
+import sys
+from collections.abc import MutableSequence
 from pathlib import Path
-from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Set
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 from neo4j import graph
 
@@ -270,27 +284,146 @@ class ContentType(str, enum.Enum):
         raise ValueError(f"Could not find content type in path {path}")
 
 
+# the number of nodes or relationships sent in each UNWIND query
+UNWIND_BATCH_SIZE = 10_000
+# strings up to this length are interned in the records, as identifiers, types and versions repeat across the repository
+MAX_INTERNED_STRING_LENGTH = 128
+# the canonical keys tuples of the records, shared by all the records with the same keys
+_RECORD_KEYS: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
+
+
+def _intern(value: Any) -> Any:
+    # only exact strings can be interned (and not str enums, such as the content types)
+    if value.__class__ is str and len(value) <= MAX_INTERNED_STRING_LENGTH:
+        return sys.intern(value)
+    return value
+
+
+def _to_row(record: Dict[str, Any]) -> tuple:
+    keys = tuple(record)
+    keys = _RECORD_KEYS.setdefault(keys, keys)
+    return (keys, *map(_intern, record.values()))
+
+
+def _intern_row(row: tuple) -> tuple:
+    """Interns the keys and the values of a row which was not created by _to_row (e.g. unpickled)."""
+    keys = tuple(map(sys.intern, row[0]))
+    return (_RECORD_KEYS.setdefault(keys, keys), *map(_intern, row[1:]))
+
+
+class Records(MutableSequence):
+    """
+    A compact list of dicts, which holds the nodes and relationships of the parsed repository.
+
+    Each dict is kept as a tuple of its values, led by the tuple of its keys (which is shared by all the records
+    with the same keys), and its short strings are interned. The records are converted back to dicts on access,
+    or to batches of dicts for the UNWIND queries with iter_batches.
+    Note that changing a dict which was returned from the records does not change them.
+    """
+
+    __slots__ = ("_rows",)
+
+    def __init__(self, records: Iterable[Dict[str, Any]] = ()) -> None:
+        self._rows: List[tuple] = []
+        self.extend(records)
+
+    @staticmethod
+    def _to_dict(row: tuple) -> Dict[str, Any]:
+        return dict(zip(row[0], row[1:]))
+
+    def __getitem__(self, index):  # type: ignore[override]
+        if isinstance(index, slice):
+            return [self._to_dict(row) for row in self._rows[index]]
+        return self._to_dict(self._rows[index])
+
+    def __setitem__(self, index, record) -> None:  # type: ignore[override]
+        if isinstance(index, slice):
+            self._rows[index] = [_to_row(item) for item in record]
+        else:
+            self._rows[index] = _to_row(record)
+
+    def __delitem__(self, index) -> None:  # type: ignore[override]
+        del self._rows[index]
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return map(self._to_dict, self._rows)
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, Records):
+            return self._rows == other._rows
+        if isinstance(other, list):
+            return list(self) == other
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"Records({list(self)})"
+
+    def __reduce__(self):
+        return self.__class__._from_rows, (self._rows,)
+
+    @classmethod
+    def _from_rows(cls, rows: List[tuple]) -> "Records":
+        records = cls()
+        records._rows = [_intern_row(row) for row in rows]
+        return records
+
+    def insert(self, index: int, record: Dict[str, Any]) -> None:
+        self._rows.insert(index, _to_row(record))
+
+    def append(self, record: Dict[str, Any]) -> None:
+        self._rows.append(_to_row(record))
+
+    def extend(self, records: Iterable[Dict[str, Any]]) -> None:
+        if isinstance(records, Records):
+            # the rows are immutable, so they are shared rather than copied
+            self._rows.extend(records._rows)
+        else:
+            self._rows.extend(map(_to_row, records))
+
+    def iter_batches(self, batch_size: int) -> Iterator[List[Dict[str, Any]]]:
+        """Yields the records as lists of dicts, of up to batch_size records each."""
+        for start in range(0, len(self._rows), batch_size):
+            yield [self._to_dict(row) for row in self._rows[start : start + batch_size]]
+
+
+def iter_record_batches(
+    records: Union[Records, List[Dict[str, Any]]], batch_size: int
+) -> Iterator[List[Dict[str, Any]]]:
+    if isinstance(records, Records):
+        yield from records.iter_batches(batch_size)
+    else:
+        for start in range(0, len(records), batch_size):
+            yield records[start : start + batch_size]
+
+
 class Relationships(dict):
+    """The relationships of the parsed content, by their type."""
+
     def add(self, relationship: RelationshipType, **kwargs):
         if relationship not in self.keys():
-            self.__setitem__(relationship, [])
+            self.__setitem__(relationship, Records())
         self.__getitem__(relationship).append(kwargs)
 
-    def add_batch(self, relationship: RelationshipType, data: List[Dict[str, Any]]):
+    def add_batch(self, relationship: RelationshipType, data: Iterable[Dict[str, Any]]):
         if relationship not in self.keys():
-            self.__setitem__(relationship, [])
+            self.__setitem__(relationship, Records())
         self.__getitem__(relationship).extend(data)
 
     def update(self, other: "Relationships") -> None:  # type: ignore
         for relationship, parsed_data in other.items():
             if relationship not in RelationshipType or not isinstance(
-                parsed_data, list
+                parsed_data, (Records, list)
             ):
                 raise TypeError
             self.add_batch(relationship, parsed_data)
 
 
 class Nodes(dict):
+    """The nodes of the parsed content, by their content type."""
+
     def __init__(self, *args) -> None:
         super().__init__(self)
         for arg in args:
@@ -301,19 +434,25 @@ class Nodes(dict):
     def add(self, **kwargs):
         content_type: ContentType = ContentType(kwargs.get("content_type"))
         if content_type not in self.keys():
-            self.__setitem__(content_type, [])
+            self.__setitem__(content_type, Records())
         self.__getitem__(content_type).append(kwargs)
 
-    def add_batch(self, data: Iterator[Dict[str, Any]]):
+    def add_batch(self, data: Iterable[Dict[str, Any]]):
         for obj in data:
             self.add(**obj)
 
     def update(self, other: "Nodes") -> None:  # type: ignore[override]
-        data: Iterator[Dict[str, Any]]
+        data: Iterable[Dict[str, Any]]
         for content_type, data in other.items():
-            if content_type not in ContentType or not isinstance(data, list):
+            if content_type not in ContentType or not isinstance(data, (Records, list)):
                 raise TypeError
-            self.add_batch(data)
+            if content_type not in self.keys():
+                self.__setitem__(content_type, Records())
+            if isinstance(data, Records):
+                # all the nodes of the records are of the same content type
+                self.__getitem__(content_type).extend(data)
+            else:
+                self.add_batch(data)
 
 
 class PackTags:
@@ -4,6 +4,7 @@ from typing import List, Optional
 import more_itertools
 import tqdm
 
+from demisto_sdk.commands.common.tracing import span, traced
 from demisto_sdk.commands.content_graph.common import Nodes, Relationships
 from demisto_sdk.commands.content_graph.interface.graph import ContentGraphInterface
 from demisto_sdk.commands.content_graph.objects.repository import ContentDTO
@@ -25,6 +26,7 @@ class ContentGraphBuilder:
         self.nodes: Nodes = Nodes()
         self.relationships: Relationships = Relationships()
 
+    @traced()
     def update_graph(
         self,
         packs_to_update: Optional[List[str]] = None,
@@ -39,6 +41,7 @@ class ContentGraphBuilder:
         self._parse_and_model_content(packs_to_update)
         self._create_or_update_graph()
 
+    @traced()
     def init_database(self) -> None:
         self.content_graph.clean_graph()
         self.content_graph.create_indexes_and_constraints()
@@ -51,6 +54,7 @@ class ContentGraphBuilder:
         for content_dto in content_dtos:
             self._collect_nodes_and_relationships_from_model(content_dto)
 
+    @traced()
     def _create_content_dtos(self, packs: Optional[List[str]]) -> List[ContentDTO]:
         """Parses the repository, then creates and returns a repository model.
 
@@ -77,6 +81,7 @@ class ContentGraphBuilder:
                 gc.collect()
         return content_dtos
 
+    @traced()
     def _collect_nodes_and_relationships_from_model(
         self, content_dto: ContentDTO
     ) -> None:
@@ -84,14 +89,18 @@ class ContentGraphBuilder:
             self.nodes.update(pack.to_nodes())
             self.relationships.update(pack.relationships)
 
+    @traced()
     def create_graph(self) -> None:
         self._parse_and_model_content()
         self._create_or_update_graph()
 
     def _create_or_update_graph(self) -> None:
         """Runs DB queries using the collected nodes and relationships to create or update the content graph."""
-        self.content_graph.create_nodes(self.nodes)
+        with span("create nodes"):
+            self.content_graph.create_nodes(self.nodes)
         gc.collect()
-        self.content_graph.create_relationships(self.relationships)
+        with span("create relationships"):
+            self.content_graph.create_relationships(self.relationships)
         gc.collect()
-        self.content_graph.remove_non_repo_items()
+        with span("remove non repo items"):
+            self.content_graph.remove_non_repo_items()
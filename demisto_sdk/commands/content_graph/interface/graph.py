@@ -1,15 +1,32 @@
+import inspect
+import os
 import shutil
 from abc import ABC, abstractmethod
+from enum import Enum
+from functools import wraps
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
-from demisto_sdk.commands.common.constants import MarketplaceVersions
+from demisto_sdk.commands.common.constants import CACHE_DIR, MarketplaceVersions
 from demisto_sdk.commands.common.content_constant_paths import CONTENT_PATH
+from demisto_sdk.commands.common.disk_cache import DiskCache
 from demisto_sdk.commands.common.git_util import GitUtil
+from demisto_sdk.commands.common.handlers import DEFAULT_JSON_HANDLER as json
 from demisto_sdk.commands.common.logger import logger
 from demisto_sdk.commands.common.tools import (
     get_file,
     sha1_dir,
+    string_to_bool,
     write_dict,
 )
 from demisto_sdk.commands.content_graph.common import ContentType, RelationshipType
@@ -21,12 +38,96 @@ from demisto_sdk.commands.content_graph.objects.content_item import ContentItem
 from demisto_sdk.commands.content_graph.objects.pack import Pack
 from demisto_sdk.commands.content_graph.objects.repository import ContentDTO
 
+GRAPH_QUERY_CACHE_DIR = CACHE_DIR / "content_graph_queries"
+PERSISTENT_GRAPH_QUERY_CACHE = "DEMISTO_SDK_PERSISTENT_GRAPH_QUERY_CACHE"
+
+
+def _normalize_query_argument(value: Any) -> Any:
+    """Converts a query argument to a JSON serializable value, equal arguments are converted to equal values."""
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, Path):
+        return str(value)
+    if isinstance(value, dict):
+        return {
+            str(key): _normalize_query_argument(val)
+            for key, val in sorted(value.items(), key=lambda item: str(item[0]))
+        }
+    if isinstance(value, (set, frozenset)):
+        return sorted((_normalize_query_argument(item) for item in value), key=str)
+    if isinstance(value, Iterable) and not isinstance(value, str):
+        return [_normalize_query_argument(item) for item in value]
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    return str(value)
+
+
+def _has_iterator(value: Any) -> bool:
+    if isinstance(value, Iterator):
+        return True
+    if isinstance(value, dict):
+        return any(_has_iterator(val) for val in value.values())
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return any(_has_iterator(item) for item in value)
+    return False
+
+
+def cached_query(
+    persistent: bool = False, load: Optional[Callable[[Any], Any]] = None
+) -> Callable:
+    """
+    Caches the results of a read-only graph query, see ContentGraphInterface.get_cached_query_result.
+
+    Args:
+        persistent: whether the results can be saved on disk as well, only for results that are JSON serializable.
+        load: converts a result loaded from the disk to the type returned by the query (e.g. a tuple).
+    """
+
+    def decorator(func: Callable) -> Callable:
+        signature = inspect.signature(func)
+
+        @wraps(func)
+        def wrapper(self: "ContentGraphInterface", *args, **kwargs):
+            arguments = signature.bind(self, *args, **kwargs)
+            arguments.apply_defaults()
+            arguments.arguments.pop("self")
+            if _has_iterator(arguments.arguments):
+                # iterators (e.g. generators) can not be consumed for the cache key without changing the query
+                return func(self, *args, **kwargs)
+            return self.get_cached_query_result(
+                func.__name__,
+                arguments.arguments,
+                lambda: func(self, *args, **kwargs),
+                persistent=persistent,
+                load=load,
+            )
+
+        return wrapper
+
+    return decorator
+
+
+def invalidates_query_cache(func: Callable) -> Callable:
+    """Clears the cached query results once a method which changes the graph is called."""
+
+    @wraps(func)
+    def wrapper(self: "ContentGraphInterface", *args, **kwargs):
+        self.clear_query_cache()
+        try:
+            return func(self, *args, **kwargs)
+        finally:
+            # results that were cached while the graph was changing are not valid as well
+            self.clear_query_cache()
+
+    return wrapper
+
 
 class ContentGraphInterface(ABC):
     repo_path = CONTENT_PATH  # type: ignore
     METADATA_FILE_NAME = "metadata.json"
     DEPENDS_ON_FILE_NAME = "depends_on.json"
     _depends_on = None
+    _query_cache: Optional[Dict[str, Any]] = None
 
     @property
     @abstractmethod
@@ -68,6 +169,78 @@ class ContentGraphInterface(ABC):
             return self.metadata.get("schema")
         return None
 
+    @property
+    def query_cache(self) -> Dict[str, Any]:
+        """In-memory results of the graph queries, cleared whenever the graph is changed."""
+        if self._query_cache is None:
+            self._query_cache = {}
+        return self._query_cache
+
+    @property
+    def persistent_query_cache(self) -> Optional[DiskCache]:
+        """
+        On-disk results of the graph queries, shared between runs as long as the graph did not change.
+        Enabled by the DEMISTO_SDK_PERSISTENT_GRAPH_QUERY_CACHE environment variable.
+        """
+        if not string_to_bool(
+            os.getenv(PERSISTENT_GRAPH_QUERY_CACHE), default_when_empty=False
+        ):
+            return None
+        return DiskCache(GRAPH_QUERY_CACHE_DIR)
+
+    def clear_query_cache(self) -> None:
+        self.query_cache.clear()
+        # the disk cache is cleared even when it is disabled in this run,
+        # so later runs which enable it do not get results of the graph before the change
+        DiskCache(GRAPH_QUERY_CACHE_DIR).clear()
+
+    def get_cached_query_result(
+        self,
+        query_name: str,
+        arguments: Dict[str, Any],
+        run_query: Callable[[], Any],
+        persistent: bool = False,
+        load: Optional[Callable[[Any], Any]] = None,
+    ) -> Any:
+        """
+        Returns the result of a read-only query from the cache, or runs the query and caches its result.
+        Results are keyed by the graph commit, the content parser hash, the query name and its normalized arguments,
+        and are saved on disk only for a graph with a commit.
+
+        Args:
+            query_name: the name of the query.
+            arguments: the arguments of the query.
+            run_query: runs the query against the graph.
+            persistent: whether the result can be saved on disk as well.
+            load: converts a result loaded from the disk to the type returned by the query.
+        """
+        commit = self.commit
+        key = json.dumps(
+            [
+                commit,
+                self.content_parser_latest_hash,
+                query_name,
+                _normalize_query_argument(arguments),
+            ],
+            sort_keys=True,
+        )
+        if key in self.query_cache:
+            logger.debug(f"Using the cached result of the graph query {query_name}")
+        elif (
+            persistent
+            # graphs without metadata can not be told apart, so their results are not shared between runs
+            and commit
+            and (persistent_query_cache := self.persistent_query_cache)
+        ):
+            result = persistent_query_cache.get_or_set(key, run_query, immutable=True)
+            self.query_cache[key] = load(result) if load else result
+        else:
+            self.query_cache[key] = run_query()
+
+        result = self.query_cache[key]
+        # so callers that change the returned collection do not change the cached result
+        return list(result) if isinstance(result, list) else result
+
     def dump_metadata(self, override_commit: bool = True) -> None:
         """Adds metadata to the graph."""
         metadata = {
@@ -1,3 +1,4 @@
+import shutil
 import xml.etree.ElementTree as ET
 from pathlib import Path
 from typing import List, Optional, Set
@@ -5,6 +6,11 @@ from zipfile import ZipFile
 
 from demisto_sdk.commands.common.logger import logger
 from demisto_sdk.commands.common.singleton import SingletonMeta
+from demisto_sdk.commands.content_graph.bulk_graph import (
+    BULK_GRAPH_SUFFIX,
+    BulkGraphReader,
+    get_bulk_graph_readers,
+)
 from demisto_sdk.commands.content_graph.neo4j_service import get_neo4j_import_path
 
 GRAPHML_FILE_SUFFIX = ".graphml"
@@ -32,25 +38,35 @@ class Neo4jImportHandler(metaclass=SingletonMeta):
 
     def clean_import_dir(self) -> None:
         for file in self.import_path.iterdir():
-            Path(file).unlink()
+            if file.is_dir():
+                shutil.rmtree(file)
+            else:
+                Path(file).unlink()
+
+    def get_bulk_graph_readers(self) -> List[BulkGraphReader]:
+        return get_bulk_graph_readers(self.import_path)
 
     def get_graphml_filenames(self) -> List[str]:
+        """Returns the GraphML files to import, skipping those of repositories which are exported in the bulk format too."""
+        bulk_graph_names = {
+            file.stem for file in self.import_path.glob(f"*{BULK_GRAPH_SUFFIX}")
+        }
         return [
             file.name
             for file in self.import_path.iterdir()
-            if file.suffix == GRAPHML_FILE_SUFFIX
+            if file.suffix == GRAPHML_FILE_SUFFIX and file.stem not in bulk_graph_names
         ]
 
     def ensure_data_uniqueness(self) -> None:
+        # the ids of the bulk exported graphs are local to their own files, only the GraphML files are rewritten
         if len(sources := self._get_import_sources()) > 1:
             for idx, source in enumerate(sources, 1):
                 self._set_unique_ids_for_source(source, str(idx))
 
     def _get_import_sources(self) -> Set[str]:
         sources: Set[str] = set()
-        for filename in self.import_path.iterdir():
-            if filename.suffix == GRAPHML_FILE_SUFFIX:
-                sources.add(filename.as_posix())
+        for filename in self.get_graphml_filenames():
+            sources.add((self.import_path / filename).as_posix())
         return sources
 
     def _set_unique_ids_for_source(self, source: str, prefix: str) -> None:
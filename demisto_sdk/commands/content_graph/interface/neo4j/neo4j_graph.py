@@ -11,6 +11,11 @@ from demisto_sdk.commands.common.constants import MarketplaceVersions
 from demisto_sdk.commands.common.cpu_count import cpu_count
 from demisto_sdk.commands.common.logger import logger
 from demisto_sdk.commands.common.tools import download_content_graph
+from demisto_sdk.commands.common.tracing import traced
+from demisto_sdk.commands.content_graph.bulk_graph import (
+    BULK_GRAPH_SUFFIX,
+    get_graph_export_format,
+)
 from demisto_sdk.commands.content_graph.common import (
     NEO4J_DATABASE_URL,
     NEO4J_PASSWORD,
@@ -19,7 +24,11 @@ from demisto_sdk.commands.content_graph.common import (
     Neo4jRelationshipResult,
     RelationshipType,
 )
-from demisto_sdk.commands.content_graph.interface.graph import ContentGraphInterface
+from demisto_sdk.commands.content_graph.interface.graph import (
+    ContentGraphInterface,
+    cached_query,
+    invalidates_query_cache,
+)
 from demisto_sdk.commands.content_graph.interface.neo4j.import_utils import (
     Neo4jImportHandler,
 )
@@ -32,7 +41,9 @@ from demisto_sdk.commands.content_graph.interface.neo4j.queries.dependencies imp
     get_all_level_packs_relationships,
 )
 from demisto_sdk.commands.content_graph.interface.neo4j.queries.import_export import (
+    export_bulk_graph,
     export_graphml,
+    import_bulk_graph,
     import_graphml,
     merge_duplicate_commands,
     merge_duplicate_content_items,
@@ -274,6 +285,7 @@ class Neo4jContentGraphInterface(ContentGraphInterface):
                     ),
                 )
 
+    @traced()
     def _add_nodes_to_mapping(self, nodes: Iterable[graph.Node]) -> None:
         """Add nodes to the content models mapping
 
@@ -347,6 +359,7 @@ class Neo4jContentGraphInterface(ContentGraphInterface):
             session.execute_write(create_indexes)
             session.execute_write(create_constraints)
 
+    @invalidates_query_cache
     def create_nodes(self, nodes: Dict[ContentType, List[Dict[str, Any]]]) -> None:
         logger.info("Creating graph nodes...")
         pack_ids = [p.get("object_id") for p in nodes.get(ContentType.PACK, [])]
@@ -358,6 +371,8 @@ class Neo4jContentGraphInterface(ContentGraphInterface):
             session.execute_write(create_nodes, nodes)
             session.execute_write(remove_empty_properties)
 
+    # the results are plain data, so they are cached on disk as well
+    @cached_query(persistent=True, load=tuple)
     def get_relationships_by_path(
         self,
         path: Path,
@@ -407,6 +422,7 @@ class Neo4jContentGraphInterface(ContentGraphInterface):
             )
             return sources, targets
 
+    @cached_query()
     def get_unknown_content_uses(
         self, file_paths: List[str], raises_error: bool, include_optional: bool = False
     ) -> List[BaseNode]:
@@ -418,6 +434,7 @@ class Neo4jContentGraphInterface(ContentGraphInterface):
             self._add_relationships_to_objects(session, results)
             return [self._id_to_obj[result] for result in results]
 
+    @cached_query()
     def get_duplicate_pack_display_name(
         self, file_paths: List[str]
     ) -> List[Tuple[str, List[str]]]:
@@ -427,6 +444,7 @@ class Neo4jContentGraphInterface(ContentGraphInterface):
             )
             return results
 
+    @cached_query()
     def get_duplicate_script_name_included_incident(
         self, file_paths: List[str]
     ) -> Dict[str, str]:
@@ -435,6 +453,7 @@ class Neo4jContentGraphInterface(ContentGraphInterface):
                 validate_multiple_script_with_same_name, file_paths
             )
 
+    @cached_query()
     def validate_duplicate_ids(
         self, file_paths: List[str]
     ) -> List[Tuple[BaseNode, List[BaseNode]]]:
@@ -451,6 +470,7 @@ class Neo4jContentGraphInterface(ContentGraphInterface):
             duplicate_models.append((self._id_to_obj[content_item.element_id], dups))
         return duplicate_models
 
+    @cached_query()
     def find_uses_paths_with_invalid_fromversion(
         self, file_paths: List[str], for_supported_versions=False
     ) -> List[BaseNode]:
@@ -471,6 +491,7 @@ class Neo4jContentGraphInterface(ContentGraphInterface):
             self._add_relationships_to_objects(session, results)
             return [self._id_to_obj[result] for result in results]
 
+    @cached_query()
     def find_uses_paths_with_invalid_toversion(
         self, file_paths: List[str], for_supported_versions=False
     ) -> List[BaseNode]:
@@ -491,6 +512,7 @@ class Neo4jContentGraphInterface(ContentGraphInterface):
             self._add_relationships_to_objects(session, results)
             return [self._id_to_obj[result] for result in results]
 
+    @cached_query()
     def find_items_using_deprecated_items(self, file_paths: List[str]) -> List[dict]:
         """Searches for content items who use content items which are deprecated.
 
@@ -503,6 +525,7 @@ class Neo4jContentGraphInterface(ContentGraphInterface):
         with self.driver.session() as session:
             return session.execute_read(get_items_using_deprecated, file_paths)
 
+    @cached_query()
     def find_uses_paths_with_invalid_marketplaces(
         self, pack_ids: List[str]
     ) -> List[BaseNode]:
@@ -523,6 +546,7 @@ class Neo4jContentGraphInterface(ContentGraphInterface):
             self._add_relationships_to_objects(session, results)
             return [self._id_to_obj[result] for result in results]
 
+    @cached_query()
     def find_core_packs_depend_on_non_core_packs(
         self,
         pack_ids: List[str],
@@ -546,6 +570,7 @@ class Neo4jContentGraphInterface(ContentGraphInterface):
             self._add_relationships_to_objects(session, results)
             return [self._id_to_obj[result] for result in results]
 
+    @cached_query()
     def find_mandatory_hidden_packs_dependencies(
         self, pack_ids: List[str]
     ) -> List[BaseNode]:
@@ -565,6 +590,7 @@ class Neo4jContentGraphInterface(ContentGraphInterface):
             self._add_relationships_to_objects(session, results)
             return [self._id_to_obj[result] for result in results]
 
+    @invalidates_query_cache
     def create_relationships(
         self, relationships: Dict[RelationshipType, List[Dict[str, Any]]]
     ) -> None:
@@ -576,6 +602,7 @@ class Neo4jContentGraphInterface(ContentGraphInterface):
                     return_preserved_relationships, self._rels_to_preserve
                 )
 
+    @invalidates_query_cache
     def remove_non_repo_items(self) -> None:
         with self.driver.session() as session:
             # Removing content-private nodes should be a temporary workaround.
@@ -583,16 +610,18 @@ class Neo4jContentGraphInterface(ContentGraphInterface):
             session.execute_write(remove_content_private_nodes)
             session.execute_write(remove_server_nodes)
 
+    @invalidates_query_cache
+    @traced()
     def import_graph(
         self,
         imported_path: Optional[Path] = None,
         download: bool = False,
         fail_on_error: bool = False,
     ) -> bool:
-        """Imports GraphML files to neo4j, by:
+        """Imports GraphML files and bulk exported graphs to neo4j, by:
         1. Preparing the GraphML files for import
         2. Dropping the constraints (we temporarily allow creating duplicate nodes from different repos)
-        3. Import the GraphML files
+        3. Import the GraphML files, and the bulk exported graphs in batches
         4. Merging duplicate nodes (conmmands/content items)
         5. Recreating the constraints
         6. Remove empty properties
@@ -625,24 +654,30 @@ class Neo4jContentGraphInterface(ContentGraphInterface):
                     raise
                 return False
 
-        logger.info("Importing graph from GraphML files...")
         self._import_handler.extract_files_from_path(imported_path)
         self._import_handler.ensure_data_uniqueness()
         graphml_filenames = self._import_handler.get_graphml_filenames()
-        if not graphml_filenames:
-            # no ml files found in the import dir, nothing to import
+        bulk_graph_readers = self._import_handler.get_bulk_graph_readers()
+        if not graphml_filenames and not bulk_graph_readers:
+            # no ml files or bulk graphs found in the import dir, nothing to import
             return False
         with self.driver.session() as session:
             session.execute_write(drop_constraints)
-            session.execute_write(import_graphml, graphml_filenames)
+            if graphml_filenames:
+                logger.info("Importing graph from GraphML files...")
+                session.execute_write(import_graphml, graphml_filenames)
+            for reader in bulk_graph_readers:
+                logger.info(f"Importing the bulk exported graph of {reader.name}...")
+                session.execute_write(import_bulk_graph, reader)
             session.execute_write(merge_duplicate_commands)
             session.execute_write(create_constraints)
-            if len(graphml_filenames) > 1:
+            if len(graphml_filenames) + len(bulk_graph_readers) > 1:
                 session.execute_write(merge_duplicate_content_items)
         has_infra_graph_been_changed = self._has_infra_graph_been_changed()
         self._id_to_obj = {}
         return not has_infra_graph_been_changed
 
+    @traced()
     def export_graph(
         self,
         output_path: Optional[Path] = None,
@@ -652,8 +687,15 @@ class Neo4jContentGraphInterface(ContentGraphInterface):
     ) -> None:
         if clean_import_dir:
             self.clean_import_dir()
+        export_format = get_graph_export_format()
         with self.driver.session() as session:
-            session.execute_write(export_graphml, self.repo_path.name)
+            if export_format.graphml:
+                session.execute_write(export_graphml, self.repo_path.name)
+            if export_format.bulk:
+                session.execute_read(
+                    export_bulk_graph,
+                    self.import_path / f"{self.repo_path.name}{BULK_GRAPH_SUFFIX}",
+                )
         self.dump_metadata(override_commit)
         self.dump_depends_on()
         if output_path:
@@ -661,12 +703,14 @@ class Neo4jContentGraphInterface(ContentGraphInterface):
             logger.info(f"Saving content graph in {output_path}.zip")
             self.zip_import_dir(output_path)
 
+    @invalidates_query_cache
     def clean_graph(self):
         with self.driver.session() as session:
             session.execute_write(delete_all_graph_nodes)
         self._id_to_obj = {}
         super().clean_graph()
 
+    @cached_query()
     def search(
         self,
         marketplace: Union[MarketplaceVersions, str] = None,
@@ -702,6 +746,8 @@ class Neo4jContentGraphInterface(ContentGraphInterface):
             **properties,
         )
 
+    @invalidates_query_cache
+    @traced()
     def create_pack_dependencies(self):
         logger.info("Creating pack dependencies...")
         with self.driver.session() as session:
@@ -714,6 +760,7 @@ class Neo4jContentGraphInterface(ContentGraphInterface):
         with self.driver.session() as session:
             return session.execute_read(get_schema)
 
+    @invalidates_query_cache
     def run_single_query(self, query: str, **kwargs) -> Any:
         with self.driver.session() as session:
             try:
@@ -1,9 +1,14 @@
+from pathlib import Path
 from time import sleep
-from typing import List
+from typing import Dict, List
 
 from neo4j import Transaction
 
-from demisto_sdk.commands.content_graph.common import ContentType
+from demisto_sdk.commands.content_graph.bulk_graph import (
+    BulkGraphReader,
+    BulkGraphWriter,
+)
+from demisto_sdk.commands.content_graph.common import UNWIND_BATCH_SIZE, ContentType
 from demisto_sdk.commands.content_graph.interface.neo4j.queries.common import run_query
 
 
@@ -19,6 +24,61 @@ def export_graphml(tx: Transaction, repo_name: str) -> None:
     run_query(tx, query)
 
 
+def export_bulk_graph(tx: Transaction, path: Path) -> None:
+    with BulkGraphWriter(path) as writer:
+        writer.add_nodes(
+            run_query(
+                tx,
+                """// Exports the nodes of the graph
+MATCH (n)
+RETURN elementId(n) AS id, labels(n) AS labels, properties(n) AS properties""",
+            )
+        )
+        writer.add_relationships(
+            run_query(
+                tx,
+                """// Exports the relationships of the graph
+MATCH (s)-[r]->(t)
+RETURN type(r) AS type, elementId(s) AS source, elementId(t) AS target, properties(r) AS properties""",
+            )
+        )
+
+
+def import_bulk_graph(tx: Transaction, reader: BulkGraphReader) -> None:
+    # maps the ids of the exported nodes to the element ids of the created nodes
+    element_ids: Dict[int, str] = {}
+    for labels, nodes in reader.iter_nodes(UNWIND_BATCH_SIZE):
+        query = f"""// Imports a batch of bulk exported nodes
+UNWIND $data AS node
+CREATE (n:{":".join(f"`{label}`" for label in labels)})
+SET n = node.properties
+RETURN node.id AS id, elementId(n) AS element_id"""
+        for record in run_query(tx, query, data=nodes):
+            element_ids[record["id"]] = record["element_id"]
+
+    for relationship_type, relationships in reader.iter_relationships(
+        UNWIND_BATCH_SIZE
+    ):
+        query = f"""// Imports a batch of bulk exported relationships
+UNWIND $data AS rel
+MATCH (s) WHERE elementId(s) = rel.source
+MATCH (t) WHERE elementId(t) = rel.target
+CREATE (s)-[r:`{relationship_type}`]->(t)
+SET r = rel.properties"""
+        run_query(
+            tx,
+            query,
+            data=[
+                {
+                    "source": element_ids[relationship["source"]],
+                    "target": element_ids[relationship["target"]],
+                    "properties": relationship["properties"],
+                }
+                for relationship in relationships
+            ],
+        )
+
+
 def merge_duplicate_commands(tx: Transaction) -> None:
     run_query(
         tx,
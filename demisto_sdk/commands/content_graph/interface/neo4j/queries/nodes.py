@@ -1,4 +1,4 @@
-from typing import Any, Dict, Iterable, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Union
 
 from neo4j import Transaction, graph
 
@@ -6,9 +6,12 @@ from demisto_sdk.commands.common.constants import MarketplaceVersions
 from demisto_sdk.commands.common.logger import logger
 from demisto_sdk.commands.content_graph.common import (
     CONTENT_PRIVATE_ITEMS,
+    UNWIND_BATCH_SIZE,
     ContentType,
+    Records,
     RelationshipType,
     get_server_content_items,
+    iter_record_batches,
 )
 from demisto_sdk.commands.content_graph.interface.neo4j.queries.common import (
     run_query,
@@ -135,7 +138,7 @@ RETURN rel"""
 
 def create_nodes(
     tx: Transaction,
-    nodes: Dict[ContentType, List[Dict[str, Any]]],
+    nodes: Dict[ContentType, Union[Records, List[Dict[str, Any]]]],
 ) -> None:
     for content_type, data in nodes.items():
         create_nodes_by_type(tx, content_type, data)
@@ -167,15 +170,17 @@ def remove_content_private_nodes(tx: Transaction) -> None:
 def create_nodes_by_type(
     tx: Transaction,
     content_type: ContentType,
-    data: List[Dict[str, Any]],
+    data: Union[Records, List[Dict[str, Any]]],
 ) -> None:
     labels: str = ":".join(content_type.labels)
     if content_type in ContentType.content_items():
         query = CREATE_CONTENT_ITEM_NODES_BY_TYPE_TEMPLATE.format(labels=labels)
     else:
         query = CREATE_NODES_BY_TYPE_TEMPLATE.format(labels=labels)
-    result = run_query(tx, query, data=data).single()
-    nodes_count: int = result["nodes_created"]
+    nodes_count = 0
+    for batch in iter_record_batches(data, UNWIND_BATCH_SIZE):
+        result = run_query(tx, query, data=batch).single()
+        nodes_count += result["nodes_created"]
     logger.debug(f"Created {nodes_count} nodes of type {content_type}.")
 
 
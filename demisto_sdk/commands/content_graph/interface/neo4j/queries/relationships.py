@@ -1,14 +1,17 @@
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 
 from neo4j import Transaction
 
 from demisto_sdk.commands.common.constants import MarketplaceVersions
 from demisto_sdk.commands.common.logger import logger
 from demisto_sdk.commands.content_graph.common import (
+    UNWIND_BATCH_SIZE,
     ContentType,
     Neo4jRelationshipResult,
+    Records,
     RelationshipType,
+    iter_record_batches,
 )
 from demisto_sdk.commands.content_graph.interface.neo4j.queries.common import (
     labels_of,
@@ -174,7 +177,7 @@ RETURN count(r) AS relationships_merged"""
 
 def create_relationships(
     tx: Transaction,
-    relationships: Dict[RelationshipType, List[Dict[str, Any]]],
+    relationships: Dict[RelationshipType, Union[Records, List[Dict[str, Any]]]],
     timeout: Optional[int] = None,
 ) -> None:
     if relationships.get(RelationshipType.HAS_COMMAND):
@@ -188,7 +191,7 @@ def create_relationships(
 def create_relationships_by_type(
     tx: Transaction,
     relationship: RelationshipType,
-    data: List[Dict[str, Any]],
+    data: Union[Records, List[Dict[str, Any]]],
 ) -> None:
     if relationship == RelationshipType.HAS_COMMAND:
         query = build_has_command_relationships_query()
@@ -220,7 +223,8 @@ def create_relationships_by_type(
         query = build_depends_on_relationships_query()
     else:
         query = build_default_relationships_query(relationship)
-    run_query(tx, query, data=data)
+    for batch in iter_record_batches(data, UNWIND_BATCH_SIZE):
+        run_query(tx, query, data=batch)
     logger.debug(f"Merged relationships of type {relationship}.")
 
 
@@ -291,7 +291,9 @@ class BaseContent(BaseNode):
                 return None
         try:
             content_item.MARKETPLACE_MIN_VERSION = "0.0.0"
-            content_item_parser = ContentItemParser.from_path(path, git_sha=git_sha)
+            content_item_parser = ContentItemParser.from_path(
+                path, git_sha=git_sha, metadata_only=metadata_only
+            )
             content_item.MARKETPLACE_MIN_VERSION = MARKETPLACE_MIN_VERSION
 
         except NotAContentItemException:
@@ -315,6 +317,8 @@ class BaseContent(BaseNode):
             logger.error(f"Could not parse content item from path: {path}")
             return None
         try:
+            if metadata_only:
+                return model.from_orm_metadata(content_item_parser)  # type: ignore[attr-defined]
             return model.from_orm(content_item_parser)  # type: ignore
         except Exception as e:
             logger.error(
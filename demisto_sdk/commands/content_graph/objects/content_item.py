@@ -19,7 +19,9 @@ if TYPE_CHECKING:
     from demisto_sdk.commands.content_graph.objects.relationship import RelationshipData
     from demisto_sdk.commands.content_graph.objects.test_playbook import TestPlaybook
 
-from pydantic import DirectoryPath, Field, fields, validator
+from pydantic import DirectoryPath, Field, ValidationError, fields, validator
+from pydantic.error_wrappers import ErrorWrapper
+from pydantic.errors import MissingError
 
 from demisto_sdk.commands.common.constants import PACKS_FOLDER, MarketplaceVersions
 from demisto_sdk.commands.common.content_constant_paths import CONTENT_PATH
@@ -53,6 +55,66 @@ class ContentItem(BaseContent):
     description: Optional[str] = ""
     is_test: bool = False
     pack: Any = Field(None, exclude=True, repr=False)
+    metadata_parser: Any = Field(None, exclude=True, repr=False)
+
+    @classmethod
+    def from_orm_metadata(cls, parser: Any) -> "ContentItem":
+        """
+        Loads the model from a parser like `from_orm`, but validates only the fields which are common to all of the
+        content items (name, marketplaces, versions etc.).
+        The rest of the fields are validated from the parser once they are accessed.
+
+        Args:
+            parser: The parser of the content item, usually parsed with `metadata_only`.
+
+        Returns:
+            ContentItem: The partially loaded model.
+        """
+        values: dict = {}
+        errors = []
+        for name in ContentItem.__fields__:
+            value, field_errors = cls._validate_parser_field(parser, name, values)
+            if field_errors:
+                errors.append(field_errors)
+            else:
+                values[name] = value
+        if errors:
+            raise ValidationError(errors, cls)
+        values["metadata_parser"] = parser
+        model = cls.construct(_fields_set=set(values), **values)
+        for name in cls.__fields__.keys() - values.keys():
+            # construct sets the defaults of the fields which were not given
+            model.__dict__.pop(name, None)
+        return model
+
+    @classmethod
+    def _validate_parser_field(cls, parser: Any, name: str, values: dict):
+        field = cls.__fields__[name]
+        value = getattr(parser, field.alias, fields.Undefined)
+        if value is fields.Undefined and field.alt_alias:
+            value = getattr(parser, field.name, fields.Undefined)
+        if value is fields.Undefined:
+            if field.required:
+                return None, ErrorWrapper(MissingError(), loc=field.alias)
+            value = field.get_default()
+            if not field.validate_always:
+                return value, None
+        return field.validate(value, values, loc=field.alias, cls=cls)  # type: ignore[arg-type]
+
+    def __getattr__(self, name: str) -> Any:
+        """Validates the fields which were not loaded by `from_orm_metadata` from the parser, once they are accessed."""
+        if name in type(self).__fields__ and (
+            parser := self.__dict__.get("metadata_parser")
+        ):
+            value, errors = self._validate_parser_field(parser, name, self.__dict__)
+            if errors:
+                raise ValidationError([errors], type(self))
+            self.__dict__[name] = value
+            self.__fields_set__.add(name)
+            return value
+        raise AttributeError(
+            f"{type(self).__name__!r} object has no attribute {name!r}"
+        )
 
     @validator("path", always=True)
     def validate_path(cls, v: Path, values) -> Path:
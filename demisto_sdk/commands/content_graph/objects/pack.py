@@ -31,6 +31,7 @@ from demisto_sdk.commands.common.tools import (
     get_file,
     write_dict,
 )
+from demisto_sdk.commands.common.tracing import traced
 from demisto_sdk.commands.content_graph.common import (
     PACK_METADATA_FILENAME,
     ContentType,
@@ -311,6 +312,7 @@ class Pack(BaseContent, PackMetadata, content_type=ContentType.PACK):
             path, marketplace, self.object_id, file_type=ImagesFolderNames.README_IMAGES
         )
 
+    @traced()
     def dump(
         self,
         path: Path,
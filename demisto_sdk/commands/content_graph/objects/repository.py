@@ -11,6 +11,7 @@ from demisto_sdk.commands.common.constants import MarketplaceVersions
 from demisto_sdk.commands.common.content_constant_paths import CONTENT_PATH
 from demisto_sdk.commands.common.cpu_count import cpu_count
 from demisto_sdk.commands.common.logger import logger
+from demisto_sdk.commands.common.tracing import traced
 from demisto_sdk.commands.content_graph.objects.pack import Pack
 from demisto_sdk.commands.content_graph.parsers.repository import RepositoryParser
 
@@ -37,6 +38,7 @@ class ContentDTO(BaseModel):
             repo_parser.parse(progress_bar=progress_bar)
         return ContentDTO.from_orm(repo_parser)
 
+    @traced()
     def dump(
         self,
         dir: DirectoryPath,
@@ -5,12 +5,16 @@ from typing import Any, Dict, List, Optional
 import networkx
 
 from demisto_sdk.commands.common.constants import MarketplaceVersions
+from demisto_sdk.commands.common.tools import get_yaml
 from demisto_sdk.commands.common.update_id_set import (
     BUILT_IN_FIELDS,
     build_tasks_graph,
     get_fields_by_script_argument,
 )
 from demisto_sdk.commands.content_graph.common import ContentType, RelationshipType
+from demisto_sdk.commands.content_graph.parsers.playbook_tasks_reader import (
+    read_playbook_for_relationships,
+)
 from demisto_sdk.commands.content_graph.parsers.yaml_content_item import (
     YAMLContentItemParser,
 )
@@ -46,15 +50,26 @@ class BasePlaybookParser(YAMLContentItemParser, content_type=ContentType.BASE_PL
         """
         super().__init__(path, pack_marketplaces, git_sha=git_sha)
         self.is_test: bool = is_test_playbook
-        self.graph: networkx.DiGraph = build_tasks_graph(self.yml_data)
-        self.connect_to_dependencies()
-        self.connect_to_tests()
+        if not self.metadata_only:
+            self.connect_to_dependencies()
+            self.connect_to_tests()
+
+    @cached_property
+    def graph(self) -> networkx.DiGraph:
+        return build_tasks_graph(self.yml_data)
 
     @cached_property
     def field_mapping(self):
         super().field_mapping.update({"object_id": "id"})
         return super().field_mapping
 
+    @cached_property
+    def yml_data(self) -> dict:
+        """The playbook data, its tasks contain only the keys used for collecting the playbook relationships."""
+        if self.git_sha:
+            return get_yaml(str(self.path), git_sha=self.git_sha)
+        return read_playbook_for_relationships(self.path)
+
     def is_mandatory_dependency(self, task_id: str) -> bool:
         try:
             return self.graph.nodes[task_id]["mandatory"]
@@ -29,8 +29,9 @@ class BaseScriptParser(IntegrationScriptParser, content_type=ContentType.BASE_SC
         self.is_test: bool = is_test_script
         self.tags: List[str] = self.yml_data.get("tags", [])
         self.skip_prepare: List[str] = self.yml_data.get("skipprepare", [])
-        self.connect_to_dependencies()
-        self.connect_to_tests()
+        if not self.metadata_only:
+            self.connect_to_dependencies()
+            self.connect_to_tests()
 
     @cached_property
     def field_mapping(self):
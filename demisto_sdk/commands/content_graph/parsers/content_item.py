@@ -73,10 +73,13 @@ class ContentItemParser(BaseContentParser, metaclass=ParserMetaclass):
             A mapping between content types and parsers.
     Attributes:
         relationships (Relationships): The relationships collections of the content item.
+        metadata_only (bool): Whether to skip collecting the relationships of the content item (and loading the data
+            needed only for them, e.g. the code of scripts), for the callers which need only its metadata.
     """
 
     content_type_to_parser: Dict[ContentType, Type["ContentItemParser"]] = {}
     pack: Any = Field(default=None, exclude=True)
+    metadata_only: bool = False
 
     def __init__(
         self,
@@ -94,9 +97,11 @@ class ContentItemParser(BaseContentParser, metaclass=ParserMetaclass):
         path: Path,
         pack_marketplaces: List[MarketplaceVersions] = list(MarketplaceVersions),
         git_sha: Optional[str] = None,
+        metadata_only: bool = False,
     ) -> "ContentItemParser":
         """Tries to parse a content item by its path.
         If during the attempt we detected the file is not a content item, `None` is returned.
+        If metadata_only is set, the relationships of the content item are not collected.
 
         Returns:
             Optional[ContentItemParser]: The parsed content item.
@@ -119,11 +124,16 @@ class ContentItemParser(BaseContentParser, metaclass=ParserMetaclass):
         if parser_cls := ContentItemParser.content_type_to_parser.get(content_type):
             try:
                 return ContentItemParser.parse(
-                    parser_cls, path, pack_marketplaces, git_sha
+                    parser_cls, path, pack_marketplaces, git_sha, metadata_only
                 )
             except IncorrectParserException as e:
                 return ContentItemParser.parse(
-                    e.correct_parser, path, pack_marketplaces, git_sha, **e.kwargs
+                    e.correct_parser,
+                    path,
+                    pack_marketplaces,
+                    git_sha,
+                    metadata_only,
+                    **e.kwargs,
                 )
             except NotAContentItemException:
                 logger.debug(f"{path} is not a content item, skipping")
@@ -140,9 +150,13 @@ class ContentItemParser(BaseContentParser, metaclass=ParserMetaclass):
         path: Path,
         pack_marketplaces: List[MarketplaceVersions],
         git_sha: Optional[str] = None,
+        metadata_only: bool = False,
         **kwargs,
     ) -> "ContentItemParser":
-        parser = parser_cls(path, pack_marketplaces, git_sha=git_sha, **kwargs)
+        parser = parser_cls.__new__(parser_cls)
+        # set before initializing the parser, as the relationships are collected by the __init__ of the parsers
+        parser.metadata_only = metadata_only
+        parser.__init__(path, pack_marketplaces, git_sha=git_sha, **kwargs)  # type: ignore[misc]
         logger.debug(f"Parsed {parser.node_id}")
         return parser
 
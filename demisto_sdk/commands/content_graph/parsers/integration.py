@@ -47,10 +47,10 @@ class IntegrationParser(IntegrationScriptParser, content_type=ContentType.INTEGR
         self.has_unittests: bool = (
             self.path.parent / self.path.parts[-1].replace(".yml", "_test.py")
         ).exists()
-        self.commands: List[CommandParser] = []
-        self.connect_to_commands()
-        self.connect_to_dependencies()
-        self.connect_to_tests()
+        if not self.metadata_only:
+            self.connect_to_commands()
+            self.connect_to_dependencies()
+            self.connect_to_tests()
 
     @cached_property
     def field_mapping(self):
@@ -74,33 +74,32 @@ class IntegrationParser(IntegrationScriptParser, content_type=ContentType.INTEGR
     def params(self) -> Optional[List]:
         return get_value(self.yml_data, self.field_mapping.get("configuration", ""), [])
 
+    @cached_property
+    def commands(self) -> List[CommandParser]:
+        return [
+            CommandParser(
+                name=command_data.get("name"),
+                description=command_data.get("description"),
+                deprecated=command_data.get("deprecated", False) or self.deprecated,
+                args=command_data.get("arguments") or [],
+                outputs=command_data.get("outputs") or [],
+            )
+            for command_data in self.script_info.get("commands", [])
+        ]
+
     def connect_to_commands(self) -> None:
         """Creates HAS_COMMAND relationships with the integration commands.
         Command's properties are stored in the relationship's data,
         since there will be a single node for all commands with the same name.
         """
-        for command_data in self.script_info.get("commands", []):
-            name = command_data.get("name")
-            deprecated = command_data.get("deprecated", False) or self.deprecated
-            description = command_data.get("description")
-            args = command_data.get("arguments") or []
-            outputs = command_data.get("outputs") or []
+        for command in self.commands:
             self.add_relationship(
                 RelationshipType.HAS_COMMAND,
-                target=name,
+                target=command.name,
                 target_type=ContentType.COMMAND,
-                name=name,
-                deprecated=deprecated,
-                description=description,
-            )
-            self.commands.append(
-                CommandParser(
-                    name=name,
-                    description=description,
-                    deprecated=deprecated,
-                    args=args,
-                    outputs=outputs,
-                )
+                name=command.name,
+                deprecated=command.deprecated,
+                description=command.description,
             )
 
     def connect_to_dependencies(self) -> None:
@@ -25,7 +25,8 @@ class IntegrationScriptParser(YAMLContentItemParser):
         self.is_unified = YAMLContentItemParser.is_unified_file(path)
         super().__init__(path, pack_marketplaces, git_sha=git_sha)
         self.script_info: Dict[str, Any] = self.yml_data.get("script", {})
-        self.connect_to_api_modules()
+        if not self.metadata_only:
+            self.connect_to_api_modules()
 
     @cached_property
     def field_mapping(self):
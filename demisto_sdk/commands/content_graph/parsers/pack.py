@@ -21,6 +21,7 @@ from demisto_sdk.commands.common.tools import (
     get_pack_ignore_content,
     get_pack_latest_rn_version,
 )
+from demisto_sdk.commands.common.tracing import span
 from demisto_sdk.commands.content_graph.common import (
     PACK_CONTRIBUTORS_FILENAME,
     PACK_METADATA_FILENAME,
@@ -265,7 +266,8 @@ class PackParser(BaseContentParser, PackMetadataParser):
         logger.debug(f"Parsing {self.node_id}")
         self.parse_ignored_errors(git_sha)
         if not metadata_only:
-            self.parse_pack_folders()
+            with span("parse pack", pack=path.name):
+                self.parse_pack_folders()
         self.get_rn_info()
 
         logger.debug(f"Successfully parsed {self.node_id}")
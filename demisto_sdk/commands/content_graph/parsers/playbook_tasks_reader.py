@@ -0,0 +1,194 @@
+import re
+from io import StringIO
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, Iterator, Optional
+
+# low level events and nodes are not exposed by the YAML handler
+from ruamel.yaml import YAML  # noqa:TID251
+from ruamel.yaml.events import (  # noqa:TID251
+    AliasEvent,
+    Event,
+    MappingEndEvent,
+    MappingStartEvent,
+    ScalarEvent,
+    SequenceEndEvent,
+    SequenceStartEvent,
+)
+from ruamel.yaml.nodes import MappingNode, ScalarNode, SequenceNode  # noqa:TID251
+
+from demisto_sdk.commands.common.logger import logger
+from demisto_sdk.commands.common.tools import get_file, get_yaml
+
+# the parts of a playbook task the relationships of the playbook are collected from, see BasePlaybookParser
+TASK_RELATIONSHIPS_KEYS = frozenset(
+    {"type", "skipunavailable", "nexttasks", "scriptarguments", "conditions", "task"}
+)
+INNER_TASK_RELATIONSHIPS_KEYS = frozenset(
+    {"playbookName", "playbookId", "scriptName", "script", "fieldMapping"}
+)
+
+# the same fix which is applied by get_file when loading yml files
+SIMPLE_EQUAL_SIGN_REGEX = re.compile(r"(simple: \s*\n*)(=)(\s*\n)")
+
+
+class UnsupportedPlaybookYAML(Exception):
+    """
+    Raised on YAML features the reader does not handle (anchors, aliases, merge keys, duplicate keys, custom tags),
+    the playbook is loaded entirely instead.
+    """
+
+
+class PlaybookTasksReader:
+    """
+    Reads a playbook yml for the content graph, without building the entire document.
+
+    The YAML events of the playbook are streamed, and everything but the tasks is built as usual. Each one of the
+    tasks is reduced to the keys its relationships (used scripts, commands, sub-playbooks, fields and filters/
+    transformers) and its flow (next tasks, whether it can be skipped) are collected from, while the rest of it
+    (names, descriptions, views, notes, etc. - most of the playbook) is skipped without being constructed.
+    The returned data is therefore equal to the loaded yml, except for the omitted task keys.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._yaml = YAML(typ="safe")
+        self._resolver = self._yaml.resolver
+        self._constructor = self._yaml.constructor
+
+    def read(self) -> Dict[str, Any]:
+        """
+        Returns the playbook data, falls back to loading the whole playbook on any unsupported or invalid yml.
+        """
+        try:
+            content = get_file(self.path, return_content=True)
+            data = self._read_document(
+                StringIO(SIMPLE_EQUAL_SIGN_REGEX.sub(r'\1"\2"\3', content))
+            )
+            if isinstance(data, dict):
+                return data
+        except UnsupportedPlaybookYAML as error:
+            logger.debug(f"Loading the entire playbook {self.path}: {error}")
+        except Exception as error:
+            logger.debug(f"Could not stream the playbook {self.path}: {error}")
+        return get_yaml(self.path)
+
+    def _read_document(self, stream: StringIO) -> Any:
+        events = iter(self._yaml.parse(stream))
+        for event in events:
+            if isinstance(
+                event,
+                (MappingStartEvent, SequenceStartEvent, ScalarEvent, AliasEvent),
+            ):
+                return self._read_node(event, events, path=())
+        return None
+
+    def _read_node(self, event: Event, events: Iterator[Event], path: tuple) -> Any:
+        if isinstance(event, AliasEvent) or getattr(event, "anchor", None):
+            raise UnsupportedPlaybookYAML("anchors and aliases are not supported")
+        if isinstance(event, ScalarEvent):
+            return self._construct_scalar(event)
+        if isinstance(event, SequenceStartEvent):
+            self._validate_collection_tag(event, SequenceNode)
+            sequence = []
+            for item in self._iter_items(events, SequenceEndEvent):
+                sequence.append(self._read_node(item, events, path + (None,)))
+            return sequence
+        if isinstance(event, MappingStartEvent):
+            self._validate_collection_tag(event, MappingNode)
+            return self._read_mapping(events, path)
+        raise UnsupportedPlaybookYAML(f"unexpected event {event}")
+
+    def _read_mapping(self, events: Iterator[Event], path: tuple) -> Dict[Any, Any]:
+        mapping: Dict[Any, Any] = {}
+        keys_to_keep = self._keys_to_keep(path)
+        for key_event in self._iter_items(events, MappingEndEvent):
+            if not isinstance(key_event, ScalarEvent):
+                raise UnsupportedPlaybookYAML("only scalar keys are supported")
+            key = self._read_node(key_event, events, path)
+            if key == "<<" and key_event.tag in (None, "tag:yaml.org,2002:merge"):
+                raise UnsupportedPlaybookYAML("merge keys are not supported")
+            if key in mapping:
+                raise UnsupportedPlaybookYAML(f"duplicate key {key}")
+
+            value_event = next(events)
+            if keys_to_keep is not None and key not in keys_to_keep:
+                self._skip_node(value_event, events)
+                # still marked, to detect duplicate keys
+                mapping[key] = None
+                continue
+            mapping[key] = self._read_node(value_event, events, path + (key,))
+
+        if keys_to_keep is not None:
+            mapping = {
+                key: value for key, value in mapping.items() if key in keys_to_keep
+            }
+        return mapping
+
+    @staticmethod
+    def _keys_to_keep(path: tuple) -> Optional[FrozenSet[str]]:
+        """
+        Returns the keys of the mapping in the path which should be read, None to read all of them.
+        """
+        if len(path) == 2 and path[0] == "tasks":
+            return TASK_RELATIONSHIPS_KEYS
+        if len(path) == 3 and path[0] == "tasks" and path[2] == "task":
+            return INNER_TASK_RELATIONSHIPS_KEYS
+        return None
+
+    @staticmethod
+    def _iter_items(events: Iterator[Event], end_event_type: type) -> Iterator[Event]:
+        for event in events:
+            if isinstance(event, end_event_type):
+                return
+            yield event
+
+    @staticmethod
+    def _skip_node(event: Event, events: Iterator[Event]) -> None:
+        """
+        Consumes the events of a node without constructing it.
+        """
+        if getattr(event, "anchor", None):
+            # the node might be referenced by an alias later on
+            raise UnsupportedPlaybookYAML("anchors and aliases are not supported")
+        if not isinstance(event, (MappingStartEvent, SequenceStartEvent)):
+            return
+        depth = 1
+        for event in events:
+            if getattr(event, "anchor", None):
+                raise UnsupportedPlaybookYAML("anchors and aliases are not supported")
+            if isinstance(event, (MappingStartEvent, SequenceStartEvent)):
+                depth += 1
+            elif isinstance(event, (MappingEndEvent, SequenceEndEvent)):
+                depth -= 1
+                if not depth:
+                    return
+
+    def _validate_collection_tag(self, event: Event, node_type: type) -> None:
+        if event.tag and event.tag != str(
+            self._resolver.resolve(node_type, None, True)
+        ):
+            raise UnsupportedPlaybookYAML(f"tag {event.tag} is not supported")
+
+    def _construct_scalar(self, event: ScalarEvent) -> Any:
+        tag = event.tag
+        if tag is None or tag == "!":
+            tag = str(self._resolver.resolve(ScalarNode, event.value, event.implicit))
+        if tag not in self._constructor.yaml_constructors:
+            raise UnsupportedPlaybookYAML(f"tag {tag} is not supported")
+        node = ScalarNode(
+            tag, event.value, event.start_mark, event.end_mark, style=event.style
+        )
+        return self._constructor.yaml_constructors[tag](self._constructor, node)
+
+
+def read_playbook_for_relationships(path: Path) -> Dict[str, Any]:
+    """
+    Reads a playbook yml with only the parts of its tasks its relationships are collected from.
+
+    Args:
+        path (Path): The playbook path.
+
+    Returns:
+        Dict[str, Any]: The playbook data.
+    """
+    return PlaybookTasksReader(path).read()
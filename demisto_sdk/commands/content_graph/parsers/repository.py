@@ -8,6 +8,7 @@ from tqdm import tqdm
 from demisto_sdk.commands.common.constants import PACKS_FOLDER
 from demisto_sdk.commands.common.cpu_count import cpu_count
 from demisto_sdk.commands.common.logger import logger
+from demisto_sdk.commands.common.tracing import traced
 from demisto_sdk.commands.content_graph.parsers.pack import PackParser
 
 IGNORED_PACKS_FOR_PARSING = ["NonSupported"]
@@ -31,6 +32,7 @@ class RepositoryParser:
         self.path: Path = path
         self.packs: List[PackParser] = []
 
+    @traced()
     def parse(
         self,
         packs_to_parse: Optional[List[Path]] = None,
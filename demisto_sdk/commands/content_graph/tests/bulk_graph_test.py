@@ -0,0 +1,181 @@
+import shutil
+from pathlib import Path
+
+import pytest
+
+from demisto_sdk.commands.common.handlers import DEFAULT_JSON_HANDLER as json
+from demisto_sdk.commands.content_graph.bulk_graph import (
+    BULK_GRAPH_SUFFIX,
+    GRAPH_EXPORT_FORMAT_ENV_VAR,
+    MANIFEST_FILE_NAME,
+    BulkGraphWriter,
+    GraphExportFormat,
+    InMemoryGraph,
+    get_bulk_graph_readers,
+    get_graph_export_format,
+)
+
+INTEGRATION_LABELS = ["BaseNode", "BaseContent", "ContentItem", "Integration"]
+COMMAND_LABELS = ["BaseNode", "BaseContent", "Command"]
+
+
+def write_graph(path):
+    """Writes a graph of a pack with an integration and its two commands, with neo4j-like element ids."""
+    with BulkGraphWriter(path) as writer:
+        writer.add_nodes(
+            [
+                {
+                    "id": "4:graph:0",
+                    "labels": ["BaseNode", "BaseContent", "Pack"],
+                    "properties": {"object_id": "QRadar", "content_type": "Pack"},
+                },
+                {
+                    "id": "4:graph:1",
+                    "labels": INTEGRATION_LABELS,
+                    "properties": {
+                        "object_id": "QRadar v3",
+                        "content_type": "Integration",
+                        "marketplaces": ["xsoar", "marketplacev2"],
+                    },
+                },
+                *(
+                    {
+                        "id": f"4:graph:{index}",
+                        "labels": COMMAND_LABELS,
+                        "properties": {"object_id": f"qradar-command-{index}"},
+                    }
+                    for index in (2, 3)
+                ),
+            ]
+        )
+        writer.add_relationships(
+            [
+                {
+                    "type": "IN_PACK",
+                    "source": "4:graph:1",
+                    "target": "4:graph:0",
+                    "properties": {},
+                },
+                *(
+                    {
+                        "type": "HAS_COMMAND",
+                        "source": "4:graph:1",
+                        "target": f"4:graph:{index}",
+                        "properties": {"deprecated": index == 3},
+                    }
+                    for index in (2, 3)
+                ),
+            ]
+        )
+
+
+def test_bulk_graph_manifest(tmp_path):
+    """
+    Given:
+        - a graph with nodes of several labels and relationships of several types
+
+    When:
+        - writing it in the bulk format
+
+    Then:
+        - make sure there is a compressed file per set of labels and per relationship type, listed in the manifest
+    """
+    bulk_path = tmp_path / f"content{BULK_GRAPH_SUFFIX}"
+    write_graph(bulk_path)
+
+    manifest = json.loads((bulk_path / MANIFEST_FILE_NAME).read_text())
+    assert {node_file["count"] for node_file in manifest["nodes"].values()} == {1, 2}
+    assert {
+        relationship_file["type"]: relationship_file["count"]
+        for relationship_file in manifest["relationships"].values()
+    } == {"IN_PACK": 1, "HAS_COMMAND": 2}
+    for relative_path in [*manifest["nodes"], *manifest["relationships"]]:
+        assert (bulk_path / relative_path).read_bytes()[:2] == b"\x1f\x8b"  # gzip
+
+
+@pytest.mark.parametrize("zipped", [False, True])
+def test_load_bulk_graph_to_memory(tmp_path, zipped):
+    """
+    Given:
+        - a graph in the bulk format, in an import directory or in a zip file of that directory
+
+    When:
+        - loading it to memory
+
+    Then:
+        - make sure the nodes can be searched by their labels and properties
+        - make sure the relationships of the nodes are loaded in both directions
+    """
+    import_path = tmp_path / "import"
+    write_graph(import_path / f"content{BULK_GRAPH_SUFFIX}")
+    if zipped:
+        import_path = shutil.make_archive(str(tmp_path / "xsoar"), "zip", import_path)
+
+    graph = InMemoryGraph.load(Path(import_path))
+
+    assert len(graph.nodes) == 4
+    assert graph.relationships_count == 3
+    (integration,) = graph.search("Integration", object_id="QRadar v3")
+    assert integration.labels == tuple(sorted(INTEGRATION_LABELS))
+    assert integration.properties["marketplaces"] == ["xsoar", "marketplacev2"]
+    commands = graph.get_relationships(integration.id, "HAS_COMMAND")
+    assert sorted(
+        (command.properties["object_id"], relationship.properties["deprecated"])
+        for relationship, command in commands
+    ) == [("qradar-command-2", False), ("qradar-command-3", True)]
+    (pack,) = graph.search("Pack")
+    ((in_pack, content_item),) = graph.get_relationships(pack.id, outgoing=False)
+    assert in_pack.relationship_type == "IN_PACK"
+    assert content_item == integration
+
+
+def test_load_several_bulk_graphs(tmp_path):
+    """
+    Given:
+        - an import directory with the bulk graphs of two repositories
+
+    When:
+        - reading and loading them
+
+    Then:
+        - make sure both are read, and their nodes are kept apart in memory
+    """
+    write_graph(tmp_path / f"content{BULK_GRAPH_SUFFIX}")
+    write_graph(tmp_path / f"private{BULK_GRAPH_SUFFIX}")
+
+    assert [reader.name for reader in get_bulk_graph_readers(tmp_path)] == [
+        "content",
+        "private",
+    ]
+    graph = InMemoryGraph.load(tmp_path)
+    assert len(graph.nodes) == 8
+    assert len(graph.search("Integration")) == 2
+    for integration in graph.search("Integration"):
+        assert len(graph.get_relationships(integration.id, "HAS_COMMAND")) == 2
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        (None, GraphExportFormat.GRAPHML),
+        ("Bulk", GraphExportFormat.BULK),
+        ("all", GraphExportFormat.ALL),
+        ("csv", GraphExportFormat.GRAPHML),
+    ],
+)
+def test_get_graph_export_format(monkeypatch, value, expected):
+    """
+    Given:
+        - the graph export format environment variable
+
+    When:
+        - getting the export format
+
+    Then:
+        - make sure GraphML is used by default, or when the format is unknown
+    """
+    if value:
+        monkeypatch.setenv(GRAPH_EXPORT_FORMAT_ENV_VAR, value)
+    else:
+        monkeypatch.delenv(GRAPH_EXPORT_FORMAT_ENV_VAR, raising=False)
+    assert get_graph_export_format() == expected
@@ -1,4 +1,12 @@
-from demisto_sdk.commands.content_graph.common import ContentType
+import pickle
+
+from demisto_sdk.commands.content_graph.common import (
+    ContentType,
+    Nodes,
+    Records,
+    Relationships,
+    RelationshipType,
+)
 from demisto_sdk.commands.content_graph.interface.neo4j.queries.common import (
     to_node_pattern,
 )
@@ -32,3 +40,73 @@ def test_to_neo4j_pattern():
         pattern
         == "(node:Integration{name: \"test\", version: 1, version_float: 1.0} WHERE node.object_ids IN ['1', '2'] AND 'xsoar' IN node.marketplaces)"
     )
+
+
+def test_relationships_are_kept_as_records():
+    """
+    Given:
+        - relationships of a content item, with different keys
+
+    When:
+        - adding them to the relationships of a pack, and pickling them (as done when parsing packs in workers)
+
+    Then:
+        - make sure they are returned as the added dicts, and the keys and short strings are shared between the records
+    """
+    item_relationships = Relationships()
+    item_relationships.add(
+        RelationshipType.USES_BY_ID,
+        source_id="Script",
+        target="Command",
+        mandatorily=True,
+    )
+    item_relationships.add(
+        RelationshipType.USES_BY_ID, source_id="Script", target="Other"
+    )
+    pack_relationships = Relationships()
+    pack_relationships.update(item_relationships)
+    pack_relationships.update(item_relationships)
+
+    records = pickle.loads(pickle.dumps(pack_relationships))[
+        RelationshipType.USES_BY_ID
+    ]
+
+    assert isinstance(records, Records)
+    assert (
+        records
+        == [
+            {"source_id": "Script", "target": "Command", "mandatorily": True},
+            {"source_id": "Script", "target": "Other"},
+        ]
+        * 2
+    )
+    assert records._rows[0][0] is records._rows[2][0]
+    assert records._rows[0][1] is records._rows[1][1]
+
+
+def test_records_batches_and_removal():
+    """
+    Given:
+        - nodes of a content type
+
+    When:
+        - removing one of them, and getting them in batches
+
+    Then:
+        - make sure the batches are lists of the remaining nodes, in order
+    """
+    nodes = Nodes(
+        *(
+            {"content_type": ContentType.SCRIPT, "object_id": f"Script{i}"}
+            for i in range(5)
+        )
+    )
+    scripts = nodes[ContentType.SCRIPT]
+    scripts.remove({"content_type": ContentType.SCRIPT, "object_id": "Script1"})
+
+    assert [
+        [node["object_id"] for node in batch] for batch in scripts.iter_batches(2)
+    ] == [
+        ["Script0", "Script2"],
+        ["Script3", "Script4"],
+    ]
@@ -0,0 +1,223 @@
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+from demisto_sdk.commands.common.constants import MarketplaceVersions
+from demisto_sdk.commands.content_graph.common import ContentType
+from demisto_sdk.commands.content_graph.interface import graph
+from demisto_sdk.commands.content_graph.interface.graph import (
+    PERSISTENT_GRAPH_QUERY_CACHE,
+    ContentGraphInterface,
+    cached_query,
+    invalidates_query_cache,
+)
+
+
+class FakeGraph(ContentGraphInterface):
+    """A graph interface which counts the queries that reach the database."""
+
+    def __init__(self, commit: Optional[str] = "1234"):
+        self.queries: List[Dict[str, Any]] = []
+        self._commit = commit
+
+    @property
+    def commit(self):
+        return self._commit
+
+    @property
+    def content_parser_latest_hash(self):
+        return "parser-hash"
+
+    @cached_query()
+    def search(
+        self, marketplace=None, content_type=ContentType.BASE_NODE, **properties
+    ):
+        self.queries.append({"marketplace": marketplace, **properties})
+        return [f"result-{len(self.queries)}"]
+
+    @cached_query(persistent=True, load=tuple)
+    def get_relationships_by_path(self, path: Path, depth: int = 1):
+        self.queries.append({"path": path, "depth": depth})
+        return [{"path": str(path)}], []
+
+    @invalidates_query_cache
+    def create_nodes(self, nodes):
+        self.queries.append({"nodes": nodes})
+
+
+# only the cached queries are implemented
+FakeGraph.__abstractmethods__ = frozenset()
+
+
+@pytest.fixture(autouse=True)
+def query_cache_dir(tmp_path, monkeypatch) -> Path:
+    monkeypatch.setattr(graph, "GRAPH_QUERY_CACHE_DIR", tmp_path)
+    return tmp_path
+
+
+@pytest.fixture()
+def persistent_cache_dir(query_cache_dir: Path, monkeypatch) -> Path:
+    monkeypatch.setenv(PERSISTENT_GRAPH_QUERY_CACHE, "true")
+    return query_cache_dir
+
+
+def test_repeated_queries_are_cached():
+    """
+    Given:
+        - a graph interface
+
+    When:
+        - running the same search several times, with its arguments passed differently
+
+    Then:
+        - make sure the query reaches the graph only once
+        - make sure changing the returned list does not change the cached result
+    """
+    content_graph = FakeGraph()
+
+    first_result = content_graph.search(MarketplaceVersions.XSOAR, object_id="test")
+    first_result.append("changed")
+    assert content_graph.search(
+        marketplace="xsoar", content_type=ContentType.BASE_NODE, object_id="test"
+    ) == ["result-1"]
+    assert len(content_graph.queries) == 1
+
+    assert content_graph.search(MarketplaceVersions.XSOAR, object_id="other") == [
+        "result-2"
+    ]
+    assert len(content_graph.queries) == 2
+
+
+def test_graph_changes_invalidate_the_cache():
+    """
+    Given:
+        - a graph interface with a cached search result
+
+    When:
+        - creating nodes in the graph
+
+    Then:
+        - make sure the search reaches the graph again
+    """
+    content_graph = FakeGraph()
+    content_graph.search(object_id="test")
+    content_graph.create_nodes({})
+
+    assert content_graph.search(object_id="test") == ["result-3"]
+
+
+def test_iterators_are_not_cached():
+    """
+    Given:
+        - a search with a generator argument
+
+    When:
+        - running it twice
+
+    Then:
+        - make sure the query is not cached, so the generator is consumed only by the query
+    """
+    content_graph = FakeGraph()
+    content_graph.search(ids=(i for i in range(3)))
+    content_graph.search(ids=(i for i in range(3)))
+
+    assert len(content_graph.queries) == 2
+
+
+def test_persistent_cache(persistent_cache_dir: Path):
+    """
+    Given:
+        - the persistent graph query cache is enabled
+
+    When:
+        - running a persistent query from two graph interfaces (runs) of the same commit, and from another commit
+
+    Then:
+        - make sure the second run is served from the disk with the same result type
+        - make sure a different commit reaches the graph
+        - make sure a graph change clears the disk cache
+    """
+    first_run = FakeGraph()
+    assert first_run.get_relationships_by_path(Path("Packs/Test/test.yml")) == (
+        [{"path": "Packs/Test/test.yml"}],
+        [],
+    )
+
+    second_run = FakeGraph()
+    assert second_run.get_relationships_by_path(Path("Packs/Test/test.yml")) == (
+        [{"path": "Packs/Test/test.yml"}],
+        [],
+    )
+    assert not second_run.queries
+
+    other_commit = FakeGraph(commit="5678")
+    other_commit.get_relationships_by_path(Path("Packs/Test/test.yml"))
+    assert len(other_commit.queries) == 1
+
+    other_commit.create_nodes({})
+    assert not list(persistent_cache_dir.glob("*.json"))
+
+
+def test_graph_without_commit_is_not_cached_on_disk(persistent_cache_dir: Path):
+    """
+    Given:
+        - the persistent graph query cache is enabled, and graphs without metadata (no commit)
+
+    When:
+        - running a persistent query from two such graph interfaces
+
+    Then:
+        - make sure the result is cached in memory only, so the second graph reaches its own database
+    """
+    first_graph = FakeGraph(commit=None)
+    first_graph.get_relationships_by_path(Path("Packs/Test/test.yml"))
+    first_graph.get_relationships_by_path(Path("Packs/Test/test.yml"))
+    assert len(first_graph.queries) == 1
+    assert not list(persistent_cache_dir.glob("*.json"))
+
+    second_graph = FakeGraph(commit=None)
+    second_graph.get_relationships_by_path(Path("Packs/Test/test.yml"))
+    assert len(second_graph.queries) == 1
+
+
+def test_non_persistent_queries_are_not_saved_on_disk(persistent_cache_dir: Path):
+    """
+    Given:
+        - the persistent graph query cache is enabled
+
+    When:
+        - running a query which returns graph models
+
+    Then:
+        - make sure its result is not saved on disk
+    """
+    FakeGraph().search(object_id="test")
+
+    assert not list(persistent_cache_dir.glob("*.json"))
+
+
+def test_graph_changes_clear_the_disabled_persistent_cache(
+    persistent_cache_dir: Path, monkeypatch
+):
+    """
+    Given:
+        - a persistent query result saved on disk
+
+    When:
+        - changing the graph in a run where the persistent graph query cache is disabled
+        - running the query again with the persistent cache enabled
+
+    Then:
+        - make sure the disk cache was cleared, and the query reaches the graph again
+    """
+    FakeGraph().get_relationships_by_path(Path("Packs/Test/test.yml"))
+
+    monkeypatch.delenv(PERSISTENT_GRAPH_QUERY_CACHE)
+    FakeGraph().create_nodes({})
+    assert not list(persistent_cache_dir.glob("*.json"))
+
+    monkeypatch.setenv(PERSISTENT_GRAPH_QUERY_CACHE, "true")
+    next_run = FakeGraph()
+    next_run.get_relationships_by_path(Path("Packs/Test/test.yml"))
+    assert len(next_run.queries) == 1
@@ -749,6 +749,37 @@ class TestParsersAndModels:
         assert model.is_fetch_events is False
         assert model.is_fetch_assets is True
 
+    def test_integration_parser_metadata_only(self, pack: Pack):
+        """
+        Given:
+            - A pack with an integration which imports an API module.
+        When:
+            - Loading the integration's model from its path with metadata only.
+        Then:
+            - Verify no relationships of the content item are collected.
+            - Verify the generic content item properties are loaded with the model.
+            - Verify the specific properties of the content item are loaded only once they are accessed.
+        """
+        from demisto_sdk.commands.content_graph.objects.integration import Integration
+
+        integration = pack.create_integration(yml=load_yaml("integration.yml"))
+        integration.code.write("from MicrosoftApiModule import *")
+
+        model = BaseContent.from_path(Path(integration.path), metadata_only=True)
+        assert isinstance(model, Integration)
+        assert not model.metadata_parser.relationships
+        assert model.name == "TestIntegration"
+        assert model.fromversion == "5.0.0"
+        assert "code" not in model.__dict__
+        assert "commands" not in model.__dict__
+
+        assert model.code == "from MicrosoftApiModule import *"
+        assert [command.name for command in model.commands] == ["test-command"]
+        assert model.is_fetch_assets is True
+        assert {"code", "commands", "is_fetch_assets"} <= model.__fields_set__
+        with pytest.raises(AttributeError):
+            model.no_such_field
+
     def test_unified_integration_parser(self, pack: Pack):
         """
         Given:
@@ -0,0 +1,115 @@
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from demisto_sdk.commands.common.constants import MarketplaceVersions
+from demisto_sdk.commands.common.legacy_git_tools import git_path
+from demisto_sdk.commands.common.tools import get_yaml
+from demisto_sdk.commands.content_graph.parsers import base_playbook
+from demisto_sdk.commands.content_graph.parsers.playbook import PlaybookParser
+from demisto_sdk.commands.content_graph.parsers.playbook_tasks_reader import (
+    INNER_TASK_RELATIONSHIPS_KEYS,
+    TASK_RELATIONSHIPS_KEYS,
+    read_playbook_for_relationships,
+)
+from TestSuite.pack import Pack
+
+PLAYBOOKS = sorted(
+    path
+    for path in Path(git_path()).glob("demisto_sdk/**/*.yml")
+    if "layboo" in str(path)
+)
+
+
+def parse_relationships(path: Path) -> Any:
+    try:
+        return PlaybookParser(path, list(MarketplaceVersions)).relationships
+    except Exception as error:
+        return type(error)
+
+
+@pytest.mark.parametrize(
+    "playbook_path", PLAYBOOKS, ids=lambda path: path.relative_to(git_path()).as_posix()
+)
+def test_relationships_are_identical_to_full_load(mocker, playbook_path: Path):
+    """
+    Given:
+        - a playbook of the test files of the repository
+
+    When:
+        - parsing it with the playbook tasks reader, and with the entire playbook loaded
+
+    Then:
+        - make sure the collected relationships are identical
+    """
+    relationships = parse_relationships(playbook_path)
+
+    mocker.patch.object(
+        base_playbook,
+        "read_playbook_for_relationships",
+        side_effect=lambda path: get_yaml(str(path)),
+    )
+    assert relationships == parse_relationships(playbook_path)
+
+
+def test_tasks_contain_only_relationships_keys(pack: Pack):
+    """
+    Given:
+        - a playbook
+
+    When:
+        - reading it with read_playbook_for_relationships
+
+    Then:
+        - make sure the tasks contain only the keys relationships are collected from
+        - make sure the rest of the playbook is identical to the loaded yml
+    """
+    playbook = pack.create_playbook()
+    playbook.create_default_playbook(name="sample")
+    full_data = get_yaml(playbook.path)
+
+    data = read_playbook_for_relationships(Path(playbook.path))
+
+    assert {key: value for key, value in data.items() if key != "tasks"} == {
+        key: value for key, value in full_data.items() if key != "tasks"
+    }
+    assert data["tasks"].keys() == full_data["tasks"].keys()
+    for task_id, task in data["tasks"].items():
+        assert set(task) == set(full_data["tasks"][task_id]) & TASK_RELATIONSHIPS_KEYS
+        assert set(task.get("task", {})) == (
+            set(full_data["tasks"][task_id].get("task", {}))
+            & INNER_TASK_RELATIONSHIPS_KEYS
+        )
+        assert task.get("nexttasks") == full_data["tasks"][task_id].get("nexttasks")
+
+
+@pytest.mark.parametrize(
+    "playbook_yml",
+    [
+        pytest.param(
+            "id: sample\ndefaults: &defaults\n  type: regular\ntasks:\n  '0':\n    <<: *defaults\n",
+            id="anchors",
+        ),
+        pytest.param(
+            "id: sample\ntasks:\n  '0':\n    type: regular\n    type: title\n",
+            id="duplicate keys",
+        ),
+        pytest.param("- id: sample\n", id="not a mapping"),
+    ],
+)
+def test_unsupported_yml_falls_back_to_full_load(tmp_path: Path, playbook_yml: str):
+    """
+    Given:
+        - playbook yml files which use anchors, duplicate keys or are not a mapping
+
+    When:
+        - reading them with read_playbook_for_relationships
+
+    Then:
+        - make sure the result is the same as loading the entire playbook
+    """
+    playbook_path = tmp_path / "playbook.yml"
+    playbook_path.write_text(playbook_yml)
+
+    assert read_playbook_for_relationships(playbook_path) == get_yaml(playbook_path)
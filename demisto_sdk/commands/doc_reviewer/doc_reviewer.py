@@ -1,3 +1,4 @@
+import multiprocessing
 import os
 import re
 import ssl
@@ -5,9 +6,10 @@ import string
 import sys
 from configparser import ConfigParser
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 import nltk
+from more_itertools import divide
 from nltk.corpus import brown, webtext
 from spellchecker import SpellChecker
 
@@ -24,6 +26,7 @@ from demisto_sdk.commands.common.content.objects.abstract_objects import TextObj
 from demisto_sdk.commands.common.content.objects.pack_objects.abstract_pack_objects.yaml_content_object import (
     YAMLContentObject,
 )
+from demisto_sdk.commands.common.cpu_count import cpu_count
 from demisto_sdk.commands.common.logger import logger
 from demisto_sdk.commands.common.tools import (
     add_default_pack_known_words,
@@ -35,6 +38,12 @@ from demisto_sdk.commands.doc_reviewer.rn_checker import ReleaseNotesChecker
 
 CAMEL_CASE_MATCH = re.compile(".+?(?:(?<=[a-z])(?=[A-Z])|(?<=[A-Z])(?=[A-Z][a-z])|$)")
 
+# the misspelled word, and the misspelled part of it (None when the word itself is misspelled)
+UnknownWord = Tuple[str, Optional[str]]
+
+# the reviewer of the files in a worker process of the multiprocessing mode
+_WORKER_DOC_REVIEWER: Optional["DocReviewer"] = None
+
 
 def replace_escape_characters(sentence: str, replace_with: str = " ") -> str:
     escape_chars = ["\\n", "\\r", "\\b", "\\f", "\\t"]
@@ -71,6 +80,7 @@ class DocReviewer:
         release_notes_only: bool = False,
         xsoar_only: bool = False,
         load_known_words_from_pack: bool = False,
+        multiprocessing: bool = False,
     ):
         if templates:
             ReleaseNotesChecker(template_examples=True)
@@ -113,6 +123,10 @@ class DocReviewer:
         self.files_with_misspells: set = set()
         self.files_without_misspells: set = set()
         self.malformed_rn_files: set = set()
+        self.run_with_multiprocessing = multiprocessing
+        # memos of the current dictionary: the misspells found in each word, and the suggestions of each misspell
+        self._word_misspells: Dict[str, Tuple[UnknownWord, ...]] = {}
+        self._suggestions: Dict[str, Set[str]] = {}
 
     @staticmethod
     def find_known_words_from_pack(file_path: str) -> Tuple[str, list]:
@@ -294,44 +308,101 @@ class DocReviewer:
 
         self.add_known_words()
 
-        for file in self.files:
-            logger.info(f"\nChecking file {file}")
+        if self.run_with_multiprocessing and len(self.files) > 1:
+            self.review_files_in_parallel()
+        else:
+            for file in self.files:
+                unknown_words = self.review_file(file)
+                if unknown_words is not None:
+                    self.report_file(file, unknown_words)
 
-            # --xsoar-only flag is specified.
-            if self.is_xsoar_supported_rn_only and not is_xsoar_supported_pack(file):
-                logger.info(
-                    f"[yellow]File '{file}' was skipped because it does not belong to an XSOAR-supported Pack[/yellow]"
-                )
-                continue
+        self.print_file_report()
+        if (self.found_misspelled or self.malformed_rn_files) and not self.no_failure:
+            return False
 
-            restarted_spellchecker = self.update_known_words_from_pack(file)
-            if restarted_spellchecker:
-                self.add_known_words()
-            self.unknown_words = {}
-            if file.endswith(".md"):
-                self.check_md_file(file)
+        return True
 
-            elif file.endswith(".yml"):
-                self.check_yaml(file)
+    def review_file(self, file: str) -> Optional[Dict[UnknownWord, Set[str]]]:
+        """Runs spell-check on a single file (and release notes check if relevant).
 
-            if self.unknown_words:
-                logger.info(
-                    f"\n[red] - Words that might be misspelled were found in "
-                    f"{file}:[/red]"
-                )
-                self.print_unknown_words(unknown_words=self.unknown_words)
-                self.found_misspelled = True
-                self.files_with_misspells.add(file)
+        Returns:
+            The words that might be misspelled in the file with their suggestions, None if the file was skipped.
+        """
+        logger.info(f"\nChecking file {file}")
 
-            else:
-                logger.info(f"[green] - No misspelled words found in {file}[/green]")
-                self.files_without_misspells.add(file)
+        # --xsoar-only flag is specified.
+        if self.is_xsoar_supported_rn_only and not is_xsoar_supported_pack(file):
+            logger.info(
+                f"[yellow]File '{file}' was skipped because it does not belong to an XSOAR-supported Pack[/yellow]"
+            )
+            return None
+
+        restarted_spellchecker = self.update_known_words_from_pack(file)
+        if restarted_spellchecker:
+            self.add_known_words()
+        self.unknown_words = {}
+        if file.endswith(".md"):
+            self.check_md_file(file)
+
+        elif file.endswith(".yml"):
+            self.check_yaml(file)
+
+        self.add_suggestions()
+        return self.unknown_words
+
+    def report_file(
+        self, file: str, unknown_words: Dict[UnknownWord, Set[str]]
+    ) -> None:
+        self.unknown_words = unknown_words
+        if self.unknown_words:
+            logger.info(
+                f"\n[red] - Words that might be misspelled were found in "
+                f"{file}:[/red]"
+            )
+            self.print_unknown_words(unknown_words=self.unknown_words)
+            self.found_misspelled = True
+            self.files_with_misspells.add(file)
 
-        self.print_file_report()
-        if (self.found_misspelled or self.malformed_rn_files) and not self.no_failure:
-            return False
+        else:
+            logger.info(f"[green] - No misspelled words found in {file}[/green]")
+            self.files_without_misspells.add(file)
 
-        return True
+    def review_files_in_parallel(self):
+        """Reviews the files in worker processes, and reports their results in the original order of the files.
+
+        Each worker reviews a consecutive part of the files (so the files of the same pack are mostly reviewed by the
+        same worker, with the same known words), the unknown words and malformed release notes of all of them
+        are merged back into this reviewer.
+        """
+        processes = min(cpu_count(), len(self.files))
+        logger.info(f"[cyan]Reviewing the files using {processes} processes[/cyan]")
+        files_parts = [list(part) for part in divide(processes, self.files)]
+        with multiprocessing.Pool(
+            processes=processes,
+            initializer=_init_worker_doc_reviewer,
+            initargs=(self.worker_arguments(),),
+        ) as pool:
+            results = pool.map(_review_files_in_worker, files_parts)
+
+        for file, unknown_words, is_malformed_rn in (
+            result for part_results in results for result in part_results
+        ):
+            if is_malformed_rn:
+                self.malformed_rn_files.add(file)
+            if unknown_words is not None:
+                self.report_file(file, unknown_words)
+
+    def worker_arguments(self) -> Dict[str, Any]:
+        """The arguments to create the reviewers of the worker processes with"""
+        return {
+            "file_paths": self.files,
+            "known_words_file_paths": self.known_words_file_paths,
+            "no_camel_case": self.no_camel_case,
+            "expand_dictionary": self.expand_dictionary,
+            "release_notes_only": self.SUPPORTED_FILE_TYPES == [FileType.RELEASE_NOTES],
+            "xsoar_only": self.is_xsoar_supported_rn_only,
+            "load_known_words_from_pack": self.load_known_words_from_pack,
+        }
 
     def update_known_words_from_pack(self, file_path: str) -> bool:
         """Update spellchecker with the file's pack's known words.
@@ -353,6 +424,7 @@ class DocReviewer:
                 if self.known_pack_words_file_path:
                     # Restart Spellchecker to remove old known_words packs file
                     self.spellchecker = SpellChecker()
+                    self.clear_spelling_memos()
                     self.known_pack_words_file_path = ""
                     restarted_spellchecker = True
 
@@ -361,11 +433,18 @@ class DocReviewer:
                 if known_words:
                     # Add the new known_words packs file
                     self.spellchecker.word_frequency.load_words(known_words)
+                    self.clear_spelling_memos()
 
         return restarted_spellchecker
 
+    def clear_spelling_memos(self):
+        """Clears the memos of the spell-check, should be called once the dictionary changes"""
+        self._word_misspells = {}
+        self._suggestions = {}
+
     def add_known_words(self):
         """Add known words to the spellchecker from external and internal files"""
+        self.clear_spelling_memos()
         # adding known words file if given - these words will not count as misspelled
         if self.known_words_file_paths:
             for known_words_file_path in self.known_words_file_paths:
@@ -402,46 +481,68 @@ class DocReviewer:
         """remove leading and trailing punctuation"""
         return word.strip(string.punctuation)
 
-    def suggest_if_misspelled(self, word: str) -> Optional[Set]:
-        if word.isalpha() and self.spellchecker.unknown([word]):
-            candidates = set(list(self.spellchecker.candidates(word))[:5])
+    def is_misspelled(self, word: str) -> bool:
+        return word.isalpha() and bool(self.spellchecker.unknown([word]))
+
+    def get_suggestions(self, word: str) -> Set[str]:
+        """Returns the corrections of a misspelled word, computed once per word"""
+        if (suggestions := self._suggestions.get(word)) is None:
+            suggestions = set(list(self.spellchecker.candidates(word) or [])[:5])
             # Don't suggest the misspelled word as its own correction, in this case the returned set will be
             # empty indicating a misspelled word with no suggestion.
-            candidates.discard(word)
-            return candidates
+            suggestions.discard(word)
+            self._suggestions[word] = suggestions
+        return set(suggestions)
+
+    def suggest_if_misspelled(self, word: str) -> Optional[Set]:
+        if self.is_misspelled(word):
+            return self.get_suggestions(word)
         return None
 
+    def add_suggestions(self):
+        """Adds the suggestions of the unknown words, which are computed only when reporting them"""
+        self.unknown_words = {
+            (word, sub_word): self.get_suggestions(sub_word or word)
+            for word, sub_word in self.unknown_words
+        }
+
     def check_sentence(self, sentence: str):
         if sentence:
             for word in replace_escape_characters(sentence).split():
                 self.check_word(word)
 
     def check_word(self, word):
-        """Check if a word is legal"""
+        """Check if a word is legal, the suggestions of the unknown words are added by add_suggestions"""
+        if (misspells := self._word_misspells.get(word)) is None:
+            misspells = self._word_misspells[word] = tuple(self.find_misspells(word))
+        for misspell in misspells:
+            self.unknown_words.setdefault(misspell, None)
+
+    def find_misspells(self, word: str) -> List[UnknownWord]:
+        """Returns the misspelled word or the misspelled parts of it, if there are any"""
         # First check if the word, as is exists in the dictionary.
         if not self.spellchecker.unknown([word]):
-            return
+            return []
 
         word = self.remove_punctuation(word)
         if not self.spellchecker.unknown([word]):
-            return
+            return []
 
         sub_words = []
         if "-" in word:
-            if not self.spellchecker.unknown([word]):
-                return
             sub_words.extend(word.split("-"))
         elif not self.no_camel_case and self.is_camel_case(word):
             sub_words.extend(self.camel_case_split(word))
-        else:
+        elif self.is_misspelled(word):
             # The word isn't kebab-case or CamelCase, so we check its own spelling
-            if (suggestions := self.suggest_if_misspelled(word)) is not None:
-                self.unknown_words[(word, None)] = suggestions
+            return [(word, None)]
 
+        misspells = []
         for sub_word in set(sub_words):
             sub_word = self.remove_punctuation(sub_word)
-            if (suggestions := self.suggest_if_misspelled(sub_word)) is not None:
-                self.unknown_words[(word, sub_word)] = suggestions
+            if self.is_misspelled(sub_word):
+                misspells.append((word, sub_word))
+        return misspells
 
     def check_md_file(self, file_path):
         """Runs spell check on .md file. Adds unknown words to given unknown_words set.
@@ -546,3 +647,24 @@ class DocReviewer:
             if task_info:
                 self.check_sentence(task_info.get("description"))
                 self.check_sentence(task_info.get("name"))
+
+
+def _init_worker_doc_reviewer(reviewer_arguments: Dict[str, Any]):
+    global _WORKER_DOC_REVIEWER
+    _WORKER_DOC_REVIEWER = DocReviewer(**reviewer_arguments)
+    _WORKER_DOC_REVIEWER.add_known_words()
+
+
+def _review_files_in_worker(
+    files: List[str],
+) -> List[Tuple[str, Optional[Dict[UnknownWord, Set[str]]], bool]]:
+    """Reviews files in a worker process.
+
+    Returns:
+        The file, its unknown words (None if skipped) and whether it is a malformed release note, for each file.
+    """
+    reviewer: DocReviewer = _WORKER_DOC_REVIEWER  # type: ignore[assignment]
+    return [
+        (file, reviewer.review_file(file), file in reviewer.malformed_rn_files)
+        for file in files
+    ]
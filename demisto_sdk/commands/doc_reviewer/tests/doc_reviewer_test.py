@@ -7,6 +7,7 @@ from typing import List
 
 import pytest
 from click.testing import CliRunner, Result
+from spellchecker import SpellChecker
 
 from demisto_sdk import __main__
 from demisto_sdk.commands.common.constants import FileType
@@ -1445,3 +1446,80 @@ def test_pack_known_word_arg(use_pack_known_words, expected_param_value, mocker)
     )
     runner.invoke(__main__.doc_review, use_pack_known_words)
     assert m.call_args.kwargs.get("load_known_words_from_pack") == expected_param_value
+
+
+def test_spell_check_is_memoized(repo, mocker):
+    """
+    Given:
+        - two release notes, with the same misspelled words appearing several times in each one of them
+
+    When:
+        - running doc-review on both of them
+
+    Then:
+        - make sure the suggestions of each misspelled word are computed only once
+        - make sure the misspelled words are still reported for both files, with their suggestions
+    """
+    pack = repo.create_pack("test_pack")
+    content = "\n#### Scripts\n##### ScriptName\n- Added the nomnomone and the SomeWorrd. nomnomone, SomeWorrd."
+    rn_files = [
+        pack.create_release_notes(version=f"1_0_{i}", content=content).path
+        for i in range(2)
+    ]
+    print_unknown_words = mocker.patch.object(DocReviewer, "print_unknown_words")
+
+    with ChangeCWD(repo.path):
+        doc_reviewer = DocReviewer(file_paths=rn_files)
+        candidates = mocker.spy(SpellChecker, "candidates")
+        assert not doc_reviewer.run_doc_review()
+
+    assert sorted(call.args[1] for call in candidates.call_args_list) == [
+        "Worrd",
+        "nomnomone",
+    ]
+    assert print_unknown_words.call_count == 2
+    for call in print_unknown_words.call_args_list:
+        unknown_words = call.kwargs["unknown_words"]
+        assert set(unknown_words) == {
+            ("nomnomone", None),
+            ("SomeWorrd", "Worrd"),
+        }
+        assert "word" in unknown_words[("SomeWorrd", "Worrd")]
+    assert doc_reviewer.files_with_misspells == set(rn_files)
+
+
+def test_doc_review_with_multiprocessing(repo):
+    """
+    Given:
+        - a valid release note, a misspelled release note and a malformed release note
+
+    When:
+        - running doc-review on them in parallel processes
+
+    Then:
+        - make sure the misspelled and malformed files found by the worker processes are reported
+    """
+    pack = repo.create_pack("test_pack")
+    valid_rn = pack.create_release_notes(
+        version="1_0_0",
+        content="\n#### Scripts\n##### ScriptName\n- Added the feature.",
+    )
+    misspelled_rn = pack.create_release_notes(
+        version="1_0_1",
+        content="\n#### Scripts\n##### ScriptName\n- Added the nomnomone.",
+    )
+    malformed_rn = pack.create_release_notes(
+        version="1_0_2",
+        content="\n#### Scripts\n##### ScriptName\n- Fixed a bug.",
+    )
+
+    with ChangeCWD(repo.path):
+        doc_reviewer = DocReviewer(
+            file_paths=[valid_rn.path, misspelled_rn.path, malformed_rn.path],
+            multiprocessing=True,
+        )
+        assert not doc_reviewer.run_doc_review()
+
+    assert doc_reviewer.files_with_misspells == {misspelled_rn.path}
+    assert doc_reviewer.files_without_misspells == {valid_rn.path, malformed_rn.path}
+    assert doc_reviewer.malformed_rn_files == {malformed_rn.path}
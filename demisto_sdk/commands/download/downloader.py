@@ -9,7 +9,7 @@ from enum import Enum
 from io import BytesIO, StringIO
 from pathlib import Path
 from tempfile import TemporaryDirectory
-from typing import DefaultDict, Dict
+from typing import DefaultDict, Dict, Iterator
 
 import demisto_client.demisto_api
 import mergedeep
@@ -51,6 +51,7 @@ from demisto_sdk.commands.common.tools import (
     pascal_case,
     safe_read_unicode,
     write_dict,
+    yaml_safe_load,
 )
 from demisto_sdk.commands.format.format_module import format_manager
 from demisto_sdk.commands.init.initiator import Initiator
@@ -91,6 +92,11 @@ ITEM_TYPE_TO_REQUEST_TYPE = {
     ContentItemType.PLAYBOOK: "GET",
 }
 
+# UUIDs in YAML files are replaced together with their surrounding quotes (if there are any),
+# so the replacing names can be wrapped with quotes without duplicating them.
+YAML_UUID_REGEX = re.compile(rf"(?P<quote>['\"]?)(?P<uuid>{UUID_REGEX})(?P=quote)")
+UUID_PATTERN = re.compile(rf"(?P<uuid>{UUID_REGEX})")
+
 # Fields to keep on existing content items when overwriting them with a download (fields that are omitted by the server)
 KEEP_EXISTING_JSON_FIELDS = ["fromVersion", "toVersion"]
 KEEP_EXISTING_YAML_FIELDS = [
@@ -228,10 +234,7 @@ class Downloader:
                         )
                         return 1
 
-                all_custom_content_data = self.download_custom_content()
-                all_custom_content_objects = self.parse_custom_content_data(
-                    file_name_to_content_item_data=all_custom_content_data
-                )
+                all_custom_content_objects = self.stream_custom_content_objects()
 
                 # Filter custom content so that we'll process only downloaded content
                 downloaded_content_objects = self.filter_custom_content(
@@ -266,8 +269,13 @@ class Downloader:
                     self.replace_uuid_ids(
                         custom_content_objects=downloaded_content_objects,
                         uuid_mapping=uuid_mapping,
+                        reload_data=False,
                     )
 
+                self.load_custom_content_data(
+                    custom_content_objects=downloaded_content_objects
+                )
+
             existing_pack_data = self.build_existing_pack_structure(
                 existing_pack_path=output_path
             )
@@ -295,9 +303,8 @@ class Downloader:
         """
         List all custom content available to download from the configured XSOAR instance.
         """
-        all_custom_content_data = self.download_custom_content()
-        all_custom_content_objects = self.parse_custom_content_data(
-            file_name_to_content_item_data=all_custom_content_data
+        all_custom_content_objects = self.stream_custom_content_objects(
+            keep_files=False
         )
 
         logger.info(
@@ -322,10 +329,6 @@ class Downloader:
         Returns:
             dict[str, dict]: A new custom content objects dict with filtered items.
         """
-        file_name_to_content_name_map = {
-            file_name: content_object["name"]
-            for file_name, content_object in custom_content_objects.items()
-        }
         filtered_custom_content_objects: dict[str, dict] = {}
         original_count = len(custom_content_objects)
         logger.debug(f"Filtering {original_count} custom content items...")
@@ -333,13 +336,10 @@ class Downloader:
         compiled_regex = re.compile(self.regex) if self.regex else None
 
         for file_name, content_item_data in custom_content_objects.items():
-            content_item_name = file_name_to_content_name_map[file_name]
-
             # Filter according input / regex flags
-            if (
-                self.download_all_custom_content
-                or (compiled_regex and re.match(compiled_regex, content_item_name))
-                or content_item_name in self.input_files
+            if self.is_requested_content_item(
+                content_item_name=content_item_data["name"],
+                compiled_regex=compiled_regex,
             ):
                 filtered_custom_content_objects[file_name] = content_item_data
 
@@ -348,6 +348,25 @@ class Downloader:
         )
         return filtered_custom_content_objects
 
+    def is_requested_content_item(
+        self, content_item_name: str, compiled_regex: re.Pattern | None
+    ) -> bool:
+        """
+        Check whether a custom content item was requested for download by the input / regex / all flags.
+
+        Args:
+            content_item_name (str): The name of the custom content item.
+            compiled_regex (re.Pattern | None): The compiled regex of the regex flag, if it was used.
+
+        Returns:
+            bool: True if the content item should be downloaded, False otherwise.
+        """
+        return bool(
+            self.download_all_custom_content
+            or (compiled_regex and re.match(compiled_regex, content_item_name))
+            or content_item_name in self.input_files
+        )
+
     def create_uuid_to_name_mapping(
         self, custom_content_objects: dict[str, dict]
     ) -> dict[str, str]:
@@ -386,13 +405,13 @@ class Downloader:
         logger.debug("Custom content IDs mapping created successfully.")
         return mapping
 
-    def download_custom_content(self) -> dict[str, StringIO]:
+    def iter_custom_content_bundle(self) -> Iterator[tuple[str, str]]:
         """
-        Download custom content bundle using server's API,
-        and create a StringIO object containing file data for each file within it.
+        Download custom content bundle using server's API, and stream the files within it one by one,
+        without loading the whole bundle to memory.
 
-        Returns:
-            dict[str, StringIO]: A dictionary mapping custom content's file names to their content.
+        Yields:
+            tuple[str, str]: The file name and the content of each custom content file in the bundle.
         """
         try:
             logger.info(
@@ -428,28 +447,44 @@ class Downloader:
             raise HandledError from e
 
         logger.debug("Custom content bundle fetched successfully.")
-        logger.debug(
-            f"Downloaded content bundle size (bytes): {len(api_response.data)}"
+
+        # A response that was already read to memory can't be streamed
+        bundle_file = (
+            BytesIO(api_response.data) if api_response.closed else api_response
         )
+        files_count = 0
 
-        loaded_files: dict[str, StringIO] = {}
+        with tarfile.open(fileobj=bundle_file, mode="r|*") as tar:
+            for file in tar:
+                if extracted_file := tar.extractfile(file):
+                    files_count += 1
+                    yield file.name.lstrip("/"), safe_read_unicode(
+                        extracted_file.read()
+                    )
 
-        with tarfile.open(fileobj=BytesIO(api_response.data), mode="r") as tar:
-            tar_members = tar.getmembers()
-            logger.debug(f"Custom content bundle contains {len(tar_members)} items.")
+        logger.debug(f"Custom content bundle contains {files_count} items.")
 
-            for file in tar_members:
-                file_name = file.name.lstrip("/")
+    def download_custom_content(self) -> dict[str, StringIO]:
+        """
+        Download custom content bundle using server's API,
+        and create a StringIO object containing file data for each file within it.
 
-                if extracted_file := tar.extractfile(file):
-                    file_data = StringIO(safe_read_unicode(extracted_file.read()))
-                    loaded_files[file_name] = file_data
+        Returns:
+            dict[str, StringIO]: A dictionary mapping custom content's file names to their content.
+        """
+        loaded_files: dict[str, StringIO] = {
+            file_name: StringIO(file_content)
+            for file_name, file_content in self.iter_custom_content_bundle()
+        }
 
         logger.debug("Custom content items loaded to memory successfully.")
         return loaded_files
 
     def replace_uuid_ids(
-        self, custom_content_objects: dict[str, dict], uuid_mapping: dict[str, str]
+        self,
+        custom_content_objects: dict[str, dict],
+        uuid_mapping: dict[str, str],
+        reload_data: bool = True,
     ):
         """
         Find and replace UUID IDs of custom content items with their names (using the provided mapping).
@@ -461,6 +496,8 @@ class Downloader:
             custom_content_objects (dict[str, dict]): A dictionary mapping custom content names
                 to their corresponding objects.
             uuid_mapping (dict[str, str]): A dictionary mapping UUID IDs to corresponding names of custom content.
+            reload_data (bool, optional): Whether to parse the data of updated content items right away.
+                If False, the data of updated content items is reset, to be loaded by 'load_custom_content_data'.
         """
         changed_uuids_count = 0
         failed_content_items = set()
@@ -468,7 +505,9 @@ class Downloader:
         for original_file_name, file_object in custom_content_objects.items():
             try:
                 if self.replace_uuid_ids_for_item(
-                    custom_content_object=file_object, uuid_mapping=uuid_mapping
+                    custom_content_object=file_object,
+                    uuid_mapping=uuid_mapping,
+                    reload_data=reload_data,
                 ):
                     changed_uuids_count += 1
 
@@ -489,56 +528,71 @@ class Downloader:
             )
 
     def replace_uuid_ids_for_item(
-        self, custom_content_object: dict, uuid_mapping: dict[str, str]
+        self,
+        custom_content_object: dict,
+        uuid_mapping: dict[str, str],
+        reload_data: bool = True,
     ) -> bool:
         """
         Find and replace UUID IDs of custom content items with their names.
-        The method first creates a mapping of a UUID to a name, and then replaces all UUIDs using this mapping.
+        All the UUIDs of the item are replaced in a single pass over the file, using the provided mapping.
 
         Args:
             custom_content_object (dict): A single custom content object to update UUIDs in.
             uuid_mapping (dict[str, str]): A dictionary mapping UUID IDs to corresponding names of custom content.
+            reload_data (bool, optional): Whether to parse the data of the updated file right away.
+                If False, the data is reset, to be loaded by 'load_custom_content_data'.
 
         Returns:
             bool: True if the object was updated, False otherwise.
         """
         content_item_file_content = custom_content_object["file"].getvalue()
-        uuid_matches = re.findall(UUID_REGEX, content_item_file_content)
+        is_yaml = custom_content_object["file_extension"] in ("yml", "yaml")
+        found_uuids: set[str] = set()
+        replaced_uuids: set[str] = set()
 
-        if uuid_matches:
-            for uuid in set(uuid_matches).intersection(uuid_mapping):
-                logger.debug(
-                    f"Replacing UUID '{uuid}' with '{uuid_mapping[uuid]}' in "
-                    f"'{custom_content_object['name']}'"
-                )
+        def replace_uuid(uuid_match: re.Match) -> str:
+            uuid = uuid_match["uuid"]
+            found_uuids.add(uuid)
 
-                if custom_content_object["file_extension"] in ("yml", "yaml"):
-                    # Wrap the new ID with quotes for cases where the name contains special characters like ':'.
-                    # Handle cases where there are quotes already surrounding the ID (avoid duplicate quotes).
-                    for replace_str in (f"'{uuid}'", f'"{uuid}"', uuid):
-                        content_item_file_content = content_item_file_content.replace(
-                            replace_str, f"'{uuid_mapping[uuid]}'"
-                        )
+            if uuid not in uuid_mapping:
+                return uuid_match[0]
 
-                else:
-                    content_item_file_content = content_item_file_content.replace(
-                        uuid, uuid_mapping[uuid]
-                    )
+            replaced_uuids.add(uuid)
+            # Wrap the new ID with quotes for cases where the name contains special characters like ':'.
+            # Quotes that already surround the ID are part of the match (avoid duplicate quotes).
+            return f"'{uuid_mapping[uuid]}'" if is_yaml else uuid_mapping[uuid]
+
+        updated_file_content = (YAML_UUID_REGEX if is_yaml else UUID_PATTERN).sub(
+            replace_uuid, content_item_file_content
+        )
+
+        if not found_uuids:
+            return False
 
-            # Update ID if it's a UUID
-            if custom_content_object["id"] in uuid_mapping:
-                custom_content_object["id"] = uuid_mapping[custom_content_object["id"]]
+        for uuid in replaced_uuids:
+            logger.debug(
+                f"Replacing UUID '{uuid}' with '{uuid_mapping[uuid]}' in "
+                f"'{custom_content_object['name']}'"
+            )
+
+        # Update ID if it's a UUID
+        if custom_content_object["id"] in uuid_mapping:
+            custom_content_object["id"] = uuid_mapping[custom_content_object["id"]]
 
+        if updated_file_content != content_item_file_content:
             # Update custom content object
-            custom_content_object["file"] = StringIO(content_item_file_content)
-            loaded_file_data = get_file_details(
-                content_item_file_content,
-                full_file_path=custom_content_object["file_name"],
+            custom_content_object["file"] = StringIO(updated_file_content)
+            custom_content_object["data"] = (
+                get_file_details(
+                    updated_file_content,
+                    full_file_path=custom_content_object["file_name"],
+                )
+                if reload_data
+                else None
             )
-            custom_content_object["data"] = loaded_file_data
 
-            return True
-        return False
+        return True
 
     def build_request_params(
         self,
@@ -863,48 +917,164 @@ class Downloader:
         custom_content_objects: dict[str, dict] = {}
 
         for file_name, file_data in file_name_to_content_item_data.items():
-            try:
-                logger.debug(f"Parsing '{file_name}'...")
-                custom_content_object: Dict = self.create_content_item_object(
-                    file_name=file_name, file_data=file_data
-                )
+            if custom_content_object := self.parse_custom_content_item(
+                file_name=file_name, file_data=file_data
+            ):
+                custom_content_objects[file_name] = custom_content_object
 
-                # Check if all required fields are present
-                missing_field = False
-                for _field in ("id", "name", "entity", "type"):
-                    if not custom_content_object.get(_field):
-                        logger.warning(
-                            f"'{file_name}' will be skipped as its {_field} could not be detected."
-                        )
-                        missing_field = True
-                        break
+        logger.info(
+            f"Successfully parsed {len(custom_content_objects)} custom content objects."
+        )
+        return custom_content_objects
 
-                # If the content is missing a required field, skip it
-                if missing_field:
-                    continue
+    def stream_custom_content_objects(self, keep_files: bool = True) -> dict[str, dict]:
+        """
+        Download the custom content bundle, and parse each file as it is streamed from the bundle.
 
-                # If the content is written in JavaScript (not supported), skip it
-                if custom_content_object["type"] in (
-                    FileType.INTEGRATION,
-                    FileType.SCRIPT,
-                ) and custom_content_object.get("code_lang") in (None, "javascript"):
-                    logger.warning(
-                        f"Skipping '{file_name}' as JavaScript content is not supported."
-                    )
-                    continue
+        YAML files are loaded with the (fast) safe loader, which is enough for detecting the ID, name and type
+        of the content items. The file content is kept only for content items that are requested for download,
+        other content items are kept as metadata only (for the UUID mapping).
+        The data of the requested items is loaded later on by 'load_custom_content_data',
+        after their UUIDs are replaced, so that each file is fully parsed at most once.
 
-                custom_content_objects[file_name] = custom_content_object
+        Args:
+            keep_files (bool, optional): Whether to keep the files of the requested content items.
 
-            except Exception as e:
-                # We fail the whole download process, since we might miss UUIDs to replace if not.
-                logger.error(f"Error while parsing '{file_name}': {e}")
-                raise
+        Returns:
+            dict[str, dict]: A dictionary mapping content item's file names, to dictionaries containing metadata
+                about the content item (and file data for requested items).
+        """
+        logger.info("Parsing downloaded custom content data...")
+        custom_content_objects: dict[str, dict] = {}
+        compiled_regex = re.compile(self.regex) if self.regex else None
+
+        for file_name, file_content in self.iter_custom_content_bundle():
+            is_yaml = file_name.endswith(("yml", "yaml"))
+            custom_content_object = self.parse_custom_content_item(
+                file_name=file_name,
+                file_data=StringIO(file_content),
+                _loaded_data=self.safe_load_yaml(file_name, file_content)
+                if is_yaml
+                else None,
+            )
+
+            if not custom_content_object:
+                continue
+
+            if keep_files and self.is_requested_content_item(
+                content_item_name=custom_content_object["name"],
+                compiled_regex=compiled_regex,
+            ):
+                if is_yaml:
+                    # Loaded by 'load_custom_content_data' with the round-trip loader
+                    custom_content_object["data"] = None
+
+            else:
+                custom_content_object.pop("file")
+                custom_content_object.pop("data")
+
+            custom_content_objects[file_name] = custom_content_object
 
         logger.info(
             f"Successfully parsed {len(custom_content_objects)} custom content objects."
         )
         return custom_content_objects
 
+    @staticmethod
+    def safe_load_yaml(file_name: str, file_content: str) -> dict | None:
+        """
+        Load a YAML file with the safe loader, which is much faster than the round-trip loader.
+
+        Returns:
+            dict | None: The loaded data, or None if the file could not be loaded (parsed by the regular loader).
+        """
+        try:
+            return yaml_safe_load.load(StringIO(file_content))
+
+        except Exception as e:
+            logger.debug(f"Could not load '{file_name}' with the safe loader: {e}")
+            return None
+
+    def load_custom_content_data(self, custom_content_objects: dict[str, dict]):
+        """
+        Load the data of custom content objects that their data was not loaded yet.
+
+        Note:
+            This method modifies the provided 'custom_content_objects' dictionary.
+
+        Args:
+            custom_content_objects (dict[str, dict]): A dictionary mapping custom content names
+                to their corresponding objects.
+        """
+        failed_content_items = set()
+
+        for file_name, custom_content_object in custom_content_objects.items():
+            if custom_content_object["data"] is not None:
+                continue
+
+            try:
+                custom_content_object["data"] = get_file_details(
+                    custom_content_object["file"].getvalue(),
+                    full_file_path=custom_content_object["file_name"],
+                )
+
+            except Exception as e:
+                logger.warning(
+                    f"Could not parse '{custom_content_object['name']}'. "
+                    f"Content item will be skipped.\nError: {e}"
+                )
+                failed_content_items.add(file_name)
+
+        for failed_content_item in failed_content_items:
+            custom_content_objects.pop(failed_content_item)
+
+    def parse_custom_content_item(
+        self, file_name: str, file_data: StringIO, _loaded_data: dict | None = None
+    ) -> dict | None:
+        """
+        Converts a single custom content file to a custom content object.
+
+        Args:
+            file_name (str): The file name of the custom content item.
+            file_data (StringIO): The file data of the custom content item.
+            _loaded_data (dict | None, optional): The loaded data of the custom content item.
+                If not provided, the file will be parsed.
+
+        Returns:
+            dict | None: The custom content object, or None if the content item is not supported.
+        """
+        try:
+            logger.debug(f"Parsing '{file_name}'...")
+            custom_content_object: Dict = self.create_content_item_object(
+                file_name=file_name, file_data=file_data, _loaded_data=_loaded_data
+            )
+
+            # Check if all required fields are present
+            for _field in ("id", "name", "entity", "type"):
+                if not custom_content_object.get(_field):
+                    logger.warning(
+                        f"'{file_name}' will be skipped as its {_field} could not be detected."
+                    )
+                    # If the content is missing a required field, skip it
+                    return None
+
+            # If the content is written in JavaScript (not supported), skip it
+            if custom_content_object["type"] in (
+                FileType.INTEGRATION,
+                FileType.SCRIPT,
+            ) and custom_content_object.get("code_lang") in (None, "javascript"):
+                logger.warning(
+                    f"Skipping '{file_name}' as JavaScript content is not supported."
+                )
+                return None
+
+            return custom_content_object
+
+        except Exception as e:
+            # We fail the whole download process, since we might miss UUIDs to replace if not.
+            logger.error(f"Error while parsing '{file_name}': {e}")
+            raise
+
     def create_custom_content_table(
         self, custom_content_objects: dict[str, dict]
     ) -> str:
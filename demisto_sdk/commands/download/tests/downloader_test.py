@@ -4,7 +4,7 @@ import builtins
 import logging
 import os
 import shutil
-from io import TextIOWrapper
+from io import BytesIO, TextIOWrapper
 from pathlib import Path
 from typing import Callable, Tuple
 
@@ -24,6 +24,7 @@ from demisto_sdk.commands.common.handlers import DEFAULT_JSON_HANDLER as json
 from demisto_sdk.commands.common.handlers import DEFAULT_YAML_HANDLER as yaml
 from demisto_sdk.commands.common.tests.tools_test import SENTENCE_WITH_UMLAUTS
 from demisto_sdk.commands.common.tools import get_child_files
+from demisto_sdk.commands.download import downloader as downloader_module
 from demisto_sdk.commands.download.downloader import *
 from TestSuite.playbook import Playbook
 from TestSuite.test_tools import str_in_call_args_list
@@ -1499,3 +1500,123 @@ def test_invalid_regex_error(mocker):
         logger_error.call_args_list,
         "Error: Invalid regex pattern provided: '*invalid-regex*'.",
     )
+
+
+def test_streamed_custom_content_bundle(mocker):
+    """
+    Given: A custom content bundle response that was not read to memory yet.
+    When: Calling 'download_custom_content'.
+    Then: Ensure the bundle is streamed, and all the files within it are loaded.
+    """
+    mock_bundle_data = (
+        TESTS_DATA_FOLDER / "custom_content" / "download_tar.tar.gz"
+    ).read_bytes()
+    mock_bundle_response = HTTPResponse(
+        body=BytesIO(mock_bundle_data), status=200, preload_content=False
+    )
+    mocker.patch.object(
+        demisto_client,
+        "generic_request_func",
+        return_value=(mock_bundle_response, None, None),
+    )
+
+    custom_content_data = Downloader().download_custom_content()
+
+    assert len(custom_content_data) == 11
+    assert "integration-custom_integration.yml" in custom_content_data
+
+
+def test_stream_custom_content_objects_keeps_only_requested_files(mocker):
+    """
+    Given: A custom content bundle, and a single requested content item.
+    When: Running the download command.
+    Then:
+        - Ensure only the file of the requested content item is kept.
+        - Ensure the UUIDs of the requested content item are replaced, and its data is loaded
+          (once, after the replacement) with the round-trip loader.
+    """
+    mock_bundle_data = (
+        TESTS_DATA_FOLDER / "custom_content" / "download_tar.tar.gz"
+    ).read_bytes()
+    mocker.patch.object(
+        demisto_client,
+        "generic_request_func",
+        return_value=(HTTPResponse(body=mock_bundle_data, status=200), None, None),
+    )
+    downloader = Downloader(input=("custom_playbook",), output="fake_output_dir")
+    mocker.patch.object(downloader, "verify_output_path", return_value=True)
+    mocker.patch.object(downloader, "build_existing_pack_structure", return_value={})
+    write_files = mocker.patch.object(
+        downloader, "write_files_into_output_path", return_value=True
+    )
+    stream_objects = mocker.spy(downloader, "stream_custom_content_objects")
+    get_file_details_mock = mocker.spy(downloader_module, "get_file_details")
+
+    assert downloader.download() == 0
+
+    assert [
+        file_name
+        for file_name, content_object in stream_objects.spy_return.items()
+        if "file" in content_object
+    ] == ["playbook-custom_playbook.yml"]
+
+    downloaded_objects = write_files.call_args.kwargs["downloaded_content_objects"]
+    playbook_object = downloaded_objects["playbook-custom_playbook.yml"]
+    assert playbook_object["id"] == "custom_playbook"
+    assert (
+        "a53a2f17-2f05-486d-867f-a36c9f5b88d4" not in playbook_object["file"].getvalue()
+    )
+    assert playbook_object["data"] == yaml.load(playbook_object["file"].getvalue())
+    # YAML files are fully parsed only once they are downloaded (JSON files are loaded once while streamed)
+    assert [
+        call.kwargs["full_file_path"]
+        for call in get_file_details_mock.call_args_list
+        if call.kwargs["full_file_path"].endswith("yml")
+    ] == ["custom_playbook.yml"]
+
+
+@pytest.mark.parametrize(
+    "file_extension, file_content, expected_content",
+    [
+        (
+            "yml",
+            "id: 'uuid-1'\nscript: \"uuid-1\"\nplaybook: uuid-2\nother: uuid-3\n",
+            "id: 'Name: One'\nscript: 'Name: One'\nplaybook: 'Two'\nother: uuid-3\n",
+        ),
+        (
+            "json",
+            '{"id": "uuid-1", "playbook": "uuid-2", "other": "uuid-3"}',
+            '{"id": "Name: One", "playbook": "Two", "other": "uuid-3"}',
+        ),
+    ],
+)
+def test_replace_uuid_ids_for_item_single_pass(
+    file_extension: str, file_content: str, expected_content: str
+):
+    """
+    Given: A content item which references known UUIDs (quoted and not quoted), and an unknown UUID.
+    When: Calling 'replace_uuid_ids_for_item'.
+    Then: Ensure the known UUIDs are replaced with their names (quoted in YAML files), and the unknown one is kept.
+    """
+    uuids = {
+        f"uuid-{i}": f"{i}" * 8 + "-1111-2222-3333-444444444444" for i in range(1, 4)
+    }
+    for uuid_key, uuid in uuids.items():
+        file_content = file_content.replace(uuid_key, uuid)
+        expected_content = expected_content.replace(uuid_key, uuid)
+    custom_content_object = {
+        "id": uuids["uuid-1"],
+        "name": "Name: One",
+        "file": StringIO(file_content),
+        "file_name": f"playbook-test.{file_extension}",
+        "file_extension": file_extension,
+        "data": None,
+    }
+
+    assert Downloader().replace_uuid_ids_for_item(
+        custom_content_object=custom_content_object,
+        uuid_mapping={uuids["uuid-1"]: "Name: One", uuids["uuid-2"]: "Two"},
+    )
+    assert custom_content_object["file"].getvalue() == expected_content
+    assert custom_content_object["id"] == "Name: One"
+    assert custom_content_object["data"]["playbook"] == "Two"
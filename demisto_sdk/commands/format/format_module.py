@@ -1,15 +1,21 @@
+import multiprocessing
 import os
 from pathlib import Path
-from typing import Dict, List, Tuple, Union
+from typing import Any, Dict, List, Tuple, Union
 
 from demisto_sdk.commands.common.constants import (
     JOB,
     TESTS_AND_DOC_DIRECTORIES,
     FileType,
 )
+from demisto_sdk.commands.common.cpu_count import cpu_count
 from demisto_sdk.commands.common.git_util import GitUtil
 from demisto_sdk.commands.common.logger import logger
-from demisto_sdk.commands.common.tools import find_type, get_files_in_dir
+from demisto_sdk.commands.common.tools import (
+    find_type,
+    get_files_in_dir,
+    get_pack_name,
+)
 from demisto_sdk.commands.content_graph.commands.update import update_content_graph
 from demisto_sdk.commands.content_graph.interface.neo4j.neo4j_graph import (
     Neo4jContentGraphInterface as ContentGraphInterface,
@@ -141,6 +147,7 @@ def format_manager(
     id_set_path: str = None,
     clear_cache: bool = False,
     use_graph: bool = True,
+    multiprocessing: bool = False,
 ):
     """
     Format_manager is a function that activated format command on different type of files.
@@ -160,6 +167,7 @@ def format_manager(
         id_set_path (str): The path of the id_set.json file.
         clear_cache (bool): wether to clear the cache
         use_graph (bool): wheter to use the graph in format
+        multiprocessing (bool): whether to format the files of different packs in parallel processes
     Returns:
         int 0 in case of success 1 otherwise
     """
@@ -218,61 +226,25 @@ def format_manager(
                 )
                 logger.debug(f"Error encountered when updating content graph: {e}")
                 graph = False
-        for file in files:
-            file_path = str(Path(file))
-            file_type = find_type(file_path, clear_cache=clear_cache)
-
-            # Check if this is an unskippable file
-            if not any(
-                [
-                    file_path.endswith(unskippable_file)
-                    for unskippable_file in UNSKIP_FORMATTING_FILES
-                ]
-            ):
-                # If it is not an unskippable file, skip if needed
-                if Path(file_path).name in SKIP_FORMATTING_FILES:
-                    continue
-
-            if file_type and file_type.value not in UNFORMATTED_FILES:
-                file_type = file_type.value
-                info_res, err_res, skip_res = run_format_on_file(
-                    input=file_path,
-                    file_type=file_type,
-                    from_version=from_version,
-                    interactive=interactive,
-                    output=output,
-                    no_validate=no_validate,
-                    update_docker=update_docker,
-                    assume_answer=assume_answer,
-                    deprecate=deprecate,
-                    add_tests=add_tests,
-                    graph=graph,
-                )
-                if err_res:
-                    log_list.extend([(err_res, "red")])
-                if info_res:
-                    log_list.extend([(info_res, "green")])
-                if skip_res:
-                    log_list.extend([(skip_res, "yellow")])
-            elif file_type:
-                log_list.append(
-                    (
-                        [
-                            f"Ignoring format for {file_path} as {file_type.value} is currently not "
-                            f"supported by format command"
-                        ],
-                        "yellow",
-                    )
-                )
-            else:
-                log_list.append(
-                    (
-                        [
-                            f"Was unable to identify the file type for the following file: {file_path}"
-                        ],
-                        "red",
-                    )
-                )
+        format_arguments = dict(
+            from_version=from_version,
+            interactive=interactive,
+            output=output,
+            no_validate=no_validate,
+            update_docker=update_docker,
+            assume_answer=assume_answer,
+            deprecate=deprecate,
+            add_tests=add_tests,
+            graph=graph,
+        )
+        if multiprocessing and len(files) > 1:
+            files_logs = format_files_in_parallel(files, clear_cache, format_arguments)
+        else:
+            files_logs = [
+                format_file(file, clear_cache, **format_arguments) for file in files
+            ]
+        for file_logs in files_logs:
+            log_list.extend(file_logs)
         if (
             graph
         ):  # In case that the graph was activated, we need to call exit in order to close it.
@@ -300,6 +272,135 @@ def format_manager(
     return 0
 
 
+def format_file(
+    file: str, clear_cache: bool, **format_arguments
+) -> List[Tuple[List[str], str]]:
+    """Runs the format of a single file.
+
+    Args:
+        file (str): The path of the file.
+        clear_cache (bool): Whether to clear the cache of the file type.
+        format_arguments: The arguments of run_format_on_file.
+
+    Returns:
+        The lines to log about the file, with their color.
+    """
+    log_list: List[Tuple[List[str], str]] = []
+    file_path = str(Path(file))
+    file_type = find_type(file_path, clear_cache=clear_cache)
+
+    # Check if this is an unskippable file
+    if not any(
+        [
+            file_path.endswith(unskippable_file)
+            for unskippable_file in UNSKIP_FORMATTING_FILES
+        ]
+    ):
+        # If it is not an unskippable file, skip if needed
+        if Path(file_path).name in SKIP_FORMATTING_FILES:
+            return log_list
+
+    if file_type and file_type.value not in UNFORMATTED_FILES:
+        info_res, err_res, skip_res = run_format_on_file(
+            input=file_path, file_type=file_type.value, **format_arguments
+        )
+        if err_res:
+            log_list.extend([(err_res, "red")])
+        if info_res:
+            log_list.extend([(info_res, "green")])
+        if skip_res:
+            log_list.extend([(skip_res, "yellow")])
+    elif file_type:
+        log_list.append(
+            (
+                [
+                    f"Ignoring format for {file_path} as {file_type.value} is currently not "
+                    f"supported by format command"
+                ],
+                "yellow",
+            )
+        )
+    else:
+        log_list.append(
+            (
+                [
+                    f"Was unable to identify the file type for the following file: {file_path}"
+                ],
+                "red",
+            )
+        )
+    return log_list
+
+
+def format_files_in_parallel(
+    files: List[str], clear_cache: bool, format_arguments: Dict[str, Any]
+) -> List[List[Tuple[List[str], str]]]:
+    """Formats the files in worker processes, a worker per pack at a time.
+
+    The graph can not be shared with the worker processes, so the files which are formatted using the graph are
+    formatted in this process once the workers are done (they may update the files of other content items, which
+    could be formatted by the workers at the same time otherwise).
+    Prompts can not be answered in the worker processes either, so the files are formatted one by one when the
+    format might prompt.
+
+    Returns:
+        The lines to log about each one of the files, in the order of the files.
+    """
+    if (
+        format_arguments.get("interactive")
+        and format_arguments.get("assume_answer") is None
+    ):
+        logger.warning(
+            "[yellow]Formatting in parallel requires --assume-yes or --assume-no, formatting the files one by one[/yellow]"
+        )
+        return [format_file(file, clear_cache, **format_arguments) for file in files]
+
+    graph = format_arguments.get("graph")
+    packs_files: Dict[str, List[int]] = {}
+    graph_files = []
+    for index, file in enumerate(files):
+        file_type = find_type(str(Path(file)), clear_cache=clear_cache)
+        if graph and file_type and file_type.value in CONTENT_ITEMS_WITH_GRAPH:
+            graph_files.append(index)
+        else:
+            packs_files.setdefault(get_pack_name(file) or "", []).append(index)
+
+    files_logs: Dict[int, List[Tuple[List[str], str]]] = {}
+    if packs_files:
+        processes = min(cpu_count(), len(packs_files))
+        logger.info(f"[cyan]Formatting the files using {processes} processes[/cyan]")
+        worker_arguments = {**format_arguments, "graph": None}
+        with multiprocessing.Pool(processes=processes) as pool:
+            results = pool.imap(
+                _format_files_in_worker,
+                [
+                    ([files[index] for index in indices], clear_cache, worker_arguments)
+                    for indices in packs_files.values()
+                ],
+            )
+            for indices, (pack_logs, updated_ids) in zip(packs_files.values(), results):
+                files_logs.update(zip(indices, pack_logs))
+                CONTENT_ENTITY_IDS_TO_UPDATE.update(updated_ids)
+
+    for index in graph_files:
+        files_logs[index] = format_file(files[index], clear_cache, **format_arguments)
+    return [files_logs[index] for index in range(len(files))]
+
+
+def _format_files_in_worker(
+    arguments: Tuple[List[str], bool, Dict[str, Any]]
+) -> Tuple[List[List[Tuple[List[str], str]]], Dict[str, str]]:
+    """Formats files in a worker process.
+
+    Returns:
+        The lines to log about each one of the files, and the content entity IDs to update which were collected.
+    """
+    files, clear_cache, format_arguments = arguments
+    CONTENT_ENTITY_IDS_TO_UPDATE.clear()
+    files_logs = [format_file(file, clear_cache, **format_arguments) for file in files]
+    return files_logs, dict(CONTENT_ENTITY_IDS_TO_UPDATE)
+
+
 def get_files_to_format_from_git(
     supported_file_types: List[str], prev_ver: str, include_untracked: bool
 ) -> List[str]:
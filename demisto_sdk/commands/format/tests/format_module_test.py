@@ -29,3 +29,47 @@ def test_format_venv_in_dir(mocker, repo):
     assert format_file_call.called
     for call_args in format_file_call.call_args_list:
         assert ".venv" not in call_args.kwargs["input"]
+
+
+def test_format_in_parallel(mocker, repo):
+    """
+    Given:
+        - integrations and scripts of several packs
+    When:
+        - Running format -i on all of the packs in parallel, and one by one
+    Then:
+        - make sure the files are formatted in both cases, with the same messages in the same order
+    """
+    packs = [repo.create_pack(f"SomePack{index}") for index in range(3)]
+    for pack in packs:
+        pack.create_integration(name=f"{pack.name}Integration")
+        pack.create_script(name=f"{pack.name}Script")
+    mocker.patch(
+        "demisto_sdk.commands.format.format_module.run_format_on_file",
+        side_effect=lambda input, **kwargs: ([f"formatted {input}"], None, None),
+    )
+    logger_info = mocker.patch("demisto_sdk.commands.format.format_module.logger.info")
+    input_paths = ",".join(str(pack._pack_path) for pack in packs)
+
+    with ChangeCWD(repo.path):
+        assert (
+            format_manager(
+                input=input_paths,
+                assume_answer=True,
+                use_graph=False,
+                multiprocessing=True,
+            )
+            == 0
+        )
+        parallel_logs = [str(call.args[0]) for call in logger_info.call_args_list]
+        logger_info.reset_mock()
+        assert (
+            format_manager(input=input_paths, assume_answer=True, use_graph=False) == 0
+        )
+        sequential_logs = [str(call.args[0]) for call in logger_info.call_args_list]
+
+    for pack in packs:
+        assert any(f"{pack.name}Integration.yml" in log for log in sequential_logs)
+    assert [
+        log for log in parallel_logs if "Formatting the files using" not in log
+    ] == sequential_logs
@@ -1,23 +1,44 @@
+import multiprocessing
 from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
 
 from demisto_sdk.commands.common.constants import (
     ARGUMENT_FIELDS_TO_CHECK,
     INTEGRATION_ARGUMENT_TYPES,
+    INTEGRATIONS_DIR,
     PARAM_FIELDS_TO_CHECK,
 )
+from demisto_sdk.commands.common.cpu_count import cpu_count
+from demisto_sdk.commands.common.git_util import GitUtil
+from demisto_sdk.commands.common.handlers import DEFAULT_JSON_HANDLER as json
 from demisto_sdk.commands.common.logger import logger
-from demisto_sdk.commands.common.tools import get_yaml
+from demisto_sdk.commands.common.tools import get_yaml, write_dict, yaml_safe_load
 
 
 class IntegrationDiffDetector:
-    def __init__(self, new: str = "", old: str = "", docs_format: bool = False):
+    def __init__(
+        self,
+        new: str = "",
+        old: str = "",
+        docs_format: bool = False,
+        new_yaml_data: Optional[dict] = None,
+        old_yaml_data: Optional[dict] = None,
+    ):
+        """
+        Args:
+            new: The path of the new integration version.
+            old: The path of the old integration version.
+            docs_format: Whether to output the differences in the format of the README.
+            new_yaml_data: The data of the new integration version, when it is not read from the new path.
+            old_yaml_data: The data of the old integration version, when it is not read from the old path.
+        """
 
-        if not Path(new).exists():
+        if new_yaml_data is None and not Path(new).exists():
             logger.error(
                 "[red]No such file or directory for the new integration version.[/red]"
             )
 
-        if not Path(old).exists():
+        if old_yaml_data is None and not Path(old).exists():
             logger.error(
                 "[red]No such file or directory for the old integration version.[/red]"
             )
@@ -26,8 +47,12 @@ class IntegrationDiffDetector:
         self.old = old
         self.docs_format_output = docs_format
 
-        self.old_yaml_data = get_yaml(self.old)
-        self.new_yaml_data = get_yaml(self.new)
+        self.old_yaml_data = (
+            get_yaml(self.old) if old_yaml_data is None else old_yaml_data
+        )
+        self.new_yaml_data = (
+            get_yaml(self.new) if new_yaml_data is None else new_yaml_data
+        )
 
         self.fount_missing = False
         self.missing_items_report: dict = {}
@@ -98,11 +123,13 @@ class IntegrationDiffDetector:
         outputs = []
 
         # for each old integration command check if exist in the new, if not, check what is missing
+        new_commands_by_name = self.index_elements(new_commands, "name")
         for old_command in old_commands:
-            if old_command not in new_commands:
-                new_command = self.check_if_element_exist(
-                    old_command, new_commands, "name"
-                )
+            if old_command.get("name") is None:
+                continue
+            same_name_commands = new_commands_by_name.get(old_command["name"], [])
+            if old_command not in same_name_commands:
+                new_command = same_name_commands[0] if same_name_commands else {}
 
                 if not new_command:
                     commands.append(
@@ -151,11 +178,15 @@ class IntegrationDiffDetector:
         new_command_arguments = new_command["arguments"]
         old_command_arguments = old_command["arguments"]
 
+        new_arguments_by_name = self.index_elements(new_command_arguments, "name")
         for argument in old_command_arguments:
-            if argument not in new_command_arguments:
+            if argument.get("name") is None:
+                continue
+            same_name_arguments = new_arguments_by_name.get(argument["name"], [])
+            if argument not in same_name_arguments:
 
-                new_command_argument = IntegrationDiffDetector.check_if_element_exist(
-                    argument, new_command_arguments, "name"
+                new_command_argument = (
+                    same_name_arguments[0] if same_name_arguments else {}
                 )
 
                 if not new_command_argument:
@@ -288,11 +319,19 @@ class IntegrationDiffDetector:
         new_command_outputs = new_command["outputs"]
         old_command_outputs = old_command["outputs"]
 
+        new_outputs_by_context_path = IntegrationDiffDetector.index_elements(
+            new_command_outputs, "contextPath"
+        )
         for output in old_command_outputs:
-            if output not in new_command_outputs:
+            if output.get("contextPath") is None:
+                continue
+            same_context_path_outputs = new_outputs_by_context_path.get(
+                output["contextPath"], []
+            )
+            if output not in same_context_path_outputs:
 
-                new_command_output = IntegrationDiffDetector.check_if_element_exist(
-                    output, new_command_outputs, "contextPath"
+                new_command_output = (
+                    same_context_path_outputs[0] if same_context_path_outputs else {}
                 )
 
                 if not new_command_output:
@@ -342,9 +381,14 @@ class IntegrationDiffDetector:
         """
         parameters = []
 
+        new_params_by_display = self.index_elements(new_params, "display")
         for old_param in old_params:
-            if old_param not in new_params:
-                param = self.check_if_element_exist(old_param, new_params, "display")
+            if old_param.get("display") is None:
+                # e.g. a credentials parameter, which can not be matched to a new parameter by its display
+                continue
+            same_display_params = new_params_by_display.get(old_param["display"], [])
+            if old_param not in same_display_params:
+                param = same_display_params[0] if same_display_params else {}
 
                 if not param:
                     parameters.append(
@@ -374,6 +418,28 @@ class IntegrationDiffDetector:
                     )
         return parameters
 
+    @staticmethod
+    def index_elements(list_of_elements, field_to_check) -> Dict[Any, List[dict]]:
+        """
+        Indexes a given list of elements by a given field, so the elements are found by it without scanning the list.
+        An element equal to another element has the same value in the field, so it is in the same list of the index.
+        Elements without the field are not indexed, as they can not be matched by it.
+
+        Args:
+            list_of_elements: The list of elements.
+            field_to_check: The field to index the elements by.
+
+        Return:
+            Dict of the elements with each value of the field, in their order in the list.
+        """
+        elements_index: Dict[Any, List[dict]] = {}
+
+        for element in list_of_elements:
+            if (value := element.get(field_to_check)) is not None:
+                elements_index.setdefault(value, []).append(element)
+
+        return elements_index
+
     @staticmethod
     def check_if_element_exist(
         element_to_check, list_of_elements, field_to_check
@@ -564,3 +630,151 @@ class IntegrationDiffDetector:
                 result[element["command_name"]] = [element]
 
         return result
+
+
+def get_changed_integrations(old_ref: str, new_ref: str) -> List[Tuple[str, str]]:
+    """
+    Gets the integrations which were modified or renamed between two git refs.
+
+    Args:
+        old_ref: The git ref of the old integration versions.
+        new_ref: The git ref of the new integration versions.
+
+    Return:
+        The old and the new paths of each one of the changed integration ymls, relative to the repository.
+    """
+    changed_integrations = []
+    diff = GitUtil.shared().repo.git.diff(
+        "--name-status", "--find-renames", "--diff-filter=MR", old_ref, new_ref
+    )
+
+    for line in diff.splitlines():
+        _, old_path, *renamed_path = line.split("\t")
+        new_path = renamed_path[0] if renamed_path else old_path
+        parts = Path(new_path).parts
+        # Packs/<pack>/Integrations/<integration>/<integration>.yml or Packs/<pack>/Integrations/<integration>.yml
+        if new_path.endswith(".yml") and INTEGRATIONS_DIR in parts[-3:-1]:
+            changed_integrations.append((old_path, new_path))
+
+    return sorted(changed_integrations, key=lambda paths: paths[1])
+
+
+def _diff_integration(arguments: Tuple[str, bytes, bytes]) -> Optional[dict]:
+    """
+    Gets the differences between the old and the new versions of an integration, in a worker process.
+
+    Return:
+        The report of the integration, None if it is not an integration.
+    """
+    path, old_content, new_content = arguments
+    old_yaml_data = yaml_safe_load.load(old_content.decode())
+    new_yaml_data = yaml_safe_load.load(new_content.decode())
+    if not all(
+        isinstance(yaml_data, dict)
+        and isinstance(yaml_data.get("script"), dict)
+        and "configuration" in yaml_data
+        for yaml_data in (old_yaml_data, new_yaml_data)
+    ):
+        return None
+
+    integration_diff_detector = IntegrationDiffDetector(
+        new=path, old=path, new_yaml_data=new_yaml_data, old_yaml_data=old_yaml_data
+    )
+    integration_diff_detector.missing_items_report = (
+        integration_diff_detector.get_differences()
+    )
+
+    return {
+        "path": path,
+        "display": new_yaml_data.get("display", ""),
+        "differences": integration_diff_detector.missing_items_report,
+        "docs": integration_diff_detector.print_items_in_docs_format(secho_result=False)
+        if integration_diff_detector.missing_items_report
+        else "",
+    }
+
+
+def check_changed_integrations(
+    old_ref: str,
+    new_ref: str,
+    docs_format: bool = False,
+    output: Optional[str] = None,
+) -> bool:
+    """
+    Checks the differences of all of the integrations which were changed between two git refs, and writes a combined
+    report - a JSON report, or a markdown report in the format of the README when docs_format is set.
+    Both versions of the integrations are read through a single git reader, and the integrations are compared in
+    parallel processes.
+
+    Args:
+        old_ref: The git ref of the old integration versions.
+        new_ref: The git ref of the new integration versions.
+        docs_format: Whether to write the report in the format of the README.
+        output: The path to write the report to, it is printed when not given.
+
+    Return:
+        bool. return true if all of the new integrations contain everything in the old integrations.
+    """
+    changed_integrations = get_changed_integrations(old_ref, new_ref)
+    reader = GitUtil.shared().object_reader
+    old_contents = reader.read_many(
+        old_ref,
+        [reader.repo_path / old_path for old_path, _ in changed_integrations],
+    )
+    new_contents = reader.read_many(
+        new_ref,
+        [reader.repo_path / new_path for _, new_path in changed_integrations],
+    )
+    diff_arguments = [
+        (new_path, old_content, new_content)
+        for (_, new_path), old_content, new_content in zip(
+            changed_integrations, old_contents, new_contents
+        )
+        if old_content is not None and new_content is not None
+    ]
+    logger.info(
+        f"Checking the differences of {len(diff_arguments)} changed integrations between {old_ref} and {new_ref}"
+    )
+
+    if len(diff_arguments) > 1:
+        with multiprocessing.Pool(
+            processes=min(cpu_count(), len(diff_arguments))
+        ) as pool:
+            reports = pool.map(_diff_integration, diff_arguments)
+    else:
+        reports = [_diff_integration(arguments) for arguments in diff_arguments]
+    reports_with_differences = [
+        report for report in reports if report and report["differences"]
+    ]
+
+    if docs_format:
+        result = "".join(
+            f'\n## {report["display"]} ({report["path"]})\n{report["docs"]}'
+            for report in reports_with_differences
+        )
+        if output:
+            Path(output).write_text(result)
+        else:
+            logger.info(result)
+        return True
+
+    result_json = [
+        {key: value for key, value in report.items() if key != "docs"}
+        for report in reports
+        if report
+    ]
+    if output:
+        write_dict(output, result_json, indent=4)
+    else:
+        logger.info(json.dumps(result_json, indent=4))
+
+    if reports_with_differences:
+        logger.info(
+            "[red]The following integrations are not backwards compatible:\n"
+            + "\n".join(report["path"] for report in reports_with_differences)
+            + "[/red]"
+        )
+        return False
+
+    logger.info("[green]The integrations are backwards compatible[/green]")
+    return True
@@ -1,10 +1,12 @@
 import copy
 import logging
 
+from demisto_sdk.commands.common.handlers import DEFAULT_JSON_HANDLER as json
 from demisto_sdk.commands.integration_diff.integration_diff_detector import (
     IntegrationDiffDetector,
+    check_changed_integrations,
 )
-from TestSuite.test_tools import str_in_call_args_list
+from TestSuite.test_tools import ChangeCWD, str_in_call_args_list
 
 
 class TestIntegrationDiffDetector:
@@ -553,6 +555,38 @@ class TestIntegrationDiffDetector:
         assert missing_param in parameters
         assert changed_param in parameters
 
+    def test_params_without_display(self, pack):
+        """
+        Given
+            - Two integration versions with a parameter without a display, which is unchanged in one case
+              and changed in the other.
+        When
+            - Running get_differences().
+        Then
+            - Verify that the parameter does not fail the diff, and no difference is reported for it.
+        """
+        old_integration_yml = copy.deepcopy(self.OLD_INTEGRATION_YAML)
+        old_integration_yml["configuration"].append({"name": "creds", "type": 9})
+        old_integration = pack.create_integration(
+            "oldIntegration", yml=old_integration_yml
+        )
+        unchanged_integration = pack.create_integration(
+            "unchangedIntegration", yml=old_integration_yml
+        )
+        changed_integration_yml = copy.deepcopy(old_integration_yml)
+        changed_integration_yml["configuration"][-1]["required"] = True
+        changed_integration = pack.create_integration(
+            "changedIntegration", yml=changed_integration_yml
+        )
+
+        for new_integration in (unchanged_integration, changed_integration):
+            assert (
+                IntegrationDiffDetector(
+                    new=new_integration.yml.path, old=old_integration.yml.path
+                ).get_differences()
+                == {}
+            )
+
     def test_print_without_items(self, pack, mocker, monkeypatch):
         """
         Given
@@ -711,3 +745,55 @@ class TestIntegrationDiffDetector:
                 for current_str in excepted_output
             ]
         )
+
+    def test_check_changed_integrations(self, repo, tmp_path):
+        """
+        Given
+            - Two commits of a repository, where one integration became backwards compatible with a newer version,
+              another one was changed in a way which is not backwards compatible, and a third one was not changed.
+        When
+            - Running check_changed_integrations() between the commits.
+        Then
+            - Ensure only the changed integrations are reported, in the order of their paths.
+            - Ensure the integrations are not backwards compatible, because of the second integration.
+            - Ensure the markdown report contains only the integration which is not backwards compatible.
+        """
+        pack = repo.create_pack("DiffPack")
+        compatible = pack.create_integration("A", yml=self.OLD_INTEGRATION_YAML)
+        not_compatible = pack.create_integration("B", yml=self.NEW_INTEGRATION_YAML)
+        pack.create_integration("C", yml=self.NEW_INTEGRATION_YAML)
+        repo.init_git()
+        first_commit = repo.git_util.repo.head.commit.hexsha
+        compatible.yml.write_dict(self.NEW_INTEGRATION_YAML)
+        not_compatible.yml.write_dict(self.OLD_INTEGRATION_YAML)
+        repo.git_util.commit_files("Change the integrations")
+        json_report = tmp_path / "report.json"
+        docs_report = tmp_path / "report.md"
+
+        with ChangeCWD(repo.path):
+            assert not check_changed_integrations(
+                old_ref=first_commit, new_ref="HEAD", output=str(json_report)
+            )
+            assert check_changed_integrations(
+                old_ref=first_commit,
+                new_ref="HEAD",
+                docs_format=True,
+                output=str(docs_report),
+            )
+
+        report = json.loads(json_report.read_text())
+        assert [item["path"] for item in report] == [
+            "Packs/DiffPack/Integrations/A/A.yml",
+            "Packs/DiffPack/Integrations/B/B.yml",
+        ]
+        assert report[0]["differences"] == {}
+        assert (
+            report[1]["differences"]
+            == IntegrationDiffDetector(
+                new_yaml_data=self.OLD_INTEGRATION_YAML,
+                old_yaml_data=self.NEW_INTEGRATION_YAML,
+            ).get_differences()
+        )
+        assert report[1]["differences"]
+        assert "Packs/DiffPack/Integrations/B/B.yml" in docs_report.read_text()
+        assert "Packs/DiffPack/Integrations/A/A.yml" not in docs_report.read_text()
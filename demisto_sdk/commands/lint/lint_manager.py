@@ -37,6 +37,7 @@ from demisto_sdk.commands.common.tools import (
     get_json,
     is_external_repository,
 )
+from demisto_sdk.commands.common.tracing import traced
 from demisto_sdk.commands.content_graph.commands.update import (
     update_content_graph,
 )
@@ -432,6 +433,7 @@ class LintManager:
 
         return list(pkgs_to_check)  # type: ignore
 
+    @traced()
     def execute_all_packages(
         self,
         parallel: int,
@@ -572,6 +574,7 @@ class LintManager:
                     res.cancel()
             return 1, 0
 
+    @traced()
     def run(
         self,
         parallel: int,
@@ -53,6 +53,7 @@ from demisto_sdk.commands.common.tools import (
     get_yaml,
     run_command_os,
 )
+from demisto_sdk.commands.common.tracing import traced
 from demisto_sdk.commands.lint.commands_builder import (
     build_bandit_command,
     build_flake8_command,
@@ -204,6 +205,7 @@ class Linter:
         return True
 
     @timer(group_name="lint")
+    @traced()
     def run_pack(
         self,
         no_flake8: bool,
@@ -3,7 +3,8 @@ import re
 import shutil
 import sys
 from distutils.util import strtobool
-from typing import Any, List, Optional, Union
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, List, Optional, Set, Tuple, Union
 
 import autopep8
 
@@ -109,6 +110,10 @@ class OpenAPIIntegration:
         self.definitions: dict = {}
         self.components: dict = {}
         self.reference: dict = {}
+        # caches of the referenced schemas, see flatten_reference
+        self.reference_properties: Dict[str, list] = {}
+        self.reference_scopes: Dict[str, Tuple[FrozenSet[str], FrozenSet[str]]] = {}
+        self.flattened_references: Dict[tuple, List[tuple]] = {}
         self.functions: list = []
         self.parameters: list = []
         self.fix_code = fix_code
@@ -139,6 +144,9 @@ class OpenAPIIntegration:
         self.definitions = self.json.get("definitions", {})
         self.components = self.json.get("components", {})
         self.reference = self.definitions or self.components.get("schemas", {}) or {}
+        self.reference_properties = {}
+        self.reference_scopes = {}
+        self.flattened_references = {}
         self.security_definitions = self.json.get("securityDefinitions", {})
         self.functions = []
 
@@ -763,70 +771,125 @@ class OpenAPIIntegration:
         Returns:
             results: A list of the object's properties.
         """
-        arr: list = []
+        properties = self.flatten_schema(obj, frozenset(context), ())
+        return [
+            {
+                "name": ".".join(context + list(keys)),
+                "type": prop_type,
+                "description": description,
+            }
+            for keys, prop_type, description in properties
+        ]
 
-        def extract(
-            extracted_object: Union[dict, list], prop_arr: list, current_context: list
-        ) -> list:
+    def flatten_schema(
+        self, obj: Any, context_keys: FrozenSet[str], refs_stack: Tuple[str, ...]
+    ) -> List[tuple]:
+        """
+        Flattens a schema object into its typed properties, relative to the object.
+        Keys which are already in the context of a property are skipped.
+        Args:
+            obj: The schema object.
+            context_keys: The keys in the context of the object.
+            refs_stack: The references which contain the object, a reference to one of them is not followed.
 
-            if isinstance(extracted_object, list):
-                for item in extracted_object:
-                    extract(item, prop_arr, current_context)
-
-            elif isinstance(extracted_object, dict):
-                if extracted_object.get("type") and isinstance(
-                    extracted_object.get("type"), str
-                ):
-                    if extracted_object.get("type") in ["array", "object"]:
-                        refs = self.extract_values(extracted_object, "$ref")
-                        if refs:
-                            ref = refs[0].split("/")[-1]
-                            prop_arr = extract(
-                                self.extract_values(
-                                    self.reference.get(ref, {}), "properties"
-                                ),
-                                prop_arr,
-                                current_context,
-                            )
-                        elif extracted_object.get("items"):
-                            for k, v in extracted_object.get("items", {}).items():
-                                prop_arr = extract(v, prop_arr, current_context)
-                        elif extracted_object.get("properties"):
-                            prop_arr = extract(
-                                extracted_object.get("properties", {}),
-                                prop_arr,
-                                current_context,
+        Returns:
+            properties: A list of the (keys, type, description) of the properties, the returned lists are shared
+                and must not be changed.
+        """
+        properties: List[tuple] = []
+        if isinstance(obj, list):
+            for item in obj:
+                properties.extend(self.flatten_schema(item, context_keys, refs_stack))
+
+        elif isinstance(obj, dict):
+            obj_type = obj.get("type")
+            if obj_type and isinstance(obj_type, str):
+                if obj_type in ["array", "object"]:
+                    if refs := self.extract_values(obj, "$ref"):
+                        return self.flatten_reference(
+                            refs[0].split("/")[-1], context_keys, refs_stack
+                        )
+                    elif obj.get("items"):
+                        for item in obj.get("items", {}).values():
+                            properties.extend(
+                                self.flatten_schema(item, context_keys, refs_stack)
                             )
-                        elif extracted_object.get("allOf"):
-                            for item in extracted_object.get("allOf", []):
-                                prop_arr = extract(item, prop_arr, current_context)
-                    else:
-                        prop_arr.append(
-                            {
-                                "name": ".".join(current_context),
-                                "type": extracted_object.get("type", "Unknown"),
-                                "description": extracted_object.get("description", ""),
-                            }
+                    elif obj.get("properties"):
+                        return self.flatten_schema(
+                            obj.get("properties", {}), context_keys, refs_stack
+                        )
+                    elif obj.get("allOf"):
+                        return self.flatten_schema(
+                            obj.get("allOf", []), context_keys, refs_stack
                         )
-                elif extracted_object.get("type") and isinstance(
-                    extracted_object.get("type"), dict
-                ):
-                    for k, v in extracted_object.items():
-                        if k not in current_context:
-                            current_context.append(k)
-                            prop_arr = extract(v, prop_arr, current_context)
-                            current_context.pop()
                 else:
-                    for k, v in extracted_object.items():
-                        if k not in current_context:
-                            current_context.append(k)
-                            prop_arr = extract(v, prop_arr, current_context)
-                            current_context.pop()
+                    properties.append(((), obj_type, obj.get("description", "")))
+            else:
+                for k, v in obj.items():
+                    if k not in context_keys:
+                        properties.extend(
+                            ((k, *keys), prop_type, description)
+                            for keys, prop_type, description in self.flatten_schema(
+                                v, context_keys | {k}, refs_stack
+                            )
+                        )
 
-            return prop_arr
+        return properties
 
-        results = extract(obj, arr, context)
-        return results
+    def flatten_reference(
+        self, ref: str, context_keys: FrozenSet[str], refs_stack: Tuple[str, ...]
+    ) -> List[tuple]:
+        """
+        Flattens the properties of a referenced schema, see flatten_schema.
+        The result is cached by the context keys and the containing references which can affect it,
+        so a schema which is referenced by many operations is flattened once.
+        """
+        if ref in refs_stack:
+            # a recursive schema, its properties were already flattened by the containing reference
+            return []
+        keys, refs = self.get_reference_scope(ref)
+        cache_key = (ref, context_keys & keys, refs.intersection(refs_stack))
+        if cache_key not in self.flattened_references:
+            self.flattened_references[cache_key] = self.flatten_schema(
+                self.get_reference_properties(ref), context_keys, refs_stack + (ref,)
+            )
+        return self.flattened_references[cache_key]
+
+    def get_reference_properties(self, ref: str) -> list:
+        """
+        Returns the properties objects of a referenced schema, the returned list is shared and must not be changed.
+        """
+        if ref not in self.reference_properties:
+            self.reference_properties[ref] = self.extract_values(
+                self.reference.get(ref, {}), "properties"
+            )
+        return self.reference_properties[ref]
+
+    def get_reference_scope(self, ref: str) -> Tuple[FrozenSet[str], FrozenSet[str]]:
+        """
+        Returns all of the keys in a referenced schema and in the schemas it references (recursively),
+        and the names of these schemas, which are everything that flattening the schema depends on.
+        """
+        if ref not in self.reference_scopes:
+            keys: Set[str] = set()
+            refs: Set[str] = set()
+            refs_to_scan = [ref]
+            while refs_to_scan:
+                objects = [self.reference.get(refs_to_scan.pop(), {})]
+                while objects:
+                    obj = objects.pop()
+                    if isinstance(obj, dict):
+                        keys.update(obj)
+                        objects.extend(obj.values())
+                        if isinstance(obj.get("$ref"), str):
+                            child_ref = obj["$ref"].split("/")[-1]
+                            if child_ref not in refs:
+                                refs.add(child_ref)
+                                refs_to_scan.append(child_ref)
+                    elif isinstance(obj, list):
+                        objects.extend(obj)
+            self.reference_scopes[ref] = (frozenset(keys), frozenset(refs))
+        return self.reference_scopes[ref]
 
     def extract_outputs(self, data: dict) -> tuple:
         """
@@ -860,9 +923,7 @@ class OpenAPIIntegration:
                 if refs:
                     for ref in refs:
                         ref = ref.split("/")[-1]
-                        ref_props = self.extract_values(
-                            self.reference.get(ref, {}), "properties"
-                        )
+                        ref_props = self.get_reference_properties(ref)
                         # Addition of filtering dicts only was added because some swaggers contain example files
                         # Which are written in string and caused errors on ref_props[0].items()
                         ref_props = [
@@ -924,9 +985,7 @@ class OpenAPIIntegration:
                 refs = self.extract_values(arg["schema"], "$ref")
                 for ref in refs:
                     ref = ref.split("/")[-1]
-                    ref_args = self.extract_values(
-                        self.reference.get(ref, {}), "properties"
-                    )
+                    ref_args = self.get_reference_properties(ref)
                     # Addition of filtering dicts only was added because some swaggers contain example files
                     # Which are written in string and caused errors on ref_props[0].items()
                     ref_args = [
@@ -944,9 +1003,7 @@ class OpenAPIIntegration:
                             if "$ref" in ref_arg[k]:
                                 new_ref_arg["properties"] = {}
                                 c_ref = ref_arg[k]["$ref"].split("/")[-1]
-                                complex_refs = self.extract_values(
-                                    self.reference.get(c_ref, {}), "properties"
-                                )
+                                complex_refs = self.get_reference_properties(c_ref)
                                 for complex_ref in complex_refs:
                                     for ck, cv in complex_ref.items():
                                         new_ref_arg["properties"][ck] = {}
@@ -1220,6 +1277,7 @@ class OpenAPIIntegration:
         return argument_default
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def clean_description(description: str) -> str:
         """
         Cleans a description string.
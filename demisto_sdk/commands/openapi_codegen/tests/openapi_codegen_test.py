@@ -299,3 +299,63 @@ class TestOpenAPICodeGen:
             }
         }
         integration.extract_outputs(data)
+
+    def test_extract_outputs_of_shared_and_recursive_refs(self, mocker):
+        """
+        Given:
+        - A schema which references a recursive schema, which references the first schema back.
+
+        When:
+        - Extracting the outputs of two operations which respond with the first schema.
+
+        Then:
+        - Ensure the recursive reference is not followed again, and the outputs are composed of the referenced schemas.
+        - Ensure the referenced schemas are flattened only for the first operation.
+        """
+        integration = OpenAPIIntegration(
+            self.swagger_path, "TestSwagger", "test-swagger", "TestSwagger"
+        )
+        integration.reference = {
+            "Item": {
+                "properties": {
+                    "id": {"type": "string", "description": "The item ID."},
+                    "owner": {"type": "object", "$ref": "#/definitions/User"},
+                }
+            },
+            "User": {
+                "properties": {
+                    "name": {"type": "string"},
+                    "manager": {"type": "object", "$ref": "#/definitions/User"},
+                    "items": {
+                        "type": "array",
+                        "items": {"$ref": "#/definitions/Item"},
+                    },
+                }
+            },
+        }
+        data = {
+            "responses": {
+                "200": {
+                    "description": "An item",
+                    "schema": {"$ref": "#/definitions/Item"},
+                }
+            }
+        }
+        flatten_reference = mocker.spy(integration, "flatten_reference")
+        flatten_schema = mocker.spy(integration, "flatten_schema")
+
+        outputs, _, context_path = integration.extract_outputs(data)
+        first_flattens = flatten_schema.call_count
+        # the owner, the manager (which is recursive and not followed) and the items of the owner
+        assert flatten_reference.call_count == 3
+
+        assert context_path == "Item"
+        assert outputs == [
+            {"name": "id", "type": "String", "description": "The item ID."},
+            {"name": "owner.name", "type": "String", "description": ""},
+            {"name": "owner.items.id", "type": "String", "description": "The item ID."},
+        ]
+        assert integration.extract_outputs(data)[0] == outputs
+        # the flattened owner is reused
+        assert flatten_reference.call_count == 4
+        assert flatten_schema.call_count - first_flattens < first_flattens
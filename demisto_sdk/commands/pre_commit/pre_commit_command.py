@@ -24,6 +24,7 @@ from demisto_sdk.commands.common.logger import logger
 from demisto_sdk.commands.common.tools import (
     write_dict,
 )
+from demisto_sdk.commands.common.tracing import span, traced
 from demisto_sdk.commands.content_graph.objects.base_content import BaseContent
 from demisto_sdk.commands.content_graph.objects.integration_script import (
     IntegrationScript,
@@ -49,6 +50,7 @@ INTEGRATION_SCRIPT_REGEX = re.compile(r"^Packs/.*/(?:Integrations|Scripts)/.*.ym
 
 class PreCommitRunner:
     @staticmethod
+    @traced()
     def prepare_hooks(pre_commit_context: PreCommitContext) -> None:
         hooks = pre_commit_context.hooks
         if "pycln" in hooks:
@@ -146,29 +148,31 @@ class PreCommitRunner:
         """
         if command is None:
             command = ["run", "-a"]
-        return subprocess.run(
-            list(
-                filter(
-                    None,
-                    [
-                        sys.executable,
-                        "-m",
-                        "pre_commit",
-                        *command,
-                        "-c",
-                        str(path),
-                        "-v" if verbose and "run" in command else "",
-                    ],
-                )
-            ),
-            env=precommit_env,
-            cwd=CONTENT_PATH,
-            stdout=stdout,
-            stderr=stdout,
-            universal_newlines=True,
-        )
+        with span(f"pre-commit {command[0]}", config=path.name):
+            return subprocess.run(
+                list(
+                    filter(
+                        None,
+                        [
+                            sys.executable,
+                            "-m",
+                            "pre_commit",
+                            *command,
+                            "-c",
+                            str(path),
+                            "-v" if verbose and "run" in command else "",
+                        ],
+                    )
+                ),
+                env=precommit_env,
+                cwd=CONTENT_PATH,
+                stdout=stdout,
+                stderr=stdout,
+                universal_newlines=True,
+            )
 
     @staticmethod
+    @traced()
     def run(
         pre_commit_context: PreCommitContext,
         precommit_env: dict,
@@ -347,7 +351,8 @@ def group_by_language(
     language_to_files: Dict[str, Set] = defaultdict(set)
     with multiprocessing.Pool() as pool:
         integrations_scripts = pool.map(
-            BaseContent.from_path, integrations_scripts_mapping.keys()
+            partial(BaseContent.from_path, metadata_only=True),
+            integrations_scripts_mapping.keys(),
         )
 
     exclude_integration_script = set()
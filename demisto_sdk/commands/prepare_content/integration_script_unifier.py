@@ -1,11 +1,12 @@
 import base64
 import copy
 import glob
+import hashlib
 import os
 import re
 import tempfile
 from pathlib import Path
-from typing import Dict, List, Union
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple, Union
 
 from inflection import dasherize, underscore
 from ruamel.yaml.scalarstring import (  # noqa: TID251 - only importing FoldedScalarString is OK
@@ -20,6 +21,7 @@ from demisto_sdk.commands.common.constants import (
     PARTNER_SUPPORT,
     SUPPORT_LEVEL_HEADER,
     TYPE_TO_EXTENSION,
+    URL_IMAGE_LINK_REGEX,
     FileType,
     ImagesFolderNames,
     MarketplaceVersions,
@@ -41,6 +43,10 @@ from demisto_sdk.commands.common.tools import (
 from demisto_sdk.commands.prepare_content.markdown_images_handler import (
     replace_markdown_urls_and_upload_to_artifacts,
 )
+from demisto_sdk.commands.prepare_content.unified_output_cache import (
+    UNIFIED_OUTPUT_CACHE,
+    hash_file,
+)
 from demisto_sdk.commands.prepare_content.unifier import Unifier
 
 PACK_METADATA_PATH = "pack_metadata.json"
@@ -64,6 +70,26 @@ CONTRIBUTOR_COMMUNITY_DETAILED_DESC = (
 INTEGRATIONS_DOCS_REFERENCE = "https://xsoar.pan.dev/docs/reference/integrations/"
 
 
+class ApiModuleFile(NamedTuple):
+    signature: Tuple[
+        int, int
+    ]  # modification time and size, to know the file did not change without reading it
+    sha256: str
+    code: str
+
+
+class ExpandedApiModule(NamedTuple):
+    code: str  # the module code, with all the API modules it imports inserted in place of their imports
+    closure: Tuple[
+        Tuple[Path, str], ...
+    ]  # the path and sha256 of the module and of every module it imports
+
+
+# process-wide caches, so every API module is read and expanded once even when imported by many integrations
+API_MODULES_FILES: Dict[Path, ApiModuleFile] = {}
+EXPANDED_API_MODULES: Dict[Path, ExpandedApiModule] = {}
+
+
 class IntegrationScriptUnifier(Unifier):
     @staticmethod
     def unify(
@@ -94,6 +120,38 @@ class IntegrationScriptUnifier(Unifier):
                 f"No code file found for '{path}', assuming file is already unified."
             )
             return data
+        return UNIFIED_OUTPUT_CACHE.get_or_unify(
+            key=[
+                str(path.absolute()),
+                marketplace and MarketplaceVersions(marketplace).value,
+                custom,
+                image_prefix,
+            ],
+            inputs=IntegrationScriptUnifier.get_unify_inputs(
+                package_path, data, script_type, is_script_package, marketplace
+            ),
+            unify=lambda: IntegrationScriptUnifier._unify_package(
+                path,
+                data,
+                script_type,
+                is_script_package,
+                marketplace,
+                custom,
+                image_prefix,
+            ),
+        )
+
+    @staticmethod
+    def _unify_package(
+        path: Path,
+        data: dict,
+        script_type: str,
+        is_script_package: bool,
+        marketplace: Optional[MarketplaceVersions],
+        custom: str,
+        image_prefix: str,
+    ) -> dict:
+        package_path = path.parent
         yml_unified = copy.deepcopy(data)
 
         yml_unified, _ = IntegrationScriptUnifier.insert_script_to_yml(
@@ -133,6 +191,68 @@ class IntegrationScriptUnifier(Unifier):
         logger.debug(f"[green]Created unified yml: {path.name}[/green]")
         return yml_unified
 
+    @staticmethod
+    def get_unify_inputs(
+        package_path: Path,
+        data: dict,
+        script_type: str,
+        is_script_package: bool,
+        marketplace: Optional[MarketplaceVersions],
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Collects everything the unified yml of a package depends on, for the unified output cache.
+        :return: The unification inputs, or None if the unified yml should not be cached
+        """
+        try:
+            code_path = IntegrationScriptUnifier.get_code_file(
+                package_path, script_type
+            )
+            code = get_file(code_path, return_content=True)
+            api_modules = []
+            for module_name in IntegrationScriptUnifier.check_api_module_imports(
+                code
+            ).values():
+                closure = IntegrationScriptUnifier.get_expanded_api_module(
+                    module_name, get_content_path(package_path)
+                ).closure
+                if not all(sha256 for _, sha256 in closure):
+                    return None
+                api_modules.append(
+                    [[str(module_path), sha256] for module_path, sha256 in closure]
+                )
+
+            _, image_path = IntegrationScriptUnifier.get_data(
+                package_path, "*png", is_script_package
+            )
+            description, description_path = IntegrationScriptUnifier.get_data(
+                package_path, "*_description.md", is_script_package
+            )
+            if (
+                marketplace
+                and description
+                and re.search(URL_IMAGE_LINK_REGEX, description.decode("utf-8"))
+            ):
+                # the images of the description are uploaded to the artifacts on every unification
+                return None
+
+            return {
+                "data": data,
+                "code": hashlib.sha256(code.encode()).hexdigest(),
+                "api_modules": api_modules,
+                "image": hash_file(image_path),
+                "description": hash_file(description_path),
+                "readme": hash_file(package_path / "README.md"),
+                "pack_metadata": get_pack_metadata(file_path=str(package_path)),
+                "contributor": IntegrationScriptUnifier.get_contributor_data(
+                    package_path, is_script_package
+                ),
+            }
+        except Exception as error:
+            logger.debug(
+                f"Could not collect the unification inputs of {package_path}: {error}"
+            )
+            return None
+
     @staticmethod
     def update_hidden_parameters_value(
         data: dict, marketplace: MarketplaceVersions = None
@@ -440,39 +560,123 @@ class IntegrationScriptUnifier(Unifier):
         :return: The integration script with the module code appended in place of the import
         """
         for module_import, module_name in import_to_name.items():
-            module_path = Path(
-                content_path,
-                "Packs",
-                "ApiModules",
-                "Scripts",
-                module_name,
-                f"{module_name}.py",
+            expanded_module = IntegrationScriptUnifier.get_expanded_api_module(
+                module_name, content_path
             )
-            module_code = IntegrationScriptUnifier._get_api_module_code(
-                module_name, module_path
+            script_code = script_code.replace(
+                module_import,
+                IntegrationScriptUnifier._wrap_module_code(
+                    module_import, module_name, expanded_module.code
+                ),
             )
+        return script_code
+
+    @staticmethod
+    def _wrap_module_code(
+        module_import: str, module_name: str, module_code: str
+    ) -> str:
+        # the wrapper numbers represents the number of generated lines added
+        # before (negative) or after (positive) the registration line
+        return (
+            f"\n### GENERATED CODE ###: {module_import}\n"
+            f"# This code was inserted in place of an API module.\n"
+            f"register_module_line('{module_name}', 'start', __line__(), wrapper=-3)\n"
+            f"{module_code}\n"
+            f"register_module_line('{module_name}', 'end', __line__(), wrapper=1)\n"
+            f"### END GENERATED CODE ###"
+        )
 
-            # handles cases where ApiModuleA imports ApiModuleB
-            tmp_imports_to_names = IntegrationScriptUnifier.check_api_module_imports(
-                module_code
+    @staticmethod
+    def get_expanded_api_module(
+        module_name: str, content_path: Path, importing_modules: Tuple[str, ...] = ()
+    ) -> ExpandedApiModule:
+        """
+        Returns the code of an API module with all the API modules it imports (recursively) inserted in its code.
+        Expanded modules are cached for the whole process, and are used as long as the hashes of the files of the
+        module and of the modules it imports did not change.
+        :param module_name: The API module name
+        :param content_path: The path to the content repo
+        :param importing_modules: The API modules which import this module, to detect circular imports
+        :return: The expanded API module
+        """
+        if module_name in importing_modules:
+            raise ValueError(
+                f"Circular API module imports: {' -> '.join(importing_modules + (module_name,))}"
             )
-            module_code = IntegrationScriptUnifier.insert_module_code(
-                module_code, tmp_imports_to_names, content_path
+        module_path = Path(
+            content_path,
+            "Packs",
+            "ApiModules",
+            "Scripts",
+            module_name,
+            f"{module_name}.py",
+        )
+        if (cached_module := EXPANDED_API_MODULES.get(module_path)) and all(
+            IntegrationScriptUnifier._read_api_module(path.stem, path)[1] == sha256
+            for path, sha256 in cached_module.closure
+        ):
+            return cached_module
+
+        module_code, module_sha256 = IntegrationScriptUnifier._read_api_module(
+            module_name, module_path
+        )
+        closure: List[Tuple[Path, Optional[str]]] = [(module_path, module_sha256)]
+
+        # handles cases where ApiModuleA imports ApiModuleB
+        for (
+            inner_module_import,
+            inner_module_name,
+        ) in IntegrationScriptUnifier.check_api_module_imports(module_code).items():
+            inner_module = IntegrationScriptUnifier.get_expanded_api_module(
+                inner_module_name,
+                content_path,
+                importing_modules + (module_name,),
+            )
+            module_code = module_code.replace(
+                inner_module_import,
+                IntegrationScriptUnifier._wrap_module_code(
+                    inner_module_import, inner_module_name, inner_module.code
+                ),
             )
+            closure.extend(inner_module.closure)
 
-            # the wrapper numbers represents the number of generated lines added
-            # before (negative) or after (positive) the registration line
-            module_code = (
-                f"\n### GENERATED CODE ###: {module_import}\n"
-                f"# This code was inserted in place of an API module.\n"
-                f"register_module_line('{module_name}', 'start', __line__(), wrapper=-3)\n"
-                f"{module_code}\n"
-                f"register_module_line('{module_name}', 'end', __line__(), wrapper=1)\n"
-                f"### END GENERATED CODE ###"
+        expanded_module = ExpandedApiModule(module_code, tuple(closure))  # type: ignore[arg-type]
+        if all(sha256 for _, sha256 in closure):
+            EXPANDED_API_MODULES[module_path] = expanded_module
+        return expanded_module
+
+    @staticmethod
+    def _read_api_module(
+        module_name: str, module_path: Path
+    ) -> Tuple[str, Optional[str]]:
+        """
+        Returns the code of an API module file and its sha256, the file is read again only if it was modified.
+        The sha256 is None when the file can not be cached (e.g. it does not exist on the file system).
+        """
+        try:
+            file_stat = module_path.stat()
+            signature: Optional[Tuple[int, int]] = (
+                file_stat.st_mtime_ns,
+                file_stat.st_size,
             )
+        except OSError:
+            signature = None
 
-            script_code = script_code.replace(module_import, module_code)
-        return script_code
+        if (
+            signature
+            and (module_file := API_MODULES_FILES.get(module_path))
+            and module_file.signature == signature
+        ):
+            return module_file.code, module_file.sha256
+
+        module_code = IntegrationScriptUnifier._get_api_module_code(
+            module_name, module_path
+        )
+        if not signature:
+            return module_code, None
+        sha256 = hashlib.sha256(module_code.encode()).hexdigest()
+        API_MODULES_FILES[module_path] = ApiModuleFile(signature, sha256, module_code)
+        return module_code, sha256
 
     @staticmethod
     def insert_pack_version(
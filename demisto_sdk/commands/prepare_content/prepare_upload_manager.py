@@ -12,6 +12,7 @@ from demisto_sdk.commands.common.logger import logger
 from demisto_sdk.commands.common.tools import (
     write_dict,
 )
+from demisto_sdk.commands.common.tracing import traced
 from demisto_sdk.commands.content_graph.commands.update import update_content_graph
 from demisto_sdk.commands.content_graph.interface import (
     ContentGraphInterface,
@@ -23,6 +24,7 @@ from demisto_sdk.commands.content_graph.objects.pack import Pack
 
 class PrepareUploadManager:
     @staticmethod
+    @traced()
     def prepare_for_upload(
         input: Path,
         output: Optional[Path] = None,
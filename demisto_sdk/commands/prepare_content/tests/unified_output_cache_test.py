@@ -0,0 +1,140 @@
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+from ruamel.yaml.scalarstring import (  # noqa: TID251 - only importing FoldedScalarString is OK
+    FoldedScalarString,
+)
+
+from demisto_sdk.commands.common.constants import MarketplaceVersions
+from demisto_sdk.commands.common.tools import get_file, get_yaml
+from demisto_sdk.commands.prepare_content import integration_script_unifier
+from demisto_sdk.commands.prepare_content import (
+    unified_output_cache as unified_output_cache_module,
+)
+from demisto_sdk.commands.prepare_content.integration_script_unifier import (
+    IntegrationScriptUnifier,
+)
+from demisto_sdk.commands.prepare_content.unified_output_cache import (
+    DISABLE_UNIFIED_OUTPUT_CACHE,
+    UnifiedOutputCache,
+    get_unifier_sources_hash,
+)
+from TestSuite.repo import Repo
+
+
+@pytest.fixture()
+def unified_output_cache(tmp_path, monkeypatch) -> UnifiedOutputCache:
+    monkeypatch.delenv(DISABLE_UNIFIED_OUTPUT_CACHE)
+    cache = UnifiedOutputCache(tmp_path / "unified_output_cache")
+    monkeypatch.setattr(integration_script_unifier, "UNIFIED_OUTPUT_CACHE", cache)
+    return cache
+
+
+def unify(path: Path, marketplace=MarketplaceVersions.XSOAR) -> dict:
+    return IntegrationScriptUnifier.unify(path, get_yaml(path), marketplace)
+
+
+def test_unchanged_integration_is_unified_once(
+    mocker, repo: Repo, unified_output_cache: UnifiedOutputCache
+):
+    """
+    Given:
+        - an integration package and the unified output cache is enabled
+
+    When:
+        - unifying it twice without changes, and again after changing its code
+
+    Then:
+        - make sure the second unification returns the cached output, with the script as a folded string
+        - make sure the integration is unified again once its code changes
+    """
+    integration = repo.create_pack().create_integration("TestIntegration")
+    yml_path = Path(integration.yml.path)
+    unify_package = mocker.spy(IntegrationScriptUnifier, "_unify_package")
+
+    unified = unify(yml_path)
+    cached_unified = unify(yml_path)
+
+    assert cached_unified == unified
+    assert isinstance(cached_unified["script"]["script"], FoldedScalarString)
+    assert unify_package.call_count == 1
+    assert (unified_output_cache.hits, unified_output_cache.misses) == (1, 1)
+
+    integration.code.write("print('changed')")
+    get_file.cache_clear()
+    assert "print('changed')" in unify(yml_path)["script"]["script"]
+    assert unify_package.call_count == 2
+
+
+def test_unifier_changes_invalidate_the_cache(
+    mocker, monkeypatch, repo: Repo, unified_output_cache: UnifiedOutputCache
+):
+    """
+    Given:
+        - an integration package which was unified and cached
+
+    When:
+        - unifying it again after the sources of the unifiers changed, with the same SDK version
+
+    Then:
+        - make sure the integration is unified again instead of returning the cached output
+    """
+    integration = repo.create_pack().create_integration("TestIntegration")
+    yml_path = Path(integration.yml.path)
+    unify_package = mocker.spy(IntegrationScriptUnifier, "_unify_package")
+    unify(yml_path)
+
+    monkeypatch.setattr(
+        unified_output_cache_module,
+        "get_unifier_sources_hash",
+        lambda: f"changed-{get_unifier_sources_hash()}",
+    )
+    unify(yml_path)
+
+    assert unify_package.call_count == 2
+
+
+def test_marketplaces_are_cached_separately(
+    repo: Repo, unified_output_cache: UnifiedOutputCache
+):
+    """
+    Given:
+        - an integration package which was unified for XSOAR
+
+    When:
+        - unifying it for XSIAM, and for XSOAR again
+
+    Then:
+        - make sure the XSIAM unification is not served from the XSOAR entry
+        - make sure the entry of XSOAR is still used
+    """
+    integration = repo.create_pack().create_integration("TestIntegration")
+    yml_path = Path(integration.yml.path)
+
+    unify(yml_path)
+    unify(yml_path, MarketplaceVersions.MarketplaceV2)
+    unify(yml_path)
+
+    assert (unified_output_cache.hits, unified_output_cache.misses) == (1, 2)
+
+
+def test_unrestorable_output_is_not_cached(tmp_path, monkeypatch):
+    """
+    Given:
+        - a unified output with a value which can not be restored from JSON
+
+    When:
+        - unifying it twice
+
+    Then:
+        - make sure it is not cached
+    """
+    monkeypatch.delenv(DISABLE_UNIFIED_OUTPUT_CACHE)
+    cache = UnifiedOutputCache(tmp_path)
+    unified = {"name": "test", "created": datetime(2023, 1, 1)}
+
+    for _ in range(2):
+        assert cache.get_or_unify(["test"], {"inputs": 1}, lambda: unified) == unified
+
+    assert (cache.hits, cache.misses) == (0, 2)
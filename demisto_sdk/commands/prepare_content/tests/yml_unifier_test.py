@@ -579,6 +579,86 @@ def test_insert_module_code__verify_offsets(mocker):
     assert int(end_offset.group(1)) == len(code[end_offset.span()[1] :].splitlines())
 
 
+def create_api_module(content_path: Path, module_name: str, code: str) -> Path:
+    module_path = (
+        content_path / "Packs/ApiModules/Scripts" / module_name / f"{module_name}.py"
+    )
+    module_path.parent.mkdir(parents=True, exist_ok=True)
+    module_path.write_text(code)
+    return module_path
+
+
+def test_insert_module_code_reads_api_modules_once(mocker, tmp_path):
+    """
+    Given:
+     - An ApiModule which imports another ApiModule, both imported by several integrations
+
+    When:
+     - calling insert_module_code for every integration
+
+    Then:
+     - Ensure each module file is read only once
+     - Ensure the code returned is the same as the code of the first integration
+     - Ensure a modified module is read again and its new code is inserted
+    """
+    create_api_module(
+        tmp_path, "OuterApiModule", "from InnerApiModule import *\nOUTER = 1"
+    )
+    inner_module_path = create_api_module(tmp_path, "InnerApiModule", "INNER = 1")
+    get_api_module_code = mocker.spy(IntegrationScriptUnifier, "_get_api_module_code")
+    imports = {
+        "from OuterApiModule import *": "OuterApiModule",
+        "from InnerApiModule import *": "InnerApiModule",
+    }
+
+    codes = {
+        IntegrationScriptUnifier.insert_module_code(
+            "from OuterApiModule import *\nfrom InnerApiModule import *",
+            imports,
+            tmp_path,
+        )
+        for _ in range(5)
+    }
+
+    assert len(codes) == 1
+    assert get_api_module_code.call_count == 2
+    code = codes.pop()
+    assert "register_module_line('InnerApiModule', 'start'" in code
+    assert "OUTER = 1" in code
+
+    inner_module_path.write_text("INNER = 2  # changed")
+    code = IntegrationScriptUnifier.insert_module_code(
+        "from OuterApiModule import *", imports, tmp_path
+    )
+    assert "INNER = 2  # changed" in code
+    assert get_api_module_code.call_count == 3
+
+
+def test_insert_module_code_circular_imports(tmp_path):
+    """
+    Given:
+     - ApiModules which import each other
+
+    When:
+     - calling insert_module_code
+
+    Then:
+     - Ensure a ValueError with the import cycle is raised
+    """
+    create_api_module(tmp_path, "AApiModule", "from BApiModule import *")
+    create_api_module(tmp_path, "BApiModule", "from AApiModule import *")
+
+    with pytest.raises(
+        ValueError,
+        match="Circular API module imports: AApiModule -> BApiModule -> AApiModule",
+    ):
+        IntegrationScriptUnifier.insert_module_code(
+            "from AApiModule import *",
+            {"from AApiModule import *": "AApiModule"},
+            tmp_path,
+        )
+
+
 @pytest.mark.parametrize(
     "package_path, dir_name, file_path",
     [
@@ -0,0 +1,188 @@
+import hashlib
+import os
+from functools import lru_cache
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Union
+
+from ruamel.yaml.scalarstring import (  # noqa: TID251 - only importing FoldedScalarString is OK
+    FoldedScalarString,
+)
+
+from demisto_sdk.commands.common.constants import CACHE_DIR
+from demisto_sdk.commands.common.disk_cache import DiskCache
+from demisto_sdk.commands.common.handlers import DEFAULT_JSON_HANDLER as json
+from demisto_sdk.commands.common.logger import logger
+from demisto_sdk.commands.common.tools import string_to_bool
+
+UNIFIED_OUTPUT_CACHE_DIR = CACHE_DIR / "unified_output"
+DISABLE_UNIFIED_OUTPUT_CACHE = "DEMISTO_SDK_DISABLE_UNIFIED_OUTPUT_CACHE"
+
+# the types which are restored as is from the JSON entries
+JSON_TYPES = {dict, list, str, int, float, bool, type(None)}
+
+
+def get_sdk_version() -> str:
+    try:
+        return version("demisto-sdk")
+    except PackageNotFoundError:
+        return "dev"
+
+
+@lru_cache(maxsize=1)
+def get_unifier_sources_hash() -> str:
+    """
+    Returns the sha256 of the sources of the prepare-content modules (without their tests), so a change of the
+    unification code invalidates the cache even when the version of the SDK stays the same (e.g. in a dev install).
+    """
+    package_path = Path(__file__).parent
+    sources_hash = hashlib.sha256()
+    for path in sorted(package_path.rglob("*.py")):
+        relative_path = path.relative_to(package_path)
+        if "tests" in relative_path.parts:
+            continue
+        sources_hash.update(str(relative_path).encode())
+        sources_hash.update(path.read_bytes())
+    return sources_hash.hexdigest()
+
+
+def hash_file(path: Union[Path, str, None]) -> Optional[str]:
+    """
+    Returns the sha256 of a file, None if there is no such file.
+    """
+    if not path or not Path(path).is_file():
+        return None
+    return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+
+
+def _collect_folded_paths(
+    data: Any, path: List[Union[str, int]], folded_paths: List[List[Union[str, int]]]
+) -> bool:
+    """
+    Collects the paths of the folded strings of the data.
+
+    Returns:
+        bool: whether the data is made of plain JSON types only (besides folded strings), and can be restored as is.
+    """
+    if isinstance(data, FoldedScalarString):
+        folded_paths.append(path)
+        return True
+    if type(data) not in JSON_TYPES:
+        return False
+    if isinstance(data, dict):
+        return all(
+            isinstance(key, str)
+            and _collect_folded_paths(value, path + [key], folded_paths)
+            for key, value in data.items()
+        )
+    if isinstance(data, list):
+        return all(
+            _collect_folded_paths(value, path + [index], folded_paths)
+            for index, value in enumerate(data)
+        )
+    return True
+
+
+def _restore_folded_strings(
+    data: Dict[str, Any], folded_paths: List[List[Union[str, int]]]
+) -> Dict[str, Any]:
+    for path in folded_paths:
+        parent = data
+        for part in path[:-1]:
+            parent = parent[part]
+        parent[path[-1]] = FoldedScalarString(parent[path[-1]])
+    return data
+
+
+class UnifiedOutputCache:
+    """
+    Caches the unified outputs of content items on disk, between runs of prepare-content and upload.
+
+    Each item has a single entry (per marketplace and custom label) which holds its unified output together with the
+    digest of all the inputs it was unified from (the yml, code, image, description, README, pack metadata,
+    the API modules the code imports, the version of the SDK and the sources of the unifiers), the entry is used only as long as the digest of the
+    current inputs is the same, and is replaced otherwise.
+    The cache can be disabled by setting the DEMISTO_SDK_DISABLE_UNIFIED_OUTPUT_CACHE environment variable.
+    """
+
+    def __init__(self, cache_dir: Path = UNIFIED_OUTPUT_CACHE_DIR):
+        self.cache = DiskCache(cache_dir)
+        self.hits = 0
+        self.misses = 0
+        self.uncacheable = 0
+
+    @property
+    def enabled(self) -> bool:
+        return not string_to_bool(
+            os.getenv(DISABLE_UNIFIED_OUTPUT_CACHE), default_when_empty=False
+        )
+
+    def get_or_unify(
+        self,
+        key: List[Any],
+        inputs: Optional[Dict[str, Any]],
+        unify: Callable[[], Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """
+        Returns the cached unified output if its inputs did not change, unifies the item otherwise.
+
+        Args:
+            key: identifies the unified item (path, marketplace etc.)
+            inputs: everything the unified output depends on, None if the item should not be cached
+            unify: unifies the item on a cache miss
+        """
+        if not self.enabled:
+            return unify()
+        if inputs is None:
+            self.uncacheable += 1
+            return unify()
+
+        try:
+            cache_key = json.dumps(key)
+            inputs_digest = hashlib.sha256(
+                json.dumps(
+                    {
+                        "sdk_version": get_sdk_version(),
+                        "unifier_sources": get_unifier_sources_hash(),
+                        **inputs,
+                    }
+                ).encode()
+            ).hexdigest()
+        except (TypeError, ValueError, OverflowError) as error:
+            # e.g. dates in the yml
+            logger.debug(f"The inputs of {key} can not be serialized: {error}")
+            self.uncacheable += 1
+            return unify()
+
+        entry = self.cache.get(cache_key)
+        if entry and entry.get("inputs_digest") == inputs_digest:
+            self.hits += 1
+            logger.debug(f"Using the cached unified output of {key}")
+            return _restore_folded_strings(entry["unified"], entry["folded_paths"])
+
+        self.misses += 1
+        unified = unify()
+        folded_paths: List[List[Union[str, int]]] = []
+        if _collect_folded_paths(unified, [], folded_paths):
+            self.cache.set(
+                cache_key,
+                {
+                    "inputs_digest": inputs_digest,
+                    "unified": unified,
+                    "folded_paths": folded_paths,
+                },
+                immutable=True,
+            )
+        else:
+            logger.debug(f"The unified output of {key} can not be cached")
+        return unified
+
+    def log_stats(self) -> None:
+        if self.hits or self.misses or self.uncacheable:
+            logger.info(
+                f"Unified output cache: {self.hits} hits, {self.misses} misses, "
+                f"{self.uncacheable} not cacheable"
+            )
+
+
+UNIFIED_OUTPUT_CACHE = UnifiedOutputCache()
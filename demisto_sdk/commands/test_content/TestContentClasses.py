@@ -3,9 +3,11 @@ import os
 import re
 import subprocess
 import sys
+import threading
 import time
 import urllib.parse
 import uuid
+from collections import defaultdict
 from copy import deepcopy
 from datetime import datetime, timezone
 from math import ceil
@@ -25,6 +27,10 @@ from packaging.version import Version
 from slack_sdk import WebClient as SlackClient
 from urllib3.exceptions import ReadTimeoutError
 
+from demisto_sdk.commands.common.clients.errors import PollingTimeout
+from demisto_sdk.commands.common.clients.incident_state_poller import (
+    IncidentStatePoller,
+)
 from demisto_sdk.commands.common.constants import (
     DEFAULT_CONTENT_ITEM_FROM_VERSION,
     DEFAULT_CONTENT_ITEM_TO_VERSION,
@@ -57,6 +63,8 @@ FAILED_MATCH_INSTANCE_MSG = (
 )
 ENTRY_TYPE_ERROR = 4
 DEFAULT_INTERVAL = 4
+# the playbook state of an investigation which its run status did not change is fetched again after this many seconds
+PLAYBOOK_STATE_MAX_AGE = 30
 MAX_RETRIES = 3
 RETRIES_THRESHOLD = ceil(MAX_RETRIES / 2)
 
@@ -810,6 +818,115 @@ class TestPlaybook:
             )
 
 
+class PlaybookStatesFetcher:
+    """
+    Fetches the playbook states of all the test investigations which are polled in the build,
+    used as the single fetcher of the build's playbook state poller.
+
+    On each polling round, the run statuses of all the polled investigations of a server are retrieved by a single
+    incidents search request. The exact playbook state of an investigation (by the inv-playbook endpoint, which has no
+    batch variant) is fetched only when it is polled for the first time, its run status changed or was not returned
+    by the search, or its state was fetched more than `max_state_age` seconds ago.
+    """
+
+    def __init__(self, max_state_age: float = PLAYBOOK_STATE_MAX_AGE):
+        self.max_state_age = max_state_age
+        self._tests: Dict[str, "TestContext"] = {}
+        self._run_statuses: Dict[str, Any] = {}
+        self._states: Dict[str, Tuple[str, float]] = {}
+        self._rounds: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def register(self, test: "TestContext"):
+        with self._lock:
+            self._tests[test.incident_id] = test  # type: ignore[index]
+            self._rounds[test.incident_id] = 0  # type: ignore[index]
+
+    def unregister(self, test: "TestContext"):
+        with self._lock:
+            for investigations_data in (
+                self._tests,
+                self._run_statuses,
+                self._states,
+                self._rounds,
+            ):
+                investigations_data.pop(test.incident_id, None)  # type: ignore[arg-type]
+
+    @staticmethod
+    def _search_run_statuses(
+        client: DefaultApi, incident_ids: List[str]
+    ) -> Dict[str, Any]:
+        search_filter = demisto_client.demisto_api.SearchIncidentsData()
+        search_filter.filter = demisto_client.demisto_api.IncidentFilter(
+            id=incident_ids, size=len(incident_ids)
+        )
+        response = client.search_incidents(filter=search_filter)
+        run_statuses = {}
+        for incident in response.data or []:
+            # the tests of XSOAR servers poll the investigation ID, and of SaaS servers the incident ID
+            for incident_id in {incident.id, incident.investigation_id}:
+                if incident_id in incident_ids:
+                    run_statuses[incident_id] = incident.run_status
+        return run_statuses
+
+    def _get_playbook_state(
+        self, test: "TestContext", run_statuses: Dict[str, Any]
+    ) -> str:
+        incident_id: str = test.incident_id  # type: ignore[assignment]
+        now = time.monotonic()
+        last_state = self._states.get(incident_id)
+        if (
+            not last_state
+            or incident_id not in run_statuses
+            or run_statuses[incident_id] != self._run_statuses.get(incident_id)
+            or now - last_state[1] >= self.max_state_age
+        ):
+            playbook_state = test._fetch_playbook_state()
+            self._states[incident_id] = (playbook_state, now)
+        else:
+            playbook_state = last_state[0]
+        if incident_id in run_statuses:
+            self._run_statuses[incident_id] = run_statuses[incident_id]
+
+        number_of_rounds = self._rounds.get(incident_id, 0) + 1
+        self._rounds[incident_id] = number_of_rounds
+        if number_of_rounds % DEFAULT_INTERVAL == 0:
+            msg = f"{test.playbook} loop no. {number_of_rounds // DEFAULT_INTERVAL}, {playbook_state=}"
+            test.playbook.log_info(msg)
+        return playbook_state
+
+    def __call__(self, incident_ids: List[str]) -> Dict[str, Any]:
+        with self._lock:
+            tests = [self._tests[i] for i in incident_ids if i in self._tests]
+
+        tests_by_client: Dict[int, List["TestContext"]] = defaultdict(list)
+        for test in tests:
+            tests_by_client[id(test.client)].append(test)
+
+        states = {}
+        for client_tests in tests_by_client.values():
+            client_incident_ids = [test.incident_id for test in client_tests]
+            try:
+                run_statuses = self._search_run_statuses(
+                    client_tests[0].client, client_incident_ids  # type: ignore[arg-type]
+                )
+            except Exception as error:
+                # the exact playbook state of each one of the investigations is fetched instead
+                client_tests[0].playbook.log_debug(
+                    f"Could not search the run statuses of investigations {client_incident_ids}: {error}"
+                )
+                run_statuses = {}
+            for test in client_tests:
+                try:
+                    states[test.incident_id] = self._get_playbook_state(
+                        test, run_statuses
+                    )
+                except Exception as error:
+                    # fails the polling of this investigation only, once it failed on several rounds
+                    states[test.incident_id] = error
+        return states
+
+
 class BuildContext:
     def __init__(self, kwargs: dict, logging_module: ParallelLoggingManager):
         self.server_type = kwargs["server_type"]
@@ -865,6 +982,11 @@ class BuildContext:
         self.all_integrations_configurations = self._get_all_integration_config(
             self.instances_ips
         )
+        # shared between all the servers threads, so the playbooks states are polled from a single place
+        self.playbook_state_poller = IncidentStatePoller(
+            min_interval=5, max_interval=30
+        )
+        self.playbook_states_fetcher = PlaybookStatesFetcher()
 
     def _get_all_integration_config(self, instances_ips: list) -> Optional[list]:
         """
@@ -2015,42 +2137,53 @@ class TestContext:
                 "Failed to print investigation error, error trying to communicate with demisto server"
             )
 
+    def _fetch_playbook_state(self) -> str:
+        """
+        Fetches the playbook state of the test's investigation, used by the build's playbook states fetcher.
+        Returns:
+            A string representing the status of the playbook
+        """
+        try:
+            # fetch status
+            return self._get_investigation_playbook_state()
+        except demisto_client.demisto_api.rest.ApiException:
+            self.playbook.log_exception(
+                "Error when trying to get investigation playbook state"
+            )
+            return "Pending"
+
     def _poll_for_playbook_state(self) -> str:
         """
         Polls for the playbook execution in the incident and return it's state.
+        The polling itself is done by the build's shared poller, which queries all the in-flight investigations
+        of the build on the same rounds with an adaptive interval instead of sleeping in every test thread.
         Returns:
             A string representing the status of the playbook
         """
-        timeout = time.time() + self.playbook.configuration.timeout
-        number_of_attempts = 1
-        # wait for playbook to finish run
-        while True:
-            # give playbook time to run
-            time.sleep(5)
-            try:
-                # fetch status
-                playbook_state = self._get_investigation_playbook_state()
-            except demisto_client.demisto_api.rest.ApiException:
-                playbook_state = "Pending"
-                self.playbook.log_exception(
-                    "Error when trying to get investigation playbook state"
-                )
-
-            if playbook_state in (PB_Status.COMPLETED, PB_Status.NOT_SUPPORTED_VERSION):
-                break
-            if playbook_state == PB_Status.FAILED:
-                self.playbook.log_error(f"{self.playbook} failed with error/s")
-                self._print_investigation_error()
-                break
-            if time.time() > timeout:
-                self.playbook.log_error(f"{self.playbook} failed on timeout")
-                break
-
-            if number_of_attempts % DEFAULT_INTERVAL == 0:
-                msg = f"{self.playbook} loop no. {number_of_attempts // DEFAULT_INTERVAL}, {playbook_state=}"
-                self.playbook.log_info(msg)
+        fetcher = self.build_context.playbook_states_fetcher
+        fetcher.register(self)
+        try:
+            future = self.build_context.playbook_state_poller.track(
+                self.incident_id,  # type: ignore[arg-type]
+                fetcher=fetcher,
+                is_final=lambda state: state
+                in (
+                    PB_Status.COMPLETED,
+                    PB_Status.NOT_SUPPORTED_VERSION,
+                    PB_Status.FAILED,
+                ),
+                timeout=self.playbook.configuration.timeout,
+            )
+            playbook_state = future.result()
+        except PollingTimeout as error:
+            self.playbook.log_error(f"{self.playbook} failed on timeout")
+            return error.last_state or "Pending"
+        finally:
+            fetcher.unregister(self)
 
-            number_of_attempts = number_of_attempts + 1
+        if playbook_state == PB_Status.FAILED:
+            self.playbook.log_error(f"{self.playbook} failed with error/s")
+            self._print_investigation_error()
         return playbook_state
 
     def replace_external_playbook_configuration(
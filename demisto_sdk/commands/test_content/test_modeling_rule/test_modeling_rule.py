@@ -1,9 +1,12 @@
 import logging
 import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from copy import deepcopy
 from datetime import datetime, timezone
 from pathlib import Path
-from time import sleep
-from typing import Any, Dict, List, Optional, Tuple, Union
+from time import monotonic, sleep
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 from uuid import UUID
 
 import dateparser
@@ -19,6 +22,7 @@ from tenacity import (
     before_sleep_log,
     retry_if_exception_type,
     stop_after_attempt,
+    wait_exponential,
     wait_fixed,
 )
 from typer.main import get_command_from_info
@@ -201,8 +205,14 @@ def sanitize_received_value_by_expected_type(
     return received_value_type, received_value
 
 
-def create_retrying_caller(retry_attempts: int, sleep_interval: int) -> Retrying:
-    """Create a Retrying object with the given retry_attempts and sleep_interval."""
+def create_retrying_caller(
+    retry_attempts: int, sleep_interval: int, exponential_backoff: bool = False
+) -> Retrying:
+    """Create a Retrying object with the given retry_attempts and sleep_interval.
+
+    When exponential_backoff is set, the wait between attempts starts at 1 second and is doubled on every attempt,
+    with sleep_interval as its upper bound.
+    """
     sleep_interval = parse_int_or_default(sleep_interval, XSIAM_CLIENT_SLEEP_INTERVAL)
     retry_attempts = parse_int_or_default(retry_attempts, XSIAM_CLIENT_RETRY_ATTEMPTS)
     retry_params: Dict[str, Any] = {
@@ -210,7 +220,9 @@ def create_retrying_caller(retry_attempts: int, sleep_interval: int) -> Retrying
         "before_sleep": before_sleep_log(logger, logging.DEBUG),
         "retry": retry_if_exception_type(requests.exceptions.RequestException),
         "stop": stop_after_attempt(retry_attempts),
-        "wait": wait_fixed(sleep_interval),
+        "wait": wait_exponential(multiplier=1, max=sleep_interval)
+        if exponential_backoff
+        else wait_fixed(sleep_interval),
     }
     return Retrying(**retry_params)
 
@@ -931,8 +943,88 @@ def delete_existing_dataset_flow(
             logger.info("[cyan]Dataset does not exists on tenant[/cyan]")
 
 
-def verify_data_sets_exists(xsiam_client, retrying_caller, test_data):
+class DatasetsWaiter:
+    """Waits for the datasets of modeling rules that are tested concurrently.
+
+    Instead of sleeping before every dataset query of every modeling rule, each dataset is waited for
+    once - `init_sleep_time` seconds after its test data was pushed - and queried once,
+    all the modeling rules that push to the same dataset share the result of that query.
+    """
+
+    def __init__(
+        self,
+        xsiam_client: XsiamApiClient,
+        retrying_caller: Retrying,
+        init_sleep_time: int = 30,
+    ):
+        self.xsiam_client = xsiam_client
+        self.retrying_caller = retrying_caller
+        self.init_sleep_time = init_sleep_time
+        self._lock = threading.Lock()
+        self._pushed_at: Dict[str, float] = {}
+        self._checks: Dict[str, "Future[TestCase]"] = {}
+
+    def mark_pushed(self, datasets: Iterable[str]):
+        """Records the time test data was pushed into the given datasets."""
+        with self._lock:
+            now = monotonic()
+            for dataset in datasets:
+                self._pushed_at[dataset] = now
+                # a dataset that was missing when checked might exist once more data is pushed into it
+                if (
+                    (check := self._checks.get(dataset))
+                    and check.done()
+                    and (check.exception() or not check.result().is_passed)
+                ):
+                    self._checks.pop(dataset)
+
+    def check_dataset_exists(self, dataset: str) -> TestCase:
+        """Checks whether the dataset exists, the query is done once per dataset.
+
+        Returns:
+            TestCase: a copy of the test case of the dataset check.
+        """
+        with self._lock:
+            check = self._checks.get(dataset)
+            should_check = check is None
+            if should_check:
+                check = self._checks[dataset] = Future()
+                remaining_sleep_time = max(
+                    self._pushed_at.get(dataset, monotonic())
+                    + self.init_sleep_time
+                    - monotonic(),
+                    0,
+                )
+        if should_check:
+            try:
+                check.set_result(  # type: ignore[union-attr]
+                    check_dataset_exists(
+                        self.xsiam_client,
+                        self.retrying_caller,
+                        dataset,
+                        init_sleep_time=int(remaining_sleep_time),
+                    )
+                )
+            except Exception as error:
+                check.set_exception(error)  # type: ignore[union-attr]
+        # each test suite must hold its own test case element
+        return TestCase.fromelem(deepcopy(check.result()._elem))  # type: ignore[union-attr]
+
+
+def verify_data_sets_exists(
+    xsiam_client,
+    retrying_caller,
+    test_data,
+    datasets_waiter: Optional[DatasetsWaiter] = None,
+):
     datasets_test_case_ls = []
+    if datasets_waiter:
+        for dataset_name in dict.fromkeys(data.dataset for data in test_data.data):
+            datasets_test_case_ls.append(
+                datasets_waiter.check_dataset_exists(dataset_name)
+            )
+        return datasets_test_case_ls
+
     for dataset in test_data.data:
         dataset_name = dataset.dataset
         dataset_test_case = check_dataset_exists(
@@ -952,6 +1044,7 @@ def validate_modeling_rule(
     delete_existing_dataset: bool,
     xsiam_client: XsiamApiClient,
     tenant_demisto_version: Version,
+    datasets_waiter: Optional[DatasetsWaiter] = None,
 ) -> Tuple[bool, Union[TestSuite, None]]:
     """Validate a modeling rule.
 
@@ -965,6 +1058,7 @@ def validate_modeling_rule(
         delete_existing_dataset (bool): Whether to delete the existing dataset in the tenant.
         xsiam_client (XsiamApiClient): The XSIAM client used to do API calls to the tenant.
         tenant_demisto_version (Version): The demisto version of the XSIAM tenant.
+        datasets_waiter (DatasetsWaiter): Shared datasets waiter, used when modeling rules are tested concurrently.
     """
     modeling_rule = ModelingRule(modeling_rule_directory.as_posix())
     modeling_rule_file_name = Path(modeling_rule.path).name
@@ -1124,8 +1218,12 @@ def validate_modeling_rule(
                 modeling_rule_test_suite.add_testcase(push_test_data_test_case)
                 if not push_test_data_test_case.is_passed:
                     return False, modeling_rule_test_suite
+                if datasets_waiter:
+                    datasets_waiter.mark_pushed(
+                        {data.dataset for data in test_data.data if data.dataset}
+                    )
                 datasets_test_case = verify_data_sets_exists(
-                    xsiam_client, retrying_caller, test_data
+                    xsiam_client, retrying_caller, test_data, datasets_waiter
                 )
                 modeling_rule_test_suite.add_testcases(datasets_test_case)
             else:
@@ -1481,6 +1579,18 @@ def test_modeling_rule(
         "--log-file-path",
         help="Path to save log files onto.",
     ),
+    max_workers: int = typer.Option(
+        1,
+        "-mw",
+        "--max-workers",
+        min=1,
+        show_default=True,
+        help=(
+            "The number of modeling rules to test concurrently. When larger than 1, test data is pushed for all "
+            "the modeling rules up front, each dataset is waited for once, and XQL queries are retried with an "
+            "exponential backoff. Implies non-interactive mode."
+        ),
+    ),
 ):
     """
     Test a modeling rule against an XSIAM tenant
@@ -1503,7 +1613,16 @@ def test_modeling_rule(
             extra={"markup": True},
         )
 
-    retrying_caller = create_retrying_caller(retry_attempts, sleep_interval)
+    concurrent = max_workers > 1
+    if concurrent and interactive:
+        logger.info(
+            "[cyan]Testing modeling rules concurrently - running in non-interactive mode[/cyan]",
+            extra={"markup": True},
+        )
+        interactive = False
+    retrying_caller = create_retrying_caller(
+        retry_attempts, sleep_interval, exponential_backoff=concurrent
+    )
 
     errors = False
     xml = JUnitXml()
@@ -1518,12 +1637,18 @@ def test_modeling_rule(
     )
     xsiam_client = XsiamApiClient(xsiam_client_cfg)
     tenant_demisto_version: Version = xsiam_client.get_demisto_version()
-    for i, modeling_rule_directory in enumerate(inputs, start=1):
+    datasets_waiter = (
+        DatasetsWaiter(xsiam_client, retrying_caller) if concurrent else None
+    )
+
+    def test_single_modeling_rule(
+        i: int, modeling_rule_directory: Path
+    ) -> Tuple[bool, Union[TestSuite, None]]:
         logger.info(
             f"[cyan][{i}/{len(inputs)}] Test Modeling Rule: {get_relative_path_to_content(modeling_rule_directory)}[/cyan]",
             extra={"markup": True},
         )
-        success, modeling_rule_test_suite = validate_modeling_rule(
+        return validate_modeling_rule(
             modeling_rule_directory,
             # can ignore the types since if they are not set to str values an error occurs
             xsiam_url,  # type: ignore[arg-type]
@@ -1534,21 +1659,33 @@ def test_modeling_rule(
             delete_existing_dataset,
             xsiam_client=xsiam_client,
             tenant_demisto_version=tenant_demisto_version,
+            datasets_waiter=datasets_waiter,
         )
-        if success:
-            logger.info(
-                f"[green]Test Modeling rule {get_relative_path_to_content(modeling_rule_directory)} passed[/green]",
-                extra={"markup": True},
-            )
-        else:
-            errors = True
-            logger.error(
-                f"[red]Test Modeling Rule {get_relative_path_to_content(modeling_rule_directory)} failed[/red]",
-                extra={"markup": True},
-            )
-        if modeling_rule_test_suite:
-            modeling_rule_test_suite.add_property("start_time", start_time)
-            xml.add_testsuite(modeling_rule_test_suite)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results: Iterable[Tuple[bool, Union[TestSuite, None]]] = (
+            executor.map(test_single_modeling_rule, range(1, len(inputs) + 1), inputs)
+            if concurrent
+            else map(test_single_modeling_rule, range(1, len(inputs) + 1), inputs)
+        )
+        # results are reported in the order of the inputs
+        for modeling_rule_directory, (success, modeling_rule_test_suite) in zip(
+            inputs, results
+        ):
+            if success:
+                logger.info(
+                    f"[green]Test Modeling rule {get_relative_path_to_content(modeling_rule_directory)} passed[/green]",
+                    extra={"markup": True},
+                )
+            else:
+                errors = True
+                logger.error(
+                    f"[red]Test Modeling Rule {get_relative_path_to_content(modeling_rule_directory)} failed[/red]",
+                    extra={"markup": True},
+                )
+            if modeling_rule_test_suite:
+                modeling_rule_test_suite.add_property("start_time", start_time)
+                xml.add_testsuite(modeling_rule_test_suite)
 
     if output_junit_file:
         logger.info(
@@ -1,12 +1,21 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from functools import partial
+from typing import Dict, List
 
 import pytest
+from demisto_client.demisto_api import Incident
+from demisto_client.demisto_api.models import InlineResponse200
 
+from demisto_sdk.commands.common.clients.incident_state_poller import (
+    IncidentStatePoller,
+)
 from demisto_sdk.commands.common.constants import PB_Status
 from demisto_sdk.commands.common.handlers import DEFAULT_JSON_HANDLER as json
 from demisto_sdk.commands.test_content.Docker import Docker
 from demisto_sdk.commands.test_content.TestContentClasses import (
     Integration,
+    PlaybookStatesFetcher,
     TestConfiguration,
     TestContext,
     TestPlaybook,
@@ -1108,3 +1117,134 @@ def test_replacing_pb_inputs_fails_with_build_fail(
     with pytest.raises(Exception) as e:
         test_context.replace_external_playbook_configuration(new_configuration)
     assert expected_error in str(e)
+
+
+class FakeInvestigationsServer:
+    """
+    Fake server of test investigations, their run statuses are searched in batch, and their playbook states one by one.
+    """
+
+    def __init__(self, run_statuses: Dict[str, str], states: Dict[str, str]):
+        self.run_statuses = run_statuses
+        self.states = states
+        self.searches: List[List[str]] = []
+        self.state_requests: List[str] = []
+
+    def search_incidents(self, filter):
+        self.searches.append(filter.filter.id)
+        return InlineResponse200(
+            data=[
+                Incident(
+                    id=incident_id,
+                    investigation_id=incident_id,
+                    run_status=self.run_statuses[incident_id],
+                )
+                for incident_id in filter.filter.id
+            ]
+        )
+
+    def test_context(self, mocker, build_context, incident_id: str) -> TestContext:
+        test_context = TestContext(
+            build_context=build_context,
+            playbook=mocker.MagicMock(),
+            client=self,
+            server_context=mocker.MagicMock(),
+        )
+        test_context.incident_id = incident_id
+        test_context.playbook.configuration.timeout = 5
+
+        def get_investigation_playbook_state():
+            self.state_requests.append(incident_id)
+            return self.states[incident_id]
+
+        mocker.patch.object(
+            test_context,
+            "_get_investigation_playbook_state",
+            side_effect=get_investigation_playbook_state,
+        )
+        return test_context
+
+
+def test_playbook_states_fetcher(mocker):
+    """
+    Given:
+        - 3 in-progress test investigations on the same server
+    When:
+        - fetching their playbook states on several rounds, while one of them completes and then the search fails
+    Then:
+        - Ensure the run statuses of all the investigations are searched in a single request per round
+        - Ensure the playbook state of an investigation is fetched only on the first round and once its run status
+          changed, or of all of them when the search failed
+        - Ensure the progress of the polling is logged every 4 rounds
+    """
+    server = FakeInvestigationsServer(
+        run_statuses=dict.fromkeys(["1", "2", "3"], "running"),
+        states=dict.fromkeys(["1", "2", "3"], PB_Status.IN_PROGRESS),
+    )
+    fetcher = PlaybookStatesFetcher()
+    tests = [server.test_context(mocker, mocker.MagicMock(), i) for i in "123"]
+    for test in tests:
+        fetcher.register(test)
+
+    assert fetcher(["1", "2", "3"]) == dict.fromkeys("123", PB_Status.IN_PROGRESS)
+    assert fetcher(["1", "2", "3"]) == dict.fromkeys("123", PB_Status.IN_PROGRESS)
+    assert server.state_requests == ["1", "2", "3"]
+
+    server.run_statuses["2"] = "completed"
+    server.states["2"] = PB_Status.COMPLETED
+    assert fetcher(["1", "2", "3"])["2"] == PB_Status.COMPLETED
+    assert server.state_requests == ["1", "2", "3", "2"]
+    fetcher.unregister(tests[1])
+
+    mocker.patch.object(server, "search_incidents", side_effect=Exception("error"))
+    assert fetcher(["1", "3"]) == dict.fromkeys("13", PB_Status.IN_PROGRESS)
+    assert server.state_requests == ["1", "2", "3", "2", "1", "3"]
+    assert server.searches == [["1", "2", "3"]] * 3
+    tests[0].playbook.log_info.assert_called_once_with(
+        f"{tests[0].playbook} loop no. 1, playbook_state='inprogress'"
+    )
+
+
+def test_poll_for_playbook_state_of_concurrent_tests(mocker):
+    """
+    Given:
+        - 3 test investigations which are polled concurrently by the build's poller,
+          and complete once they are searched together
+    When:
+        - polling for their playbook states from the test threads
+    Then:
+        - Ensure all of them completed
+        - Ensure each polling round searched the run statuses of the investigations by a single request
+    """
+    build_context = mocker.MagicMock()
+    build_context.playbook_state_poller = IncidentStatePoller(
+        min_interval=0.01, max_interval=0.02
+    )
+    build_context.playbook_states_fetcher = PlaybookStatesFetcher()
+    server = FakeInvestigationsServer(
+        run_statuses=dict.fromkeys(["1", "2", "3"], "running"),
+        states=dict.fromkeys(["1", "2", "3"], PB_Status.IN_PROGRESS),
+    )
+    search_incidents = server.search_incidents
+
+    def complete_once_searched_together(filter):
+        if len(filter.filter.id) == 3:
+            server.run_statuses = dict.fromkeys(["1", "2", "3"], "completed")
+            server.states = dict.fromkeys(["1", "2", "3"], PB_Status.COMPLETED)
+        return search_incidents(filter)
+
+    mocker.patch.object(
+        server, "search_incidents", side_effect=complete_once_searched_together
+    )
+    tests = [server.test_context(mocker, build_context, i) for i in "123"]
+    barrier = threading.Barrier(3)
+
+    def poll(test: TestContext) -> str:
+        barrier.wait()
+        return test._poll_for_playbook_state()
+
+    with build_context.playbook_state_poller, ThreadPoolExecutor(3) as executor:
+        assert list(executor.map(poll, tests)) == [PB_Status.COMPLETED] * 3
+
+    assert sorted(server.searches[-1]) == ["1", "2", "3"]
+    assert len(server.searches) == build_context.playbook_state_poller.requests_count
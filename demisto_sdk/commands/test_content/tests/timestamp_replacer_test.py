@@ -8,7 +8,10 @@ import pytest
 from mitmproxy.http import Headers, HTTPFlow, Request
 
 from demisto_sdk.commands.common.handlers import DEFAULT_JSON_HANDLER as json
-from demisto_sdk.commands.test_content.timestamp_replacer import TimestampReplacer
+from demisto_sdk.commands.test_content.timestamp_replacer import (
+    KeyPathMatcher,
+    TimestampReplacer,
+)
 
 
 @pytest.fixture()
@@ -279,6 +282,72 @@ class TestTimeStampReplacer:
             elif key == "dict1":
                 assert time_stamp_replacer.constant in val["list"]
 
+    def test_json_body_without_problematic_keys_is_not_parsed(self, mocker, flow):
+        """
+        Given:
+            - A timestamp replacer instance with problematic json keys
+        When:
+            - digesting a request in playback mode, whose json body has none of the problematic keys
+        Then:
+            - Ensure the body is not parsed nor modified
+        """
+        mitmproxy.ctx.options.script_mode = "playback"
+        flow.request.method = "POST"
+        flow.request.set_content(json.dumps({"key1": "value1"}).encode())
+        time_stamp_replacer = TimestampReplacer()
+        time_stamp_replacer.json_keys = {"timestamp_key", "dict1.list.1"}
+        modify_json_body = mocker.spy(time_stamp_replacer, "modify_json_body")
+        time_stamp_replacer.request(flow)
+        assert not modify_json_body.called
+        assert json.loads(flow.request.get_content()) == {"key1": "value1"}
+
+    def test_modifying_json_list_body(self, flow):
+        """
+        Given:
+            - A timestamp replacer instance with a problematic json key which starts with a list index
+        When:
+            - modifying a json body which is a list
+        Then:
+            - Ensure the matcher does not skip the body, and the problematic key is replaced with constant value
+        """
+        json_body = [{"key1": "value1"}, {"time": "2021-01-11T13:18:12+00:00"}]
+        time_stamp_replacer = TimestampReplacer()
+        time_stamp_replacer.json_keys = {"1.time"}
+        assert time_stamp_replacer.get_json_keys_matcher().may_match(
+            json.dumps(json_body).encode()
+        )
+        time_stamp_replacer.modify_json_body(flow.request, json_body)  # type: ignore[arg-type]
+        assert json.loads(flow.request.get_content()) == [
+            {"key1": "value1"},
+            {"time": time_stamp_replacer.constant},
+        ]
+
+    def test_problem_keys_file_is_updated_with_new_keys_only(self, mocker, flow):
+        """
+        Given:
+            - A timestamp replacer instance
+        When:
+            - recording the same request twice, and then a request with a new problematic key
+        Then:
+            - Ensure the problem keys file is written only for the requests with new problematic keys
+        """
+        mocker.patch("builtins.open", mock_open())
+        write_out_problematic_keys = mocker.patch.object(
+            TimestampReplacer, "write_out_problematic_keys"
+        )
+        mitmproxy.ctx.options.detect_timestamps = True
+        mitmproxy.ctx.options.script_mode = "record"
+        flow.request.method = "POST"
+        time_stamp_replacer = TimestampReplacer()
+        for key in ("timestamp_key", "timestamp_key", "other_timestamp_key"):
+            flow.request.set_content(json.dumps({key: TIMESTAMP_FORMATS[0]}).encode())
+            time_stamp_replacer.request(flow)
+        assert write_out_problematic_keys.call_count == 2
+        assert time_stamp_replacer.json_keys == {
+            "timestamp_key",
+            "other_timestamp_key",
+        }
+
     def test_url_query_is_sorted(self, mocker, flow):
         """
         Given:
@@ -336,6 +405,41 @@ class TestTimeStampReplacer:
         )
 
 
+def test_key_path_matcher():
+    """
+    Given:
+        - Key paths of values in dicts and lists, one of them inside the value of another
+    When:
+        - Matching them in json bodies
+    Then:
+        - Ensure only bodies which may contain the key paths are considered
+        - Ensure the values of the existing key paths are found, and not the values inside a found value
+    """
+    matcher = KeyPathMatcher(
+        ["timestamp_key", "dict1.list.1", "dict1.list.5", "a", "a.b"]
+    )
+    body = {
+        "key1": "value1",
+        "timestamp_key": "2021",
+        "dict1": {"list": ["test", "2021"]},
+        "a": {"b": "2021"},
+    }
+    assert matcher.may_match(json.dumps(body).encode())
+    assert not matcher.may_match(b'{"key1": "value1"}')
+    assert not KeyPathMatcher([]).may_match(json.dumps(body).encode())
+    # the indexes of top level lists are not quoted in the body
+    assert KeyPathMatcher(["0.time"]).may_match(b'[{"time": "2021-01-01T00:00:00Z"}]')
+
+    for obj, key in matcher.find(body):
+        obj[key] = "constant_value"
+    assert body == {
+        "key1": "value1",
+        "timestamp_key": "constant_value",
+        "dict1": {"list": ["test", "constant_value"]},
+        "a": "constant_value",
+    }
+
+
 def test_demisto_sdk_imports():
     code_file = Path(__file__).parent.parent / "timestamp_replacer.py"
     assert (
@@ -7,13 +7,13 @@ DO NOT import anything from custom packages, only use builtins.
 import functools
 import json  # noqa: TID251
 import logging
+import re
 import urllib.parse
 from ast import literal_eval
 from collections import OrderedDict
-from copy import deepcopy
 from pathlib import Path
 from time import ctime
-from typing import List, Union
+from typing import Any, Iterable, List, Tuple, Union
 
 from dateparser import parse
 from mitmproxy import ctx
@@ -57,6 +57,79 @@ def record_concurrently(replaying: bool = False):
         return concurrent
 
 
+class KeyPathMatcher:
+    """
+    Finds the values of key paths (in dot notation, e.g. 'query.filter.time' or 'items.0.time') in json bodies.
+
+    The key paths are compiled once into a tree of their parts, so a body is walked only along the key paths,
+    and into a pattern of their first parts, so bodies which can not contain any of the key paths are not parsed.
+    """
+
+    # marks a node of the tree as the end of a key path, the parts of the key paths are strings
+    KEY_PATH_END = None
+
+    def __init__(self, key_paths: Iterable[str]):
+        self.key_paths = frozenset(key_paths)
+        self.tree: dict = {}
+        for key_path in self.key_paths:
+            node = self.tree
+            for part in key_path.split("."):
+                node = node.setdefault(part, {})
+            node[self.KEY_PATH_END] = True
+
+        self.first_parts_pattern = None
+        # keys which may be escaped in a json body are not searched for, and neither are the indexes of top level
+        # lists, which are not quoted in the body, such bodies are always parsed
+        if all(
+            not part.isdigit()
+            and part.isascii()
+            and part.isprintable()
+            and not {"\\", "/", '"', "'"} & set(part)
+            for part in self.tree
+        ):
+            # the keys are quoted both in json bodies and in python literal bodies
+            self.first_parts_pattern = re.compile(
+                b"[\"'](?:"
+                + b"|".join(re.escape(part.encode()) for part in self.tree)
+                + b")[\"']"
+            )
+
+    def may_match(self, content: bytes) -> bool:
+        """Whether the content may contain any of the key paths, without parsing it"""
+        if not self.tree:
+            return False
+        if self.first_parts_pattern is None:
+            return True
+        return self.first_parts_pattern.search(content) is not None
+
+    def find(self, body: Any) -> List[Tuple[Union[dict, list], Union[str, int]]]:
+        """
+        Finds the values of the key paths in a json body.
+
+        Returns:
+            List[Tuple[Union[dict, list], Union[str, int]]]: The (object, key) of each one of the values, the values
+                inside an object which matches a key path are not returned.
+        """
+        matches = []
+        nodes = [(self.tree, body)]
+        while nodes:
+            node, obj = nodes.pop()
+            for part, sub_node in node.items():
+                if part is self.KEY_PATH_END:
+                    continue
+                if isinstance(obj, dict) and part in obj:
+                    key: Union[str, int] = part
+                elif isinstance(obj, list) and part.isdigit() and int(part) < len(obj):
+                    key = int(part)
+                else:
+                    continue
+                if self.KEY_PATH_END in sub_node:
+                    matches.append((obj, key))
+                else:
+                    nodes.append((sub_node, obj[key]))
+        return matches
+
+
 class TimestampReplacer:
     def __init__(self):
         self.count = 0
@@ -66,6 +139,9 @@ class TimestampReplacer:
         self.query_keys = set()
         self.bad_keys_filepath = ""
         self.detect_timestamps = False
+        self.json_keys_matcher = KeyPathMatcher(())
+        # the problematic keys which were written to the keys file, the file is updated only once there are new ones
+        self.written_problem_keys: Tuple[frozenset, ...] = ()
 
     def load(self, loader: Loader):
         loader.add_option(
@@ -142,9 +218,6 @@ class TimestampReplacer:
         if ctx.options.script_mode == "record":
             if ctx.options.detect_timestamps:
                 self.run_all_key_detections(req)
-                logging.info(
-                    f'updating problem_keys file at "{self.bad_keys_filepath}"'
-                )
                 self.update_problem_keys_file()
         elif ctx.options.script_mode in {"clean", "playback"}:
             logging.info(f"flow.live is: {flow.live}")
@@ -232,6 +305,9 @@ class TimestampReplacer:
         """
         if req.method == "POST":
             raw_content = req.raw_content
+            if not self.get_json_keys_matcher().may_match(raw_content or b""):
+                logging.info("the json body has no problematic keys - not cleaning it")
+                return
             if raw_content is not None:
                 try:
                     content = raw_content.decode()
@@ -260,6 +336,12 @@ class TimestampReplacer:
                 except Exception:
                     logging.exception(f"failed to run json.loads on content {content}")
 
+    def get_json_keys_matcher(self) -> KeyPathMatcher:
+        """The matcher of the problematic json keys, which is compiled again only once they change"""
+        if self.json_keys_matcher.key_paths != set(self.json_keys):
+            self.json_keys_matcher = KeyPathMatcher(self.json_keys)
+        return self.json_keys_matcher
+
     def modify_json_body(self, req: Request, json_body: dict) -> None:
         """Modify the json body of a request by replacing any timestamp data with constant data
 
@@ -267,45 +349,12 @@ class TimestampReplacer:
             req (Request): The request whose json body will be modified.
             json_body (dict): The request body to modify.
         """
-        original_content = deepcopy(json_body)
-        modified = False
-        keys_to_replace = self.json_keys
-        logging.info(f"{keys_to_replace}")
-        for key_path in keys_to_replace:
-            body = json_body
-            keys = key_path.split(".")
-            logging.info(f"keypath parts: {keys}")
-            lastkey = keys[-1]
-            logging.info(f"lastkey: {lastkey}")
-            skip_key = False
-            for k in keys[:-1]:
-                if k in body:
-                    body = body[k]
-                elif isinstance(body, list) and k.isdigit():
-                    if int(k) > len(body) - 1:
-                        skip_key = True
-                        break
-                    body = body[int(k)]
-                else:
-                    skip_key = True
-                    break
-            if not skip_key:
-                if lastkey in body:
-                    logging.info(f'modifying request to "{req.pretty_url}"')
-                    body[lastkey] = self.constant
-                    modified = True
-                elif (
-                    isinstance(body, list)
-                    and lastkey.isdigit()
-                    and int(lastkey) <= len(body) - 1
-                ):
-                    logging.info(f'modifying request to "{req.pretty_url}"')
-                    body[int(lastkey)] = self.constant
-                    modified = True
-        if modified:
-            logging.info(
-                f"original request body:\n{json.dumps(original_content, indent=4)}"
-            )
+        matches = self.get_json_keys_matcher().find(json_body)
+        if matches:
+            logging.info(f'modifying request to "{req.pretty_url}"')
+            logging.info(f"original request body:\n{json.dumps(json_body, indent=4)}")
+            for obj, key in matches:
+                obj[key] = self.constant  # type: ignore[index]
             logging.info(f"modified request body:\n{json.dumps(json_body, indent=4)}")
             req.set_content(json.dumps(json_body).encode())
 
@@ -407,58 +456,35 @@ class TimestampReplacer:
 
         def travel_dict(obj: Union[dict, list], key_path="") -> List[str]:
             bad_key_paths = []
-            if isinstance(obj, dict):
-                for key, val in obj.items():
-                    sub_key_path = f"{key_path}.{key}" if key_path else key
-                    if isinstance(val, (list, dict)):
-                        bad_key_paths.extend(travel_dict(val, sub_key_path))
-                    else:
-                        is_string = isinstance(val, str) and len(val) > 4
-                        possible_timestamp = (
-                            isinstance(val, (int, float)) and len(str(val)) >= 8
-                        )
-                        if is_string or possible_timestamp:
-                            for_eval = val
-                            if possible_timestamp:
-                                if isinstance(for_eval, float):
-                                    digits = str(val).split(".")
-                                    for_eval = digits[0]
-                                if len(str(for_eval)) < 13:
-                                    parsed_date = self.safely_parse(ctime(val))
-                                else:
-                                    parsed_date = self.safely_parse(ctime(val / 1000.0))
-                            else:
-                                parsed_date = self.safely_parse(val)
-                            # if parsed_date is not None then successfully interpreted value as some sort of
-                            # time related thingieding
-                            if parsed_date:
-                                bad_key_paths.append(sub_key_path)
-            elif isinstance(obj, list):
-                for i, val in enumerate(obj):
-                    sub_key_path = f"{key_path}.{i}" if key_path else i
-                    if isinstance(val, (list, dict)):
-                        bad_key_paths.extend(travel_dict(val, sub_key_path))
-                    else:
-                        is_string = isinstance(val, str) and len(val) > 4
-                        possible_timestamp = (
-                            isinstance(val, (int, float)) and len(str(val)) >= 8
-                        )
-                        if is_string or possible_timestamp:
-                            for_eval = val
-                            if possible_timestamp:
-                                if isinstance(for_eval, float):
-                                    digits = str(val).split(".")
-                                    for_eval = digits[0]
-                                if len(str(for_eval)) < 13:
-                                    parsed_date = self.safely_parse(ctime(val))
-                                else:
-                                    parsed_date = self.safely_parse(ctime(val / 1000.0))
+            items = obj.items() if isinstance(obj, dict) else enumerate(obj)
+            for key, val in items:
+                sub_key_path = f"{key_path}.{key}" if key_path else key
+                if isinstance(val, (list, dict)):
+                    bad_key_paths.extend(travel_dict(val, sub_key_path))
+                elif sub_key_path in self.json_keys:
+                    # already known to be problematic, no need to parse its value again
+                    bad_key_paths.append(sub_key_path)
+                else:
+                    is_string = isinstance(val, str) and len(val) > 4
+                    possible_timestamp = (
+                        isinstance(val, (int, float)) and len(str(val)) >= 8
+                    )
+                    if is_string or possible_timestamp:
+                        for_eval = val
+                        if possible_timestamp:
+                            if isinstance(for_eval, float):
+                                digits = str(val).split(".")
+                                for_eval = digits[0]
+                            if len(str(for_eval)) < 13:
+                                parsed_date = self.safely_parse(ctime(val))
                             else:
-                                parsed_date = self.safely_parse(val)
-                            # if parsed_date is not None then successfully interpreted value as some sort of
-                            # time related thingieding
-                            if parsed_date:
-                                bad_key_paths.append(sub_key_path)
+                                parsed_date = self.safely_parse(ctime(val / 1000.0))
+                        else:
+                            parsed_date = self.safely_parse(val)
+                        # if parsed_date is not None then successfully interpreted value as some sort of
+                        # time related thingieding
+                        if parsed_date:
+                            bad_key_paths.append(sub_key_path)
             return bad_key_paths
 
         bad_keys = travel_dict(content)
@@ -466,6 +492,15 @@ class TimestampReplacer:
 
     def update_problem_keys_file(self):
         """Update the problem keys dictionary at the keys_filepath with new problematic keys"""
+        problem_keys = (
+            frozenset(self.json_keys),
+            frozenset(self.form_keys),
+            frozenset(self.query_keys),
+        )
+        if problem_keys == self.written_problem_keys:
+            logging.info("no new problematic keys - not updating the problem_keys file")
+            return
+        logging.info(f'updating problem_keys file at "{self.bad_keys_filepath}"')
         existing_problem_keys = self.read_in_problematic_keys()
         for key, val in existing_problem_keys.items():
             if key == "keys_to_replace":
@@ -481,6 +516,7 @@ class TimestampReplacer:
                     set(val.split()).union(self.query_keys)
                 )
         self.write_out_problematic_keys(existing_problem_keys)
+        self.written_problem_keys = problem_keys
 
     def read_in_problematic_keys(self):
         """Load problematic keys dictionary from the keys_filepath argument filepath in content-test-data repo
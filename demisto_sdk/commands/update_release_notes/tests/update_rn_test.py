@@ -12,8 +12,10 @@ import pytest
 
 from demisto_sdk.commands.common.constants import (
     DEFAULT_CONTENT_ITEM_TO_VERSION,
+    DEMISTO_GIT_PRIMARY_BRANCH,
     FileType,
 )
+from demisto_sdk.commands.common.git_object_reader import GitObjectReader
 from demisto_sdk.commands.common.handlers import DEFAULT_JSON_HANDLER as json
 from demisto_sdk.commands.common.hook_validations.readme import ReadMeValidator
 from demisto_sdk.commands.common.legacy_git_tools import git_path
@@ -33,6 +35,7 @@ from demisto_sdk.commands.update_release_notes.update_rn import (
     get_deprecated_rn,
     get_file_description,
 )
+from TestSuite.test_tools import ChangeCWD
 
 
 class TestRNUpdate:
@@ -1418,6 +1421,25 @@ def get_mock_yml_obj(path, file_type, deprecated) -> dict:
     return old_yml_dict, new_yml_obj
 
 
+def mock_docker_image_change(mocker, old_docker_image: str, new_docker_image: str):
+    """Mocks the integration yml to have the new docker image, and its content in the main branch the old one."""
+    mocker.patch.object(
+        GitObjectReader,
+        "relative_path",
+        return_value="Packs/Test/Integrations/Test.yml",
+    )
+    mocker.patch.object(GitObjectReader, "resolve_tree", return_value="tree")
+    mocker.patch.object(
+        GitObjectReader,
+        "read",
+        return_value=f"script:\n  dockerimage: {old_docker_image}\n".encode(),
+    )
+    mocker.patch(
+        "demisto_sdk.commands.update_release_notes.update_rn.get_yaml",
+        return_value={"script": {"dockerimage": new_docker_image}},
+    )
+
+
 class TestRNUpdateUnit:
     META_BACKUP = ""
     FILES_PATH = os.path.normpath(
@@ -2015,7 +2037,7 @@ class TestRNUpdateUnit:
         assert execute_update_mock.call_count == 1
 
     def test_update_docker_image_when_yml_has_changed_but_not_docker_image_property(
-        self, mocker
+        self, repo
     ):
         """
         Given
@@ -2030,43 +2052,54 @@ class TestRNUpdateUnit:
             check_docker_image_changed,
         )
 
-        return_value = "+category: Utilities\
-                        +commonfields:\
-                        +  id: Test\
-                        +  version: -1\
-                        +configuration:\
-                        +- defaultvalue: https://soar.test.com\
-                        +  display: Server URL (e.g. https://soar.test.com)\
-                        +- display: Fetch incidents\
-                        +  name: isFetch\
-                        +- display: Incident type"
-
-        mocker.patch(
-            "demisto_sdk.commands.update_release_notes.update_rn.run_command",
-            return_value=return_value,
+        integration = repo.create_pack("Test").create_integration(
+            "Test", docker_image="demisto/python3:3.9.8.24398"
         )
+        repo.init_git()
+        integration.yml.update({"category": "Utilities"})
 
-        assert (
-            check_docker_image_changed(main_branch="origin/master", packfile="test.yml")
-            is None
+        with ChangeCWD(repo.path):
+            assert (
+                check_docker_image_changed(
+                    main_branch=DEMISTO_GIT_PRIMARY_BRANCH,
+                    packfile=integration.yml.path,
+                )
+                is None
+            )
+
+    def test_check_docker_image_changed_of_missing_file(self, repo):
+        """
+        Given
+            - a yml path in the repository which does not exist
+        When
+            - calling the check_docker_image_changed function
+        Then
+            - Ensure the docker image check is skipped rather than failing
+        """
+        from demisto_sdk.commands.update_release_notes.update_rn import (
+            check_docker_image_changed,
         )
 
-    @pytest.mark.parametrize(
-        "return_value_mock",
-        [
-            ("+  dockerimage: demisto/python3:3.9.8.24399"),
-            ("+dockerimage: demisto/python3:3.9.8.24399"),
-        ],
-    )
-    def test_check_docker_image_changed(self, mocker, return_value_mock):
+        pack = repo.create_pack("Test")
+        repo.init_git()
+
+        with ChangeCWD(repo.path):
+            assert (
+                check_docker_image_changed(
+                    main_branch=DEMISTO_GIT_PRIMARY_BRANCH,
+                    packfile=str(Path(pack.path) / "Integrations" / "Test.yml"),
+                )
+                is None
+            )
+
+    @pytest.mark.parametrize("item_type", ["integration", "script"])
+    def test_check_docker_image_changed(self, repo, item_type):
         """
         This test checks that for both integration and script YMLs, where the docker image resides at a different level,
         changes made to this key are found correctly by 'check_docker_image_changed' function.
         Given
-            - Case 1: a git diff mock of a modified integration .yml file where the docker is changed and there're spaces between the
-            '+' and the dockerimage
-            - Case 2: a git diff mock of a modified sccript .yml file where the docker is changed and there's no space between the
-            '+' and the dockerimage
+            - Case 1: a modified integration .yml file where the docker image is changed (under the script section)
+            - Case 2: a modified script .yml file where the docker image is changed (at the top level)
         When
             - calling the check_docker_image_changed function
         Then
@@ -2079,16 +2112,31 @@ class TestRNUpdateUnit:
             check_docker_image_changed,
         )
 
-        return_value = "+  dockerimage: demisto/python3:3.9.8.24399"
-
-        mocker.patch(
-            "demisto_sdk.commands.update_release_notes.update_rn.run_command",
-            return_value=return_value,
-        )
-        assert (
-            check_docker_image_changed(main_branch="origin/master", packfile="test.yml")
-            == "demisto/python3:3.9.8.24399"
-        )
+        pack = repo.create_pack("Test")
+        if item_type == "integration":
+            item = pack.create_integration(
+                "Test", docker_image="demisto/python3:3.9.8.24398"
+            )
+        else:
+            item = pack.create_script(
+                "Test", docker_image="demisto/python3:3.9.8.24398"
+            )
+        repo.init_git()
+        if item_type == "integration":
+            item.yml.update(
+                {"dockerimage": "demisto/python3:3.9.8.24399"},
+                key_dict_to_update="script",
+            )
+        else:
+            item.yml.update({"dockerimage": "demisto/python3:3.9.8.24399"})
+
+        with ChangeCWD(repo.path):
+            assert (
+                check_docker_image_changed(
+                    main_branch=DEMISTO_GIT_PRIMARY_BRANCH, packfile=item.yml.path
+                )
+                == "demisto/python3:3.9.8.24399"
+            )
 
     def test_update_docker_image_in_yml(self, mocker):
         """
@@ -2103,28 +2151,12 @@ class TestRNUpdateUnit:
 
         from demisto_sdk.commands.update_release_notes.update_rn import UpdateRN
 
-        expected_res = (
-            "diff --git a/Packs/test1/Integrations/test1/test1.yml b/Packs/test1/Integrations/test1/test1.yml\n"
-            "--- a/Packs/test1/Integrations/test1/test1.yml\n"
-            "+++ b/Packs/test1/Integrations/test1/test1.yml\n"
-            "@@ -1270,7 +1270,7 @@ script:\n"
-            "description: update docker image.\n"
-            "execution: false\n"
-            "name: test1\n"
-            "-  dockerimage: demisto/python3:3.9.6.22912\n"
-            "+  dockerimage: demisto/python3:3.9.6.22914\n"
-            "feed: false\n"
-            "isfetch: false\n"
-            "longRunning: false\n"
-        )
-
         with open(
             "demisto_sdk/commands/update_release_notes/tests_data/Packs/Test/pack_metadata.json"
         ) as file:
             pack_data = json.load(file)
-        mocker.patch(
-            "demisto_sdk.commands.update_release_notes.update_rn.run_command",
-            return_value=expected_res,
+        mock_docker_image_change(
+            mocker, "demisto/python3:3.9.6.22912", "demisto/python3:3.9.6.22914"
         )
         mocker.patch.object(UpdateRN, "is_bump_required", return_value=False)
         mocker.patch.object(UpdateRN, "get_pack_metadata", return_value=pack_data)
@@ -2182,10 +2214,7 @@ class TestRNUpdateUnit:
             "w",
         ) as file:
             file.write("### Integrations\n")
-        mocker.patch(
-            "demisto_sdk.commands.update_release_notes.update_rn.run_command",
-            return_value="+  dockerimage:python/test:1243",
-        )
+        mock_docker_image_change(mocker, "python/test:1242", "python/test:1243")
         mocker.patch.object(UpdateRN, "is_bump_required", return_value=False)
         mocker.patch.object(UpdateRN, "get_pack_metadata", return_value=pack_data)
         mocker.patch(
@@ -2221,10 +2250,7 @@ class TestRNUpdateUnit:
             "demisto_sdk/commands/update_release_notes/tests_data/Packs/release_notes/1_0_0.md"
         ) as file:
             RN = file.read()
-        assert (
-            RN.count("Updated the Docker image to: *dockerimage:python/test:1243*.")
-            == 1
-        )
+        assert RN.count("Updated the Docker image to: *python/test:1243*.") == 1
 
         with open(
             "demisto_sdk/commands/update_release_notes/tests_data/Packs/release_notes/1_0_0.md",
@@ -2249,10 +2275,7 @@ class TestRNUpdateUnit:
             "demisto_sdk/commands/update_release_notes/tests_data/Packs/Test/pack_metadata.json"
         ) as file:
             pack_data = json.load(file)
-        mocker.patch(
-            "demisto_sdk.commands.update_release_notes.update_rn.run_command",
-            return_value="+  type:True",
-        )
+        mock_docker_image_change(mocker, "python/test:1243", "python/test:1243")
         mocker.patch.object(UpdateRN, "is_bump_required", return_value=True)
         mocker.patch.object(UpdateRN, "get_pack_metadata", return_value=pack_data)
         mocker.patch(
@@ -2286,7 +2309,7 @@ class TestRNUpdateUnit:
         Path(
             "demisto_sdk/commands/update_release_notes/tests_data/Packs/release_notes/1_1_0.md"
         ).unlink()
-        assert "Updated the Docker image to: *dockerimage:python/test:1243*" not in RN
+        assert "Updated the Docker image to: *python/test:1243*" not in RN
 
     def test_new_integration_docker_not_updated(self, mocker):
         """
@@ -2825,3 +2848,128 @@ def test_git_add_release_notes(mocker):
     assert Path(filepath).exists()
     Path(filepath).unlink()
     assert not Path(filepath).exists()
+
+
+def test_update_release_notes_in_batch(mocker, repo):
+    """
+    Given:
+        - two packs with integrations whose docker images were changed since the main branch
+    When:
+        - prefetching the git data of the packs, and updating their release notes as a batch
+    Then:
+        - make sure the versions of the packs and the docker images are read from the main branch at once
+        - make sure the release notes mention the new docker images
+        - make sure the updated files are added to git once the batch is done, and the prefetched data is cleared
+    """
+    from demisto_sdk.commands.update_release_notes.update_rn import UpdateRN
+
+    packs = [repo.create_pack(f"Test{index}") for index in range(2)]
+    integrations = [
+        pack.create_integration("Test", docker_image="demisto/python3:3.9.8.24398")
+        for pack in packs
+    ]
+    for pack in packs:
+        pack.pack_metadata.update({"currentVersion": "1.0.0"})
+    repo.init_git()
+    repo.git_util.repo.create_remote("origin", url=repo.path)
+    repo.git_util.repo.git.update_ref(
+        f"refs/remotes/origin/{DEMISTO_GIT_PRIMARY_BRANCH}", "HEAD"
+    )
+    for integration in integrations:
+        integration.yml.update(
+            {"dockerimage": "demisto/python3:3.9.8.24399"},
+            key_dict_to_update="script",
+        )
+    get_remote_file = mocker.patch(
+        "demisto_sdk.commands.update_release_notes.update_rn.get_remote_file"
+    )
+    check_docker_image_changed = mocker.patch(
+        "demisto_sdk.commands.update_release_notes.update_rn.check_docker_image_changed"
+    )
+    run_command = mocker.patch(
+        "demisto_sdk.commands.update_release_notes.update_rn.run_command"
+    )
+    metadata_paths = [os.path.join(pack.path, "pack_metadata.json") for pack in packs]
+
+    with ChangeCWD(repo.path):
+        with UpdateRN.batch():
+            UpdateRN.prefetch_git_data(
+                metadata_paths=metadata_paths,
+                yml_paths=[integration.yml.path for integration in integrations],
+            )
+            assert UpdateRN._PREFETCHED_MASTER_VERSIONS == dict.fromkeys(
+                metadata_paths, "1.0.0"
+            )
+            for pack, integration in zip(packs, integrations):
+                update_rn = UpdateRN(
+                    pack_path=pack.path,
+                    update_type="revision",
+                    modified_files_in_pack={integration.yml.path},
+                    added_files=set(),
+                )
+                assert update_rn.execute_update()
+                assert (
+                    "Updated the Docker image to: *demisto/python3:3.9.8.24399*."
+                    in Path(update_rn.rn_path).read_text()
+                )
+        staged_files = repo.git_util.repo.git.diff(
+            "--cached", "--name-only"
+        ).splitlines()
+
+    assert not any(
+        call.args[0].endswith("pack_metadata.json")
+        for call in get_remote_file.call_args_list
+    )
+    assert not check_docker_image_changed.called
+    assert not run_command.called
+    assert sorted(staged_files) == sorted(
+        f"Packs/{pack.name}/{file_name}"
+        for pack in packs
+        for file_name in ("pack_metadata.json", "ReleaseNotes/1_0_1.md")
+    )
+    assert not UpdateRN._PREFETCHED_MASTER_VERSIONS
+    assert not UpdateRN._PREFETCHED_DOCKER_IMAGES
+    assert UpdateRN._FILES_TO_GIT_ADD is None
+
+
+def test_prefetch_git_data_with_malformed_files(repo):
+    """
+    Given:
+        - two packs, the pack metadata and integration yml of the first one are malformed in the main branch
+    When:
+        - prefetching the git data of the packs
+    Then:
+        - make sure the prefetch does not fail
+        - make sure the data of the malformed files is not prefetched, so they are read again per pack
+        - make sure the data of the other pack is prefetched
+    """
+    from demisto_sdk.commands.update_release_notes.update_rn import UpdateRN
+
+    packs = [repo.create_pack(f"Test{index}") for index in range(2)]
+    integrations = [pack.create_integration("Test") for pack in packs]
+    for pack in packs:
+        pack.pack_metadata.update({"currentVersion": "1.0.0"})
+    metadata_paths = [os.path.join(pack.path, "pack_metadata.json") for pack in packs]
+    yml_paths = [integration.yml.path for integration in integrations]
+    valid_contents = [
+        Path(path).read_text() for path in (metadata_paths[0], yml_paths[0])
+    ]
+    Path(metadata_paths[0]).write_text("{not json")
+    Path(yml_paths[0]).write_text("script: [not yaml")
+    repo.init_git()
+    repo.git_util.repo.create_remote("origin", url=repo.path)
+    repo.git_util.repo.git.update_ref(
+        f"refs/remotes/origin/{DEMISTO_GIT_PRIMARY_BRANCH}", "HEAD"
+    )
+    for path, content in zip((metadata_paths[0], yml_paths[0]), valid_contents):
+        Path(path).write_text(content)
+
+    with ChangeCWD(repo.path):
+        with UpdateRN.batch():
+            UpdateRN.prefetch_git_data(
+                metadata_paths=metadata_paths, yml_paths=yml_paths
+            )
+            assert UpdateRN._PREFETCHED_MASTER_VERSIONS == {metadata_paths[1]: "1.0.0"}
+            assert set(UpdateRN._PREFETCHED_DOCKER_IMAGES) == {
+                str(Path(yml_paths[1]).absolute())
+            }
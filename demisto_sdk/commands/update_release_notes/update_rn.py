@@ -5,13 +5,17 @@ import copy
 import errno
 import os
 import re
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Iterable, Optional, Tuple, Union
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 
 from packaging.version import Version
 
 from demisto_sdk.commands.common.constants import (
     ALL_FILES_VALIDATION_IGNORE_WHITELIST,
+    DEMISTO_GIT_UPSTREAM,
     DEPRECATED_DESC_REGEX,
     DEPRECATED_NO_REPLACE_DESC_REGEX,
     EVENT_COLLECTOR,
@@ -32,6 +36,7 @@ from demisto_sdk.commands.common.content.objects.pack_objects import (
 from demisto_sdk.commands.common.content.objects.pack_objects.abstract_pack_objects.yaml_content_object import (
     YAMLContentObject,
 )
+from demisto_sdk.commands.common.git_util import GitUtil
 from demisto_sdk.commands.common.handlers import DEFAULT_JSON_HANDLER as json
 from demisto_sdk.commands.common.logger import logger
 from demisto_sdk.commands.common.tools import (
@@ -48,12 +53,15 @@ from demisto_sdk.commands.common.tools import (
     get_yaml,
     pack_name_to_path,
     run_command,
+    yaml_safe_load,
 )
 from demisto_sdk.commands.content_graph.commands.update import update_content_graph
 from demisto_sdk.commands.content_graph.interface import (
     ContentGraphInterface,
 )
 
+RN_UPDATE_WORKERS = 8
+
 CLASS_BY_FILE_TYPE = {
     FileType.INTEGRATION: Integration,
     FileType.SCRIPT: Script,
@@ -130,6 +138,12 @@ def get_deprecated_rn(path: str, file_type):
 
 class UpdateRN:
     CONTENT_PATH = Path(get_content_path())  # type: ignore[arg-type]
+    # set in batch mode, where the data of the main branch is read for all of the packs at once
+    _PREFETCHED_MAIN_BRANCH: Optional[str] = None
+    _PREFETCHED_MASTER_VERSIONS: Dict[str, str] = {}
+    _PREFETCHED_DOCKER_IMAGES: Dict[str, Optional[str]] = {}
+    # in batch mode, the updated files are added to git by a single command once all of the packs are updated
+    _FILES_TO_GIT_ADD: Optional[List[str]] = None
 
     def __init__(
         self,
@@ -171,8 +185,9 @@ class UpdateRN:
         self.should_delete_existing_rn = False
         self.pack_metadata_only = pack_metadata_only
         self.is_force = is_force
-        git_util = Content.git_util()
-        self.main_branch = git_util.handle_prev_ver()[1]
+        self.main_branch = (
+            UpdateRN._PREFETCHED_MAIN_BRANCH or Content.git_util().handle_prev_ver()[1]
+        )
         self.metadata_path = os.path.join(self.pack_path, "pack_metadata.json")
         self.master_version = self.get_master_version()
         self.rn_path = ""
@@ -264,8 +279,13 @@ class UpdateRN:
                 in [FileType.INTEGRATION, FileType.BETA_INTEGRATION, FileType.SCRIPT]
                 and packfile not in self.added_files
             ):
-                docker_image_name: Optional[str] = check_docker_image_changed(
-                    main_branch=self.main_branch, packfile=packfile
+                absolute_packfile = str(Path(packfile).absolute())
+                docker_image_name: Optional[str] = (
+                    UpdateRN._PREFETCHED_DOCKER_IMAGES[absolute_packfile]
+                    if absolute_packfile in UpdateRN._PREFETCHED_DOCKER_IMAGES
+                    else check_docker_image_changed(
+                        main_branch=self.main_branch, packfile=packfile
+                    )
                 )
             else:
                 docker_image_name = None
@@ -407,6 +427,97 @@ class UpdateRN:
 
         return True
 
+    @staticmethod
+    def prefetch_git_data(
+        metadata_paths: Iterable[str], yml_paths: Iterable[str]
+    ) -> None:
+        """
+        Reads the data of the main branch which is needed for updating the release notes of many packs at once,
+        instead of per pack: the versions of the packs and the docker images of the modified ymls.
+        Files which could not be read from the local repository are read again per pack (e.g. through the API).
+
+        :param
+            metadata_paths: The pack metadata paths of the packs to update
+            yml_paths: The modified (not added) yml paths of the packs to update
+        """
+        git_util = GitUtil.shared()
+        reader = git_util.object_reader
+        main_branch = git_util.handle_prev_ver()[1]
+        UpdateRN._PREFETCHED_MAIN_BRANCH = main_branch
+
+        metadata_paths = list(dict.fromkeys(metadata_paths))
+        if metadata_paths:
+            # the revision which get_remote_file reads the pack metadata from
+            tag = main_branch.replace(f"{DEMISTO_GIT_UPSTREAM}/", "").replace(
+                "demisto/", ""
+            )
+            metadata_revision = git_util.get_local_remote_file_path(
+                metadata_paths[0], tag
+            ).partition(":")[0]
+            metadata_contents = reader.read_many(metadata_revision, metadata_paths)  # type: ignore[arg-type]
+        else:
+            metadata_contents = []
+        for metadata_path, content in zip(metadata_paths, metadata_contents):
+            if not content:
+                continue
+            try:
+                UpdateRN._PREFETCHED_MASTER_VERSIONS[metadata_path] = json.loads(
+                    content
+                ).get("currentVersion", "0.0.0")
+            except Exception as e:
+                # read again when updating the pack, which handles the error
+                logger.debug(
+                    f"Could not prefetch the version of {metadata_path} from {metadata_revision}: {e}"
+                )
+
+        yml_paths = [
+            str(Path(path).absolute())
+            for path in dict.fromkeys(yml_paths)
+            if Path(path).is_file() and reader.relative_path(path) is not None
+        ]
+        if not yml_paths or not reader.resolve_tree(main_branch):
+            return
+        for yml_path, content in zip(
+            yml_paths, reader.read_many(main_branch, yml_paths)  # type: ignore[arg-type]
+        ):
+            try:
+                UpdateRN._PREFETCHED_DOCKER_IMAGES[
+                    yml_path
+                ] = _get_changed_docker_image(yml_path, content)
+            except Exception as e:
+                # checked again when updating the pack, which handles the error
+                logger.debug(f"Could not prefetch the docker image of {yml_path}: {e}")
+        logger.debug(
+            f"Prefetched the data of {len(metadata_paths)} packs and {len(yml_paths)} ymls from {main_branch}"
+        )
+
+    @staticmethod
+    @contextmanager
+    def batch():
+        """
+        Updates the release notes of many packs as a batch: the prefetched data of the main branch is kept until the
+        batch is done, and the updated files are added to git by a single command at the end of the batch.
+        """
+        if UpdateRN._FILES_TO_GIT_ADD is not None:
+            # already in a batch
+            yield
+            return
+        UpdateRN._FILES_TO_GIT_ADD = []
+        try:
+            yield
+        finally:
+            files_to_add, UpdateRN._FILES_TO_GIT_ADD = UpdateRN._FILES_TO_GIT_ADD, None
+            UpdateRN._PREFETCHED_MAIN_BRANCH = None
+            UpdateRN._PREFETCHED_MASTER_VERSIONS = {}
+            UpdateRN._PREFETCHED_DOCKER_IMAGES = {}
+            if files_to_add:
+                try:
+                    GitUtil.shared().repo.git.add(*dict.fromkeys(files_to_add))
+                except Exception as e:
+                    logger.warning(
+                        f"Could not add the updated files to git: {', '.join(files_to_add)}\n{e}"
+                    )
+
     def get_master_version(self) -> str:
         """
         Gets the current version from origin/master or origin/main if available, otherwise return '0.0.0'.
@@ -416,6 +527,8 @@ class UpdateRN:
             The master version
 
         """
+        if self.metadata_path in UpdateRN._PREFETCHED_MASTER_VERSIONS:
+            return UpdateRN._PREFETCHED_MASTER_VERSIONS[self.metadata_path]
         master_current_version = "0.0.0"
         master_metadata = None
         try:
@@ -640,6 +753,9 @@ class UpdateRN:
                 logger.info(
                     f"[green]Updated pack metadata version at path : {self.metadata_path}[/green]"
                 )
+            if UpdateRN._FILES_TO_GIT_ADD is not None:
+                UpdateRN._FILES_TO_GIT_ADD.append(self.metadata_path)
+                return
             try:
                 run_command(f"git add {self.metadata_path}", exit_on_error=False)
             except RuntimeError:
@@ -928,6 +1044,9 @@ class UpdateRN:
             self.existing_rn_changed = True
             with open(release_notes_path, "w") as fp:
                 fp.write(rn_string)
+        if UpdateRN._FILES_TO_GIT_ADD is not None:
+            UpdateRN._FILES_TO_GIT_ADD.append(release_notes_path)
+            return
         try:
             run_command(f"git add {release_notes_path}", exit_on_error=False)
         except RuntimeError:
@@ -1019,6 +1138,7 @@ def update_api_modules_dependents_rn(
     added: Iterable[str],
     modified: Iterable[str],
     text: str = "",
+    batch: bool = False,
 ) -> set:
     """Updates release notes for any pack that depends on API module that has changed.
     :param
@@ -1028,6 +1148,7 @@ def update_api_modules_dependents_rn(
         modified: The modified files
         id_set_path: The id set path
         text: Text to add to the release notes files
+        batch: Whether to prefetch the git data of the dependent packs in bulk, and update them in parallel
 
     :rtype: ``set``
     :return
@@ -1045,12 +1166,10 @@ def update_api_modules_dependents_rn(
         integrations = get_api_module_dependencies_from_graph(api_module_set, graph)
         if integrations:
             logger.info("Executing update-release-notes on those as well.")
-        for integration in integrations:
-            integration_pack_name = integration.pack_id
-            integration_path = integration.path
-            integration_pack_path = pack_name_to_path(integration_pack_name)
+
+        def update_integration_pack_rn(integration_pack_name: str, integration_path):
             update_pack_rn = UpdateRN(
-                pack_path=integration_pack_path,
+                pack_path=pack_name_to_path(integration_pack_name),
                 update_type=update_type,
                 modified_files_in_pack={integration_path},
                 pre_release=pre_release,
@@ -1058,12 +1177,58 @@ def update_api_modules_dependents_rn(
                 pack=integration_pack_name,
                 text=text,
             )
-            updated = update_pack_rn.execute_update()
-            if updated:
-                total_updated_packs.add(integration_pack_name)
+            return update_pack_rn.execute_update()
+
+        if not batch:
+            for integration in integrations:
+                if update_integration_pack_rn(integration.pack_id, integration.path):
+                    total_updated_packs.add(integration.pack_id)
+            return total_updated_packs
+
+        # the integrations of each pack are updated one after the other, as they update the same release notes
+        integration_paths_by_pack: Dict[str, list] = defaultdict(list)
+        for integration in integrations:
+            integration_paths_by_pack[integration.pack_id].append(integration.path)
+
+        def update_pack_integrations_rn(integration_pack_name: str) -> bool:
+            updated = False
+            for integration_path in integration_paths_by_pack[integration_pack_name]:
+                updated |= update_integration_pack_rn(
+                    integration_pack_name, integration_path
+                )
+            return updated
+
+        with UpdateRN.batch():
+            UpdateRN.prefetch_git_data(
+                metadata_paths=[
+                    os.path.join(pack_name_to_path(pack), "pack_metadata.json")
+                    for pack in integration_paths_by_pack
+                ],
+                yml_paths=[
+                    str(UpdateRN.CONTENT_PATH / integration.path)
+                    for integration in integrations
+                ],
+            )
+            with ThreadPoolExecutor(max_workers=RN_UPDATE_WORKERS) as executor:
+                for pack, updated in zip(
+                    integration_paths_by_pack,
+                    executor.map(
+                        update_pack_integrations_rn, integration_paths_by_pack
+                    ),
+                ):
+                    if updated:
+                        total_updated_packs.add(pack)
         return total_updated_packs
 
 
+def _get_docker_image(yml: dict) -> Optional[str]:
+    # the docker image of integrations is under their script section, and of scripts at the top level
+    script = yml.get("script")
+    if isinstance(script, dict):
+        return script.get("dockerimage")
+    return yml.get("dockerimage")
+
+
 def check_docker_image_changed(main_branch: str, packfile: str) -> Optional[str]:
     """Checks whether the docker image was changed in master.
 
@@ -1076,28 +1241,35 @@ def check_docker_image_changed(main_branch: str, packfile: str) -> Optional[str]
     The latest docker image
     """
     try:
-        diff = run_command(f"git diff {main_branch} -- {packfile}", exit_on_error=False)
-    except RuntimeError as e:
-        if any(["is outside repository" in exp for exp in e.args]):
-            return None
-        else:
-            logger.info(
-                f"[yellow]skipping docker image check, Encountered the following error:\n{e.args[0]}[/yellow]"
-            )
+        reader = GitUtil.shared().object_reader
+        if reader.relative_path(packfile) is None:
+            # the file is outside of the repository
             return None
-    else:
-        diff_lines = diff.splitlines()
-        for diff_line in diff_lines:
-            if (
-                "dockerimage:" in diff_line
-            ):  # search whether exists a line that notes that the Docker image was
-                # changed.
-                split_line = diff_line.split()
-                if split_line[0].startswith("+"):
-                    return split_line[-1]
+        if not reader.resolve_tree(main_branch):
+            raise ValueError(f"Could not find the {main_branch} branch")
+        return _get_changed_docker_image(packfile, reader.read(main_branch, packfile))
+    except Exception as e:
+        logger.info(
+            f"[yellow]skipping docker image check, Encountered the following error:\n{e}[/yellow]"
+        )
         return None
 
 
+def _get_changed_docker_image(
+    packfile: str, old_content: Optional[bytes]
+) -> Optional[str]:
+    """The docker image of the yml, if it is different from the one of its content in the main branch."""
+    docker_image = _get_docker_image(get_yaml(packfile))
+    old_docker_image = (
+        _get_docker_image(yaml_safe_load.load(old_content.decode()) or {})
+        if old_content
+        else None
+    )
+    if docker_image and docker_image != old_docker_image:
+        return docker_image
+    return None
+
+
 def get_from_version_at_update_rn(path: str) -> Optional[str]:
     """
     param:
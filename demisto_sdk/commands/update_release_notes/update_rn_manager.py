@@ -1,6 +1,8 @@
 import os
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple
 
 import git
 
@@ -18,6 +20,7 @@ from demisto_sdk.commands.common.tools import (
     suppress_stdout,
 )
 from demisto_sdk.commands.update_release_notes.update_rn import (
+    RN_UPDATE_WORKERS,
     UpdateRN,
     update_api_modules_dependents_rn,
 )
@@ -37,6 +40,7 @@ class UpdateReleaseNotesManager:
         prev_ver: Optional[str] = None,
         is_force: bool = False,
         is_bc: bool = False,
+        batch: bool = False,
     ):
         self.given_pack = user_input
         self.changed_packs_from_git: set = set()
@@ -56,6 +60,7 @@ class UpdateReleaseNotesManager:
             raise ValueError("Please remove the -g flag when specifying only one pack.")
         self.rn_path: list = list()
         self.is_bc = is_bc
+        self.batch = batch
 
     def manage_rn_update(self):
         """
@@ -76,8 +81,9 @@ class UpdateReleaseNotesManager:
         # Check whether the packs have some existing RNs already (created manually or by the command)
         self.check_existing_rn(added_files)
 
-        self.handle_api_module_change(modified_files, added_files)
-        self.create_release_notes(modified_files, added_files, old_format_files)
+        with UpdateRN.batch() if self.batch else nullcontext():
+            self.handle_api_module_change(modified_files, added_files)
+            self.create_release_notes(modified_files, added_files, old_format_files)
         if len(self.total_updated_packs) > 1:
             logger.info(
                 "\n[green]Successfully updated the following packs:\n"
@@ -222,6 +228,7 @@ class UpdateReleaseNotesManager:
                 added_files,
                 modified_files,
                 self.text,
+                batch=self.batch,
             )
             self.total_updated_packs = self.total_updated_packs.union(updated_packs)
 
@@ -251,23 +258,79 @@ class UpdateReleaseNotesManager:
             )
 
         elif self.changed_packs_from_git:  # update all changed packs
-            for pack in self.changed_packs_from_git:
-                if (
-                    API_MODULES_PACK in pack
-                ):  # We already handled Api Modules so we can skip it.
-                    continue
-                self.create_pack_release_notes(
-                    pack,
+            # We already handled Api Modules so we can skip it.
+            packs = [
+                pack
+                for pack in self.changed_packs_from_git
+                if API_MODULES_PACK not in pack
+            ]
+            if self.batch:
+                self.create_packs_release_notes_in_batch(
+                    packs,
                     filtered_modified_files,
                     filtered_added_files,
                     old_format_files,
                 )
+            else:
+                for pack in packs:
+                    self.create_pack_release_notes(
+                        pack,
+                        filtered_modified_files,
+                        filtered_added_files,
+                        old_format_files,
+                    )
         else:
             logger.info(
                 "[yellow]No changes that require release notes were detected. If such changes were made, "
                 "please commit the changes and rerun the command.[/yellow]"
             )
 
+    def create_packs_release_notes_in_batch(
+        self,
+        packs: List[str],
+        filtered_modified_files: set,
+        filtered_added_files: set,
+        old_format_files: set,
+    ):
+        """Creates the release notes for the given packs in parallel, once the git data of all of them is prefetched.
+
+        :param
+            packs: The packs to create release notes for
+            filtered_modified_files: A set of filtered modified files
+            filtered_added_files: A set of filtered added files
+            old_format_files: A set of old formatted files
+        """
+        modified_ymls = []
+        for file in filtered_modified_files.union(old_format_files):
+            file_path = str(
+                UpdateRN.CONTENT_PATH / (file[1] if isinstance(file, tuple) else file)
+            )
+            # the release notes of images and descriptions are of their ymls
+            for suffix in ("_image.png", "_description.md"):
+                file_path = file_path.replace(suffix, ".yml")
+            if file_path.endswith(".yml") and file not in filtered_added_files:
+                modified_ymls.append(file_path)
+        UpdateRN.prefetch_git_data(
+            metadata_paths=[
+                os.path.join(pack_name_to_path(pack), "pack_metadata.json")
+                for pack in packs
+            ],
+            yml_paths=modified_ymls,
+        )
+        with ThreadPoolExecutor(max_workers=RN_UPDATE_WORKERS) as executor:
+            # consuming the results, so errors are raised
+            list(
+                executor.map(
+                    lambda pack: self.create_pack_release_notes(
+                        pack,
+                        filtered_modified_files,
+                        filtered_added_files,
+                        old_format_files,
+                    ),
+                    packs,
+                )
+            )
+
     def create_pack_release_notes(
         self,
         pack: str,
@@ -27,6 +27,7 @@ from demisto_sdk.commands.common.tools import (
     get_file,
     string_to_bool,
 )
+from demisto_sdk.commands.common.tracing import traced
 from demisto_sdk.commands.content_graph.objects.base_content import (
     BaseContent,
 )
@@ -38,6 +39,9 @@ from demisto_sdk.commands.content_graph.objects.exceptions import (
     FailedUploadMultipleException,
 )
 from demisto_sdk.commands.content_graph.objects.pack import Pack, upload_zip
+from demisto_sdk.commands.prepare_content.unified_output_cache import (
+    UNIFIED_OUTPUT_CACHE,
+)
 from demisto_sdk.commands.upload.constants import CONTENT_TYPES_EXCLUDED_FROM_UPLOAD
 from demisto_sdk.commands.upload.exceptions import (
     IncompatibleUploadVersionException,
@@ -98,6 +102,7 @@ class Uploader:
         self.zip = zip  # -z flag
         self.destination_zip_dir = destination_zip_dir
 
+    @traced()
     def _upload_zipped(self, path: Path) -> bool:
         """
         Upload a zipped pack to the remote Cortex XSOAR instance.
@@ -186,6 +191,7 @@ class Uploader:
 
         return False
 
+    @traced()
     def upload(self):
         """Upload the pack / directory / file to the remote Cortex XSOAR instance."""
         if self.demisto_version.base_version == "0":
@@ -248,6 +254,7 @@ class Uploader:
         self.print_summary()
         return SUCCESS_RETURN_CODE if success else ERROR_RETURN_CODE
 
+    @traced()
     def _upload_single(self, path: Path) -> bool:
         """
         Upload a content item, a pack, or a zip containing packs.
@@ -509,6 +516,8 @@ class Uploader:
             )
             logger.info(f"[red]FAILED UPLOADS:\n{failed_upload_str}\n[/red]")
 
+        UNIFIED_OUTPUT_CACHE.log_stats()
+
 
 class ConfigFileParser:
     def __init__(self, path: Path):
@@ -1,6 +1,7 @@
+import multiprocessing
 import os
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple, Union
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple, Type, Union
 
 from git import InvalidGitRepositoryError
 
@@ -25,6 +26,7 @@ from demisto_sdk.commands.common.constants import (
 )
 from demisto_sdk.commands.common.content import Content
 from demisto_sdk.commands.common.content_constant_paths import CONTENT_PATH
+from demisto_sdk.commands.common.cpu_count import cpu_count
 from demisto_sdk.commands.common.logger import logger
 from demisto_sdk.commands.common.tools import (
     detect_file_level,
@@ -42,6 +44,71 @@ from demisto_sdk.commands.content_graph.parsers.content_item import (
     NotAContentItemException,
 )
 
+# the paths are parsed in a pool of processes only when each process gets at least this number of paths,
+# as starting the pool (and pickling the parsed objects back) costs more than parsing a few items
+MIN_PATHS_PER_PROCESS = 5
+
+
+class ParsingResult(NamedTuple):
+    """The content object parsed from a path, and the exception raised when the path is not a valid content item."""
+
+    path: Path
+    content_object: Optional[BaseContent]
+    error: Optional[Type[Exception]] = None
+
+
+def _parse_paths(paths: List[Path], git_sha: Optional[str]) -> List[ParsingResult]:
+    results = []
+    for path in paths:
+        try:
+            results.append(
+                ParsingResult(
+                    path,
+                    BaseContent.from_path(
+                        path, git_sha=git_sha, raise_on_exception=True
+                    ),
+                )
+            )
+        except (NotAContentItemException, InvalidContentItemException) as error:
+            results.append(ParsingResult(path, None, type(error)))
+    return results
+
+
+def _parse_paths_batch(batch: Tuple[List[Path], Optional[str]]) -> List[ParsingResult]:
+    return _parse_paths(*batch)
+
+
+def parse_paths(
+    paths: List[Path], git_sha: Optional[str] = None
+) -> List[ParsingResult]:
+    """
+    Parses the content objects of the given paths, in a pool of processes when there are enough of them.
+    All of the paths are loaded from the same commit, so each process reads a batch of files of that commit.
+
+    Args:
+        paths: the paths of the content items and packs to parse.
+        git_sha: the commit to load the paths from, the local files by default.
+
+    Returns:
+        List[ParsingResult]: the parsing result of each path, in the order of the given paths.
+    """
+    processes = min(cpu_count(), len(paths) // MIN_PATHS_PER_PROCESS)
+    if processes <= 1:
+        return _parse_paths(paths, git_sha)
+    # a few batches per process, so the processes which parse big packs do not hold back the rest
+    batch_size = -(-len(paths) // (processes * 4))
+    batches = [
+        (paths[index : index + batch_size], git_sha)
+        for index in range(0, len(paths), batch_size)
+    ]
+    logger.debug(f"Parsing {len(paths)} paths in {processes} processes")
+    with multiprocessing.Pool(processes=processes) as pool:
+        return [
+            result
+            for batch_results in pool.imap(_parse_paths_batch, batches)
+            for result in batch_results
+        ]
+
 
 class Initializer:
     """
@@ -439,20 +506,13 @@ class Initializer:
         related_files_main_items: Set[Path] = self.collect_related_files_main_items(
             files_set
         )
-        for file_path in related_files_main_items:
-            path: Path = Path(file_path)
-            try:
-                temp_obj = BaseContent.from_path(
-                    path, git_sha=None, raise_on_exception=True
-                )
-                if temp_obj is None:
-                    invalid_content_items.add(path)
-                else:
-                    basecontent_with_path_set.add(temp_obj)
-            except NotAContentItemException:
-                non_content_items.add(file_path)  # type: ignore[arg-type]
-            except InvalidContentItemException:
-                invalid_content_items.add(file_path)  # type: ignore[arg-type]
+        for result in parse_paths(sorted(map(Path, related_files_main_items))):
+            if result.error is NotAContentItemException:
+                non_content_items.add(result.path)
+            elif result.content_object is None:
+                invalid_content_items.add(result.path)
+            else:
+                basecontent_with_path_set.add(result.content_object)
         return basecontent_with_path_set, invalid_content_items, non_content_items
 
     def git_paths_to_basecontent_set(
@@ -471,32 +531,51 @@ class Initializer:
         basecontent_with_path_set: Set[BaseContent] = set()
         invalid_content_items: Set[Path] = set()
         non_content_items: Set[Path] = set()
+        # the new paths of the changed items, mapped to their git statuses and old paths
+        changed_items: Dict[Path, Tuple[Optional[GitStatuses], Path]] = {}
         for file_path, git_status in statuses_dict.items():
             if git_status == GitStatuses.DELETED:
                 continue
-            try:
-                old_path = file_path
-                if isinstance(file_path, tuple):
-                    file_path, old_path = file_path
-                obj = BaseContent.from_path(file_path, raise_on_exception=True)
-                if obj:
-                    obj.git_status = git_status
-                    # Check if the file exists
-                    if git_status in (GitStatuses.MODIFIED, GitStatuses.RENAMED):
-                        obj.old_base_content_object = BaseContent.from_path(
-                            old_path, git_sha=git_sha, raise_on_exception=True
-                        )
-                    else:
-                        obj.old_base_content_object = obj.copy(deep=True)
-                    if obj.old_base_content_object:
-                        obj.old_base_content_object.git_sha = git_sha
-                    basecontent_with_path_set.add(obj)
-                elif obj is None:
-                    invalid_content_items.add(file_path)
-            except NotAContentItemException:
-                non_content_items.add(file_path)  # type: ignore[arg-type]
-            except InvalidContentItemException:
-                invalid_content_items.add(file_path)  # type: ignore[arg-type]
+            old_path = file_path
+            if isinstance(file_path, tuple):
+                file_path, old_path = file_path
+            changed_items[file_path] = (git_status, old_path)  # type: ignore[assignment]
+
+        # parsing the current objects, and then the old objects of the modified items, all of them from the same commit
+        modified_statuses = (GitStatuses.MODIFIED, GitStatuses.RENAMED)
+        current_results = parse_paths(sorted(changed_items))
+        old_paths = sorted(
+            {
+                changed_items[result.path][1]
+                for result in current_results
+                if result.content_object
+                and changed_items[result.path][0] in modified_statuses
+            }
+        )
+        old_results = {
+            result.path: result for result in parse_paths(old_paths, git_sha=git_sha)
+        }
+
+        for result in current_results:
+            obj, error = result.content_object, result.error
+            git_status, old_path = changed_items[result.path]
+            if obj:
+                obj.git_status = git_status
+                if git_status in modified_statuses:
+                    old_result = old_results[old_path]
+                    # an old version which is not a valid content item fails the changed item as well
+                    obj.old_base_content_object = old_result.content_object
+                    error = old_result.error
+                else:
+                    obj.old_base_content_object = obj.copy(deep=True)
+                if obj.old_base_content_object:
+                    obj.old_base_content_object.git_sha = git_sha
+            if error is NotAContentItemException:
+                non_content_items.add(result.path)
+            elif error is InvalidContentItemException or obj is None:
+                invalid_content_items.add(result.path)
+            else:
+                basecontent_with_path_set.add(obj)
         return basecontent_with_path_set, invalid_content_items, non_content_items
 
     def get_items_status(
@@ -1,8 +1,9 @@
 import os
 from concurrent.futures._base import Future, as_completed
 from configparser import ConfigParser
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Callable, List, Optional, Set, Tuple
+from typing import Callable, Iterable, List, Optional, Set, Tuple
 
 import pebble
 from git import GitCommandError, InvalidGitRepositoryError
@@ -65,6 +66,7 @@ from demisto_sdk.commands.common.hook_validations.deprecation import (
 from demisto_sdk.commands.common.hook_validations.description import (
     DescriptionValidator,
 )
+from demisto_sdk.commands.common.hook_validations.docker import DockerImageValidator
 from demisto_sdk.commands.common.hook_validations.generic_definition import (
     GenericDefinitionValidator,
 )
@@ -163,6 +165,7 @@ from demisto_sdk.commands.common.tools import (
     run_command_os,
     specify_files_from_directory,
 )
+from demisto_sdk.commands.common.tracing import traced
 from demisto_sdk.commands.create_id_set.create_id_set import IDSetCreator
 
 SKIPPED_FILES = [
@@ -385,6 +388,7 @@ class OldValidateManager:
             )
             return 1
 
+    @traced()
     def run_validation(self):
         """Initiates validation in accordance with mode (i,g,a)"""
         if self.validate_all:
@@ -400,6 +404,7 @@ class OldValidateManager:
             is_valid = self.run_validation_using_git()
         return self.print_final_report(is_valid)
 
+    @traced()
     def run_validation_on_specific_files(self):
         """Run validations only on specific files"""
         files_validation_result = set()
@@ -407,47 +412,50 @@ class OldValidateManager:
             self.setup_git_params()
         files_to_validate = self.file_path.split(",")
 
-        for path in files_to_validate:
-            error_ignore_list = self.get_error_ignore_list(get_pack_name(path))
-            file_level = detect_file_level(path)
+        with self.prefetch_docker_images(
+            files_to_validate
+        ), self.batch_readme_mdx_validations(files_to_validate):
+            for path in files_to_validate:
+                error_ignore_list = self.get_error_ignore_list(get_pack_name(path))
+                file_level = detect_file_level(path)
 
-            if file_level == PathLevel.FILE:
-                logger.info(
-                    f"\n[cyan]================= Validating file {path} =================[/cyan]"
-                )
-                files_validation_result.add(
-                    self.run_validations_on_file(path, error_ignore_list)
-                )
+                if file_level == PathLevel.FILE:
+                    logger.info(
+                        f"\n[cyan]================= Validating file {path} =================[/cyan]"
+                    )
+                    files_validation_result.add(
+                        self.run_validations_on_file(path, error_ignore_list)
+                    )
 
-            elif file_level == PathLevel.CONTENT_ENTITY_DIR:
-                logger.info(
-                    f"\n[cyan]================= Validating content directory {path} =================[/cyan]"
-                )
-                files_validation_result.add(
-                    self.run_validation_on_content_entities(path, error_ignore_list)
-                )
+                elif file_level == PathLevel.CONTENT_ENTITY_DIR:
+                    logger.info(
+                        f"\n[cyan]================= Validating content directory {path} =================[/cyan]"
+                    )
+                    files_validation_result.add(
+                        self.run_validation_on_content_entities(path, error_ignore_list)
+                    )
 
-            elif file_level == PathLevel.CONTENT_GENERIC_ENTITY_DIR:
-                logger.info(
-                    f"\n[cyan]================= Validating content directory {path} =================[/cyan]"
-                )
-                files_validation_result.add(
-                    self.run_validation_on_generic_entities(path, error_ignore_list)
-                )
+                elif file_level == PathLevel.CONTENT_GENERIC_ENTITY_DIR:
+                    logger.info(
+                        f"\n[cyan]================= Validating content directory {path} =================[/cyan]"
+                    )
+                    files_validation_result.add(
+                        self.run_validation_on_generic_entities(path, error_ignore_list)
+                    )
 
-            elif file_level == PathLevel.PACK:
-                logger.info(
-                    f"\n[cyan]================= Validating pack {path} =================[/cyan]"
-                )
-                files_validation_result.add(self.run_validations_on_pack(path)[0])
+                elif file_level == PathLevel.PACK:
+                    logger.info(
+                        f"\n[cyan]================= Validating pack {path} =================[/cyan]"
+                    )
+                    files_validation_result.add(self.run_validations_on_pack(path)[0])
 
-            else:
-                logger.info(
-                    f"\n[cyan]================= Validating package {path} =================[/cyan]"
-                )
-                files_validation_result.add(
-                    self.run_validation_on_package(path, error_ignore_list)
-                )
+                else:
+                    logger.info(
+                        f"\n[cyan]================= Validating package {path} =================[/cyan]"
+                    )
+                    files_validation_result.add(
+                        self.run_validation_on_package(path, error_ignore_list)
+                    )
 
         if self.validate_graph:
             logger.info(
@@ -480,6 +488,7 @@ class OldValidateManager:
                 )
                 raise
 
+    @traced()
     def run_validation_on_all_packs(self):
         """Runs validations on all files in all packs in repo (-a option)
 
@@ -506,14 +515,77 @@ class OldValidateManager:
         all_packs.sort(key=str.lower)
 
         ReadMeValidator.add_node_env_vars()
+        readme_files = self.get_readme_files(all_packs)
+        ReadMeValidator.prefetch_absolute_image_links(readme_files)
         if self.is_possible_validate_readme:
             with ReadMeValidator.start_mdx_server(handle_error=self.handle_error):
+                ReadMeValidator.prefetch_mdx_validations(readme_files)
                 return self.validate_packs(
                     all_packs, all_packs_valid, count, num_of_packs
                 )
         else:
             return self.validate_packs(all_packs, all_packs_valid, count, num_of_packs)
 
+    @staticmethod
+    def get_readme_files(paths: Iterable) -> List[str]:
+        """Returns the README files out of the given files, and the README files under the given directories"""
+        readme_files = []
+        for path in paths:
+            if isinstance(path, tuple):
+                # renamed files are given as (old path, new path)
+                path = path[1]
+            path = Path(path)
+            if path.is_dir():
+                readme_files.extend(map(str, path.glob("**/*README.md")))
+            elif path.name.endswith("README.md") and path.is_file():
+                readme_files.append(str(path))
+        return readme_files
+
+    @contextmanager
+    def batch_readme_mdx_validations(self, paths: Iterable):
+        """
+        Keeps the mdx server up while validating the given paths, instead of starting it for each README,
+        and validates all of their READMEs in batches beforehand.
+        The absolute image links of the READMEs are checked beforehand as well, all at once.
+        """
+        readme_files = self.get_readme_files(paths)
+        if readme_files:
+            ReadMeValidator.prefetch_absolute_image_links(readme_files)
+        if not readme_files or not self.is_possible_validate_readme:
+            yield
+            return
+        ReadMeValidator.add_node_env_vars()
+        with ReadMeValidator.start_mdx_server(handle_error=self.handle_error):
+            ReadMeValidator.prefetch_mdx_validations(readme_files)
+            yield
+
+    @contextmanager
+    def prefetch_docker_images(self, paths: Iterable):
+        """
+        Resolves the docker images of the integrations and scripts of the given paths all at once, instead of
+        requesting docker hub for each one of them while it is validated.
+        The resolved images are kept only while validating the paths.
+        """
+        if self.skip_docker_checks:
+            yield
+            return
+        yml_files = []
+        for path in paths:
+            if isinstance(path, tuple):
+                # renamed files are given as (old path, new path)
+                path = path[1]
+            path = Path(path)
+            if path.is_dir():
+                yml_files.extend(map(str, path.glob("**/*.yml")))
+            elif path.suffix == ".yml" and path.is_file():
+                yml_files.append(str(path))
+        try:
+            if yml_files:
+                DockerImageValidator.prefetch_docker_images(yml_files)
+            yield
+        finally:
+            DockerImageValidator.clear_prefetched_docker_images()
+
     def validate_packs(
         self, all_packs: list, all_packs_valid: set, count: int, num_of_packs: int
     ) -> bool:
@@ -1170,6 +1242,7 @@ class OldValidateManager:
 
         return filtered_modified_files, filtered_added_files, filtered_old_format
 
+    @traced()
     def run_validation_using_git(self):
         """Runs validation on only changed packs/files (g)"""
         valid_git_setup = self.setup_git_params()
@@ -1202,10 +1275,17 @@ class OldValidateManager:
 
         validation_results = {valid_git_setup, valid_types}
 
-        validation_results.add(
-            self.validate_modified_files(modified_files | old_format_files)
-        )
-        validation_results.add(self.validate_added_files(added_files, modified_files))
+        with self.prefetch_docker_images(
+            modified_files | added_files | old_format_files
+        ), self.batch_readme_mdx_validations(
+            modified_files | added_files | old_format_files
+        ):
+            validation_results.add(
+                self.validate_modified_files(modified_files | old_format_files)
+            )
+            validation_results.add(
+                self.validate_added_files(added_files, modified_files)
+            )
         validation_results.add(
             self.validate_changed_packs_unique_files(
                 modified_files, added_files, old_format_files, changed_meta_files
@@ -10,13 +10,22 @@ from demisto_sdk.commands.common.constants import INTEGRATIONS_DIR, GitStatuses
 from demisto_sdk.commands.common.content_constant_paths import CONTENT_PATH
 from demisto_sdk.commands.common.handlers import DEFAULT_JSON_HANDLER as json
 from demisto_sdk.commands.content_graph.common import ContentType
+from demisto_sdk.commands.content_graph.objects.base_content import BaseContent
+from demisto_sdk.commands.content_graph.parsers.content_item import (
+    NotAContentItemException,
+)
 from demisto_sdk.commands.content_graph.tests.test_tools import load_yaml
+from demisto_sdk.commands.validate import initializer as initializer_module
 from demisto_sdk.commands.validate.config_reader import (
     ConfigReader,
     ConfiguredValidations,
 )
 from demisto_sdk.commands.validate.initializer import Initializer
-from demisto_sdk.commands.validate.tests.test_tools import create_integration_object
+from demisto_sdk.commands.validate.tests.test_tools import (
+    create_integration_object,
+    create_metadata_object,
+    create_script_object,
+)
 from demisto_sdk.commands.validate.validate_manager import ValidateManager
 from demisto_sdk.commands.validate.validation_results import ResultWriter
 from demisto_sdk.commands.validate.validators.BA_validators.BA101_id_should_equal_name import (
@@ -431,6 +440,60 @@ def test_should_run(validator, expected_results):
     assert expected_results == validator.should_run(INTEGRATION, [], {})
 
 
+def test_get_content_objects_per_validator(mocker):
+    """
+    Given:
+    - Validators of different content types and git statuses, and two validators with the same error code.
+    - Integrations with different git statuses and deprecation, a script and a pack metadata whose errors of
+      PackMetadataNameValidator are ignored by its support level.
+    When:
+    - Calling the get_content_objects_per_validator function.
+    Then:
+    Make sure each validator gets the content objects which should_run returns True for, in the order of the objects.
+    """
+    validate_manager = get_validate_manager(mocker)
+    validate_manager.validators = [
+        IDNameAllStatusesValidator(),
+        PackMetadataNameValidator(),
+        BreakingBackwardsSubtypeValidator(),
+        IDNameAllStatusesValidator(),
+    ]
+    modified_integration = create_integration_object()
+    modified_integration.git_status = GitStatuses.MODIFIED
+    deprecated_integration = create_integration_object(
+        paths=["deprecated"], values=[True]
+    )
+    metadata = create_metadata_object()
+    validate_manager.objects_to_run = [
+        create_integration_object(),
+        modified_integration,
+        deprecated_integration,
+        create_script_object(),
+        metadata,
+    ]
+    validate_manager.configured_validations = ConfiguredValidations(
+        support_level_dict={metadata.support_level: {"ignore": ["PA108"]}}
+    )
+
+    content_objects_per_validator = validate_manager.get_content_objects_per_validator()
+
+    assert content_objects_per_validator == [
+        [
+            content_object
+            for content_object in validate_manager.objects_to_run
+            if validator.should_run(
+                content_object,
+                [],
+                validate_manager.configured_validations.support_level_dict,
+            )
+        ]
+        for validator in validate_manager.validators
+    ]
+    assert [
+        len(content_objects) for content_objects in content_objects_per_validator
+    ] == [3, 0, 1, 3]
+
+
 def test_object_collection_with_readme_path(repo):
     """
     Given:
@@ -592,3 +655,88 @@ def test_get_items_status(repo):
         expected_results[item_path] == git_status
         for item_path, git_status in results.items()
     )
+
+
+def test_paths_to_basecontent_set_in_processes(mocker, repo):
+    """
+    Given:
+    - Paths of several integrations, and a path which is not a content item.
+    When:
+    - Calling the paths_to_basecontent_set with enough paths to parse them in a pool of processes.
+    Then:
+    - Make sure that the objects are the same as when parsing them in the current process.
+    - Make sure that the path which is not a content item is classified as such.
+    """
+    pack = repo.create_pack("pack_no_1")
+    paths = {
+        Path(pack.create_integration(f"integration_{index}").yml.path)
+        for index in range(2 * initializer_module.MIN_PATHS_PER_PROCESS)
+    }
+    not_a_content_item = Path(pack.path) / "Playbooks" / "notes.txt"
+    not_a_content_item.write_text("test")
+    paths.add(not_a_content_item)
+    initializer = Initializer()
+
+    sequential_results = initializer.paths_to_basecontent_set(paths)
+    mocker.patch.object(initializer_module, "cpu_count", return_value=2)
+    pool = mocker.spy(initializer_module.multiprocessing, "Pool")
+    parallel_results = initializer.paths_to_basecontent_set(paths)
+
+    assert pool.call_args.kwargs == {"processes": 2}
+    assert parallel_results == sequential_results
+    objects, invalid_content_items, non_content_items = parallel_results
+    assert sorted(obj.object_id for obj in objects) == sorted(
+        f"integration_{index}"
+        for index in range(2 * initializer_module.MIN_PATHS_PER_PROCESS)
+    )
+    assert not invalid_content_items
+    assert non_content_items == {not_a_content_item}
+
+
+def test_git_paths_to_basecontent_set(mocker, repo):
+    """
+    Given:
+    - A modified integration, an added integration and a modified integration which was not a content item before.
+    When:
+    - Calling the git_paths_to_basecontent_set.
+    Then:
+    - Make sure that the old object of the modified integration is loaded from the given commit.
+    - Make sure that the added integration gets a copy of itself as its old object.
+    - Make sure that the integration which was not a content item before is classified as such.
+    """
+    pack = repo.create_pack("pack_no_1")
+    modified, added, not_a_content_item_before = (
+        Path(pack.create_integration(name).yml.path)
+        for name in ("modified", "added", "not_a_content_item_before")
+    )
+    from_path = BaseContent.from_path
+    loaded_from_commit = []
+
+    def from_path_of_commit(path, git_sha=None, raise_on_exception=False):
+        if git_sha:
+            loaded_from_commit.append(path)
+            if path == not_a_content_item_before:
+                raise NotAContentItemException
+        return from_path(path, raise_on_exception=raise_on_exception)
+
+    mocker.patch.object(BaseContent, "from_path", side_effect=from_path_of_commit)
+    (
+        objects,
+        invalid_content_items,
+        non_content_items,
+    ) = Initializer().git_paths_to_basecontent_set(
+        {
+            modified: GitStatuses.MODIFIED,
+            added: GitStatuses.ADDED,
+            not_a_content_item_before: GitStatuses.MODIFIED,
+        },
+        git_sha="prev_ver",
+    )
+
+    assert sorted(loaded_from_commit) == sorted([modified, not_a_content_item_before])
+    objects_by_id = {obj.object_id: obj for obj in objects}
+    assert set(objects_by_id) == {"modified", "added"}
+    assert objects_by_id["modified"].old_base_content_object.git_sha == "prev_ver"
+    assert objects_by_id["added"].old_base_content_object.object_id == "added"
+    assert not invalid_content_items
+    assert non_content_items == {not_a_content_item_before}
@@ -1,8 +1,10 @@
 from pathlib import Path
-from typing import List, Set
+from typing import Dict, List, Optional, Set, Tuple, Type
 
+from demisto_sdk.commands.common.constants import GitStatuses
 from demisto_sdk.commands.common.logger import logger
 from demisto_sdk.commands.common.tools import is_abstract_class
+from demisto_sdk.commands.common.tracing import span, traced
 from demisto_sdk.commands.content_graph.objects.base_content import BaseContent
 from demisto_sdk.commands.validate.config_reader import (
     ConfigReader,
@@ -16,6 +18,7 @@ from demisto_sdk.commands.validate.validators.base_validator import (
     BaseValidator,
     InvalidContentItemResult,
     ValidationResult,
+    is_error_ignored,
 )
 
 
@@ -39,10 +42,11 @@ class ValidateManager:
         self.initializer = initializer
         self.objects_to_run: Set[BaseContent] = set()
         self.invalid_items: Set[Path] = set()
-        (
-            self.objects_to_run,
-            self.invalid_items,
-        ) = self.initializer.gather_objects_to_run_on()
+        with span("gather objects to run on"):
+            (
+                self.objects_to_run,
+                self.invalid_items,
+            ) = self.initializer.gather_objects_to_run_on()
         self.use_git = self.initializer.use_git
         self.committed_only = self.initializer.committed_only
         self.configured_validations: ConfiguredValidations = (
@@ -52,6 +56,7 @@ class ValidateManager:
         )
         self.validators = self.filter_validators()
 
+    @traced()
     def run_validations(self) -> int:
         """
             Running all the relevant validation on all the filtered files based on the should_run calculations,
@@ -61,18 +66,15 @@ class ValidateManager:
             int: the exit code to obtained from the calculations of post_results.
         """
         logger.info("Starting validate items.")
-        for validator in self.validators:
-            if filtered_content_objects_for_validator := list(
-                filter(
-                    lambda content_object: validator.should_run(
-                        content_object,
-                        self.configured_validations.ignorable_errors,
-                        self.configured_validations.support_level_dict,
-                    ),
-                    self.objects_to_run,
-                )
-            ):
-                validation_results: List[ValidationResult] = validator.is_valid(filtered_content_objects_for_validator)  # type: ignore
+        for validator, filtered_content_objects_for_validator in zip(
+            self.validators, self.get_content_objects_per_validator()
+        ):
+            if filtered_content_objects_for_validator:
+                with span(
+                    validator.error_code,
+                    items=len(filtered_content_objects_for_validator),
+                ):
+                    validation_results: List[ValidationResult] = validator.is_valid(filtered_content_objects_for_validator)  # type: ignore
                 if self.allow_autofix and validator.is_auto_fixable:
                     for validation_result in validation_results:
                         try:
@@ -98,6 +100,61 @@ class ValidateManager:
             only_throw_warning=self.configured_validations.only_throw_warnings
         )
 
+    def get_content_objects_per_validator(self) -> List[List[BaseContent]]:
+        """
+        Matches the content objects to the validators which should run on them, as by BaseValidator.should_run.
+        The validators which apply to each combination of content type, git status and deprecation are found once,
+        so each content object is only offered to the validators which apply to it. The ignored errors and the support
+        level are then checked against sets of error codes, before checking the errors ignored by the object itself.
+
+        Returns:
+            List[List[BaseContent]]: the content objects to run each one of the validators on.
+        """
+        ignorable_errors = self.configured_validations.ignorable_errors
+        ignorable_error_codes = set(ignorable_errors)
+        support_level_ignored_error_codes = {
+            support_level: set(support_level_config.get("ignore", []))
+            for support_level, support_level_config in self.configured_validations.support_level_dict.items()
+        }
+        # the indices of the validators which apply to each content type, git status and deprecation
+        dispatch_table: Dict[
+            Tuple[Type[BaseContent], Optional[GitStatuses], bool], List[int]
+        ] = {}
+        content_objects_per_validator: List[List[BaseContent]] = [
+            [] for _ in self.validators
+        ]
+        for content_object in self.objects_to_run:
+            key = (
+                type(content_object),
+                content_object.git_status,
+                bool(content_object.deprecated),
+            )
+            if key not in dispatch_table:
+                dispatch_table[key] = [
+                    index
+                    for index, validator in enumerate(self.validators)
+                    if validator.is_applicable(content_object)
+                ]
+            if not (applicable_validators := dispatch_table[key]):
+                continue
+            ignored_error_codes = support_level_ignored_error_codes.get(
+                content_object.support_level, set()
+            )
+            for index in applicable_validators:
+                validator = self.validators[index]
+                if validator.error_code in ignored_error_codes or (
+                    validator.error_code in ignorable_error_codes
+                    and is_error_ignored(
+                        validator.error_code,
+                        ignorable_errors,
+                        content_object,
+                        validator.related_file_type,
+                    )
+                ):
+                    continue
+                content_objects_per_validator[index].append(content_object)
+        return content_objects_per_validator
+
     def filter_validators(self) -> List[BaseValidator]:
         """
         Filter the validations by their error code
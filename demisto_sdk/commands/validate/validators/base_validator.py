@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from abc import ABC
+from functools import lru_cache
 from pathlib import Path
 from typing import (
     ClassVar,
@@ -56,10 +57,25 @@ class BaseValidator(ABC, BaseModel, Generic[ContentTypes]):
     related_file_type: ClassVar[Optional[List[RelatedFileType]]] = None
 
     def get_content_types(self):
-        args = (get_args(self.__orig_bases__[0]) or get_args(self.__orig_bases__[1]))[0]  # type: ignore
-        if isinstance(args, (BaseContent, BaseContentMetaclass)):
-            return args
-        return get_args(args)
+        return get_validator_content_types(type(self))
+
+    def is_applicable(self, content_item: ContentTypes) -> bool:
+        """check whether the validation applies to the given content item, according to its type, deprecation and git status.
+        The result is the same for all of the content items with the same type, deprecation and git status.
+
+        Args:
+            content_item (BaseContent): The content item to run the validation on.
+
+        Returns:
+            bool: True if the validation applies to the content item. Otherwise, return False.
+        """
+        return (
+            isinstance(content_item, self.get_content_types())
+            and should_run_on_deprecated(self.run_on_deprecated, content_item)
+            and should_run_according_to_status(
+                content_item.git_status, self.expected_git_statuses
+            )
+        )
 
     def should_run(
         self,
@@ -77,23 +93,17 @@ class BaseValidator(ABC, BaseModel, Generic[ContentTypes]):
         Returns:
             bool: True if the validation should run. Otherwise, return False.
         """
-        return all(
-            [
-                isinstance(content_item, self.get_content_types()),
-                should_run_on_deprecated(self.run_on_deprecated, content_item),
-                should_run_according_to_status(
-                    content_item.git_status, self.expected_git_statuses
-                ),
-                not is_error_ignored(
-                    self.error_code,
-                    ignorable_errors,
-                    content_item,
-                    self.related_file_type,
-                ),
-                not is_support_level_support_validation(
-                    self.error_code, support_level_dict, content_item.support_level
-                ),
-            ]
+        return (
+            self.is_applicable(content_item)
+            and not is_error_ignored(
+                self.error_code,
+                ignorable_errors,
+                content_item,
+                self.related_file_type,
+            )
+            and not is_support_level_support_validation(
+                self.error_code, support_level_dict, content_item.support_level
+            )
         )
 
     def is_valid(
@@ -149,6 +159,15 @@ class BaseResult(BaseModel):
         }
 
 
+@lru_cache(maxsize=None)
+def get_validator_content_types(validator_class: type):
+    """The content types which the given validator class runs on, as given to its BaseValidator base."""
+    args = (get_args(validator_class.__orig_bases__[0]) or get_args(validator_class.__orig_bases__[1]))[0]  # type: ignore
+    if isinstance(args, (BaseContent, BaseContentMetaclass)):
+        return args
+    return get_args(args)
+
+
 def is_error_ignored(
     err_code: str,
     ignorable_errors: List[str],
@@ -149,7 +149,7 @@ def process_file(file_path: Path) -> ProcessResults:
 
     try:
         env = ENV.copy()
-        integration_script = BaseContent.from_path(file_path)
+        integration_script = BaseContent.from_path(file_path, metadata_only=True)
         results = ProcessResults()
 
         if not isinstance(integration_script, IntegrationScript):
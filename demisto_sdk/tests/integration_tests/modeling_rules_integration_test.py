@@ -1,7 +1,11 @@
 import logging
 import os
+import re
+import threading
 from pathlib import Path
+from typing import Any, Dict, List, Set
 
+import junitparser
 import pytest
 import requests_mock
 import typer
@@ -1795,3 +1799,141 @@ class TestDeleteExistingDataset:
                 )
         except typer.Exit:
             assert False, "No exception should be raised in this scenario."
+
+
+class FakeXsiamTenant:
+    """
+    A stub of the XSIAM endpoints used by the test-modeling-rule command,
+    which answers XQL queries according to the data that was pushed to it.
+    """
+
+    def __init__(self, requests_mocker, base_url: str, expected_values: List[dict]):
+        self.expected_values = expected_values
+        self.pushed_datasets: Set[str] = set()
+        self.queries: Dict[str, str] = {}
+        self.dataset_checks: List[str] = []
+        self._lock = threading.Lock()
+        requests_mocker.post(f"{base_url}/logs/v1/xsiam", json=self.push_to_dataset)
+        requests_mocker.post(
+            f"{base_url}/public_api/v1/xql/start_xql_query/", json=self.start_xql_query
+        )
+        requests_mocker.post(
+            f"{base_url}/public_api/v1/xql/get_query_results/",
+            json=self.get_query_results,
+        )
+
+    def push_to_dataset(self, request, context):
+        self.pushed_datasets.add(
+            f'{request.headers["vendor"]}_{request.headers["product"]}_raw'
+        )
+        return {}
+
+    def start_xql_query(self, request, context):
+        with self._lock:
+            execution_id = f"execution-{len(self.queries)}"
+            self.queries[execution_id] = request.json()["request_data"]["query"]
+        return {"reply": execution_id}
+
+    def get_query_results(self, request, context):
+        query = self.queries[request.json()["request_data"]["query_id"]]
+        data: List[Any] = []
+        if dataset_check := re.search(r"\| dataset = (\w+)$", query):
+            dataset = dataset_check.group(1)
+            self.dataset_checks.append(dataset)
+            data = ["some-results"] if dataset in self.pushed_datasets else []
+        elif "dedup" in query:
+            dataset = re.search(r"dataset in\((\w+)\)", query).group(1)  # type: ignore[union-attr]
+            event_ids = re.findall(r'"([\w-]+)"', query)
+            data = [
+                {f"{dataset}.test_data_event_id": event_id, **expected_values}
+                for event_id, expected_values in zip(event_ids, self.expected_values)
+            ]
+        return {"reply": {"status": "SUCCESS", "results": {"data": data}}}
+
+
+class TestTheTestModelingRuleCommandConcurrently:
+    def test_the_test_modeling_rule_command_concurrently(
+        self, repo, monkeypatch, mocker, requests_mocker
+    ):
+        """
+        Given:
+            - Three modeling rules with test data files which push to the same dataset.
+
+        When:
+            - The command is run with --max-workers 3 against a stub of the XSIAM tenant.
+
+        Then:
+            - Verify all the modeling rules passed and the command returns with a zero exit code.
+            - Verify the shared dataset was queried only once.
+            - Verify the JUnit file holds the test suites in the order of the inputs.
+        """
+        logger_info = mocker.patch.object(logging.getLogger("demisto-sdk"), "info")
+        monkeypatch.setenv("COLUMNS", "1000")
+
+        from demisto_sdk.commands.test_content.test_modeling_rule.test_modeling_rule import (
+            app as test_modeling_rule_cmd,
+        )
+        from demisto_sdk.commands.test_content.xsiam_tools.test_data import TestData
+
+        runner = CliRunner()
+        sleep_mock = mocker.patch(
+            "demisto_sdk.commands.test_content.test_modeling_rule.test_modeling_rule.sleep",
+            return_value=None,
+        )
+
+        fake_test_data = TestData.parse_file(TEST_DATA_FILE_PATH.as_posix())
+        modeling_rule_directories = []
+        for i in range(3):
+            pack = repo.create_pack(f"Pack{i}")
+            pack.create_modeling_rule(
+                f"{DEFAULT_MODELING_RULE_NAME}{i}", rules=ONE_MODEL_RULE_TEXT
+            )
+            modeling_rule_directory = Path(
+                pack._modeling_rules_path / f"{DEFAULT_MODELING_RULE_NAME}{i}"
+            )
+            (
+                modeling_rule_directory
+                / f"{DEFAULT_MODELING_RULE_NAME}{i}_testdata.json"
+            ).write_text(fake_test_data.json(indent=4))
+            modeling_rule_directories.append(modeling_rule_directory)
+
+        junit_path = Path(repo.path) / "modeling_rules_results.xml"
+        with SetFakeXsiamClientEnvironmentVars() as fake_env_vars:
+            requests_mocker.get(
+                f"{fake_env_vars.demisto_base_url}/xsoar/contentpacks/metadata/installed",
+                json=[{"name": f"Pack{i}", "id": f"Pack{i}"} for i in range(3)],
+            )
+            tenant = FakeXsiamTenant(
+                requests_mocker,
+                fake_env_vars.demisto_base_url,
+                [event.expected_values for event in fake_test_data.data],
+            )
+            result = runner.invoke(
+                test_modeling_rule_cmd,
+                [
+                    *(directory.as_posix() for directory in modeling_rule_directories),
+                    "--non-interactive",
+                    "--sleep_interval",
+                    "0",
+                    "--retry_attempts",
+                    "0",
+                    "--max-workers",
+                    "3",
+                    "--junit-path",
+                    junit_path.as_posix(),
+                ],
+            )
+
+        assert result.exit_code == 0
+        assert tenant.dataset_checks == ["fake_fakerson_raw"]
+        assert sleep_mock.call_count == 1
+        for directory in modeling_rule_directories:
+            assert str_in_call_args_list(
+                logger_info.call_args_list, f"{directory.name} passed"
+            )
+        assert [
+            suite.name for suite in junitparser.JUnitXml.fromfile(junit_path.as_posix())
+        ] == [
+            f"Modeling Rule Test Results {DEFAULT_MODELING_RULE_NAME}{i}.yml"
+            for i in range(3)
+        ]